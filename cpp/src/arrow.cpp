@@ -0,0 +1,162 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+#include "arrow.h"
+#include "pypowsybl.h"
+#include <cstring>
+#include <limits>
+#include <string>
+#include <vector>
+
+namespace pypowsybl {
+
+namespace arrow {
+
+namespace {
+
+struct SchemaPrivateData {
+    std::string format;
+    std::string name;
+};
+
+struct ArrayPrivateData {
+    std::vector<uint8_t> validity;
+    std::vector<uint8_t> values;
+    std::vector<int32_t> offsets;
+    std::vector<const void*> buffers;
+};
+
+void releaseSchema(ArrowSchema* schema) {
+    if (schema->release == nullptr) {
+        return;
+    }
+    delete (SchemaPrivateData*) schema->private_data;
+    schema->release = nullptr;
+}
+
+void releaseArray(ArrowArray* array) {
+    if (array->release == nullptr) {
+        return;
+    }
+    delete (ArrayPrivateData*) array->private_data;
+    array->release = nullptr;
+}
+
+const char* arrowFormat(int type) {
+    switch (type) {
+        case 0:
+            return "u";
+        case 1:
+            return "g";
+        case 2:
+            return "i";
+        case 3:
+            return "b";
+        default:
+            throw PyPowsyblError("Series type not supported: " + std::to_string(type));
+    }
+}
+
+void fillStrings(const series& s, ArrayPrivateData* data, int64_t& nullCount) {
+    char** values = (char**) s.data.ptr;
+    int length = s.data.length;
+    size_t totalSize = 0;
+    for (int i = 0; i < length; i++) {
+        if (values[i] != nullptr) {
+            totalSize += strlen(values[i]);
+        }
+    }
+    if (totalSize > (size_t) std::numeric_limits<int32_t>::max()) {
+        throw PyPowsyblError("Series " + std::string(s.name) + " is too large to be exported to arrow");
+    }
+    data->offsets.resize(length + 1);
+    data->values.resize(totalSize);
+    int32_t offset = 0;
+    for (int i = 0; i < length; i++) {
+        data->offsets[i] = offset;
+        if (values[i] == nullptr) {
+            if (data->validity.empty()) {
+                data->validity.assign((length + 7) / 8, 0xFF);
+            }
+            data->validity[i / 8] &= (uint8_t) ~(1 << (i % 8));
+            nullCount++;
+        } else {
+            size_t size = strlen(values[i]);
+            memcpy(data->values.data() + offset, values[i], size);
+            offset += (int32_t) size;
+        }
+    }
+    data->offsets[length] = offset;
+    data->buffers = {data->validity.empty() ? nullptr : data->validity.data(), data->offsets.data(), data->values.data()};
+}
+
+void fillBooleans(const series& s, ArrayPrivateData* data) {
+    const char* values = (const char*) s.data.ptr;
+    int length = s.data.length;
+    data->values.assign((length + 7) / 8, 0);
+    for (int i = 0; i < length; i++) {
+        if (values[i]) {
+            data->values[i / 8] |= (uint8_t) (1 << (i % 8));
+        }
+    }
+    data->buffers = {nullptr, data->values.data()};
+}
+
+template<typename T>
+void fillPrimitives(const series& s, ArrayPrivateData* data) {
+    const uint8_t* values = (const uint8_t*) s.data.ptr;
+    data->values.assign(values, values + s.data.length * sizeof(T));
+    data->buffers = {nullptr, data->values.data()};
+}
+
+}
+
+void exportSeries(const series& s, ArrowSchema* schema, ArrowArray* array) {
+    const char* format = arrowFormat(s.type);
+    SchemaPrivateData* schemaData = new SchemaPrivateData();
+    schemaData->format = format;
+    schemaData->name = s.name;
+    schema->format = schemaData->format.c_str();
+    schema->name = schemaData->name.c_str();
+    schema->metadata = nullptr;
+    schema->flags = ARROW_FLAG_NULLABLE;
+    schema->n_children = 0;
+    schema->children = nullptr;
+    schema->dictionary = nullptr;
+    schema->release = &releaseSchema;
+    schema->private_data = schemaData;
+
+    ArrayPrivateData* arrayData = new ArrayPrivateData();
+    int64_t nullCount = 0;
+    switch (s.type) {
+        case 0:
+            fillStrings(s, arrayData, nullCount);
+            break;
+        case 1:
+            fillPrimitives<double>(s, arrayData);
+            break;
+        case 2:
+            fillPrimitives<int32_t>(s, arrayData);
+            break;
+        case 3:
+            fillBooleans(s, arrayData);
+            break;
+    }
+    array->length = s.data.length;
+    array->null_count = nullCount;
+    array->offset = 0;
+    array->n_buffers = arrayData->buffers.size();
+    array->n_children = 0;
+    array->buffers = arrayData->buffers.data();
+    array->children = nullptr;
+    array->dictionary = nullptr;
+    array->release = &releaseArray;
+    array->private_data = arrayData;
+}
+
+}
+
+}
@@ -0,0 +1,68 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+#ifndef PYPOWSYBL_ARROW_H
+#define PYPOWSYBL_ARROW_H
+
+#include <cstdint>
+#include "pypowsybl-api.h"
+
+/**
+ * Structures of the Arrow C data interface, as specified in
+ * https://arrow.apache.org/docs/format/CDataInterface.html
+ */
+#ifndef ARROW_C_DATA_INTERFACE
+#define ARROW_C_DATA_INTERFACE
+
+#define ARROW_FLAG_DICTIONARY_ORDERED 1
+#define ARROW_FLAG_NULLABLE 2
+#define ARROW_FLAG_MAP_KEYS_SORTED 4
+
+struct ArrowSchema {
+    const char* format;
+    const char* name;
+    const char* metadata;
+    int64_t flags;
+    int64_t n_children;
+    struct ArrowSchema** children;
+    struct ArrowSchema* dictionary;
+    void (*release)(struct ArrowSchema*);
+    void* private_data;
+};
+
+struct ArrowArray {
+    int64_t length;
+    int64_t null_count;
+    int64_t offset;
+    int64_t n_buffers;
+    int64_t n_children;
+    const void** buffers;
+    struct ArrowArray** children;
+    struct ArrowArray* dictionary;
+    void (*release)(struct ArrowArray*);
+    void* private_data;
+};
+
+#endif  // ARROW_C_DATA_INTERFACE
+
+namespace pypowsybl {
+
+namespace arrow {
+
+/**
+ * Exports a series to the Arrow C data interface.
+ * Buffers are owned by the exported array, which means the series may be freed
+ * independently once the export is done.
+ * Strings are exported as a single contiguous utf8 buffer with int32 offsets,
+ * booleans are bit-packed.
+ */
+void exportSeries(const series& s, ArrowSchema* schema, ArrowArray* array);
+
+}
+
+}
+
+#endif  // PYPOWSYBL_ARROW_H
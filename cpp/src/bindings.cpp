@@ -7,8 +7,12 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
+#include <climits>
+#include <cstring>
+#include <unordered_map>
 #include "pypowsybl.h"
 #include "pylogging.h"
+#include "arrow.h"
 
 namespace py = pybind11;
 
@@ -23,56 +27,115 @@ void bindArray(py::module_& m, const std::string& className) {
             }, py::keep_alive<0, 1>());
 }
 
-void deleteDataframe(dataframe* df) {
+/**
+ * Owns the memory of the columns of a dataframe created from python data.
+ * Numpy arrays which already have the expected memory layout are directly referenced,
+ * other columns are copied once into contiguous buffers.
+ */
+struct DataframeBuffers {
+    std::vector<py::object> arrays;
+    std::vector<std::vector<double>> doubles;
+    std::vector<std::vector<int>> ints;
+    std::vector<std::vector<char>> stringsData;
+    std::vector<std::vector<char*>> stringsPointers;
+};
+
+void deleteDataframe(dataframe* df, DataframeBuffers* buffers) {
     for (int indice = 0 ; indice < df->series_count; indice ++) {
-        series* column = df->series + indice;
-        if (column->type == 0) {
-            pypowsybl::deleteCharPtrPtr((char**) column->data.ptr, column->data.length);
-        } else if (column->type == 1) {
-            delete[] (double*) column->data.ptr;
-        } else if (column->type == 2 || column->type == 3) {
-            delete[] (int*) column->data.ptr;
-        }
-        delete[] column->name;
+        delete[] df->series[indice].name;
     }
     delete[] df->series;
     delete df;
+    //referenced numpy arrays must be released with the GIL
+    py::gil_scoped_acquire acquire;
+    delete buffers;
+}
+
+template<typename T>
+bool referenceNumpyArray(const py::handle& values, series* column, DataframeBuffers* buffers) {
+    if (!py::isinstance<py::array_t<T>>(values)) {
+        return false;
+    }
+    py::array_t<T> array = py::reinterpret_borrow<py::array_t<T>>(values);
+    if (array.ndim() != 1 || !(array.flags() & py::array::c_style)) {
+        return false;
+    }
+    column->data.length = array.shape(0);
+    column->data.ptr = (void*) array.data();
+    buffers->arrays.push_back(array);
+    return true;
+}
+
+//all strings of the column are written in a single buffer, pointers of the C series point into it
+void copyStrings(const py::handle& values, series* column, DataframeBuffers* buffers) {
+    if (!py::isinstance<py::sequence>(values) || py::isinstance<py::str>(values)) {
+        throw py::cast_error("Expected a sequence of strings");
+    }
+    py::sequence sequence = py::reinterpret_borrow<py::sequence>(values);
+    std::vector<std::string> strings;
+    strings.reserve(sequence.size());
+    size_t dataSize = 0;
+    for (auto value : sequence) {
+        strings.push_back(value.cast<std::string>());
+        dataSize += strings.back().size() + 1;
+    }
+    std::vector<char> data(dataSize);
+    std::vector<char*> pointers(strings.size());
+    size_t offset = 0;
+    for (size_t i = 0; i < strings.size(); i++) {
+        pointers[i] = data.data() + offset;
+        memcpy(pointers[i], strings[i].c_str(), strings[i].size() + 1);
+        offset += strings[i].size() + 1;
+    }
+    column->data.length = pointers.size();
+    column->data.ptr = pointers.data();
+    buffers->stringsData.push_back(std::move(data));
+    buffers->stringsPointers.push_back(std::move(pointers));
 }
 
 std::shared_ptr<dataframe> createDataframe(py::list columnsValues, const std::vector<std::string>& columnsNames, const std::vector<int>& columnsTypes, const std::vector<bool>& isIndex) {
     int columnsNumber = columnsNames.size();
-    std::shared_ptr<dataframe> dataframe(new ::dataframe(), ::deleteDataframe);
-    series* columns = new series[columnsNumber];
+    DataframeBuffers* buffers = new DataframeBuffers();
+    series* columns = new series[columnsNumber]();
+    std::shared_ptr<dataframe> dataframe(new ::dataframe(), [buffers](::dataframe* df) {
+        ::deleteDataframe(df, buffers);
+    });
+    dataframe->series_count = columnsNumber;
+    dataframe->series = columns;
     for (int indice = 0 ; indice < columnsNumber ; indice ++ ) {
         series* column = columns + indice;
-        py::str name = (py::str) columnsNames[indice];
-        column->name = strdup(((std::string) name).c_str());
+        column->name = pypowsybl::copyStringToCharPtr(columnsNames[indice]);
         column->index = int(isIndex[indice]);
         int type = columnsTypes[indice];
         column->type = type;
+        py::handle values = columnsValues[indice];
         if (type == 0) {
             try {
-                std::vector<std::string> values = py::cast<std::vector<std::string>>(columnsValues[indice]);
-                column->data.length = values.size();
-                column->data.ptr = pypowsybl::copyVectorStringToCharPtrPtr(values);
+                copyStrings(values, column, buffers);
             }
             catch(const py::cast_error& e) {
                 throw pypowsybl::PyPowsyblError("Data of column \"" + columnsNames[indice] + "\" has the wrong type, expected string");  
             }
         } else if (type == 1) {
+            if (referenceNumpyArray<double>(values, column, buffers)) {
+                continue;
+            }
             try {
-                std::vector<double> values = py::cast<std::vector<double>>(columnsValues[indice]);
-                column->data.length = values.size();
-                column->data.ptr = pypowsybl::copyVectorDouble(values);
+                buffers->doubles.push_back(py::cast<std::vector<double>>(values));
+                column->data.length = buffers->doubles.back().size();
+                column->data.ptr = buffers->doubles.back().data();
             }
             catch(const py::cast_error& e) {
                 throw pypowsybl::PyPowsyblError("Data of column \"" + columnsNames[indice] + "\" has the wrong type, expected float");  
             }
         } else if (type == 2 || type == 3) {
+            if (type == 2 && referenceNumpyArray<int>(values, column, buffers)) {
+                continue;
+            }
             try {
-                std::vector<int> values = py::cast<std::vector<int>>(columnsValues[indice]);
-                column->data.length = values.size();
-                column->data.ptr = pypowsybl::copyVectorInt(values);
+                buffers->ints.push_back(py::cast<std::vector<int>>(values));
+                column->data.length = buffers->ints.back().size();
+                column->data.ptr = buffers->ints.back().data();
             }
             catch(const py::cast_error& e) {
                 std::string expected = type == 2 ? "int" : "bool";
@@ -80,8 +143,6 @@ std::shared_ptr<dataframe> createDataframe(py::list columnsValues, const std::ve
             }
         }
     }
-    dataframe->series_count = columnsNumber;
-    dataframe->series = columns;
     return dataframe;
 }
 
@@ -120,6 +181,155 @@ py::array seriesAsNumpyArray(const series& series) {
     return py::array(py::dtype::of<T>(), series.data.length, series.data.ptr, py::cast(series));
 }
 
+void releaseArrowSchemaCapsule(PyObject* capsule) {
+    ArrowSchema* schema = (ArrowSchema*) PyCapsule_GetPointer(capsule, "arrow_schema");
+    if (schema->release != nullptr) {
+        schema->release(schema);
+    }
+    delete schema;
+}
+
+void releaseArrowArrayCapsule(PyObject* capsule) {
+    ArrowArray* array = (ArrowArray*) PyCapsule_GetPointer(capsule, "arrow_array");
+    if (array->release != nullptr) {
+        array->release(array);
+    }
+    delete array;
+}
+
+/**
+ * A dictionary of strings, used to encode a string series as integer codes, null strings having code -1.
+ * A string keeps the same code for the whole life of the dictionary,
+ * so that the same column of several dataframes, encoded with the same dictionary, share their categories.
+ */
+class StringDictionary {
+public:
+    StringDictionary() = default;
+
+    int code(const char* value) {
+        if (value == nullptr) {
+            return -1;
+        }
+        std::string str(value);
+        auto it = codes_.find(str);
+        if (it != codes_.end()) {
+            return it->second;
+        }
+        int code = (int) codes_.size();
+        codes_.emplace(str, code);
+        values_.append(py::str(str));
+        return code;
+    }
+
+    int size() const {
+        return (int) codes_.size();
+    }
+
+    py::list values() const {
+        return py::reinterpret_steal<py::list>(PySequence_List(values_.ptr()));
+    }
+
+private:
+    std::unordered_map<std::string, int> codes_;
+    py::list values_;
+};
+
+py::array_t<int> seriesAsDictionaryCodes(const series& s, StringDictionary& dictionary) {
+    if (s.type != 0) {
+        throw pypowsybl::PyPowsyblError("Only string series can be dictionary encoded, series " + std::string(s.name) + " has type " + std::to_string(s.type));
+    }
+    py::array_t<int> codes(s.data.length);
+    int* codesPtr = codes.mutable_data();
+    char** values = (char**) s.data.ptr;
+    for (int i = 0; i < s.data.length; i++) {
+        codesPtr[i] = dictionary.code(values[i]);
+    }
+    return codes;
+}
+
+//Exports series data according to the arrow PyCapsule interface
+py::tuple seriesAsArrowCapsules(const series& s) {
+    ArrowSchema* schema = new ArrowSchema();
+    ArrowArray* array = new ArrowArray();
+    schema->release = nullptr;
+    array->release = nullptr;
+    try {
+        pypowsybl::arrow::exportSeries(s, schema, array);
+    } catch (...) {
+        if (schema->release != nullptr) {
+            schema->release(schema);
+        }
+        delete schema;
+        delete array;
+        throw;
+    }
+    py::object schemaCapsule = py::reinterpret_steal<py::object>(PyCapsule_New(schema, "arrow_schema", &releaseArrowSchemaCapsule));
+    py::object arrayCapsule = py::reinterpret_steal<py::object>(PyCapsule_New(array, "arrow_array", &releaseArrowArrayCapsule));
+    return py::make_tuple(schemaCapsule, arrayCapsule);
+}
+
+/**
+ * Bytes of a python buffer, given to java as a single array: the buffer must be C-contiguous,
+ * and its size must fit in an int.
+ */
+struct BinaryBuffer {
+    py::buffer_info info;
+
+    explicit BinaryBuffer(const py::buffer& buffer)
+        : info(buffer.request()) {
+        py::ssize_t expectedStride = info.itemsize;
+        for (py::ssize_t i = info.ndim - 1; i >= 0; i--) {
+            if (info.shape[i] > 1 && info.strides[i] != expectedStride) {
+                throw py::value_error("Binary buffer must be C-contiguous");
+            }
+            expectedStride *= info.shape[i];
+        }
+        if (info.size * info.itemsize > INT_MAX) {
+            throw py::value_error("Binary buffer size must not exceed " + std::to_string(INT_MAX) + " bytes");
+        }
+    }
+
+    const char* data() const {
+        return (const char*) info.ptr;
+    }
+
+    int size() const {
+        return (int) (info.size * info.itemsize);
+    }
+};
+
+//python callback notified of the progress of the import running in the current thread, if any
+thread_local py::object* importProgressCallback = nullptr;
+
+void notifyImportProgress(char* fileName, int parsedCount, int totalCount) {
+    if (importProgressCallback == nullptr) {
+        return;
+    }
+    py::gil_scoped_acquire acquire;
+    try {
+        (*importProgressCallback)(fileName, parsedCount, totalCount);
+    } catch (py::error_already_set& err) {
+        //cannot be raised through java, the python callback is expected to keep its errors
+    }
+}
+
+pypowsybl::JavaHandle loadNetwork(const std::string& file, const std::map<std::string, std::string>& parameters, int parallelism,
+                                  const std::vector<std::string>& skippedProfiles, pypowsybl::JavaHandle* reporter, py::object progress) {
+    if (progress.is_none()) {
+        py::gil_scoped_release release;
+        return pypowsybl::loadNetwork(file, parameters, parallelism, skippedProfiles, reporter, nullptr);
+    }
+    //the callback is only visible from the thread running the import, so that concurrent imports are independent
+    struct CallbackScope {
+        py::object* previous;
+        explicit CallbackScope(py::object* callback) : previous(importProgressCallback) { importProgressCallback = callback; }
+        ~CallbackScope() { importProgressCallback = previous; }
+    } scope(&progress);
+    auto fptr = &::notifyImportProgress;
+    py::gil_scoped_release release;
+    return pypowsybl::loadNetwork(file, parameters, parallelism, skippedProfiles, reporter, reinterpret_cast<void*>(fptr));
+}
+
 PYBIND11_MODULE(_pypowsybl, m) {
     pypowsybl::init();
 
@@ -131,6 +341,12 @@ PYBIND11_MODULE(_pypowsybl, m) {
 
     m.def("set_java_library_path", &pypowsybl::setJavaLibraryPath, "Set java.library.path JVM property");
 
+    m.def("create_isolate", &pypowsybl::createIsolate, "Create a new isolate, and return its ID", py::call_guard<py::gil_scoped_release>());
+    m.def("set_thread_isolate", &pypowsybl::setThreadIsolate, "Set the isolate of the calls of the current thread which do not involve any java object",
+          py::arg("isolate"));
+    m.def("get_thread_isolate", &pypowsybl::getThreadIsolate, "Get the isolate of the calls of the current thread which do not involve any java object");
+    m.def("get_handle_isolate", &pypowsybl::getHandleIsolate, "Get the isolate which owns a java object", py::arg("handle"));
+
     m.def("set_config_read", &pypowsybl::setConfigRead, "Set config read mode");
 
     m.def("set_default_loadflow_provider", &pypowsybl::setDefaultLoadFlowProvider, "Set default loadflow provider", py::arg("provider"));
@@ -141,6 +357,13 @@ PYBIND11_MODULE(_pypowsybl, m) {
 
     m.def("is_config_read", &pypowsybl::isConfigRead, "Get config read mode");
 
+    m.def("create_cancel_token", &pypowsybl::createCancelToken, "Create a token to cancel computations",
+          py::arg("parent"), py::arg("deadline"));
+    m.def("cancel", &pypowsybl::cancel, "Cancel the computations of a token", py::arg("cancel_token"));
+    m.def("is_cancelled", &pypowsybl::isCancelled, "Check if a token is cancelled", py::arg("cancel_token"));
+    m.def("is_interrupted", &pypowsybl::isInterrupted, "Check if the computation of a token stopped before its end",
+          py::arg("cancel_token"));
+
     m.def("get_default_loadflow_provider", &pypowsybl::getDefaultLoadFlowProvider, "Get default loadflow provider");
 
     m.def("get_default_security_analysis_provider", &pypowsybl::getDefaultSecurityAnalysisProvider, "Get default security analysis provider");
@@ -157,6 +380,12 @@ PYBIND11_MODULE(_pypowsybl, m) {
 
     m.def("update_connectable_status", &pypowsybl::updateConnectableStatus, "Update a connectable (branch or injection) status");
 
+    m.def("update_switches_positions", &pypowsybl::updateSwitchesPositions, "Update the position of several switches",
+          py::call_guard<py::gil_scoped_release>(), py::arg("network"), py::arg("ids"), py::arg("open"));
+
+    m.def("update_connectables_status", &pypowsybl::updateConnectablesStatus, "Update the status of several connectables (branches or injections)",
+          py::call_guard<py::gil_scoped_release>(), py::arg("network"), py::arg("ids"), py::arg("connected"));
+
     py::enum_<element_type>(m, "ElementType")
             .value("BUS", element_type::BUS)
             .value("LINE", element_type::LINE)
@@ -219,18 +448,29 @@ PYBIND11_MODULE(_pypowsybl, m) {
     m.def("create_exporter_parameters_series_array", &pypowsybl::createExporterParametersSeriesArray, "Create a parameters series array for a given export format",
           py::arg("format"));
 
-    m.def("load_network", &pypowsybl::loadNetwork, "Load a network from a file", py::call_guard<py::gil_scoped_release>(),
-          py::arg("file"), py::arg("parameters"), py::arg("reporter"));
+    m.def("load_network", &::loadNetwork, "Load a network from a file",
+          py::arg("file"), py::arg("parameters"), py::arg("parallelism"), py::arg("skipped_profiles"), py::arg("reporter"),
+          py::arg("progress") = py::none());
 
     m.def("load_network_from_string", &pypowsybl::loadNetworkFromString, "Load a network from a string", py::call_guard<py::gil_scoped_release>(),
           py::arg("file_name"), py::arg("file_content"),py::arg("parameters"), py::arg("reporter"));
 
+    m.def("load_network_from_binary_buffer", [](const std::string& fileName, const py::buffer& buffer, const std::map<std::string, std::string>& parameters,
+                                                 pypowsybl::JavaHandle* reporter) {
+        BinaryBuffer binaryBuffer(buffer);
+        py::gil_scoped_release release;
+        return pypowsybl::loadNetworkFromBinaryBuffer(fileName, binaryBuffer.data(), binaryBuffer.size(), parameters, reporter);
+    }, "Load a network from a binary buffer", py::arg("file_name"), py::arg("buffer"), py::arg("parameters"), py::arg("reporter"));
+
     m.def("dump_network", &pypowsybl::dumpNetwork, "Dump network to a file in a given format", py::call_guard<py::gil_scoped_release>(),
           py::arg("network"), py::arg("file"),py::arg("format"), py::arg("parameters"), py::arg("reporter"));
 
     m.def("dump_network_to_string", &pypowsybl::dumpNetworkToString, "Dump network in a given format", py::call_guard<py::gil_scoped_release>(),
           py::arg("network"), py::arg("format"), py::arg("parameters"), py::arg("reporter"));
 
+    m.def("dump_network_to_binary_buffer", &pypowsybl::dumpNetworkToBinaryBuffer, "Dump network in a given format to a binary buffer", py::call_guard<py::gil_scoped_release>(),
+          py::arg("network"), py::arg("format"), py::arg("parameters"), py::arg("reporter"));
+
     m.def("reduce_network", &pypowsybl::reduceNetwork, "Reduce network", py::call_guard<py::gil_scoped_release>(),
           py::arg("network"), py::arg("v_min"), py::arg("v_max"),
           py::arg("ids"), py::arg("vls"), py::arg("depths"), py::arg("with_dangling_lines"));
@@ -328,6 +568,52 @@ PYBIND11_MODULE(_pypowsybl, m) {
     m.def("run_load_flow", &pypowsybl::runLoadFlow, "Run a load flow", py::call_guard<py::gil_scoped_release>(),
           py::arg("network"), py::arg("dc"), py::arg("parameters"), py::arg("provider"), py::arg("reporter"));
 
+    m.def("run_load_flow_variants", [](const pypowsybl::JavaHandle& network, bool dc, const pypowsybl::LoadFlowParameters& parameters,
+                                       const std::string& provider, const std::vector<std::string>& variantIds, int maxWorkers) {
+              std::vector<pypowsybl::LoadFlowComponentResultArray*> results;
+              {
+                  py::gil_scoped_release release;
+                  results = pypowsybl::runLoadFlowVariants(network, dc, parameters, provider, variantIds, maxWorkers);
+              }
+              py::list resultsList;
+              for (pypowsybl::LoadFlowComponentResultArray* result : results) {
+                  resultsList.append(py::cast(result, py::return_value_policy::take_ownership));
+              }
+              return resultsList;
+          }, "Run load flows on several variants, concurrently",
+          py::arg("network"), py::arg("dc"), py::arg("parameters"), py::arg("provider"), py::arg("variant_ids"), py::arg("max_workers"));
+
+    m.def("run_load_flow_time_series", [](const pypowsybl::JavaHandle& network, bool dc, const pypowsybl::LoadFlowParameters& parameters,
+                                          const std::string& provider, int stepsCount,
+                                          const std::vector<element_type>& profilesElementTypes, const std::vector<std::string>& profilesAttributes,
+                                          const std::vector<std::vector<std::string>>& profilesIds, py::array_t<double, py::array::c_style> profilesValues,
+                                          const std::vector<element_type>& resultsElementTypes, const std::vector<std::string>& resultsAttributes,
+                                          const std::vector<std::vector<std::string>>& resultsIds, py::array_t<double, py::array::c_style> resultsValues,
+                                          py::array_t<int, py::array::c_style> statuses) {
+              size_t profilesSize = 0;
+              for (const std::vector<std::string>& ids : profilesIds) {
+                  profilesSize += stepsCount * ids.size();
+              }
+              size_t resultsSize = 0;
+              for (const std::vector<std::string>& ids : resultsIds) {
+                  resultsSize += stepsCount * ids.size();
+              }
+              if ((size_t) profilesValues.size() != profilesSize || (size_t) resultsValues.size() != resultsSize || statuses.size() != stepsCount) {
+                  throw pypowsybl::PyPowsyblError("Time series arrays do not have the expected size");
+              }
+              double* profilesPtr = profilesValues.mutable_data();
+              double* resultsPtr = resultsValues.mutable_data();
+              int* statusesPtr = statuses.mutable_data();
+              py::gil_scoped_release release;
+              pypowsybl::runLoadFlowTimeSeries(network, dc, parameters, provider, stepsCount,
+                                               profilesElementTypes, profilesAttributes, profilesIds, profilesPtr,
+                                               resultsElementTypes, resultsAttributes, resultsIds, resultsPtr, statusesPtr);
+          }, "Run a load flow for each step of a time series, writing results to the given arrays",
+          py::arg("network"), py::arg("dc"), py::arg("parameters"), py::arg("provider"), py::arg("steps_count"),
+          py::arg("profiles_element_types"), py::arg("profiles_attributes"), py::arg("profiles_ids"), py::arg("profiles_values"),
+          py::arg("results_element_types"), py::arg("results_attributes"), py::arg("results_ids"), py::arg("results_values"),
+          py::arg("statuses"));
+
     m.def("run_load_flow_validation", &pypowsybl::runLoadFlowValidation, "Run a load flow validation", py::arg("network"), py::arg("validation_type"));
 
     m.def("write_single_line_diagram_svg", &pypowsybl::writeSingleLineDiagramSvg, "Write single line diagram SVG",
@@ -346,6 +632,8 @@ PYBIND11_MODULE(_pypowsybl, m) {
 
     m.def("add_contingency", &pypowsybl::addContingency, "Add a contingency to a security analysis or sensitivity analysis",
           py::arg("analysis_context"), py::arg("contingency_id"), py::arg("elements_ids"));
+    m.def("add_contingencies", &pypowsybl::addContingencies, "Add contingencies, given as pairs of contingency and element IDs, to a security analysis or sensitivity analysis",
+          py::call_guard<py::gil_scoped_release>(), py::arg("analysis_context"), py::arg("network"), py::arg("contingency_ids"), py::arg("elements_ids"));
 
     py::enum_<pypowsybl::LimitType>(m, "LimitType")
             .value("CURRENT", pypowsybl::LimitType::CURRENT)
@@ -420,7 +708,23 @@ PYBIND11_MODULE(_pypowsybl, m) {
 
     m.def("run_security_analysis", &pypowsybl::runSecurityAnalysis, "Run a security analysis", py::call_guard<py::gil_scoped_release>(),
           py::arg("security_analysis_context"), py::arg("network"), py::arg("parameters"),
-          py::arg("provider"), py::arg("dc"), py::arg("reporter"));
+          py::arg("provider"), py::arg("dc"), py::arg("reporter"), py::arg("cancel_token"));
+
+    m.def("create_security_analysis_result_stream", &pypowsybl::createSecurityAnalysisResultStream,
+          "Create a bounded buffer of security analysis results", py::arg("capacity"));
+    m.def("run_security_analysis_stream", &pypowsybl::runSecurityAnalysisStream,
+          "Run a security analysis, putting the results of batches of contingencies in a stream", py::call_guard<py::gil_scoped_release>(),
+          py::arg("security_analysis_context"), py::arg("stream"), py::arg("network"), py::arg("parameters"),
+          py::arg("provider"), py::arg("dc"), py::arg("reporter"), py::arg("cancel_token"), py::arg("batch_size"));
+    m.def("get_next_security_analysis_stream_result", &pypowsybl::getNextSecurityAnalysisStreamResult,
+          "Wait at most the given time for the next result of a security analysis stream, None at its end or if there is none in time",
+          py::call_guard<py::gil_scoped_release>(), py::arg("stream"), py::arg("timeout_ms"));
+    m.def("is_security_analysis_result_stream_ended", &pypowsybl::isSecurityAnalysisResultStreamEnded,
+          "Check if the end of a security analysis stream has been reached", py::arg("stream"));
+    m.def("finish_security_analysis_result_stream", &pypowsybl::finishSecurityAnalysisResultStream,
+          "Signal the end of a security analysis result stream, the analysis of which could not be run", py::arg("stream"));
+    m.def("close_security_analysis_result_stream", &pypowsybl::closeSecurityAnalysisResultStream,
+          "Close a security analysis result stream", py::arg("stream"));
 
     m.def("create_sensitivity_analysis", &pypowsybl::createSensitivityAnalysis, "Create run_sea sensitivity analysis");
 
@@ -445,7 +749,8 @@ PYBIND11_MODULE(_pypowsybl, m) {
           py::arg("sensitivity_analysis_context"), py::arg("bus_ids"), py::arg("target_voltage_ids"));
 
     m.def("run_sensitivity_analysis", &pypowsybl::runSensitivityAnalysis, "Run a sensitivity analysis", py::call_guard<py::gil_scoped_release>(),
-          py::arg("sensitivity_analysis_context"), py::arg("network"), py::arg("dc"), py::arg("parameters"), py::arg("provider"), py::arg("reporter"));
+          py::arg("sensitivity_analysis_context"), py::arg("network"), py::arg("dc"), py::arg("parameters"), py::arg("provider"), py::arg("reporter"),
+          py::arg("cancel_token"));
 
     py::class_<matrix>(m, "Matrix", py::buffer_protocol())
             .def_buffer([](matrix& m) -> py::buffer_info {
@@ -476,6 +781,9 @@ PYBIND11_MODULE(_pypowsybl, m) {
             .def_property_readonly("index", [](const series& s) {
                 return (bool) s.index;
             })
+            .def_property_readonly("type", [](const series& s) {
+                return s.type;
+            })
             .def_property_readonly("data", [](const series& s) -> py::object {
                 switch(s.type) {
                     case 0:
@@ -489,9 +797,19 @@ PYBIND11_MODULE(_pypowsybl, m) {
                     default:
                         throw pypowsybl::PyPowsyblError("Series type not supported: " + std::to_string(s.type));
                 }
-            });
+            })
+            .def("__arrow_c_array__", [](const series& s, py::object requestedSchema) {
+                return seriesAsArrowCapsules(s);
+            }, "Export series data as an arrow array, through the arrow C data interface", py::arg("requested_schema") = py::none())
+            .def("dictionary_encoded_data", &seriesAsDictionaryCodes, "Encode string series data as codes of the given dictionary, new values are added to the dictionary",
+                 py::arg("dictionary"));
     bindArray<pypowsybl::SeriesArray>(m, "SeriesArray");
 
+    py::class_<StringDictionary>(m, "StringDictionary", "A dictionary of strings, used to encode string series")
+            .def(py::init<>())
+            .def("__len__", &StringDictionary::size)
+            .def_property_readonly("values", &StringDictionary::values, "Values of the dictionary, ordered by code.");
+
     py::class_<pypowsybl::SeriesMetadata>(m, "SeriesMetadata", "Metadata about one series")
             .def(py::init<const std::string&, int, bool, bool, bool>())
             .def_property_readonly("name", &pypowsybl::SeriesMetadata::name, "Name of this series.")
@@ -507,7 +825,29 @@ PYBIND11_MODULE(_pypowsybl, m) {
         py::arg("element_type"));
 
     m.def("create_network_elements_series_array", &pypowsybl::createNetworkElementsSeriesArray, "Create a network elements series array for a given element type",
-          py::call_guard<py::gil_scoped_release>(), py::arg("network"), py::arg("element_type"), py::arg("filter_attributes_type"), py::arg("attributes"), py::arg("array"));
+          py::call_guard<py::gil_scoped_release>(), py::arg("network"), py::arg("element_type"), py::arg("filter_attributes_type"), py::arg("attributes"), py::arg("array"),
+          py::arg("filter") = py::none());
+
+    m.def("create_network_elements_variants_series_array", &pypowsybl::createNetworkElementsVariantsSeriesArray,
+          "Create a network elements series array for a given element type, stacking the values of several variants",
+          py::call_guard<py::gil_scoped_release>(), py::arg("network"), py::arg("element_type"), py::arg("filter_attributes_type"), py::arg("attributes"), py::arg("array"),
+          py::arg("filter"), py::arg("variant_ids"));
+
+    m.def("create_network_elements_series_arrays", [](const pypowsybl::JavaHandle& network, const std::vector<element_type>& elementTypes,
+                                                     const std::vector<filter_attributes_type>& filterAttributesTypes,
+                                                     const std::vector<std::vector<std::string>>& attributes) {
+              std::vector<pypowsybl::SeriesArray*> seriesArrays;
+              {
+                  py::gil_scoped_release release;
+                  seriesArrays = pypowsybl::createNetworkElementsSeriesArrays(network, elementTypes, filterAttributesTypes, attributes);
+              }
+              py::list result;
+              for (pypowsybl::SeriesArray* seriesArray : seriesArrays) {
+                  result.append(py::cast(seriesArray, py::return_value_policy::take_ownership));
+              }
+              return result;
+          }, "Create network elements series arrays for several element types, in one call",
+          py::arg("network"), py::arg("element_types"), py::arg("filter_attributes_types"), py::arg("attributes"));
 
     m.def("create_network_elements_extension_series_array", &pypowsybl::createNetworkElementsExtensionSeriesArray, "Create a network elements extensions series array for a given extension name",
           py::call_guard<py::gil_scoped_release>(), py::arg("network"), py::arg("extension_name"));
@@ -522,6 +862,24 @@ PYBIND11_MODULE(_pypowsybl, m) {
 
     m.def("get_network_metadata", &pypowsybl::getNetworkMetadata, "get attributes", py::arg("network"));
     m.def("get_working_variant_id", &pypowsybl::getWorkingVariantId, "get the current working variant id", py::arg("network"));
+    py::class_<pypowsybl::ByteArray>(m, "ByteArray", py::buffer_protocol())
+            .def("__len__", [](const pypowsybl::ByteArray& a) {
+                return a.length();
+            })
+            .def_buffer([](pypowsybl::ByteArray& a) -> py::buffer_info {
+                return py::buffer_info(a.begin(), sizeof(char), py::format_descriptor<uint8_t>::format(), a.length());
+            });
+    m.def("serialize_network", &pypowsybl::serializeNetwork, "Serialize a network with all its variants to a binary buffer", py::call_guard<py::gil_scoped_release>(),
+          py::arg("network"), py::arg("compress"));
+    m.def("deserialize_network", [](const py::buffer& buffer) {
+        BinaryBuffer binaryBuffer(buffer);
+        py::gil_scoped_release release;
+        return pypowsybl::deserializeNetwork(binaryBuffer.data(), binaryBuffer.size());
+    }, "Deserialize a network from a binary buffer", py::arg("buffer"));
+    m.def("copy_network", &pypowsybl::copyNetwork, "Copy a network with the given variants", py::call_guard<py::gil_scoped_release>(),
+          py::arg("network"), py::arg("variant_ids"));
+    m.def("get_network_modification_count", &pypowsybl::getNetworkModificationCount, "get the number of modifications of the network elements", py::arg("network"));
+    m.def("get_variant_modification_count", &pypowsybl::getVariantModificationCount, "get the number of modifications of a variant of the network", py::arg("network"), py::arg("variant"));
     m.def("set_working_variant", &pypowsybl::setWorkingVariant, "set working variant", py::arg("network"), py::arg("variant"));
     m.def("remove_variant", &pypowsybl::removeVariant, "remove a variant", py::arg("network"), py::arg("variant"));
     m.def("clone_variant", &pypowsybl::cloneVariant, "clone a variant", py::arg("network"), py::arg("src"), py::arg("variant"), py::arg("may_overwrite"));
@@ -545,6 +903,18 @@ PYBIND11_MODULE(_pypowsybl, m) {
     "get all buses for a voltage level in bus breaker view", py::arg("network"), py::arg("voltage_level"));
     m.def("get_bus_breaker_view_switches", &pypowsybl::getBusBreakerViewSwitches, "get all switches for a voltage level", py::arg("network"), py::arg("voltage_level"));
     m.def("get_limit_violations", &pypowsybl::getLimitViolations, "get limit violations of a security analysis", py::arg("result"));
+    m.def("get_contingency_status", &pypowsybl::getContingencyStatus, "get status of the contingencies of a security analysis", py::arg("result"));
+    m.def("get_security_analysis_contingency_results", &pypowsybl::getSecurityAnalysisContingencyResults,
+          "get result of a security analysis for the given contingencies", py::arg("result"), py::arg("contingency_ids"));
+    m.def("serialize_security_analysis_result", &pypowsybl::serializeSecurityAnalysisResult, "Serialize a security analysis result to a binary buffer",
+          py::call_guard<py::gil_scoped_release>(), py::arg("result"));
+    m.def("deserialize_security_analysis_result", [](const py::buffer& buffer) {
+        BinaryBuffer binaryBuffer(buffer);
+        py::gil_scoped_release release;
+        return pypowsybl::deserializeSecurityAnalysisResult(binaryBuffer.data(), binaryBuffer.size());
+    }, "Deserialize a security analysis result from a binary buffer", py::arg("buffer"));
+    m.def("merge_security_analysis_results", &pypowsybl::mergeSecurityAnalysisResults, "Merge security analysis results run on distinct contingencies",
+          py::call_guard<py::gil_scoped_release>(), py::arg("results"));
 
     m.def("get_branch_results", &pypowsybl::getBranchResults, "create a table with all branch results computed after security analysis",
           py::arg("result"));
@@ -8,35 +8,125 @@
 #include "pylogging.h"
 #include "pypowsybl-java.h"
 #include <iostream>
+#include <mutex>
+#include <algorithm>
 
 namespace pypowsybl {
 
+//main isolate, created when the module is loaded
 graal_isolate_t* isolate = nullptr;
 
+//all isolates, the main one being the first one
+std::vector<graal_isolate_t*> isolates;
+std::mutex isolatesMutex;
+
+//isolate used by the calls of the current thread which do not involve any java object
+thread_local graal_isolate_t* threadIsolate = nullptr;
+
+//isolate of the last call of the current thread, which owns the java objects returned by this call
+thread_local graal_isolate_t* lastIsolate = nullptr;
+
 void init() {
     graal_isolatethread_t* thread = nullptr;
 
     if (graal_create_isolate(nullptr, &isolate, &thread) != 0) {
         throw std::runtime_error("graal_create_isolate error");
     }
+    isolates.push_back(isolate);
+}
+
+int createIsolate() {
+    graal_isolate_t* created = nullptr;
+    graal_isolatethread_t* thread = nullptr;
+
+    if (graal_create_isolate(nullptr, &created, &thread) != 0) {
+        throw std::runtime_error("graal_create_isolate error");
+    }
+    //the creating thread is attached to the new isolate: detached, so that calls attach their thread themselves
+    if (graal_detach_thread(thread) != 0) {
+        throw std::runtime_error("graal_detach_thread error");
+    }
+    std::lock_guard<std::mutex> guard(isolatesMutex);
+    isolates.push_back(created);
+    return isolates.size() - 1;
+}
+
+graal_isolate_t* getIsolate(int isolateId) {
+    std::lock_guard<std::mutex> guard(isolatesMutex);
+    if (isolateId < 0 || isolateId >= isolates.size()) {
+        throw PyPowsyblError("Isolate " + std::to_string(isolateId) + " does not exist");
+    }
+    return isolates[isolateId];
+}
+
+int getIsolateId(graal_isolate_t* isolateToFind) {
+    std::lock_guard<std::mutex> guard(isolatesMutex);
+    return std::find(isolates.begin(), isolates.end(), isolateToFind) - isolates.begin();
+}
+
+graal_isolate_t* getDefaultIsolate() {
+    return threadIsolate != nullptr ? threadIsolate : isolate;
+}
+
+void setThreadIsolate(int isolateId) {
+    threadIsolate = getIsolate(isolateId);
+}
+
+int getThreadIsolate() {
+    return getIsolateId(getDefaultIsolate());
+}
+
+int getHandleIsolate(const JavaHandle& handle) {
+    return getIsolateId((graal_isolate_t*) handle.isolate());
+}
+
+//a call is made in the isolate of the java objects it involves, if any,
+//otherwise in the isolate of the current thread
+graal_isolate_t* selectIsolate(graal_isolate_t* selected) {
+    return selected != nullptr ? selected : getDefaultIsolate();
+}
+
+template<typename T, typename... ARGS>
+graal_isolate_t* selectIsolate(graal_isolate_t* selected, const T& arg, const ARGS&... args);
+
+template<typename... ARGS>
+graal_isolate_t* selectIsolate(graal_isolate_t* selected, const JavaHandle& handle, const ARGS&... args);
+
+template<typename T, typename... ARGS>
+graal_isolate_t* selectIsolate(graal_isolate_t* selected, const T& arg, const ARGS&... args) {
+    return selectIsolate(selected, args...);
+}
+
+template<typename... ARGS>
+graal_isolate_t* selectIsolate(graal_isolate_t* selected, const JavaHandle& handle, const ARGS&... args) {
+    if (handle.isNull()) {
+        return selectIsolate(selected, args...);
+    }
+    graal_isolate_t* handleIsolate = (graal_isolate_t*) handle.isolate();
+    if (selected != nullptr && selected != handleIsolate) {
+        throw PyPowsyblError("Objects of different isolates cannot be used together");
+    }
+    return selectIsolate(handleIsolate, args...);
 }
 
 class GraalVmGuard {
 public:
-    GraalVmGuard() {
-        if (!isolate) {
+    explicit GraalVmGuard(graal_isolate_t* target)
+        : isolate_(target) {
+        if (!isolate_) {
             throw std::runtime_error("isolate has not been created");
         }
         //if thread already attached to the isolate,
         //we assume it's a nested call --> do nothing
 
-        thread_ = graal_get_current_thread(isolate);
+        thread_ = graal_get_current_thread(isolate_);
         if (thread_ == nullptr) {
-            if (graal_attach_thread(isolate, &thread_) != 0) {
+            if (graal_attach_thread(isolate_, &thread_) != 0) {
                 throw std::runtime_error("graal_create_isolate error");
             }
             shouldDetach = true;
        }
+       lastIsolate = isolate_;
     }
 
     ~GraalVmGuard() noexcept(false) {
@@ -49,7 +139,12 @@ public:
         return thread_;
     }
 
+    graal_isolate_t * isolate() const {
+        return isolate_;
+    }
+
 private:
+    graal_isolate_t* isolate_ = nullptr;
     bool shouldDetach = false;
     graal_isolatethread_t* thread_ = nullptr;
 };
@@ -68,8 +163,8 @@ void setLogLevelFromPythonLogger(GraalVmGuard* guard, exception_handler* exc) {
 }
 
 template<typename F, typename... ARGS>
-void callJava(F f, ARGS... args) {
-    GraalVmGuard guard;
+void callJavaInIsolate(graal_isolate_t* target, F f, ARGS... args) {
+    GraalVmGuard guard(target);
     exception_handler exc;
 
     setLogLevelFromPythonLogger(&guard, &exc);
@@ -86,9 +181,14 @@ void callJava(F f, ARGS... args) {
     }
 }
 
+template<typename F, typename... ARGS>
+void callJava(F f, ARGS... args) {
+    callJavaInIsolate(selectIsolate(nullptr, args...), f, args...);
+}
+
 template<typename T, typename F, typename... ARGS>
 T callJava(F f, ARGS... args) {
-    GraalVmGuard guard;
+    GraalVmGuard guard(selectIsolate(nullptr, args...));
     exception_handler exc;
 
     setLogLevelFromPythonLogger(&guard, &exc);
@@ -103,27 +203,35 @@ T callJava(F f, ARGS... args) {
             throw py::error_already_set();
         }
     }
+    //returned java objects are owned by this isolate, even if other calls have been nested
+    lastIsolate = guard.isolate();
     return r;
 }
 
-//Destruction of java object when the shared_ptr has no more references
+void* getLastCallIsolate() {
+    return lastIsolate != nullptr ? lastIsolate : getDefaultIsolate();
+}
+
+//Destruction of java object, in the isolate which owns it, when the shared_ptr has no more references
 JavaHandle::JavaHandle(void* handle):
-    handle_(handle, [](void* to_be_deleted) {
+    isolate_(getLastCallIsolate())
+{
+    graal_isolate_t* owner = (graal_isolate_t*) isolate_;
+    handle_ = std::shared_ptr<void>(handle, [owner](void* to_be_deleted) {
         if (to_be_deleted) {
-            callJava<>(::destroyObjectHandle, to_be_deleted);
+            callJavaInIsolate(owner, ::destroyObjectHandle, to_be_deleted);
         }
-    })
-{
+    });
 }
 
 template<>
 Array<load_flow_component_result>::~Array() {
-    callJava<>(::freeLoadFlowComponentResultPointer, delegate_);
+    callJavaInIsolate((graal_isolate_t*) isolate_, ::freeLoadFlowComponentResultPointer, delegate_);
 }
 
 template<>
 Array<contingency_result>::~Array() {
-    callJava<>(::freeContingencyResultArrayPointer, delegate_);
+    callJavaInIsolate((graal_isolate_t*) isolate_, ::freeContingencyResultArrayPointer, delegate_);
 }
 
 template<>
@@ -133,7 +241,12 @@ Array<limit_violation>::~Array() {
 
 template<>
 Array<series>::~Array() {
-    callJava<>(::freeSeriesArray, delegate_);
+    callJavaInIsolate((graal_isolate_t*) isolate_, ::freeSeriesArray, delegate_);
+}
+
+template<>
+Array<char>::~Array() {
+    callJavaInIsolate((graal_isolate_t*) isolate_, ::freeArray, delegate_);
 }
 
 template<typename T>
@@ -466,6 +579,22 @@ bool isConfigRead() {
     return callJava<bool>(::isConfigRead);
 }
 
+JavaHandle createCancelToken(JavaHandle* parent, long deadline) {
+    return callJava<JavaHandle>(::createCancelToken, (parent == nullptr) ? nullptr : *parent, deadline);
+}
+
+void cancel(const JavaHandle& cancelToken) {
+    callJava(::cancel, cancelToken);
+}
+
+bool isCancelled(const JavaHandle& cancelToken) {
+    return callJava<bool>(::isCancelled, cancelToken);
+}
+
+bool isInterrupted(const JavaHandle& cancelToken) {
+    return callJava<bool>(::isInterrupted, cancelToken);
+}
+
 std::string getVersionTable() {
     return toString(callJava<char*>(::getVersionTable));
 }
@@ -532,7 +661,8 @@ std::shared_ptr<network_metadata> getNetworkMetadata(const JavaHandle& network)
     });
 }
 
-JavaHandle loadNetwork(const std::string& file, const std::map<std::string, std::string>& parameters, JavaHandle* reporter) {
+JavaHandle loadNetwork(const std::string& file, const std::map<std::string, std::string>& parameters, int parallelism,
+                       const std::vector<std::string>& skippedProfiles, JavaHandle* reporter, void* progressCallback) {
     std::vector<std::string> parameterNames;
     std::vector<std::string> parameterValues;
     parameterNames.reserve(parameters.size());
@@ -543,8 +673,10 @@ JavaHandle loadNetwork(const std::string& file, const std::map<std::string, std:
     }
     ToCharPtrPtr parameterNamesPtr(parameterNames);
     ToCharPtrPtr parameterValuesPtr(parameterValues);
+    ToCharPtrPtr skippedProfilesPtr(skippedProfiles);
     return callJava<JavaHandle>(::loadNetwork, (char*) file.data(), parameterNamesPtr.get(), parameterNames.size(),
-                              parameterValuesPtr.get(), parameterValues.size(), (reporter == nullptr) ? nullptr : *reporter);
+                              parameterValuesPtr.get(), parameterValues.size(), parallelism, skippedProfilesPtr.get(), skippedProfiles.size(),
+                              (reporter == nullptr) ? nullptr : *reporter, progressCallback);
 }
 
 JavaHandle loadNetworkFromString(const std::string& fileName, const std::string& fileContent, const std::map<std::string, std::string>& parameters, JavaHandle* reporter) {
@@ -563,6 +695,22 @@ JavaHandle loadNetworkFromString(const std::string& fileName, const std::string&
                            parameterValuesPtr.get(), parameterValues.size(), (reporter == nullptr) ? nullptr : *reporter);
 }
 
+JavaHandle loadNetworkFromBinaryBuffer(const std::string& fileName, const char* data, int size, const std::map<std::string, std::string>& parameters, JavaHandle* reporter) {
+    std::vector<std::string> parameterNames;
+    std::vector<std::string> parameterValues;
+    parameterNames.reserve(parameters.size());
+    parameterValues.reserve(parameters.size());
+    for (std::pair<std::string, std::string> p : parameters) {
+        parameterNames.push_back(p.first);
+        parameterValues.push_back(p.second);
+    }
+    ToCharPtrPtr parameterNamesPtr(parameterNames);
+    ToCharPtrPtr parameterValuesPtr(parameterValues);
+    return callJava<JavaHandle>(::loadNetworkFromBinaryBuffer, (char*) fileName.data(), (char*) data, size,
+                           parameterNamesPtr.get(), parameterNames.size(),
+                           parameterValuesPtr.get(), parameterValues.size(), (reporter == nullptr) ? nullptr : *reporter);
+}
+
 void dumpNetwork(const JavaHandle& network, const std::string& file, const std::string& format, const std::map<std::string, std::string>& parameters, JavaHandle* reporter) {
     std::vector<std::string> parameterNames;
     std::vector<std::string> parameterValues;
@@ -593,6 +741,21 @@ std::string dumpNetworkToString(const JavaHandle& network, const std::string& fo
              parameterValuesPtr.get(), parameterValues.size(), (reporter == nullptr) ? nullptr : *reporter));
 }
 
+ByteArray* dumpNetworkToBinaryBuffer(const JavaHandle& network, const std::string& format, const std::map<std::string, std::string>& parameters, JavaHandle* reporter) {
+    std::vector<std::string> parameterNames;
+    std::vector<std::string> parameterValues;
+    parameterNames.reserve(parameters.size());
+    parameterValues.reserve(parameters.size());
+    for (std::pair<std::string, std::string> p : parameters) {
+        parameterNames.push_back(p.first);
+        parameterValues.push_back(p.second);
+    }
+    ToCharPtrPtr parameterNamesPtr(parameterNames);
+    ToCharPtrPtr parameterValuesPtr(parameterValues);
+    return new ByteArray(callJava<array*>(::dumpNetworkToBinaryBuffer, network, (char*) format.data(), parameterNamesPtr.get(), parameterNames.size(),
+             parameterValuesPtr.get(), parameterValues.size(), (reporter == nullptr) ? nullptr : *reporter));
+}
+
 void reduceNetwork(const JavaHandle& network, double v_min, double v_max, const std::vector<std::string>& ids,
                    const std::vector<std::string>& vls, const std::vector<int>& depths, bool withDangLingLines) {
     ToCharPtrPtr elementIdPtr(ids);
@@ -609,6 +772,30 @@ bool updateConnectableStatus(const JavaHandle& network, const std::string& id, b
     return callJava<bool>(::updateConnectableStatus, network, (char*) id.data(), connected);
 }
 
+std::vector<bool> toBoolVector(array* arrayPtr) {
+    ToPrimitiveVector<int> ints(arrayPtr);
+    std::vector<int> values = ints.get();
+    return std::vector<bool>(values.begin(), values.end());
+}
+
+std::vector<bool> updateSwitchesPositions(const JavaHandle& network, const std::vector<std::string>& ids, const std::vector<int>& open) {
+    if (ids.size() != open.size()) {
+        throw PyPowsyblError("Ids and open flags must have the same size");
+    }
+    ToCharPtrPtr idsPtr(ids);
+    ToIntPtr openPtr(open);
+    return toBoolVector(callJava<array*>(::updateSwitchesPositions, network, idsPtr.get(), openPtr.get(), ids.size()));
+}
+
+std::vector<bool> updateConnectablesStatus(const JavaHandle& network, const std::vector<std::string>& ids, const std::vector<int>& connected) {
+    if (ids.size() != connected.size()) {
+        throw PyPowsyblError("Ids and connected flags must have the same size");
+    }
+    ToCharPtrPtr idsPtr(ids);
+    ToIntPtr connectedPtr(connected);
+    return toBoolVector(callJava<array*>(::updateConnectablesStatus, network, idsPtr.get(), connectedPtr.get(), ids.size()));
+}
+
 std::vector<std::string> getNetworkElementsIds(const JavaHandle& network, element_type elementType, const std::vector<double>& nominalVoltages,
                                                const std::vector<std::string>& countries, bool mainCc, bool mainSc,
                                                bool notConnectedToSameBusAtBothSides) {
@@ -655,6 +842,50 @@ LoadFlowComponentResultArray* runLoadFlow(const JavaHandle& network, bool dc, co
             callJava<array*>(::runLoadFlow, network, dc, c_parameters.get(), (char *) provider.data(), (reporter == nullptr) ? nullptr : *reporter));
 }
 
+void runLoadFlowTimeSeries(const JavaHandle& network, bool dc, const LoadFlowParameters& parameters, const std::string& provider, int stepsCount,
+                           const std::vector<element_type>& profilesElementTypes, const std::vector<std::string>& profilesAttributes,
+                           const std::vector<std::vector<std::string>>& profilesIds, double* profilesValues,
+                           const std::vector<element_type>& resultsElementTypes, const std::vector<std::string>& resultsAttributes,
+                           const std::vector<std::vector<std::string>>& resultsIds, double* resultsValues, int* statuses) {
+    auto c_parameters = parameters.to_c_struct();
+    std::vector<int> profilesTypes(profilesElementTypes.begin(), profilesElementTypes.end());
+    std::vector<int> resultsTypes(resultsElementTypes.begin(), resultsElementTypes.end());
+    std::vector<std::string> allProfilesIds;
+    std::vector<int> profilesIdsCounts;
+    for (const std::vector<std::string>& ids : profilesIds) {
+        allProfilesIds.insert(allProfilesIds.end(), ids.begin(), ids.end());
+        profilesIdsCounts.push_back(ids.size());
+    }
+    std::vector<std::string> allResultsIds;
+    std::vector<int> resultsIdsCounts;
+    for (const std::vector<std::string>& ids : resultsIds) {
+        allResultsIds.insert(allResultsIds.end(), ids.begin(), ids.end());
+        resultsIdsCounts.push_back(ids.size());
+    }
+    ToCharPtrPtr profilesAttributesPtr(profilesAttributes);
+    ToCharPtrPtr profilesIdsPtr(allProfilesIds);
+    ToCharPtrPtr resultsAttributesPtr(resultsAttributes);
+    ToCharPtrPtr resultsIdsPtr(allResultsIds);
+    callJava(::runLoadFlowTimeSeries, network, dc, c_parameters.get(), (char *) provider.data(), stepsCount,
+             profilesTypes.data(), profilesAttributesPtr.get(), profilesIdsPtr.get(), profilesIdsCounts.data(), (int) profilesTypes.size(), profilesValues,
+             resultsTypes.data(), resultsAttributesPtr.get(), resultsIdsPtr.get(), resultsIdsCounts.data(), (int) resultsTypes.size(), resultsValues,
+             statuses);
+}
+
+std::vector<LoadFlowComponentResultArray*> runLoadFlowVariants(const JavaHandle& network, bool dc, const LoadFlowParameters& parameters, const std::string& provider,
+                                                               const std::vector<std::string>& variantIds, int maxWorkers) {
+    auto c_parameters = parameters.to_c_struct();
+    ToCharPtrPtr variantIdsPtr(variantIds);
+    array* resultsPtr = callJava<array*>(::runLoadFlowVariants, network, dc, c_parameters.get(), (char *) provider.data(),
+                                         variantIdsPtr.get(), variantIds.size(), maxWorkers);
+    std::vector<LoadFlowComponentResultArray*> results;
+    for (int i = 0; i < resultsPtr->length; i++) {
+        results.push_back(new LoadFlowComponentResultArray(((array**) resultsPtr->ptr)[i]));
+    }
+    callJava<>(::freeArray, resultsPtr);
+    return results;
+}
+
 SeriesArray* runLoadFlowValidation(const JavaHandle& network, validation_type validationType) {
     return new SeriesArray(callJava<array*>(::runLoadFlowValidation, network, validationType));
 }
@@ -686,10 +917,51 @@ void addContingency(const JavaHandle& analysisContext, const std::string& contin
     callJava(::addContingency, analysisContext, (char*) contingencyId.data(), elementIdPtr.get(), elementsIds.size());
 }
 
+SeriesArray* addContingencies(const JavaHandle& analysisContext, JavaHandle* network, const std::vector<std::string>& contingencyIds,
+                              const std::vector<std::string>& elementsIds) {
+    if (contingencyIds.size() != elementsIds.size()) {
+        throw PyPowsyblError("Contingency IDs and element IDs must have the same size");
+    }
+    ToCharPtrPtr contingencyIdPtr(contingencyIds);
+    ToCharPtrPtr elementIdPtr(elementsIds);
+    return new SeriesArray(callJava<array*>(::addContingencies, analysisContext, (network == nullptr) ? nullptr : *network,
+                                            contingencyIdPtr.get(), elementIdPtr.get(), contingencyIds.size()));
+}
+
 JavaHandle runSecurityAnalysis(const JavaHandle& securityAnalysisContext, const JavaHandle& network, const SecurityAnalysisParameters& parameters,
-                               const std::string& provider, bool dc, JavaHandle* reporter) {
+                               const std::string& provider, bool dc, JavaHandle* reporter, JavaHandle* cancelToken) {
+    auto c_parameters = parameters.to_c_struct();
+    return callJava<JavaHandle>(::runSecurityAnalysis, securityAnalysisContext, network, c_parameters.get(), (char *) provider.data(), dc, (reporter == nullptr) ? nullptr : *reporter,
+                                (cancelToken == nullptr) ? nullptr : *cancelToken);
+}
+
+JavaHandle createSecurityAnalysisResultStream(int capacity) {
+    return callJava<JavaHandle>(::createSecurityAnalysisResultStream, capacity);
+}
+
+void runSecurityAnalysisStream(const JavaHandle& securityAnalysisContext, const JavaHandle& stream, const JavaHandle& network, const SecurityAnalysisParameters& parameters,
+                               const std::string& provider, bool dc, JavaHandle* reporter, JavaHandle* cancelToken, int batchSize) {
     auto c_parameters = parameters.to_c_struct();
-    return callJava<JavaHandle>(::runSecurityAnalysis, securityAnalysisContext, network, c_parameters.get(), (char *) provider.data(), dc, (reporter == nullptr) ? nullptr : *reporter);
+    callJava(::runSecurityAnalysisStream, securityAnalysisContext, stream, network, c_parameters.get(), (char *) provider.data(), dc,
+             (reporter == nullptr) ? nullptr : *reporter, (cancelToken == nullptr) ? nullptr : *cancelToken, batchSize);
+}
+
+JavaHandle* getNextSecurityAnalysisStreamResult(const JavaHandle& stream, int timeoutMs) {
+    JavaHandle result = callJava<JavaHandle>(::getNextSecurityAnalysisStreamResult, stream, timeoutMs);
+    //the end of the stream, or no result in time, is a null handle
+    return result.isNull() ? nullptr : new JavaHandle(result);
+}
+
+bool isSecurityAnalysisResultStreamEnded(const JavaHandle& stream) {
+    return callJava<bool>(::isSecurityAnalysisResultStreamEnded, stream);
+}
+
+void finishSecurityAnalysisResultStream(const JavaHandle& stream) {
+    callJava(::finishSecurityAnalysisResultStream, stream);
+}
+
+void closeSecurityAnalysisResultStream(const JavaHandle& stream) {
+    callJava(::closeSecurityAnalysisResultStream, stream);
 }
 
 JavaHandle createSensitivityAnalysis() {
@@ -778,9 +1050,10 @@ void setBusVoltageFactorMatrix(const JavaHandle& sensitivityAnalysisContext, con
                 busIds.size(), targetVoltageIdPtr.get(), targetVoltageIds.size());
 }
 
-JavaHandle runSensitivityAnalysis(const JavaHandle& sensitivityAnalysisContext, const JavaHandle& network, bool dc, SensitivityAnalysisParameters& parameters, const std::string& provider, JavaHandle* reporter) {
+JavaHandle runSensitivityAnalysis(const JavaHandle& sensitivityAnalysisContext, const JavaHandle& network, bool dc, SensitivityAnalysisParameters& parameters, const std::string& provider, JavaHandle* reporter, JavaHandle* cancelToken) {
     auto c_parameters = parameters.to_c_struct();
-    return callJava<JavaHandle>(::runSensitivityAnalysis, sensitivityAnalysisContext, network, dc, c_parameters.get(), (char *) provider.data(), (reporter == nullptr) ? nullptr : *reporter);
+    return callJava<JavaHandle>(::runSensitivityAnalysis, sensitivityAnalysisContext, network, dc, c_parameters.get(), (char *) provider.data(), (reporter == nullptr) ? nullptr : *reporter,
+                                (cancelToken == nullptr) ? nullptr : *cancelToken);
 }
 
 matrix* getBranchFlowsSensitivityMatrix(const JavaHandle& sensitivityAnalysisResultContext, const std::string& matrixId, const std::string& contingencyId) {
@@ -803,9 +1076,36 @@ matrix* getReferenceVoltages(const JavaHandle& sensitivityAnalysisResultContext,
                                 (char*) contingencyId.c_str());
 }
 
-SeriesArray* createNetworkElementsSeriesArray(const JavaHandle& network, element_type elementType, filter_attributes_type filterAttributesType, const std::vector<std::string>& attributes, dataframe* dataframe) {
+SeriesArray* createNetworkElementsSeriesArray(const JavaHandle& network, element_type elementType, filter_attributes_type filterAttributesType, const std::vector<std::string>& attributes, dataframe* dataframe, dataframe* filter) {
 	ToCharPtrPtr attributesPtr(attributes);
-    return new SeriesArray(callJava<array*>(::createNetworkElementsSeriesArray, network, elementType, filterAttributesType, attributesPtr.get(), attributes.size(), dataframe));
+    return new SeriesArray(callJava<array*>(::createNetworkElementsSeriesArray, network, elementType, filterAttributesType, attributesPtr.get(), attributes.size(), dataframe, filter));
+}
+
+SeriesArray* createNetworkElementsVariantsSeriesArray(const JavaHandle& network, element_type elementType, filter_attributes_type filterAttributesType, const std::vector<std::string>& attributes, dataframe* dataframe, dataframe* filter, const std::vector<std::string>& variantIds) {
+    ToCharPtrPtr attributesPtr(attributes);
+    ToCharPtrPtr variantIdsPtr(variantIds);
+    return new SeriesArray(callJava<array*>(::createNetworkElementsVariantsSeriesArray, network, elementType, filterAttributesType, attributesPtr.get(), attributes.size(), dataframe, filter,
+                                            variantIdsPtr.get(), variantIds.size()));
+}
+
+std::vector<SeriesArray*> createNetworkElementsSeriesArrays(const JavaHandle& network, const std::vector<element_type>& elementTypes, const std::vector<filter_attributes_type>& filterAttributesTypes, const std::vector<std::vector<std::string>>& attributes) {
+    std::vector<int> types(elementTypes.begin(), elementTypes.end());
+    std::vector<int> filterTypes(filterAttributesTypes.begin(), filterAttributesTypes.end());
+    std::vector<std::string> allAttributes;
+    std::vector<int> attributesCounts;
+    for (const std::vector<std::string>& typeAttributes : attributes) {
+        allAttributes.insert(allAttributes.end(), typeAttributes.begin(), typeAttributes.end());
+        attributesCounts.push_back(typeAttributes.size());
+    }
+    ToCharPtrPtr attributesPtr(allAttributes);
+    array* seriesArraysPtr = callJava<array*>(::createNetworkElementsSeriesArrays, network, types.data(), filterTypes.data(), attributesPtr.get(),
+                                              attributesCounts.data(), (int) types.size());
+    std::vector<SeriesArray*> seriesArrays;
+    for (int i = 0; i < seriesArraysPtr->length; i++) {
+        seriesArrays.push_back(new SeriesArray(((array**) seriesArraysPtr->ptr)[i]));
+    }
+    callJava<>(::freeArray, seriesArraysPtr);
+    return seriesArrays;
 }
 
 SeriesArray* createNetworkElementsExtensionSeriesArray(const JavaHandle& network, const std::string& extensionName) {
@@ -822,6 +1122,27 @@ std::string getWorkingVariantId(const JavaHandle& network) {
     return toString(callJava<char*>(::getWorkingVariantId, network));
 }
 
+ByteArray* serializeNetwork(const JavaHandle& network, bool compress) {
+    return new ByteArray(callJava<array*>(::serializeNetwork, network, compress));
+}
+
+JavaHandle deserializeNetwork(const char* data, int size) {
+    return callJava<JavaHandle>(::deserializeNetwork, (char*) data, size);
+}
+
+JavaHandle copyNetwork(const JavaHandle& network, const std::vector<std::string>& variantIds) {
+    ToCharPtrPtr variantIdsPtr(variantIds);
+    return callJava<JavaHandle>(::copyNetwork, network, variantIdsPtr.get(), variantIds.size());
+}
+
+long getNetworkModificationCount(const JavaHandle& network) {
+    return callJava<long>(::getNetworkModificationCount, network);
+}
+
+long getVariantModificationCount(const JavaHandle& network, std::string& variant) {
+    return callJava<long>(::getVariantModificationCount, network, (char*) variant.c_str());
+}
+
 void setWorkingVariant(const JavaHandle& network, std::string& variant) {
     callJava<>(::setWorkingVariant, network, (char*) variant.c_str());
 }
@@ -860,6 +1181,34 @@ SeriesArray* getLimitViolations(const JavaHandle& securityAnalysisResult) {
     return new SeriesArray(callJava<array*>(::getLimitViolations, securityAnalysisResult));
 }
 
+SeriesArray* getContingencyStatus(const JavaHandle& securityAnalysisResult) {
+    return new SeriesArray(callJava<array*>(::getContingencyStatus, securityAnalysisResult));
+}
+
+ContingencyResultArray* getSecurityAnalysisContingencyResults(const JavaHandle& securityAnalysisResult, const std::vector<std::string>& contingencyIds) {
+    ToCharPtrPtr contingencyIdsPtr(contingencyIds);
+    return new ContingencyResultArray(callJava<array*>(::getSecurityAnalysisContingencyResults, securityAnalysisResult,
+                                                       contingencyIdsPtr.get(), contingencyIds.size()));
+}
+
+ByteArray* serializeSecurityAnalysisResult(const JavaHandle& securityAnalysisResult) {
+    return new ByteArray(callJava<array*>(::serializeSecurityAnalysisResult, securityAnalysisResult));
+}
+
+JavaHandle deserializeSecurityAnalysisResult(const char* data, int size) {
+    return callJava<JavaHandle>(::deserializeSecurityAnalysisResult, (char*) data, size);
+}
+
+JavaHandle mergeSecurityAnalysisResults(std::vector<JavaHandle>& securityAnalysisResults) {
+    std::vector<void*> resultsPtrs;
+    resultsPtrs.reserve(securityAnalysisResults.size());
+    for(int i = 0; i < securityAnalysisResults.size(); ++i) {
+      void* ptr = securityAnalysisResults[i];
+      resultsPtrs.push_back(ptr);
+    }
+    return callJava<JavaHandle>(::mergeSecurityAnalysisResults, (void**) resultsPtrs.data(), (int) resultsPtrs.size());
+}
+
 SeriesArray* getBranchResults(const JavaHandle& securityAnalysisResult) {
     return new SeriesArray(callJava<array*>(::getBranchResults, securityAnalysisResult));
 }
@@ -42,17 +42,31 @@ public:
         return handle_.get();
     }
 
+    bool isNull() const {
+        return handle_.get() == nullptr;
+    }
+
+    //The isolate which owns the java object
+    void* isolate() const {
+        return isolate_;
+    }
+
 private:
+    void* isolate_;
+
     //Object handle destruction will be called when no more reference
     std::shared_ptr<void> handle_;
 };
 
 
+//The isolate which owns the java objects returned by the last call of the current thread
+void* getLastCallIsolate();
+
 template<typename T>
 class Array {
 public:
     explicit Array(array* delegate)
-        : delegate_(delegate) {
+        : isolate_(getLastCallIsolate()), delegate_(delegate) {
     }
 
     int length() const { return delegate_->length; }
@@ -64,6 +78,8 @@ public:
     ~Array();
 
 private:
+    //The isolate which owns the java memory, where it must be freed
+    void* isolate_;
     array* delegate_;
 };
 
@@ -71,6 +87,7 @@ typedef Array<load_flow_component_result> LoadFlowComponentResultArray;
 typedef Array<contingency_result> ContingencyResultArray;
 typedef Array<limit_violation> LimitViolationArray;
 typedef Array<series> SeriesArray;
+typedef Array<char> ByteArray;
 
 
 template<typename T>
@@ -227,6 +244,14 @@ void deleteCharPtrPtr(char** charPtrPtr, int length);
 
 void init();
 
+int createIsolate();
+
+void setThreadIsolate(int isolateId);
+
+int getThreadIsolate();
+
+int getHandleIsolate(const JavaHandle& handle);
+
 void setJavaLibraryPath(const std::string& javaLibraryPath);
 
 void setConfigRead(bool configRead);
@@ -239,6 +264,14 @@ void setDefaultSensitivityAnalysisProvider(const std::string& sensitivityAnalysi
 
 bool isConfigRead();
 
+JavaHandle createCancelToken(JavaHandle* parent, long deadline);
+
+void cancel(const JavaHandle& cancelToken);
+
+bool isCancelled(const JavaHandle& cancelToken);
+
+bool isInterrupted(const JavaHandle& cancelToken);
+
 std::string getDefaultLoadFlowProvider();
 
 std::string getDefaultSecurityAnalysisProvider();
@@ -255,6 +288,10 @@ bool updateSwitchPosition(const JavaHandle& network, const std::string& id, bool
 
 bool updateConnectableStatus(const JavaHandle& network, const std::string& id, bool connected);
 
+std::vector<bool> updateSwitchesPositions(const JavaHandle& network, const std::vector<std::string>& ids, const std::vector<int>& open);
+
+std::vector<bool> updateConnectablesStatus(const JavaHandle& network, const std::vector<std::string>& ids, const std::vector<int>& connected);
+
 std::vector<std::string> getNetworkElementsIds(const JavaHandle& network, element_type elementType, const std::vector<double>& nominalVoltages,
                                                const std::vector<std::string>& countries, bool mainCc, bool mainSc,
                                                bool notConnectedToSameBusAtBothSides);
@@ -275,7 +312,8 @@ SeriesArray* createExporterParametersSeriesArray(const std::string& format);
 
 std::shared_ptr<network_metadata> getNetworkMetadata(const JavaHandle& network);
 
-JavaHandle loadNetwork(const std::string& file, const std::map<std::string, std::string>& parameters, JavaHandle* reporter);
+JavaHandle loadNetwork(const std::string& file, const std::map<std::string, std::string>& parameters, int parallelism,
+                       const std::vector<std::string>& skippedProfiles, JavaHandle* reporter, void* progressCallback);
 
 JavaHandle loadNetworkFromString(const std::string& fileName, const std::string& fileContent, const std::map<std::string, std::string>& parameters, JavaHandle* reporter);
 
@@ -299,6 +337,15 @@ void reduceNetwork(const JavaHandle& network, const double v_min, const double v
 
 LoadFlowComponentResultArray* runLoadFlow(const JavaHandle& network, bool dc, const LoadFlowParameters& parameters, const std::string& provider, JavaHandle* reporter);
 
+void runLoadFlowTimeSeries(const JavaHandle& network, bool dc, const LoadFlowParameters& parameters, const std::string& provider, int stepsCount,
+                           const std::vector<element_type>& profilesElementTypes, const std::vector<std::string>& profilesAttributes,
+                           const std::vector<std::vector<std::string>>& profilesIds, double* profilesValues,
+                           const std::vector<element_type>& resultsElementTypes, const std::vector<std::string>& resultsAttributes,
+                           const std::vector<std::vector<std::string>>& resultsIds, double* resultsValues, int* statuses);
+
+std::vector<LoadFlowComponentResultArray*> runLoadFlowVariants(const JavaHandle& network, bool dc, const LoadFlowParameters& parameters, const std::string& provider,
+                                                               const std::vector<std::string>& variantIds, int maxWorkers);
+
 SeriesArray* runLoadFlowValidation(const JavaHandle& network, validation_type validationType);
 
 void writeSingleLineDiagramSvg(const JavaHandle& network, const std::string& containerId, const std::string& svgFile);
@@ -313,7 +360,23 @@ JavaHandle createSecurityAnalysis();
 
 void addContingency(const JavaHandle& analysisContext, const std::string& contingencyId, const std::vector<std::string>& elementsIds);
 
-JavaHandle runSecurityAnalysis(const JavaHandle& securityAnalysisContext, const JavaHandle& network, const SecurityAnalysisParameters& parameters, const std::string& provider, bool dc, JavaHandle* reporter);
+SeriesArray* addContingencies(const JavaHandle& analysisContext, JavaHandle* network, const std::vector<std::string>& contingencyIds,
+                              const std::vector<std::string>& elementsIds);
+
+JavaHandle runSecurityAnalysis(const JavaHandle& securityAnalysisContext, const JavaHandle& network, const SecurityAnalysisParameters& parameters, const std::string& provider, bool dc, JavaHandle* reporter, JavaHandle* cancelToken);
+
+JavaHandle createSecurityAnalysisResultStream(int capacity);
+
+void runSecurityAnalysisStream(const JavaHandle& securityAnalysisContext, const JavaHandle& stream, const JavaHandle& network, const SecurityAnalysisParameters& parameters,
+                               const std::string& provider, bool dc, JavaHandle* reporter, JavaHandle* cancelToken, int batchSize);
+
+JavaHandle* getNextSecurityAnalysisStreamResult(const JavaHandle& stream, int timeoutMs);
+
+bool isSecurityAnalysisResultStreamEnded(const JavaHandle& stream);
+
+void finishSecurityAnalysisResultStream(const JavaHandle& stream);
+
+void closeSecurityAnalysisResultStream(const JavaHandle& stream);
 
 JavaHandle createSensitivityAnalysis();
 
@@ -330,7 +393,7 @@ void addPostContingencyBranchFlowFactorMatrix(const JavaHandle& sensitivityAnaly
 
 void setBusVoltageFactorMatrix(const JavaHandle& sensitivityAnalysisContext, const std::vector<std::string>& busIds, const std::vector<std::string>& targetVoltageIds);
 
-JavaHandle runSensitivityAnalysis(const JavaHandle& sensitivityAnalysisContext, const JavaHandle& network, bool dc, SensitivityAnalysisParameters& parameters, const std::string& provider, JavaHandle* reporter);
+JavaHandle runSensitivityAnalysis(const JavaHandle& sensitivityAnalysisContext, const JavaHandle& network, bool dc, SensitivityAnalysisParameters& parameters, const std::string& provider, JavaHandle* reporter, JavaHandle* cancelToken);
 
 matrix* getBranchFlowsSensitivityMatrix(const JavaHandle& sensitivityAnalysisResultContext, const std::string& matrixId, const std::string &contingencyId);
 
@@ -340,7 +403,11 @@ matrix* getReferenceFlows(const JavaHandle& sensitivityAnalysisResultContext, co
 
 matrix* getReferenceVoltages(const JavaHandle& sensitivityAnalysisResultContext, const std::string& contingencyId);
 
-SeriesArray* createNetworkElementsSeriesArray(const JavaHandle& network, element_type elementType, filter_attributes_type filterAttributesType, const std::vector<std::string>& attributes, dataframe* dataframe);
+SeriesArray* createNetworkElementsSeriesArray(const JavaHandle& network, element_type elementType, filter_attributes_type filterAttributesType, const std::vector<std::string>& attributes, dataframe* dataframe, dataframe* filter);
+
+SeriesArray* createNetworkElementsVariantsSeriesArray(const JavaHandle& network, element_type elementType, filter_attributes_type filterAttributesType, const std::vector<std::string>& attributes, dataframe* dataframe, dataframe* filter, const std::vector<std::string>& variantIds);
+
+std::vector<SeriesArray*> createNetworkElementsSeriesArrays(const JavaHandle& network, const std::vector<element_type>& elementTypes, const std::vector<filter_attributes_type>& filterAttributesTypes, const std::vector<std::vector<std::string>>& attributes);
 
 void removeNetworkElements(const JavaHandle& network, const std::vector<std::string>& elementIds);
 
@@ -352,6 +419,20 @@ void updateNetworkElementsWithSeries(pypowsybl::JavaHandle network, dataframe* d
 
 std::string getWorkingVariantId(const JavaHandle& network);
 
+ByteArray* serializeNetwork(const JavaHandle& network, bool compress);
+
+JavaHandle deserializeNetwork(const char* data, int size);
+
+JavaHandle loadNetworkFromBinaryBuffer(const std::string& fileName, const char* data, int size, const std::map<std::string, std::string>& parameters, JavaHandle* reporter);
+
+ByteArray* dumpNetworkToBinaryBuffer(const JavaHandle& network, const std::string& format, const std::map<std::string, std::string>& parameters, JavaHandle* reporter);
+
+JavaHandle copyNetwork(const JavaHandle& network, const std::vector<std::string>& variantIds);
+
+long getNetworkModificationCount(const JavaHandle& network);
+
+long getVariantModificationCount(const JavaHandle& network, std::string& variant);
+
 void setWorkingVariant(const JavaHandle& network, std::string& variant);
 
 void removeVariant(const JavaHandle& network, std::string& variant);
@@ -366,6 +447,16 @@ void addMonitoredElements(const JavaHandle& securityAnalysisContext, contingency
 
 SeriesArray* getLimitViolations(const JavaHandle& securityAnalysisResult);
 
+SeriesArray* getContingencyStatus(const JavaHandle& securityAnalysisResult);
+
+ContingencyResultArray* getSecurityAnalysisContingencyResults(const JavaHandle& securityAnalysisResult, const std::vector<std::string>& contingencyIds);
+
+ByteArray* serializeSecurityAnalysisResult(const JavaHandle& securityAnalysisResult);
+
+JavaHandle deserializeSecurityAnalysisResult(const char* data, int size);
+
+JavaHandle mergeSecurityAnalysisResults(std::vector<JavaHandle>& securityAnalysisResults);
+
 ContingencyResultArray* getSecurityAnalysisResult(const JavaHandle& securityAnalysisResult);
 
 SeriesArray* getBranchResults(const JavaHandle& securityAnalysisResult);
@@ -7,6 +7,8 @@
 package com.powsybl.dataframe;
 
 import com.powsybl.commons.PowsyblException;
+import com.powsybl.dataframe.impl.DefaultDataframeHandler;
+import com.powsybl.dataframe.impl.Series;
 import com.powsybl.dataframe.update.DoubleSeries;
 import com.powsybl.dataframe.update.IntSeries;
 import com.powsybl.dataframe.update.StringSeries;
@@ -51,10 +53,35 @@ public abstract class AbstractDataframeMapper<T, U> implements DataframeMapper<T
     public void createDataframe(T object, DataframeHandler dataframeHandler, DataframeFilter dataframeFilter) {
         Collection<SeriesMapper<U>> mappers = getSeriesMappers(dataframeFilter);
         dataframeHandler.allocate(mappers.size());
-        List<U> items = getItems(object);
+        List<U> items = filterItems(getItems(object), dataframeFilter);
         mappers.stream().forEach(mapper -> mapper.createSeries(items, dataframeHandler));
     }
 
+    /**
+     * Keeps only the items which satisfy all predicates of the filter.
+     * Values used in predicates are computed with the series mappers, for the items not already rejected.
+     */
+    protected List<U> filterItems(List<U> items, DataframeFilter dataframeFilter) {
+        List<U> filteredItems = items;
+        for (SeriesPredicate predicate : dataframeFilter.getPredicates()) {
+            SeriesMapper<U> mapper = seriesMappers.get(predicate.getAttribute());
+            if (mapper == null) {
+                throw new PowsyblException("No series named " + predicate.getAttribute());
+            }
+            List<Series> series = new ArrayList<>();
+            mapper.createSeries(filteredItems, new DefaultDataframeHandler(series::add));
+            boolean[] mask = predicate.evaluate(series.get(0), mapper.getMetadata().getType());
+            List<U> matchingItems = new ArrayList<>();
+            for (int i = 0; i < mask.length; i++) {
+                if (mask[i]) {
+                    matchingItems.add(filteredItems.get(i));
+                }
+            }
+            filteredItems = matchingItems;
+        }
+        return filteredItems;
+    }
+
     interface ColumnUpdater<U> {
         void update(int index, U object);
     }
@@ -24,6 +24,7 @@ public class DataframeFilter {
     private final AttributeFilterType attributeFilterType;
     private final List<String> inputAttributes;
     private final UpdatingDataframe selectingDataframe;
+    private final List<SeriesPredicate> predicates;
 
     public enum AttributeFilterType {
         DEFAULT_ATTRIBUTES,
@@ -31,10 +32,16 @@ public class DataframeFilter {
         ALL_ATTRIBUTES
     }
 
-    public DataframeFilter(AttributeFilterType attributeFilterType, List<String> inputAttributes, UpdatingDataframe selectingDataframe) {
+    public DataframeFilter(AttributeFilterType attributeFilterType, List<String> inputAttributes, UpdatingDataframe selectingDataframe,
+                           List<SeriesPredicate> predicates) {
         this.attributeFilterType = Objects.requireNonNull(attributeFilterType);
         this.inputAttributes = Objects.requireNonNull(inputAttributes);
         this.selectingDataframe = selectingDataframe;
+        this.predicates = Objects.requireNonNull(predicates);
+    }
+
+    public DataframeFilter(AttributeFilterType attributeFilterType, List<String> inputAttributes, UpdatingDataframe selectingDataframe) {
+        this(attributeFilterType, inputAttributes, selectingDataframe, Collections.emptyList());
     }
 
     public DataframeFilter(AttributeFilterType attributeFilterType, List<String> inputAttributes) {
@@ -56,4 +63,11 @@ public class DataframeFilter {
     public Optional<UpdatingDataframe> getSelectingDataframe() {
         return Optional.ofNullable(selectingDataframe);
     }
+
+    /**
+     * Conditions on attribute values that rows must all satisfy to be part of the dataframe.
+     */
+    public List<SeriesPredicate> getPredicates() {
+        return predicates;
+    }
 }
@@ -0,0 +1,182 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.dataframe;
+
+import com.powsybl.commons.PowsyblException;
+import com.powsybl.dataframe.impl.Series;
+
+import java.util.List;
+import java.util.Objects;
+import java.util.Set;
+import java.util.stream.Collectors;
+
+/**
+ * A condition on the values of a series, used to select the rows of a dataframe.
+ * Values are provided as strings, and parsed according to the type of the series.
+ */
+public class SeriesPredicate {
+
+    public enum Operator {
+        EQUAL("=="),
+        NOT_EQUAL("!="),
+        LESS("<"),
+        LESS_OR_EQUAL("<="),
+        GREATER(">"),
+        GREATER_OR_EQUAL(">="),
+        IN("in");
+
+        private final String symbol;
+
+        Operator(String symbol) {
+            this.symbol = symbol;
+        }
+
+        public static Operator fromSymbol(String symbol) {
+            for (Operator operator : values()) {
+                if (operator.symbol.equals(symbol)) {
+                    return operator;
+                }
+            }
+            throw new PowsyblException("Unknown filter operator: " + symbol);
+        }
+    }
+
+    private final String attribute;
+    private final Operator operator;
+    private final List<String> values;
+
+    public SeriesPredicate(String attribute, Operator operator, List<String> values) {
+        this.attribute = Objects.requireNonNull(attribute);
+        this.operator = Objects.requireNonNull(operator);
+        this.values = List.copyOf(values);
+        if (operator != Operator.IN && values.size() != 1) {
+            throw new PowsyblException("Filter on " + attribute + ": operator " + operator.symbol + " expects exactly one value");
+        }
+    }
+
+    public String getAttribute() {
+        return attribute;
+    }
+
+    public Operator getOperator() {
+        return operator;
+    }
+
+    public List<String> getValues() {
+        return values;
+    }
+
+    /**
+     * Evaluates this predicate on the values of a series.
+     *
+     * @return for each row of the series, true if it matches the predicate.
+     */
+    public boolean[] evaluate(Series series, SeriesDataType type) {
+        switch (type) {
+            case STRING:
+                return evaluateStrings(series.getStrings());
+            case DOUBLE:
+                return evaluateDoubles(series.getDoubles());
+            case INT:
+                return evaluateInts(series.getInts());
+            case BOOLEAN:
+                return evaluateBooleans(series.getBooleans());
+            default:
+                throw new IllegalStateException("Unexpected series type: " + type);
+        }
+    }
+
+    private boolean[] evaluateStrings(String[] seriesValues) {
+        boolean[] result = new boolean[seriesValues.length];
+        Set<String> valuesSet = Set.copyOf(values);
+        String value = comparedValue();
+        for (int i = 0; i < seriesValues.length; i++) {
+            String v = seriesValues[i] == null ? "" : seriesValues[i];
+            result[i] = operator == Operator.IN ? valuesSet.contains(v) : compare(v.compareTo(value));
+        }
+        return result;
+    }
+
+    private boolean[] evaluateDoubles(double[] seriesValues) {
+        boolean[] result = new boolean[seriesValues.length];
+        List<Double> parsedValues = values.stream().map(Double::parseDouble).collect(Collectors.toList());
+        double value = operator == Operator.IN ? Double.NaN : Double.parseDouble(comparedValue());
+        for (int i = 0; i < seriesValues.length; i++) {
+            double v = seriesValues[i];
+            if (Double.isNaN(v)) {
+                // consistent with pandas: NaN only matches the "not equal" operator
+                result[i] = operator == Operator.NOT_EQUAL;
+            } else {
+                result[i] = operator == Operator.IN ? parsedValues.contains(v) : compare(Double.compare(v, value));
+            }
+        }
+        return result;
+    }
+
+    private boolean[] evaluateInts(int[] seriesValues) {
+        boolean[] result = new boolean[seriesValues.length];
+        Set<Integer> parsedValues = values.stream().map(SeriesPredicate::parseInt).collect(Collectors.toSet());
+        int value = operator == Operator.IN ? 0 : parseInt(comparedValue());
+        for (int i = 0; i < seriesValues.length; i++) {
+            int v = seriesValues[i];
+            result[i] = operator == Operator.IN ? parsedValues.contains(v) : compare(Integer.compare(v, value));
+        }
+        return result;
+    }
+
+    private boolean[] evaluateBooleans(boolean[] seriesValues) {
+        boolean[] result = new boolean[seriesValues.length];
+        Set<Boolean> parsedValues = values.stream().map(Boolean::parseBoolean).collect(Collectors.toSet());
+        boolean value = Boolean.parseBoolean(comparedValue());
+        for (int i = 0; i < seriesValues.length; i++) {
+            boolean v = seriesValues[i];
+            result[i] = operator == Operator.IN ? parsedValues.contains(v) : compare(Boolean.compare(v, value));
+        }
+        return result;
+    }
+
+    /**
+     * The value rows are compared to, for operators other than IN.
+     */
+    private String comparedValue() {
+        return operator == Operator.IN ? null : values.get(0);
+    }
+
+    private static int parseInt(String value) {
+        // integer values may be formatted as floats on python side
+        double parsed;
+        try {
+            parsed = Double.parseDouble(value);
+        } catch (NumberFormatException e) {
+            throw new PowsyblException("Invalid integer value: " + value);
+        }
+        if (parsed != Math.rint(parsed) || parsed < Integer.MIN_VALUE || parsed > Integer.MAX_VALUE) {
+            throw new PowsyblException("Invalid integer value: " + value + ", integer values must be between "
+                    + Integer.MIN_VALUE + " and " + Integer.MAX_VALUE);
+        }
+        return (int) parsed;
+    }
+
+    private boolean compare(int comparison) {
+        switch (operator) {
+            case EQUAL:
+                return comparison == 0;
+            case NOT_EQUAL:
+                return comparison != 0;
+            case LESS:
+                return comparison < 0;
+            case LESS_OR_EQUAL:
+                return comparison <= 0;
+            case GREATER:
+                return comparison > 0;
+            case GREATER_OR_EQUAL:
+                return comparison >= 0;
+            default:
+                throw new IllegalStateException("Unexpected operator: " + operator);
+        }
+    }
+}
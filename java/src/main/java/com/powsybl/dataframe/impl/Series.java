@@ -7,6 +7,7 @@
 package com.powsybl.dataframe.impl;
 
 import com.powsybl.commons.PowsyblException;
+import com.powsybl.dataframe.SeriesDataType;
 
 import java.util.Optional;
 
@@ -64,6 +65,30 @@ public class Series {
         return name;
     }
 
+    public SeriesDataType getType() {
+        if (doubles != null) {
+            return SeriesDataType.DOUBLE;
+        } else if (ints != null) {
+            return SeriesDataType.INT;
+        } else if (booleans != null) {
+            return SeriesDataType.BOOLEAN;
+        }
+        return SeriesDataType.STRING;
+    }
+
+    public int getSize() {
+        switch (getType()) {
+            case DOUBLE:
+                return doubles.length;
+            case INT:
+                return ints.length;
+            case BOOLEAN:
+                return booleans.length;
+            default:
+                return strings.length;
+        }
+    }
+
     public double[] getDoubles() {
         return Optional.ofNullable(doubles)
             .orElseThrow(() -> new PowsyblException("Series " + getName() + " is not of type double"));
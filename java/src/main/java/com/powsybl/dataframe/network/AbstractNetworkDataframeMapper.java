@@ -31,7 +31,7 @@ public abstract class AbstractNetworkDataframeMapper<T> extends AbstractDatafram
 
     @Override
     public void createDataframe(Network network, DataframeHandler dataframeHandler, DataframeFilter dataframeFilter) {
-        List<T> items = getFilteredItems(network, dataframeFilter);
+        List<T> items = filterItems(getFilteredItems(network, dataframeFilter), dataframeFilter);
         List<SeriesMapper<T>> mappers = new ArrayList<>(getSeriesMappers(dataframeFilter));
         if (addProperties) {
             mappers.addAll(getPropertiesSeries(items, dataframeFilter));
@@ -0,0 +1,92 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.commons;
+
+import java.util.concurrent.CancellationException;
+
+/**
+ * Cooperative cancellation of a computation, checked by the computation between steps,
+ * for example between contingencies.
+ *
+ * <p>A token is cancelled when it, or its parent, is cancelled, or when its deadline is reached.
+ * Each run has its own token, child of the token given by the user if any,
+ * which records whether the run was interrupted before its end.
+ */
+public class CancelToken {
+
+    public static final long NO_DEADLINE = 0;
+
+    private final CancelToken parent;
+    private final long deadline;
+    private volatile boolean cancelled = false;
+    private volatile boolean interrupted = false;
+
+    /**
+     * @param parent   the parent token, may be null
+     * @param deadline the deadline, in milliseconds since the epoch, or {@link #NO_DEADLINE}
+     */
+    public CancelToken(CancelToken parent, long deadline) {
+        this.parent = parent;
+        this.deadline = deadline;
+    }
+
+    public void cancel() {
+        cancelled = true;
+    }
+
+    public boolean isCancelled() {
+        return cancelled
+                || (deadline != NO_DEADLINE && System.currentTimeMillis() >= deadline)
+                || (parent != null && parent.isCancelled());
+    }
+
+    /**
+     * True if the token may be cancelled through its parent or its deadline, that is by the caller
+     * of the computation, which then expects partial results. Otherwise, the token is only cancelled directly,
+     * for example on a keyboard interrupt, to abort the computation: results are then not needed, so that
+     * computations do not have to be split into steps.
+     */
+    public boolean isCancellableByCaller() {
+        return parent != null || deadline != NO_DEADLINE;
+    }
+
+    /**
+     * Interrupts the computation if the token is cancelled, by throwing a {@link CancellationException}.
+     */
+    public void check() {
+        if (isCancelled()) {
+            interrupted = true;
+            throw new CancellationException("Computation cancelled");
+        }
+    }
+
+    /**
+     * Records that the computation stopped before its end, with partial results.
+     */
+    public void setInterrupted() {
+        interrupted = true;
+    }
+
+    /**
+     * True if the computation stopped before its end, with partial results.
+     */
+    public boolean isInterrupted() {
+        return interrupted;
+    }
+
+    /**
+     * True if the given exception, or one of its causes, is the interruption of a computation by a token.
+     */
+    public static boolean isCancellation(Throwable e) {
+        for (Throwable t = e; t != null; t = t.getCause()) {
+            if (t instanceof CancellationException) {
+                return true;
+            }
+        }
+        return false;
+    }
+}
@@ -0,0 +1,46 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.commons;
+
+import com.powsybl.commons.reporter.Report;
+import com.powsybl.commons.reporter.Reporter;
+import com.powsybl.commons.reporter.TypedValue;
+
+import java.util.Map;
+import java.util.Objects;
+
+/**
+ * A reporter checking a cancel token each time a sub-reporter is created, which providers do for each step
+ * of a computation, for example for the simulation of each contingency.
+ * Reports are forwarded unchanged to the delegate reporter.
+ */
+public class CancelTokenReporter implements Reporter {
+
+    private final Reporter delegate;
+    private final CancelToken cancelToken;
+
+    public CancelTokenReporter(Reporter delegate, CancelToken cancelToken) {
+        this.delegate = Objects.requireNonNull(delegate);
+        this.cancelToken = Objects.requireNonNull(cancelToken);
+    }
+
+    @Override
+    public Reporter createSubReporter(String taskKey, String defaultName, Map<String, TypedValue> values) {
+        cancelToken.check();
+        return new CancelTokenReporter(delegate.createSubReporter(taskKey, defaultName, values), cancelToken);
+    }
+
+    @Override
+    public void report(String reportKey, String defaultMessage, Map<String, TypedValue> values) {
+        delegate.report(reportKey, defaultMessage, values);
+    }
+
+    @Override
+    public void report(Report report) {
+        delegate.report(report);
+    }
+}
@@ -71,12 +71,17 @@ public final class CommonCFunctions {
     @CEntryPoint(name = "freeSeriesArray")
     public static void freeSeriesArray(IsolateThread thread, ArrayPointer<SeriesPointer> seriesPtrArrayPtr,
                                        ExceptionHandlerPointer exceptionHandlerPtr) {
-        doCatch(exceptionHandlerPtr, () -> {
-            for (int i = 0; i < seriesPtrArrayPtr.getLength(); i++) {
-                freeSeries(seriesPtrArrayPtr.getPtr().addressOf(i));
-            }
-            freeArrayPointer(seriesPtrArrayPtr);
-        });
+        doCatch(exceptionHandlerPtr, () -> freeSeriesArrayPointer(seriesPtrArrayPtr));
+    }
+
+    /**
+     * Frees the memory of a series array, including the series content.
+     */
+    public static void freeSeriesArrayPointer(ArrayPointer<SeriesPointer> seriesPtrArrayPtr) {
+        for (int i = 0; i < seriesPtrArrayPtr.getLength(); i++) {
+            freeSeries(seriesPtrArrayPtr.getPtr().addressOf(i));
+        }
+        freeArrayPointer(seriesPtrArrayPtr);
     }
 
     private static void freeSeries(SeriesPointer seriesPointer) {
@@ -103,6 +108,39 @@ public final class CommonCFunctions {
         doCatch(exceptionHandlerPtr, () -> ObjectHandles.getGlobal().destroy(objectHandle));
     }
 
+    @CEntryPoint(name = "createCancelToken")
+    public static ObjectHandle createCancelToken(IsolateThread thread, ObjectHandle parentHandle, long deadline,
+                                                 ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            CancelToken parent = ObjectHandles.getGlobal().get(parentHandle);
+            return ObjectHandles.getGlobal().create(new CancelToken(parent, deadline));
+        });
+    }
+
+    @CEntryPoint(name = "cancel")
+    public static void cancel(IsolateThread thread, ObjectHandle cancelTokenHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
+        doCatch(exceptionHandlerPtr, () -> {
+            CancelToken token = ObjectHandles.getGlobal().get(cancelTokenHandle);
+            token.cancel();
+        });
+    }
+
+    @CEntryPoint(name = "isCancelled")
+    public static boolean isCancelled(IsolateThread thread, ObjectHandle cancelTokenHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            CancelToken token = ObjectHandles.getGlobal().get(cancelTokenHandle);
+            return token.isCancelled();
+        });
+    }
+
+    @CEntryPoint(name = "isInterrupted")
+    public static boolean isInterrupted(IsolateThread thread, ObjectHandle cancelTokenHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            CancelToken token = ObjectHandles.getGlobal().get(cancelTokenHandle);
+            return token.isInterrupted();
+        });
+    }
+
     @CEntryPoint(name = "getWorkingVariantId")
     public static CCharPointer getWorkingVariantId(IsolateThread thread, ObjectHandle networkHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> {
@@ -689,6 +689,14 @@ public final class PyPowsyblApiHeader {
         ZonePointer addressOf(int index);
     }
 
+    @CPointerTo(ArrayPointer.class)
+    public interface ArrayPointerPointer extends PointerBase {
+
+        ArrayPointer read(int index);
+
+        void write(int index, ArrayPointer value);
+    }
+
     @CPointerTo(ZonePointer.class)
     public interface ZonePointerPointer extends PointerBase {
 
@@ -15,9 +15,11 @@ import com.powsybl.python.commons.PyPowsyblApiHeader.ArrayPointer;
 import com.powsybl.python.dataframe.CDataframeHandler;
 import org.graalvm.nativeimage.UnmanagedMemory;
 import org.graalvm.nativeimage.c.struct.SizeOf;
+import org.graalvm.nativeimage.c.type.CCharPointer;
 import org.graalvm.nativeimage.c.type.CCharPointerPointer;
 import org.graalvm.nativeimage.c.type.CDoublePointer;
 import org.graalvm.nativeimage.c.type.CIntPointer;
+import org.graalvm.nativeimage.c.type.CTypeConversion;
 import org.graalvm.word.WordBase;
 import org.graalvm.word.WordFactory;
 import org.slf4j.LoggerFactory;
@@ -126,6 +128,12 @@ public final class Util {
         return allocArrayPointer(intListPtr, integerList.size());
     }
 
+    public static ArrayPointer<CCharPointer> createByteArray(byte[] bytes) {
+        CCharPointer bytesPtr = UnmanagedMemory.calloc(bytes.length);
+        CTypeConversion.asByteBuffer(bytesPtr, bytes.length).put(bytes);
+        return allocArrayPointer(bytesPtr, bytes.length);
+    }
+
     public static int convert(SeriesDataType type) {
         switch (type) {
             case STRING:
@@ -6,6 +6,8 @@
  */
 package com.powsybl.python.contingency;
 
+import com.powsybl.iidm.network.Network;
+
 import java.util.List;
 
 /**
@@ -14,4 +16,12 @@ import java.util.List;
 public interface ContingencyContainer {
 
     void addContingency(String contingencyId, List<String> elementIds);
+
+    /**
+     * Adds contingencies given as pairs of contingency ID and element ID, a contingency
+     * being made of the elements of all the pairs with its ID.
+     * If a network is given, contingencies with elements which cannot be simulated on this network
+     * are not added, and these elements are returned.
+     */
+    List<RejectedContingencyElement> addContingencies(List<String> contingencyIds, List<String> elementIds, Network network);
 }
@@ -12,6 +12,7 @@ import com.powsybl.iidm.network.*;
 
 import java.util.ArrayList;
 import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.stream.Collectors;
@@ -28,6 +29,46 @@ public class ContingencyContainerImpl implements ContingencyContainer {
         elementIdsByContingencyId.put(contingencyId, elementIds);
     }
 
+    @Override
+    public List<RejectedContingencyElement> addContingencies(List<String> contingencyIds, List<String> elementIds, Network network) {
+        if (contingencyIds.size() != elementIds.size()) {
+            throw new PowsyblException("Contingency IDs and element IDs must have the same size");
+        }
+        Map<String, List<String>> elementIdsByContingency = new LinkedHashMap<>();
+        for (int i = 0; i < contingencyIds.size(); i++) {
+            elementIdsByContingency.computeIfAbsent(contingencyIds.get(i), k -> new ArrayList<>()).add(elementIds.get(i));
+        }
+        List<RejectedContingencyElement> rejectedElements = new ArrayList<>();
+        // elements are usually part of many contingencies, they are checked only once
+        Map<String, String> rejectionReasons = new HashMap<>();
+        for (Map.Entry<String, List<String>> e : elementIdsByContingency.entrySet()) {
+            String contingencyId = e.getKey();
+            boolean rejected = false;
+            if (network != null) {
+                for (String elementId : e.getValue()) {
+                    String reason = rejectionReasons.computeIfAbsent(elementId, id -> getRejectionReason(network, id));
+                    if (!reason.isEmpty()) {
+                        rejectedElements.add(new RejectedContingencyElement(contingencyId, elementId, reason));
+                        rejected = true;
+                    }
+                }
+            }
+            if (!rejected) {
+                elementIdsByContingencyId.put(contingencyId, e.getValue());
+            }
+        }
+        return rejectedElements;
+    }
+
+    private static String getRejectionReason(Network network, String elementId) {
+        try {
+            createContingencyElement(network, elementId);
+            return "";
+        } catch (PowsyblException e) {
+            return e.getMessage();
+        }
+    }
+
     private static ContingencyElement createContingencyElement(Network network, String elementId) {
         Identifiable<?> identifiable = network.getIdentifiable(elementId);
         if (identifiable == null) {
@@ -0,0 +1,38 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.contingency;
+
+import java.util.Objects;
+
+/**
+ * An element of a contingency which cannot be simulated on a network,
+ * because it does not exist in the network or because its type is not supported.
+ */
+public class RejectedContingencyElement {
+
+    private final String contingencyId;
+    private final String elementId;
+    private final String reason;
+
+    public RejectedContingencyElement(String contingencyId, String elementId, String reason) {
+        this.contingencyId = Objects.requireNonNull(contingencyId);
+        this.elementId = Objects.requireNonNull(elementId);
+        this.reason = Objects.requireNonNull(reason);
+    }
+
+    public String getContingencyId() {
+        return contingencyId;
+    }
+
+    public String getElementId() {
+        return elementId;
+    }
+
+    public String getReason() {
+        return reason;
+    }
+}
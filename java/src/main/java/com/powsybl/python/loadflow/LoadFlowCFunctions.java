@@ -26,6 +26,8 @@ import org.graalvm.nativeimage.c.function.CEntryPoint;
 import org.graalvm.nativeimage.c.struct.SizeOf;
 import org.graalvm.nativeimage.c.type.CCharPointer;
 import org.graalvm.nativeimage.c.type.CCharPointerPointer;
+import org.graalvm.nativeimage.c.type.CDoublePointer;
+import org.graalvm.nativeimage.c.type.CIntPointer;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
@@ -103,6 +105,72 @@ public final class LoadFlowCFunctions {
         });
     }
 
+    @CEntryPoint(name = "runLoadFlowVariants")
+    public static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.ArrayPointerPointer> runLoadFlowVariants(IsolateThread thread, ObjectHandle networkHandle, boolean dc,
+                                                                                                             LoadFlowParametersPointer loadFlowParametersPtr,
+                                                                                                             CCharPointer provider,
+                                                                                                             CCharPointerPointer variantIdsPtrPtr, int variantIdsCount,
+                                                                                                             int maxWorkers,
+                                                                                                             PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return Util.doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            String providerStr = CTypeUtil.toString(provider);
+            LoadFlowProvider loadFlowProvider = LoadFlowCUtils.getLoadFlowProvider(providerStr);
+            logger().info("loadflow provider used is : {}", loadFlowProvider.getName());
+
+            LoadFlowParameters parameters = LoadFlowCUtils.createLoadFlowParameters(dc, loadFlowParametersPtr, loadFlowProvider);
+            List<String> variantIds = CTypeUtil.toStringList(variantIdsPtrPtr, variantIdsCount);
+            List<LoadFlowResult> results = MultiVariantLoadFlow.run(network, variantIds, new LoadFlow.Runner(loadFlowProvider), parameters, maxWorkers);
+            PyPowsyblApiHeader.ArrayPointerPointer resultsPtr = UnmanagedMemory.calloc(results.size() * SizeOf.get(PyPowsyblApiHeader.ArrayPointerPointer.class));
+            for (int i = 0; i < results.size(); i++) {
+                resultsPtr.write(i, createLoadFlowComponentResultArrayPointer(results.get(i)));
+            }
+            return allocArrayPointer(resultsPtr, results.size());
+        });
+    }
+
+    @CEntryPoint(name = "runLoadFlowTimeSeries")
+    public static void runLoadFlowTimeSeries(IsolateThread thread, ObjectHandle networkHandle, boolean dc,
+                                             LoadFlowParametersPointer loadFlowParametersPtr, CCharPointer provider, int stepsCount,
+                                             CIntPointer profilesElementTypes, CCharPointerPointer profilesAttributes,
+                                             CCharPointerPointer profilesIds, CIntPointer profilesIdsCounts, int profilesCount,
+                                             CDoublePointer profilesValues,
+                                             CIntPointer resultsElementTypes, CCharPointerPointer resultsAttributes,
+                                             CCharPointerPointer resultsIds, CIntPointer resultsIdsCounts, int resultsCount,
+                                             CDoublePointer resultsValues, CIntPointer statuses,
+                                             PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            String providerStr = CTypeUtil.toString(provider);
+            LoadFlowProvider loadFlowProvider = LoadFlowCUtils.getLoadFlowProvider(providerStr);
+            logger().info("loadflow provider used is : {}", loadFlowProvider.getName());
+
+            LoadFlowParameters parameters = LoadFlowCUtils.createLoadFlowParameters(dc, loadFlowParametersPtr, loadFlowProvider);
+            List<TimeSeriesLoadFlow.ElementsAttribute> profiles = createElementsAttributes(profilesElementTypes, profilesAttributes,
+                    profilesIds, profilesIdsCounts, profilesCount);
+            List<TimeSeriesLoadFlow.ElementsAttribute> results = createElementsAttributes(resultsElementTypes, resultsAttributes,
+                    resultsIds, resultsIdsCounts, resultsCount);
+            TimeSeriesLoadFlow.run(network, new LoadFlow.Runner(loadFlowProvider), parameters, stepsCount,
+                    profiles, profilesValues::read, results, resultsValues::write,
+                    (step, status) -> statuses.write(step, status.ordinal()));
+        });
+    }
+
+    private static List<TimeSeriesLoadFlow.ElementsAttribute> createElementsAttributes(CIntPointer elementTypes, CCharPointerPointer attributes,
+                                                                                       CCharPointerPointer ids, CIntPointer idsCounts, int count) {
+        List<TimeSeriesLoadFlow.ElementsAttribute> elementsAttributes = new ArrayList<>(count);
+        int idsOffset = 0;
+        for (int i = 0; i < count; i++) {
+            int idsCount = idsCounts.read(i);
+            elementsAttributes.add(new TimeSeriesLoadFlow.ElementsAttribute(
+                    Util.convert(PyPowsyblApiHeader.ElementType.fromCValue(elementTypes.read(i))),
+                    CTypeUtil.toString(attributes.read(i)),
+                    CTypeUtil.toStringList(ids.addressOf(idsOffset), idsCount)));
+            idsOffset += idsCount;
+        }
+        return elementsAttributes;
+    }
+
     @CEntryPoint(name = "createLoadFlowParameters")
     public static LoadFlowParametersPointer createLoadFlowParameters(IsolateThread thread, PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> convertToLoadFlowParametersPointer(LoadFlowCUtils.createLoadFlowParameters()));
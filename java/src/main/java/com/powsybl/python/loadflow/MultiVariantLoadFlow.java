@@ -0,0 +1,87 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.loadflow;
+
+import com.powsybl.commons.PowsyblException;
+import com.powsybl.computation.local.LocalComputationManager;
+import com.powsybl.iidm.network.Network;
+import com.powsybl.iidm.network.VariantManager;
+import com.powsybl.loadflow.LoadFlow;
+import com.powsybl.loadflow.LoadFlowParameters;
+import com.powsybl.loadflow.LoadFlowResult;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+
+/**
+ * Runs load flows on several variants of a network, concurrently.
+ * Multi-thread access to the variants of the network is enabled during the computations,
+ * so that each thread works on its own variant. The working variant of the caller is restored at the end.
+ */
+public final class MultiVariantLoadFlow {
+
+    private MultiVariantLoadFlow() {
+    }
+
+    /**
+     * @param maxWorkers maximum number of concurrent load flows, the number of available processors if not strictly positive
+     * @return the load flow result of each variant, in the order of the given variants
+     */
+    public static List<LoadFlowResult> run(Network network, List<String> variantIds, LoadFlow.Runner runner,
+                                           LoadFlowParameters parameters, int maxWorkers) {
+        VariantManager variantManager = network.getVariantManager();
+        for (String variantId : variantIds) {
+            if (!variantManager.getVariantIds().contains(variantId)) {
+                throw new PowsyblException("Variant '" + variantId + "' not found");
+            }
+        }
+        if (variantIds.isEmpty()) {
+            return List.of();
+        }
+        int workers = Math.min(variantIds.size(), maxWorkers > 0 ? maxWorkers : Runtime.getRuntime().availableProcessors());
+        boolean multiThreadAccessAllowed = variantManager.isVariantMultiThreadAccessAllowed();
+        String workingVariantId = variantManager.getWorkingVariantId();
+        variantManager.allowVariantMultiThreadAccess(true);
+        ExecutorService executor = Executors.newFixedThreadPool(workers);
+        try {
+            List<Future<LoadFlowResult>> futures = new ArrayList<>(variantIds.size());
+            for (String variantId : variantIds) {
+                futures.add(executor.submit(() -> {
+                    variantManager.setWorkingVariant(variantId);
+                    return runner.run(network, variantId, LocalComputationManager.getDefault(), parameters);
+                }));
+            }
+            // all computations are waited for, even in case of failure, before disabling multi-thread access
+            List<LoadFlowResult> results = new ArrayList<>(variantIds.size());
+            RuntimeException failure = null;
+            for (Future<LoadFlowResult> future : futures) {
+                try {
+                    results.add(future.get());
+                } catch (ExecutionException e) {
+                    if (failure == null) {
+                        failure = e.getCause() instanceof RuntimeException ? (RuntimeException) e.getCause() : new PowsyblException(e.getCause());
+                    }
+                }
+            }
+            if (failure != null) {
+                throw failure;
+            }
+            return results;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new PowsyblException("Interrupted while running load flows", e);
+        } finally {
+            executor.shutdownNow();
+            variantManager.allowVariantMultiThreadAccess(multiThreadAccessAllowed);
+            variantManager.setWorkingVariant(workingVariantId);
+        }
+    }
+}
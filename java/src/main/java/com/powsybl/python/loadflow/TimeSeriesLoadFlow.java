@@ -0,0 +1,139 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.loadflow;
+
+import com.powsybl.commons.PowsyblException;
+import com.powsybl.dataframe.DataframeElementType;
+import com.powsybl.dataframe.DataframeFilter;
+import com.powsybl.dataframe.SeriesDataType;
+import com.powsybl.dataframe.SeriesMetadata;
+import com.powsybl.dataframe.impl.DefaultDataframeHandler;
+import com.powsybl.dataframe.impl.Series;
+import com.powsybl.dataframe.network.NetworkDataframeMapper;
+import com.powsybl.dataframe.network.NetworkDataframes;
+import com.powsybl.dataframe.update.DefaultUpdatingDataframe;
+import com.powsybl.dataframe.update.DoubleSeries;
+import com.powsybl.iidm.network.Network;
+import com.powsybl.loadflow.LoadFlow;
+import com.powsybl.loadflow.LoadFlowParameters;
+import com.powsybl.loadflow.LoadFlowResult;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Objects;
+import java.util.function.IntToDoubleFunction;
+
+/**
+ * Runs a sequence of load flows on a network, applying new values of some attributes before each step,
+ * and collecting values of other attributes after each step.
+ *
+ * Values are exchanged as flat arrays: for each attribute, a block of (steps x elements) values,
+ * stored step by step. Blocks of all attributes are stored one after another.
+ */
+public final class TimeSeriesLoadFlow {
+
+    /**
+     * Values of an attribute, for some elements of a given type.
+     */
+    public static final class ElementsAttribute {
+
+        private final DataframeElementType elementType;
+        private final String attribute;
+        private final List<String> ids;
+
+        public ElementsAttribute(DataframeElementType elementType, String attribute, List<String> ids) {
+            this.elementType = Objects.requireNonNull(elementType);
+            this.attribute = Objects.requireNonNull(attribute);
+            this.ids = List.copyOf(ids);
+        }
+    }
+
+    @FunctionalInterface
+    public interface ValuesWriter {
+        void set(int index, double value);
+    }
+
+    @FunctionalInterface
+    public interface StatusWriter {
+        void set(int step, LoadFlowResult.ComponentResult.Status status);
+    }
+
+    private TimeSeriesLoadFlow() {
+    }
+
+    public static void run(Network network, LoadFlow.Runner runner, LoadFlowParameters parameters, int stepsCount,
+                           List<ElementsAttribute> profiles, IntToDoubleFunction profilesValues,
+                           List<ElementsAttribute> results, ValuesWriter resultsValues, StatusWriter statuses) {
+        int[] currentStep = {0};
+        List<Runnable> updates = new ArrayList<>();
+        int offset = 0;
+        for (ElementsAttribute profile : profiles) {
+            NetworkDataframeMapper mapper = getMapper(profile);
+            DefaultUpdatingDataframe dataframe = new DefaultUpdatingDataframe(profile.ids.size());
+            dataframe.addSeries(getIndexName(mapper), true, profile.ids::get);
+            int profileOffset = offset;
+            int size = profile.ids.size();
+            dataframe.addSeries(profile.attribute, false, (DoubleSeries) i -> profilesValues.applyAsDouble(profileOffset + currentStep[0] * size + i));
+            updates.add(() -> mapper.updateSeries(network, dataframe));
+            offset += stepsCount * size;
+        }
+
+        List<DataframeFilter> resultsFilters = new ArrayList<>();
+        for (ElementsAttribute result : results) {
+            NetworkDataframeMapper mapper = getMapper(result);
+            DefaultUpdatingDataframe selection = new DefaultUpdatingDataframe(result.ids.size());
+            selection.addSeries(getIndexName(mapper), true, result.ids::get);
+            resultsFilters.add(new DataframeFilter(DataframeFilter.AttributeFilterType.INPUT_ATTRIBUTES, List.of(result.attribute), selection));
+        }
+
+        for (int step = 0; step < stepsCount; step++) {
+            currentStep[0] = step;
+            updates.forEach(Runnable::run);
+            LoadFlowResult result = runner.run(network, parameters);
+            statuses.set(step, result.getComponentResults().isEmpty() ? LoadFlowResult.ComponentResult.Status.FAILED
+                    : result.getComponentResults().get(0).getStatus());
+            int resultOffset = 0;
+            for (int r = 0; r < results.size(); r++) {
+                ElementsAttribute elementsAttribute = results.get(r);
+                double[] values = getValues(network, elementsAttribute, resultsFilters.get(r));
+                int size = elementsAttribute.ids.size();
+                for (int i = 0; i < size; i++) {
+                    resultsValues.set(resultOffset + step * size + i, values[i]);
+                }
+                resultOffset += stepsCount * size;
+            }
+        }
+    }
+
+    private static double[] getValues(Network network, ElementsAttribute elementsAttribute, DataframeFilter filter) {
+        List<Series> series = new ArrayList<>();
+        getMapper(elementsAttribute).createDataframe(network, new DefaultDataframeHandler(series::add), filter);
+        return series.stream()
+                .filter(s -> s.getName().equals(elementsAttribute.attribute))
+                .findFirst()
+                .orElseThrow(() -> new PowsyblException("No series named " + elementsAttribute.attribute))
+                .getDoubles();
+    }
+
+    private static NetworkDataframeMapper getMapper(ElementsAttribute elementsAttribute) {
+        NetworkDataframeMapper mapper = NetworkDataframes.getDataframeMapper(elementsAttribute.elementType);
+        SeriesMetadata metadata = mapper.getSeriesMetadata(elementsAttribute.attribute);
+        if (metadata.getType() != SeriesDataType.DOUBLE) {
+            throw new PowsyblException("Series " + elementsAttribute.attribute + " of " + elementsAttribute.elementType
+                    + " is not a double series");
+        }
+        return mapper;
+    }
+
+    private static String getIndexName(NetworkDataframeMapper mapper) {
+        return mapper.getSeriesMetadata().stream()
+                .filter(SeriesMetadata::isIndex)
+                .map(SeriesMetadata::getName)
+                .findFirst()
+                .orElseThrow(() -> new PowsyblException("No index in dataframe"));
+    }
+}
@@ -6,9 +6,11 @@
  */
 package com.powsybl.python.network;
 
+import com.powsybl.commons.PowsyblException;
 import com.powsybl.commons.parameters.Parameter;
 import com.powsybl.commons.parameters.ParameterType;
 import com.powsybl.dataframe.DataframeFilter;
+import com.powsybl.dataframe.DataframeHandler;
 import com.powsybl.dataframe.DataframeMapper;
 import com.powsybl.dataframe.DataframeMapperBuilder;
 import com.powsybl.dataframe.impl.DefaultDataframeHandler;
@@ -18,8 +20,10 @@ import com.powsybl.iidm.export.Exporter;
 import com.powsybl.iidm.import_.Importer;
 import com.powsybl.iidm.network.*;
 import com.powsybl.iidm.network.extensions.ConnectablePosition;
+import com.powsybl.loadflow.LoadFlowResult;
 import com.powsybl.python.commons.PyPowsyblApiHeader.ArrayPointer;
 import com.powsybl.python.commons.PyPowsyblApiHeader.SeriesPointer;
+import com.powsybl.python.contingency.RejectedContingencyElement;
 import com.powsybl.python.dataframe.CDataframeHandler;
 import com.powsybl.python.flow_decomposition.XnecWithDecompositionContext;
 import com.powsybl.python.security.BranchResultContext;
@@ -28,7 +32,9 @@ import com.powsybl.python.security.LimitViolationContext;
 import com.powsybl.python.security.ThreeWindingsTransformerResultContext;
 import com.powsybl.security.LimitViolation;
 import com.powsybl.security.LimitViolationType;
+import com.powsybl.security.LimitViolationsResult;
 import com.powsybl.security.SecurityAnalysisResult;
+import com.powsybl.security.results.PostContingencyResult;
 import org.apache.commons.collections4.IteratorUtils;
 import org.apache.commons.lang3.tuple.Pair;
 
@@ -67,6 +73,8 @@ public final class Dataframes {
     private static final DataframeMapper<SecurityAnalysisResult> T3WT_RESULTS_MAPPER = createThreeWindingsTransformersResults();
     private static final DataframeMapper<SecurityAnalysisResult> BUS_RESULTS_MAPPER = createBusResultsMapper();
     private static final DataframeMapper<SecurityAnalysisResult> LIMIT_VIOLATIONS_MAPPER = createLimitViolationsMapper();
+    private static final DataframeMapper<SecurityAnalysisResult> CONTINGENCY_STATUS_MAPPER = createContingencyStatusMapper();
+    private static final DataframeMapper<List<RejectedContingencyElement>> REJECTED_CONTINGENCY_ELEMENTS_MAPPER = createRejectedContingencyElementsMapper();
     private static final DataframeMapper<VoltageLevel.NodeBreakerView> NODE_BREAKER_VIEW_SWITCHES_MAPPER = createNodeBreakerViewSwitchesMapper();
     private static final DataframeMapper<VoltageLevel.NodeBreakerView> NODE_BREAKER_VIEW_NODES_MAPPER = createNodeBreakerViewNodes();
     private static final DataframeMapper<VoltageLevel.NodeBreakerView> NODE_BREAKER_VIEW_INTERNAL_CONNECTION_MAPPER = createNodeBreakerViewInternalConnections();
@@ -92,6 +100,137 @@ public final class Dataframes {
         return handler.getDataframePtr();
     }
 
+    /**
+     * Maps a network to a C struct, for each of the given variants.
+     * Dataframes of all variants are stacked, with an additional first index "variant_id".
+     * The working variant of the network is restored at the end.
+     */
+    public static ArrayPointer<SeriesPointer> createVariantsCDataframe(DataframeMapper<Network> mapper, Network network,
+                                                                       List<String> variantIds, DataframeFilter dataframeFilter) {
+        if (variantIds.isEmpty()) {
+            throw new PowsyblException("At least one variant is expected");
+        }
+        VariantManager variantManager = network.getVariantManager();
+        String workingVariantId = variantManager.getWorkingVariantId();
+        List<List<Series>> seriesByVariant = new ArrayList<>(variantIds.size());
+        try {
+            for (String variantId : variantIds) {
+                variantManager.setWorkingVariant(variantId);
+                List<Series> series = new ArrayList<>();
+                mapper.createDataframe(network, new DefaultDataframeHandler(series::add), dataframeFilter);
+                seriesByVariant.add(series);
+            }
+        } finally {
+            variantManager.setWorkingVariant(workingVariantId);
+        }
+        CDataframeHandler handler = new CDataframeHandler();
+        stackSeries("variant_id", variantIds, seriesByVariant, handler);
+        return handler.getDataframePtr();
+    }
+
+    /**
+     * Writes the concatenation of several dataframes, with an additional first index holding,
+     * for each row, the key of its dataframe.
+     *
+     * <p>Series are matched by name, since dataframes may not have the same series: for example, properties
+     * series only exist when some of the selected elements have the property. The result has the union
+     * of all series, in order of first appearance, rows of dataframes without a series having a null string
+     * or a NaN value for it.
+     */
+    static void stackSeries(String keyName, List<String> keys, List<List<Series>> seriesByKey, DataframeHandler handler) {
+        Map<String, Series> seriesByName = new LinkedHashMap<>();
+        List<Map<String, Series>> namedSeriesByKey = new ArrayList<>(seriesByKey.size());
+        for (List<Series> keySeries : seriesByKey) {
+            Map<String, Series> namedSeries = new HashMap<>();
+            for (Series series : keySeries) {
+                seriesByName.putIfAbsent(series.getName(), series);
+                namedSeries.put(series.getName(), series);
+            }
+            namedSeriesByKey.add(namedSeries);
+        }
+        int[] sizes = seriesByKey.stream().mapToInt(series -> series.isEmpty() ? 0 : series.get(0).getSize()).toArray();
+        int totalSize = Arrays.stream(sizes).sum();
+        handler.allocate(seriesByName.size() + 1);
+        DataframeHandler.StringSeriesWriter keyWriter = handler.newStringIndex(keyName, totalSize);
+        int row = 0;
+        for (int k = 0; k < keys.size(); k++) {
+            for (int i = 0; i < sizes[k]; i++) {
+                keyWriter.set(row++, keys.get(k));
+            }
+        }
+        for (Series series : seriesByName.values()) {
+            String name = series.getName();
+            int offset = 0;
+            switch (series.getType()) {
+                case STRING:
+                    DataframeHandler.StringSeriesWriter stringWriter = series.isIndex() ? handler.newStringIndex(name, totalSize)
+                            : handler.newStringSeries(name, totalSize);
+                    for (int k = 0; k < sizes.length; k++) {
+                        Series keySeries = namedSeriesByKey.get(k).get(name);
+                        // missing values are left null
+                        if (keySeries != null) {
+                            String[] values = keySeries.getStrings();
+                            for (int i = 0; i < values.length; i++) {
+                                stringWriter.set(offset + i, values[i]);
+                            }
+                        }
+                        offset += sizes[k];
+                    }
+                    break;
+                case INT:
+                    DataframeHandler.IntSeriesWriter intWriter = series.isIndex() ? handler.newIntIndex(name, totalSize)
+                            : handler.newIntSeries(name, totalSize);
+                    for (int k = 0; k < sizes.length; k++) {
+                        if (sizes[k] == 0) {
+                            continue;
+                        }
+                        int[] values = getKeySeries(namedSeriesByKey.get(k), name).getInts();
+                        for (int i = 0; i < values.length; i++) {
+                            intWriter.set(offset + i, values[i]);
+                        }
+                        offset += sizes[k];
+                    }
+                    break;
+                case DOUBLE:
+                    DataframeHandler.DoubleSeriesWriter doubleWriter = handler.newDoubleSeries(name, totalSize);
+                    for (int k = 0; k < sizes.length; k++) {
+                        Series keySeries = namedSeriesByKey.get(k).get(name);
+                        for (int i = 0; i < sizes[k]; i++) {
+                            doubleWriter.set(offset + i, keySeries != null ? keySeries.getDoubles()[i] : Double.NaN);
+                        }
+                        offset += sizes[k];
+                    }
+                    break;
+                case BOOLEAN:
+                    DataframeHandler.BooleanSeriesWriter booleanWriter = handler.newBooleanSeries(name, totalSize);
+                    for (int k = 0; k < sizes.length; k++) {
+                        if (sizes[k] == 0) {
+                            continue;
+                        }
+                        boolean[] values = getKeySeries(namedSeriesByKey.get(k), name).getBooleans();
+                        for (int i = 0; i < values.length; i++) {
+                            booleanWriter.set(offset + i, values[i]);
+                        }
+                        offset += sizes[k];
+                    }
+                    break;
+                default:
+                    throw new IllegalStateException("Unexpected series type: " + series.getType());
+            }
+        }
+    }
+
+    /**
+     * Integer and boolean series have no missing value: they must exist in all non empty dataframes.
+     */
+    private static Series getKeySeries(Map<String, Series> namedSeries, String name) {
+        Series series = namedSeries.get(name);
+        if (series == null) {
+            throw new IllegalStateException("Series " + name + " is missing from some dataframes");
+        }
+        return series;
+    }
+
     /**
      * Maps an object to java series
      */
@@ -128,6 +267,14 @@ public final class Dataframes {
         return LIMIT_VIOLATIONS_MAPPER;
     }
 
+    public static DataframeMapper<SecurityAnalysisResult> contingencyStatusMapper() {
+        return CONTINGENCY_STATUS_MAPPER;
+    }
+
+    public static DataframeMapper<List<RejectedContingencyElement>> rejectedContingencyElementsMapper() {
+        return REJECTED_CONTINGENCY_ELEMENTS_MAPPER;
+    }
+
     public static DataframeMapper<VoltageLevel.NodeBreakerView> nodeBreakerViewSwitches() {
         return NODE_BREAKER_VIEW_SWITCHES_MAPPER;
     }
@@ -265,6 +412,28 @@ public final class Dataframes {
                 .build();
     }
 
+    public static LoadFlowResult.ComponentResult.Status getStatus(LimitViolationsResult result) {
+        return result.isComputationOk() ? LoadFlowResult.ComponentResult.Status.CONVERGED : LoadFlowResult.ComponentResult.Status.FAILED;
+    }
+
+    private static DataframeMapper<SecurityAnalysisResult> createContingencyStatusMapper() {
+        return new DataframeMapperBuilder<SecurityAnalysisResult, PostContingencyResult>()
+                .itemsProvider(SecurityAnalysisResult::getPostContingencyResults)
+                .stringsIndex("contingency_id", r -> r.getContingency().getId())
+                .enums("status", LoadFlowResult.ComponentResult.Status.class, r -> getStatus(r.getLimitViolationsResult()))
+                .ints("limit_violation_count", r -> r.getLimitViolationsResult().getLimitViolations().size())
+                .build();
+    }
+
+    private static DataframeMapper<List<RejectedContingencyElement>> createRejectedContingencyElementsMapper() {
+        return new DataframeMapperBuilder<List<RejectedContingencyElement>, RejectedContingencyElement>()
+                .itemsProvider(elements -> elements)
+                .stringsIndex("contingency_id", RejectedContingencyElement::getContingencyId)
+                .stringsIndex("element_id", RejectedContingencyElement::getElementId)
+                .strings("reason", RejectedContingencyElement::getReason)
+                .build();
+    }
+
     private static List<NodeBreakerViewSwitchContext> getNodeBreakerViewSwitches(VoltageLevel.NodeBreakerView nodeBreakerView) {
         return IteratorUtils.toList(nodeBreakerView.getSwitches().iterator()).stream().map(switchContext ->
                 new NodeBreakerViewSwitchContext(switchContext,
@@ -18,6 +18,7 @@ import com.powsybl.dataframe.DataframeFilter;
 import com.powsybl.dataframe.DataframeFilter.AttributeFilterType;
 import com.powsybl.dataframe.SeriesDataType;
 import com.powsybl.dataframe.SeriesMetadata;
+import com.powsybl.dataframe.SeriesPredicate;
 import com.powsybl.dataframe.network.NetworkDataframeMapper;
 import com.powsybl.dataframe.network.NetworkDataframes;
 import com.powsybl.dataframe.network.adders.AliasDataframeAdder;
@@ -35,7 +36,9 @@ import com.powsybl.iidm.export.ExportersServiceLoader;
 import com.powsybl.iidm.import_.*;
 import com.powsybl.iidm.network.*;
 import com.powsybl.iidm.reducer.*;
+import com.powsybl.python.commons.ByteBufferInputStream;
 import com.powsybl.python.commons.CTypeUtil;
+import com.powsybl.python.commons.CommonCFunctions;
 import com.powsybl.python.commons.Directives;
 import com.powsybl.python.commons.PyPowsyblApiHeader;
 import com.powsybl.python.commons.Util;
@@ -49,17 +52,24 @@ import org.graalvm.nativeimage.ObjectHandles;
 import org.graalvm.nativeimage.UnmanagedMemory;
 import org.graalvm.nativeimage.c.CContext;
 import org.graalvm.nativeimage.c.function.CEntryPoint;
+import org.graalvm.nativeimage.c.function.CFunctionPointer;
+import org.graalvm.nativeimage.c.function.InvokeCFunctionPointer;
 import org.graalvm.nativeimage.c.struct.SizeOf;
 import org.graalvm.nativeimage.c.type.CCharPointer;
 import org.graalvm.nativeimage.c.type.CCharPointerPointer;
 import org.graalvm.nativeimage.c.type.CDoublePointer;
 import org.graalvm.nativeimage.c.type.CIntPointer;
+import org.graalvm.nativeimage.c.type.CTypeConversion;
 import org.graalvm.word.WordFactory;
 
 import java.io.*;
 import java.nio.charset.StandardCharsets;
 import java.nio.file.Paths;
 import java.util.*;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipOutputStream;
 
 import static com.powsybl.python.commons.CTypeUtil.toStringList;
 import static com.powsybl.python.commons.PyPowsyblApiHeader.*;
@@ -76,6 +86,7 @@ public final class NetworkCFunctions {
 
     private static final Supplier<ExportersLoader> EXPORTERS_LOADER_SUPPLIER = Suppliers.memoize(ExportersServiceLoader::new);
     private static final Supplier<ImportersLoader> IMPORTERS_LOADER_SUPPLIER = Suppliers.memoize(ImportersServiceLoader::new);
+    private static final String CGMES_TRIPLESTORE_PARAMETER = "iidm.import.cgmes.powsybl-triplestore";
 
     private NetworkCFunctions() {
     }
@@ -134,22 +145,62 @@ public final class NetworkCFunctions {
 
     @CEntryPoint(name = "loadNetwork")
     public static ObjectHandle loadNetwork(IsolateThread thread, CCharPointer file, CCharPointerPointer parameterNamesPtrPtr, int parameterNamesCount,
-                                           CCharPointerPointer parameterValuesPtrPtr, int parameterValuesCount, ObjectHandle reporterHandle,
-                                           ExceptionHandlerPointer exceptionHandlerPtr) {
+                                           CCharPointerPointer parameterValuesPtrPtr, int parameterValuesCount, int parallelism,
+                                           CCharPointerPointer skippedProfilesPtrPtr, int skippedProfilesCount, ObjectHandle reporterHandle,
+                                           ImportProgressCallback progressCallback, ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> {
             String fileStr = CTypeUtil.toString(file);
             Properties parameters = createParameters(parameterNamesPtrPtr, parameterNamesCount, parameterValuesPtrPtr, parameterValuesCount);
+            Set<String> skippedProfiles = new HashSet<>(toStringList(skippedProfilesPtrPtr, skippedProfilesCount));
             ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
+            int threads = parallelism > 0 ? parallelism : Runtime.getRuntime().availableProcessors();
             Network network;
-            if (reporter == null) {
-                network = Importers.loadNetwork(Paths.get(fileStr), LocalComputationManager.getDefault(), ImportConfig.load(), parameters);
+            // CGMES files are parsed by a dedicated triple store, unless another one is explicitly requested,
+            // other formats ignore this parameter
+            String tripleStore = parameters.getProperty(CGMES_TRIPLESTORE_PARAMETER);
+            if (tripleStore != null && !tripleStore.equals(ParallelTripleStoreFactoryService.NAME)) {
+                if (!skippedProfiles.isEmpty()) {
+                    throw new PowsyblException("Skipping CGMES profiles is not supported by triple store " + tripleStore);
+                }
+                network = loadNetwork(fileStr, parameters, reporter);
             } else {
-                network = Importers.loadNetwork(Paths.get(fileStr), LocalComputationManager.getDefault(), ImportConfig.load(), parameters, IMPORTERS_LOADER_SUPPLIER.get(), reporter);
+                parameters.setProperty(CGMES_TRIPLESTORE_PARAMETER, ParallelTripleStoreFactoryService.NAME);
+                ExecutorService executor = Executors.newFixedThreadPool(threads);
+                try {
+                    network = ParallelTripleStoreFactoryService.runImport(executor, skippedProfiles, createProgressListener(progressCallback),
+                        () -> loadNetwork(fileStr, parameters, reporter));
+                } finally {
+                    executor.shutdownNow();
+                }
             }
             return ObjectHandles.getGlobal().create(network);
         });
     }
 
+    interface ImportProgressCallback extends CFunctionPointer {
+        @InvokeCFunctionPointer
+        void invoke(CCharPointer fileName, int parsedCount, int totalCount);
+    }
+
+    private static ParallelTripleStore.ProgressListener createProgressListener(ImportProgressCallback progressCallback) {
+        if (progressCallback.isNull()) {
+            return ParallelTripleStore.ProgressListener.NO_OP;
+        }
+        return (fileName, parsedCount, totalCount) -> {
+            try (CTypeConversion.CCharPointerHolder fileNameHolder = CTypeConversion.toCString(fileName)) {
+                progressCallback.invoke(fileNameHolder.get(), parsedCount, totalCount);
+            }
+        };
+    }
+
+    private static Network loadNetwork(String file, Properties parameters, ReporterModel reporter) {
+        if (reporter == null) {
+            return Importers.loadNetwork(Paths.get(file), LocalComputationManager.getDefault(), ImportConfig.load(), parameters);
+        } else {
+            return Importers.loadNetwork(Paths.get(file), LocalComputationManager.getDefault(), ImportConfig.load(), parameters, IMPORTERS_LOADER_SUPPLIER.get(), reporter);
+        }
+    }
+
     @CEntryPoint(name = "loadNetworkFromString")
     public static ObjectHandle loadNetworkFromString(IsolateThread thread, CCharPointer fileName, CCharPointer fileContent,
                                                      CCharPointerPointer parameterNamesPtrPtr, int parameterNamesCount,
@@ -161,19 +212,38 @@ public final class NetworkCFunctions {
             Properties parameters = createParameters(parameterNamesPtrPtr, parameterNamesCount, parameterValuesPtrPtr, parameterValuesCount);
             ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
             try (InputStream is = new ByteArrayInputStream(fileContentStr.getBytes(StandardCharsets.UTF_8))) {
-                Network network;
-                if (reporter == null) {
-                    network = Importers.loadNetwork(fileNameStr, is, LocalComputationManager.getDefault(), ImportConfig.load(), parameters);
-                } else {
-                    network = Importers.loadNetwork(fileNameStr, is, LocalComputationManager.getDefault(), ImportConfig.load(), parameters, IMPORTERS_LOADER_SUPPLIER.get(), reporter);
-                }
-                return ObjectHandles.getGlobal().create(network);
+                return ObjectHandles.getGlobal().create(loadNetwork(fileNameStr, is, parameters, reporter));
             } catch (IOException e) {
                 throw new UncheckedIOException(e);
             }
         });
     }
 
+    @CEntryPoint(name = "loadNetworkFromBinaryBuffer")
+    public static ObjectHandle loadNetworkFromBinaryBuffer(IsolateThread thread, CCharPointer fileName, CCharPointer data, int size,
+                                                           CCharPointerPointer parameterNamesPtrPtr, int parameterNamesCount,
+                                                           CCharPointerPointer parameterValuesPtrPtr, int parameterValuesCount,
+                                                           ObjectHandle reporterHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            String fileNameStr = CTypeUtil.toString(fileName);
+            Properties parameters = createParameters(parameterNamesPtrPtr, parameterNamesCount, parameterValuesPtrPtr, parameterValuesCount);
+            ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
+            try (InputStream is = new ByteBufferInputStream(CTypeConversion.asByteBuffer(data, size))) {
+                return ObjectHandles.getGlobal().create(loadNetwork(fileNameStr, is, parameters, reporter));
+            } catch (IOException e) {
+                throw new UncheckedIOException(e);
+            }
+        });
+    }
+
+    private static Network loadNetwork(String fileName, InputStream is, Properties parameters, ReporterModel reporter) {
+        if (reporter == null) {
+            return Importers.loadNetwork(fileName, is, LocalComputationManager.getDefault(), ImportConfig.load(), parameters);
+        } else {
+            return Importers.loadNetwork(fileName, is, LocalComputationManager.getDefault(), ImportConfig.load(), parameters, IMPORTERS_LOADER_SUPPLIER.get(), reporter);
+        }
+    }
+
     @CEntryPoint(name = "dumpNetwork")
     public static void dumpNetwork(IsolateThread thread, ObjectHandle networkHandle, CCharPointer file, CCharPointer format,
                                    CCharPointerPointer parameterNamesPtrPtr, int parameterNamesCount,
@@ -202,17 +272,8 @@ public final class NetworkCFunctions {
             Network network = ObjectHandles.getGlobal().get(networkHandle);
             String formatStr = CTypeUtil.toString(format);
             Properties parameters = createParameters(parameterNamesPtrPtr, parameterNamesCount, parameterValuesPtrPtr, parameterValuesCount);
-            MemDataSource dataSource = new MemDataSource();
-            var exporter = Exporter.find(formatStr);
-            if (exporter == null) {
-                throw new PowsyblException("No exporter found for '" + formatStr + "' to export as a string");
-            }
             ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
-            if (reporter == null) {
-                exporter.export(network, parameters, dataSource);
-            } else {
-                exporter.export(network, parameters, dataSource, reporter);
-            }
+            MemDataSource dataSource = exportToMemDataSource(network, formatStr, parameters, reporter);
             try {
                 var names = dataSource.listNames(".*?");
                 if (names.size() != 1) {
@@ -229,6 +290,53 @@ public final class NetworkCFunctions {
         });
     }
 
+    @CEntryPoint(name = "dumpNetworkToBinaryBuffer")
+    public static ArrayPointer<CCharPointer> dumpNetworkToBinaryBuffer(IsolateThread thread, ObjectHandle networkHandle, CCharPointer format,
+                                                                       CCharPointerPointer parameterNamesPtrPtr, int parameterNamesCount,
+                                                                       CCharPointerPointer parameterValuesPtrPtr, int parameterValuesCount,
+                                                                       ObjectHandle reporterHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            String formatStr = CTypeUtil.toString(format);
+            Properties parameters = createParameters(parameterNamesPtrPtr, parameterNamesCount, parameterValuesPtrPtr, parameterValuesCount);
+            ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
+            MemDataSource dataSource = exportToMemDataSource(network, formatStr, parameters, reporter);
+            try {
+                List<String> names = new ArrayList<>(dataSource.listNames(".*?"));
+                if (names.size() == 1) {
+                    return Util.createByteArray(dataSource.getData(names.get(0)));
+                }
+                // multi files formats are zipped, as expected by importers
+                Collections.sort(names);
+                ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+                try (ZipOutputStream zip = new ZipOutputStream(bytes)) {
+                    for (String name : names) {
+                        zip.putNextEntry(new ZipEntry(name));
+                        zip.write(dataSource.getData(name));
+                        zip.closeEntry();
+                    }
+                }
+                return Util.createByteArray(bytes.toByteArray());
+            } catch (IOException e) {
+                throw new UncheckedIOException(e);
+            }
+        });
+    }
+
+    private static MemDataSource exportToMemDataSource(Network network, String format, Properties parameters, ReporterModel reporter) {
+        MemDataSource dataSource = new MemDataSource();
+        var exporter = Exporter.find(format);
+        if (exporter == null) {
+            throw new PowsyblException("No exporter found for '" + format + "'");
+        }
+        if (reporter == null) {
+            exporter.export(network, parameters, dataSource);
+        } else {
+            exporter.export(network, parameters, dataSource, reporter);
+        }
+        return dataSource;
+    }
+
     @CEntryPoint(name = "reduceNetwork")
     public static void reduceNetwork(IsolateThread thread, ObjectHandle networkHandle,
                                      double vMin, double vMax,
@@ -322,7 +430,79 @@ public final class NetworkCFunctions {
         });
     }
 
-    private static DataframeFilter createDataframeFilter(FilterAttributesType filterAttributesType, CCharPointerPointer attributesPtrPtr, int attributesCount, DataframePointer selectedElementsDataframe) {
+    @CEntryPoint(name = "serializeNetwork")
+    public static ArrayPointer<CCharPointer> serializeNetwork(IsolateThread thread, ObjectHandle networkHandle, boolean compress,
+                                                              ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            return Util.createByteArray(NetworkSerialization.serialize(network, compress));
+        });
+    }
+
+    @CEntryPoint(name = "deserializeNetwork")
+    public static ObjectHandle deserializeNetwork(IsolateThread thread, CCharPointer data, int size,
+                                                  ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            byte[] bytes = new byte[size];
+            CTypeConversion.asByteBuffer(data, size).get(bytes);
+            Network network = NetworkSerialization.deserialize(new ByteArrayInputStream(bytes));
+            return ObjectHandles.getGlobal().create(network);
+        });
+    }
+
+    @CEntryPoint(name = "copyNetwork")
+    public static ObjectHandle copyNetwork(IsolateThread thread, ObjectHandle networkHandle, CCharPointerPointer variantIdsPtrPtr,
+                                           int variantIdsCount, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            List<String> variantIds = toStringList(variantIdsPtrPtr, variantIdsCount);
+            return ObjectHandles.getGlobal().create(NetworkSerialization.copy(network, variantIds));
+        });
+    }
+
+    @CEntryPoint(name = "getNetworkModificationCount")
+    public static long getNetworkModificationCount(IsolateThread thread, ObjectHandle networkHandle, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            return NetworkModificationCounter.getModificationCount(network);
+        });
+    }
+
+    @CEntryPoint(name = "getVariantModificationCount")
+    public static long getVariantModificationCount(IsolateThread thread, ObjectHandle networkHandle, CCharPointer variantId, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            return NetworkModificationCounter.getVariantModificationCount(network, CTypeUtil.toString(variantId));
+        });
+    }
+
+    /**
+     * Creates predicates from a dataframe with 3 string columns: attribute, operator and value.
+     * Rows with the "in" operator on the same attribute are grouped in a single predicate.
+     */
+    static List<SeriesPredicate> createPredicates(UpdatingDataframe filterDataframe) {
+        if (filterDataframe == null) {
+            return Collections.emptyList();
+        }
+        StringSeries attributes = filterDataframe.getStrings("attribute");
+        StringSeries operators = filterDataframe.getStrings("operator");
+        StringSeries values = filterDataframe.getStrings("value");
+        List<SeriesPredicate> predicates = new ArrayList<>();
+        Map<String, List<String>> inValues = new LinkedHashMap<>();
+        for (int i = 0; i < filterDataframe.getRowCount(); i++) {
+            SeriesPredicate.Operator operator = SeriesPredicate.Operator.fromSymbol(operators.get(i));
+            if (operator == SeriesPredicate.Operator.IN) {
+                inValues.computeIfAbsent(attributes.get(i), k -> new ArrayList<>()).add(values.get(i));
+            } else {
+                predicates.add(new SeriesPredicate(attributes.get(i), operator, List.of(values.get(i))));
+            }
+        }
+        inValues.forEach((attribute, attributeValues) -> predicates.add(new SeriesPredicate(attribute, SeriesPredicate.Operator.IN, attributeValues)));
+        return predicates;
+    }
+
+    private static DataframeFilter createDataframeFilter(FilterAttributesType filterAttributesType, CCharPointerPointer attributesPtrPtr, int attributesCount,
+                                                         DataframePointer selectedElementsDataframe, DataframePointer filterDataframe) {
         List<String> attributes = toStringList(attributesPtrPtr, attributesCount);
         AttributeFilterType filterType = AttributeFilterType.DEFAULT_ATTRIBUTES;
         switch (filterAttributesType) {
@@ -337,10 +517,9 @@ public final class NetworkCFunctions {
                 break;
         }
 
-        DataframeFilter dataframeFilter = selectedElementsDataframe.isNonNull()
-                ? new DataframeFilter(filterType, attributes, createDataframe(selectedElementsDataframe))
-                : new DataframeFilter(filterType, attributes);
-        return dataframeFilter;
+        UpdatingDataframe selectingDataframe = selectedElementsDataframe.isNonNull() ? createDataframe(selectedElementsDataframe) : null;
+        UpdatingDataframe predicatesDataframe = filterDataframe.isNonNull() ? createDataframe(filterDataframe) : null;
+        return new DataframeFilter(filterType, attributes, selectingDataframe, createPredicates(predicatesDataframe));
     }
 
     @CEntryPoint(name = "createNetworkElementsSeriesArray")
@@ -349,15 +528,68 @@ public final class NetworkCFunctions {
                                                                                FilterAttributesType filterAttributesType,
                                                                                CCharPointerPointer attributesPtrPtr, int attributesCount,
                                                                                DataframePointer selectedElementsDataframe,
+                                                                               DataframePointer filterDataframe,
                                                                                ExceptionHandlerPointer exceptionHandlerPtr) {
         return Util.doCatch(exceptionHandlerPtr, () -> {
             NetworkDataframeMapper mapper = NetworkDataframes.getDataframeMapper(convert(elementType));
             Network network = ObjectHandles.getGlobal().get(networkHandle);
-            DataframeFilter dataframeFilter = createDataframeFilter(filterAttributesType, attributesPtrPtr, attributesCount, selectedElementsDataframe);
+            DataframeFilter dataframeFilter = createDataframeFilter(filterAttributesType, attributesPtrPtr, attributesCount, selectedElementsDataframe, filterDataframe);
             return Dataframes.createCDataframe(mapper, network, dataframeFilter);
         });
     }
 
+    @CEntryPoint(name = "createNetworkElementsVariantsSeriesArray")
+    public static ArrayPointer<SeriesPointer> createNetworkElementsVariantsSeriesArray(IsolateThread thread, ObjectHandle networkHandle,
+                                                                                       ElementType elementType,
+                                                                                       FilterAttributesType filterAttributesType,
+                                                                                       CCharPointerPointer attributesPtrPtr, int attributesCount,
+                                                                                       DataframePointer selectedElementsDataframe,
+                                                                                       DataframePointer filterDataframe,
+                                                                                       CCharPointerPointer variantIdsPtrPtr, int variantIdsCount,
+                                                                                       ExceptionHandlerPointer exceptionHandlerPtr) {
+        return Util.doCatch(exceptionHandlerPtr, () -> {
+            NetworkDataframeMapper mapper = NetworkDataframes.getDataframeMapper(convert(elementType));
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            DataframeFilter dataframeFilter = createDataframeFilter(filterAttributesType, attributesPtrPtr, attributesCount, selectedElementsDataframe, filterDataframe);
+            List<String> variantIds = toStringList(variantIdsPtrPtr, variantIdsCount);
+            return Dataframes.createVariantsCDataframe(mapper, network, variantIds, dataframeFilter);
+        });
+    }
+
+    @CEntryPoint(name = "createNetworkElementsSeriesArrays")
+    public static ArrayPointer<ArrayPointerPointer> createNetworkElementsSeriesArrays(IsolateThread thread, ObjectHandle networkHandle,
+                                                                                    CIntPointer elementTypes,
+                                                                                    CIntPointer filterAttributesTypes,
+                                                                                    CCharPointerPointer attributesPtrPtr,
+                                                                                    CIntPointer attributesCounts,
+                                                                                    int elementTypesCount,
+                                                                                    ExceptionHandlerPointer exceptionHandlerPtr) {
+        return Util.doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            ArrayPointerPointer seriesArrays = UnmanagedMemory.calloc(elementTypesCount * SizeOf.get(ArrayPointerPointer.class));
+            int attributesOffset = 0;
+            int createdCount = 0;
+            try {
+                for (int i = 0; i < elementTypesCount; i++) {
+                    NetworkDataframeMapper mapper = NetworkDataframes.getDataframeMapper(convert(ElementType.fromCValue(elementTypes.read(i))));
+                    int attributesCount = attributesCounts.read(i);
+                    DataframeFilter dataframeFilter = createDataframeFilter(FilterAttributesType.fromCValue(filterAttributesTypes.read(i)),
+                            attributesPtrPtr.addressOf(attributesOffset), attributesCount, WordFactory.nullPointer(), WordFactory.nullPointer());
+                    attributesOffset += attributesCount;
+                    seriesArrays.write(i, Dataframes.createCDataframe(mapper, network, dataframeFilter));
+                    createdCount++;
+                }
+            } catch (RuntimeException e) {
+                for (int i = 0; i < createdCount; i++) {
+                    CommonCFunctions.freeSeriesArrayPointer(seriesArrays.read(i));
+                }
+                UnmanagedMemory.free(seriesArrays);
+                throw e;
+            }
+            return allocArrayPointer(seriesArrays, elementTypesCount);
+        });
+    }
+
     @CEntryPoint(name = "createNetworkElementsExtensionSeriesArray")
     public static ArrayPointer<PyPowsyblApiHeader.SeriesPointer> createNetworkElementsExtensionSeriesArray(IsolateThread thread, ObjectHandle networkHandle,
                                                                                                            CCharPointer extensionName,
@@ -802,6 +1034,47 @@ public final class NetworkCFunctions {
         });
     }
 
+    @CEntryPoint(name = "updateSwitchesPositions")
+    public static ArrayPointer<CIntPointer> updateSwitchesPositions(IsolateThread thread, ObjectHandle networkHandle, CCharPointerPointer idsPtrPtr,
+                                                                    CIntPointer openPtr, int count, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            List<String> ids = toStringList(idsPtrPtr, count);
+            List<Boolean> open = toBooleanList(openPtr, count);
+            return createBooleanArray(NetworkUtil.updateSwitchesPositions(network, ids, open));
+        });
+    }
+
+    @CEntryPoint(name = "updateConnectablesStatus")
+    public static ArrayPointer<CIntPointer> updateConnectablesStatus(IsolateThread thread, ObjectHandle networkHandle, CCharPointerPointer idsPtrPtr,
+                                                                     CIntPointer connectedPtr, int count, ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            List<String> ids = toStringList(idsPtrPtr, count);
+            List<Boolean> connected = toBooleanList(connectedPtr, count);
+            return createBooleanArray(NetworkUtil.updateConnectablesStatus(network, ids, connected));
+        });
+    }
+
+    private static List<Boolean> toBooleanList(CIntPointer intPointer, int length) {
+        List<Boolean> booleans = new ArrayList<>(length);
+        for (int i = 0; i < length; i++) {
+            booleans.add(intPointer.read(i) != 0);
+        }
+        return booleans;
+    }
+
+    /**
+     * Booleans are exchanged as integers (0 or 1).
+     */
+    private static ArrayPointer<CIntPointer> createBooleanArray(boolean[] booleans) {
+        List<Integer> integers = new ArrayList<>(booleans.length);
+        for (boolean b : booleans) {
+            integers.add(b ? 1 : 0);
+        }
+        return createIntegerArray(integers);
+    }
+
     @CEntryPoint(name = "writeSingleLineDiagramSvg")
     public static void writeSingleLineDiagramSvg(IsolateThread thread, ObjectHandle networkHandle, CCharPointer containerId,
                                                  CCharPointer svgFile, ExceptionHandlerPointer exceptionHandlerPtr) {
@@ -0,0 +1,80 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.network;
+
+import com.powsybl.iidm.network.DefaultNetworkListener;
+import com.powsybl.iidm.network.Identifiable;
+import com.powsybl.iidm.network.Network;
+
+import java.util.Collections;
+import java.util.Map;
+import java.util.WeakHashMap;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Counts the modifications of a network: creations, removals and updates of its elements.
+ * Used on python side to know if previously fetched dataframe columns are still valid,
+ * and if the variants of a variant pool need to be reset.
+ * The counter listening to a network is created on first request.
+ */
+public final class NetworkModificationCounter extends DefaultNetworkListener {
+
+    private static final Map<Network, NetworkModificationCounter> COUNTERS = Collections.synchronizedMap(new WeakHashMap<>());
+
+    private final AtomicLong count = new AtomicLong();
+
+    private final Map<String, AtomicLong> variantsCounts = new ConcurrentHashMap<>();
+
+    private NetworkModificationCounter() {
+    }
+
+    private static NetworkModificationCounter getCounter(Network network) {
+        return COUNTERS.computeIfAbsent(network, n -> {
+            NetworkModificationCounter counter = new NetworkModificationCounter();
+            n.addListener(counter);
+            return counter;
+        });
+    }
+
+    /**
+     * The number of modifications of the network since its counter was created.
+     */
+    public static long getModificationCount(Network network) {
+        return getCounter(network).count.get();
+    }
+
+    /**
+     * The number of modifications of variant dependent attributes of the given variant
+     * since the counter of the network was created.
+     */
+    public static long getVariantModificationCount(Network network, String variantId) {
+        AtomicLong variantCount = getCounter(network).variantsCounts.get(variantId);
+        return variantCount != null ? variantCount.get() : 0;
+    }
+
+    @Override
+    public void onCreation(Identifiable<?> identifiable) {
+        count.incrementAndGet();
+    }
+
+    @Override
+    public void afterRemoval(String id) {
+        count.incrementAndGet();
+    }
+
+    @Override
+    public void onUpdate(Identifiable<?> identifiable, String attribute, Object oldValue, Object newValue) {
+        count.incrementAndGet();
+    }
+
+    @Override
+    public void onUpdate(Identifiable<?> identifiable, String attribute, String variantId, Object oldValue, Object newValue) {
+        count.incrementAndGet();
+        variantsCounts.computeIfAbsent(variantId, v -> new AtomicLong()).incrementAndGet();
+    }
+}
@@ -0,0 +1,346 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.network;
+
+import com.powsybl.commons.PowsyblException;
+import com.powsybl.dataframe.DataframeElementType;
+import com.powsybl.dataframe.DataframeFilter;
+import com.powsybl.dataframe.SeriesDataType;
+import com.powsybl.dataframe.SeriesMetadata;
+import com.powsybl.dataframe.impl.DefaultDataframeHandler;
+import com.powsybl.dataframe.impl.Series;
+import com.powsybl.dataframe.network.NetworkDataframeMapper;
+import com.powsybl.dataframe.network.NetworkDataframes;
+import com.powsybl.dataframe.update.DefaultUpdatingDataframe;
+import com.powsybl.dataframe.update.DoubleSeries;
+import com.powsybl.dataframe.update.IntSeries;
+import com.powsybl.dataframe.update.StringSeries;
+import com.powsybl.iidm.network.Network;
+import com.powsybl.iidm.network.VariantManager;
+import com.powsybl.iidm.network.VariantManagerConstants;
+import com.powsybl.iidm.xml.ExportOptions;
+import com.powsybl.iidm.xml.NetworkXml;
+
+import java.io.*;
+import java.nio.charset.StandardCharsets;
+import java.util.*;
+import java.util.stream.Collectors;
+import java.util.stream.IntStream;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
+
+/**
+ * Serializes a network, with all its variants, to a compact binary representation.
+ *
+ * <p>The initial variant is serialized as XIIDM. For each other variant, only the values of modifiable
+ * attributes of variant dependent elements which differ from the initial variant are serialized,
+ * and they are applied again, through dataframe mappers, on deserialization.
+ * The whole content may be compressed with gzip, which is detected on deserialization.
+ */
+public final class NetworkSerialization {
+
+    private static final int MAGIC = 0x50504E57;
+    private static final int VERSION = 1;
+
+    /**
+     * Element types holding variant dependent attributes, in the order their updates must be applied:
+     * switches first, since they define the buses of the bus view.
+     */
+    private static final List<DataframeElementType> VARIANT_ELEMENT_TYPES = List.of(
+            DataframeElementType.SWITCH,
+            DataframeElementType.RATIO_TAP_CHANGER,
+            DataframeElementType.PHASE_TAP_CHANGER,
+            DataframeElementType.GENERATOR,
+            DataframeElementType.LOAD,
+            DataframeElementType.BATTERY,
+            DataframeElementType.SHUNT_COMPENSATOR,
+            DataframeElementType.STATIC_VAR_COMPENSATOR,
+            DataframeElementType.VSC_CONVERTER_STATION,
+            DataframeElementType.LCC_CONVERTER_STATION,
+            DataframeElementType.DANGLING_LINE,
+            DataframeElementType.HVDC_LINE,
+            DataframeElementType.LINE,
+            DataframeElementType.TWO_WINDINGS_TRANSFORMER,
+            DataframeElementType.THREE_WINDINGS_TRANSFORMER,
+            DataframeElementType.BUS
+    );
+
+    private NetworkSerialization() {
+    }
+
+    public static byte[] serialize(Network network, boolean compress) {
+        return serialize(network, network.getVariantManager().getVariantIds(), compress);
+    }
+
+    private static byte[] serialize(Network network, Collection<String> variantIds, boolean compress) {
+        ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+        try (OutputStream os = compress ? new GZIPOutputStream(bytes) : bytes;
+             DataOutputStream out = new DataOutputStream(new BufferedOutputStream(os))) {
+            write(network, variantIds, out);
+        } catch (IOException e) {
+            throw new UncheckedIOException(e);
+        }
+        return bytes.toByteArray();
+    }
+
+    /**
+     * Copies a network, with the given variants. The initial variant is always copied.
+     * The working variant of the copy is the working variant of the network if it is copied,
+     * the initial variant otherwise.
+     */
+    public static Network copy(Network network, List<String> variantIds) {
+        Collection<String> existingVariantIds = network.getVariantManager().getVariantIds();
+        for (String variantId : variantIds) {
+            if (!existingVariantIds.contains(variantId)) {
+                throw new PowsyblException("Variant '" + variantId + "' not found");
+            }
+        }
+        return deserialize(new ByteArrayInputStream(serialize(network, variantIds, false)));
+    }
+
+    public static Network deserialize(InputStream is) {
+        try (InputStream buffered = new BufferedInputStream(is)) {
+            buffered.mark(2);
+            boolean compressed = buffered.read() == 0x1f && buffered.read() == 0x8b;
+            buffered.reset();
+            try (DataInputStream in = new DataInputStream(compressed ? new BufferedInputStream(new GZIPInputStream(buffered)) : buffered)) {
+                return read(in);
+            }
+        } catch (IOException e) {
+            throw new UncheckedIOException(e);
+        }
+    }
+
+    private static void write(Network network, Collection<String> copiedVariantIds, DataOutputStream out) throws IOException {
+        out.writeInt(MAGIC);
+        out.writeInt(VERSION);
+        VariantManager variantManager = network.getVariantManager();
+        String workingVariantId = variantManager.getWorkingVariantId();
+        writeString(out, copiedVariantIds.contains(workingVariantId) ? workingVariantId : VariantManagerConstants.INITIAL_VARIANT_ID);
+        try {
+            variantManager.setWorkingVariant(VariantManagerConstants.INITIAL_VARIANT_ID);
+            ByteArrayOutputStream xml = new ByteArrayOutputStream();
+            NetworkXml.write(network, new ExportOptions(), xml);
+            out.writeInt(xml.size());
+            xml.writeTo(out);
+
+            Map<DataframeElementType, Map<String, Series>> initialSeries = new EnumMap<>(DataframeElementType.class);
+            for (DataframeElementType type : VARIANT_ELEMENT_TYPES) {
+                initialSeries.put(type, getModifiableSeries(network, type));
+            }
+            List<String> variantIds = variantManager.getVariantIds().stream()
+                    .filter(id -> !id.equals(VariantManagerConstants.INITIAL_VARIANT_ID) && copiedVariantIds.contains(id))
+                    .collect(Collectors.toList());
+            out.writeInt(variantIds.size());
+            for (String variantId : variantIds) {
+                variantManager.setWorkingVariant(variantId);
+                writeString(out, variantId);
+                out.writeInt(VARIANT_ELEMENT_TYPES.size());
+                for (DataframeElementType type : VARIANT_ELEMENT_TYPES) {
+                    writeString(out, type.name());
+                    writeDifferences(out, initialSeries.get(type), getModifiableSeries(network, type));
+                }
+            }
+        } finally {
+            variantManager.setWorkingVariant(workingVariantId);
+        }
+    }
+
+    private static Network read(DataInputStream in) throws IOException {
+        if (in.readInt() != MAGIC) {
+            throw new PowsyblException("Invalid serialized network");
+        }
+        int version = in.readInt();
+        if (version != VERSION) {
+            throw new PowsyblException("Unsupported serialized network version: " + version);
+        }
+        String workingVariantId = readString(in);
+        byte[] xml = new byte[in.readInt()];
+        in.readFully(xml);
+        Network network = NetworkXml.read(new ByteArrayInputStream(xml));
+        VariantManager variantManager = network.getVariantManager();
+        int variantsCount = in.readInt();
+        for (int v = 0; v < variantsCount; v++) {
+            String variantId = readString(in);
+            variantManager.cloneVariant(VariantManagerConstants.INITIAL_VARIANT_ID, variantId);
+            variantManager.setWorkingVariant(variantId);
+            int typesCount = in.readInt();
+            for (int t = 0; t < typesCount; t++) {
+                DataframeElementType type = DataframeElementType.valueOf(readString(in));
+                DefaultUpdatingDataframe dataframe = readDataframe(in);
+                if (dataframe.getRowCount() > 0) {
+                    NetworkDataframes.getDataframeMapper(type).updateSeries(network, dataframe);
+                }
+            }
+        }
+        variantManager.setWorkingVariant(workingVariantId);
+        return network;
+    }
+
+    private static Map<String, Series> getModifiableSeries(Network network, DataframeElementType type) {
+        NetworkDataframeMapper mapper = NetworkDataframes.getDataframeMapper(type);
+        List<String> attributes = mapper.getSeriesMetadata().stream()
+                .filter(m -> !m.isIndex() && m.isModifiable())
+                .map(SeriesMetadata::getName)
+                .collect(Collectors.toList());
+        Map<String, Series> series = new LinkedHashMap<>();
+        mapper.createDataframe(network, new DefaultDataframeHandler(s -> series.put(s.getName(), s)),
+                new DataframeFilter(DataframeFilter.AttributeFilterType.INPUT_ATTRIBUTES, attributes));
+        return series;
+    }
+
+    private static String[] getIds(Map<String, Series> series) {
+        return series.values().stream()
+                .filter(Series::isIndex)
+                .findFirst()
+                .orElseThrow(() -> new PowsyblException("No index in dataframe"))
+                .getStrings();
+    }
+
+    /**
+     * Writes the rows of the variant series which differ from the initial series,
+     * with only the columns having at least one difference.
+     */
+    private static void writeDifferences(DataOutputStream out, Map<String, Series> initialSeries, Map<String, Series> variantSeries) throws IOException {
+        String[] initialIds = getIds(initialSeries);
+        String[] ids = getIds(variantSeries);
+        Map<String, Integer> initialRows = new HashMap<>();
+        for (int i = 0; i < initialIds.length; i++) {
+            initialRows.put(initialIds[i], i);
+        }
+        int[] initialRowByRow = Arrays.stream(ids).mapToInt(id -> initialRows.getOrDefault(id, -1)).toArray();
+
+        boolean[] modifiedRows = new boolean[ids.length];
+        List<Series> modifiedSeries = new ArrayList<>();
+        for (Series series : variantSeries.values()) {
+            if (series.isIndex()) {
+                continue;
+            }
+            Series initial = initialSeries.get(series.getName());
+            boolean modified = false;
+            for (int i = 0; i < ids.length; i++) {
+                if (initialRowByRow[i] < 0 || !valueEquals(series, i, initial, initialRowByRow[i])) {
+                    modifiedRows[i] = true;
+                    modified = true;
+                }
+            }
+            if (modified) {
+                modifiedSeries.add(series);
+            }
+        }
+        int[] rows = IntStream.range(0, ids.length).filter(i -> modifiedRows[i]).toArray();
+        out.writeInt(rows.length);
+        out.writeInt(modifiedSeries.size());
+        for (int row : rows) {
+            writeString(out, ids[row]);
+        }
+        for (Series series : modifiedSeries) {
+            writeString(out, series.getName());
+            out.writeByte(series.getType().ordinal());
+            for (int row : rows) {
+                writeValue(out, series, row);
+            }
+        }
+    }
+
+    private static boolean valueEquals(Series series, int row, Series other, int otherRow) {
+        switch (series.getType()) {
+            case STRING:
+                return Objects.equals(series.getStrings()[row], other.getStrings()[otherRow]);
+            case DOUBLE:
+                return Double.compare(series.getDoubles()[row], other.getDoubles()[otherRow]) == 0;
+            case INT:
+                return series.getInts()[row] == other.getInts()[otherRow];
+            case BOOLEAN:
+                return series.getBooleans()[row] == other.getBooleans()[otherRow];
+            default:
+                throw new IllegalStateException("Unexpected series type: " + series.getType());
+        }
+    }
+
+    private static void writeValue(DataOutputStream out, Series series, int row) throws IOException {
+        switch (series.getType()) {
+            case STRING:
+                writeString(out, series.getStrings()[row]);
+                break;
+            case DOUBLE:
+                out.writeDouble(series.getDoubles()[row]);
+                break;
+            case INT:
+                out.writeInt(series.getInts()[row]);
+                break;
+            case BOOLEAN:
+                out.writeBoolean(series.getBooleans()[row]);
+                break;
+            default:
+                throw new IllegalStateException("Unexpected series type: " + series.getType());
+        }
+    }
+
+    private static DefaultUpdatingDataframe readDataframe(DataInputStream in) throws IOException {
+        int rowCount = in.readInt();
+        int seriesCount = in.readInt();
+        String[] ids = new String[rowCount];
+        for (int i = 0; i < rowCount; i++) {
+            ids[i] = readString(in);
+        }
+        DefaultUpdatingDataframe dataframe = new DefaultUpdatingDataframe(rowCount);
+        dataframe.addSeries("id", true, (StringSeries) i -> ids[i]);
+        for (int s = 0; s < seriesCount; s++) {
+            String name = readString(in);
+            SeriesDataType type = SeriesDataType.values()[in.readByte()];
+            switch (type) {
+                case STRING:
+                    String[] strings = new String[rowCount];
+                    for (int i = 0; i < rowCount; i++) {
+                        strings[i] = readString(in);
+                    }
+                    dataframe.addSeries(name, false, (StringSeries) i -> strings[i]);
+                    break;
+                case DOUBLE:
+                    double[] doubles = new double[rowCount];
+                    for (int i = 0; i < rowCount; i++) {
+                        doubles[i] = in.readDouble();
+                    }
+                    dataframe.addSeries(name, false, (DoubleSeries) i -> doubles[i]);
+                    break;
+                case INT:
+                case BOOLEAN:
+                    // booleans are updated as integers, like when updating from python
+                    int[] ints = new int[rowCount];
+                    for (int i = 0; i < rowCount; i++) {
+                        ints[i] = type == SeriesDataType.INT ? in.readInt() : (in.readBoolean() ? 1 : 0);
+                    }
+                    dataframe.addSeries(name, false, (IntSeries) i -> ints[i]);
+                    break;
+                default:
+                    throw new IllegalStateException("Unexpected series type: " + type);
+            }
+        }
+        return dataframe;
+    }
+
+    private static void writeString(DataOutputStream out, String value) throws IOException {
+        if (value == null) {
+            out.writeInt(-1);
+            return;
+        }
+        byte[] bytes = value.getBytes(StandardCharsets.UTF_8);
+        out.writeInt(bytes.length);
+        out.write(bytes);
+    }
+
+    private static String readString(DataInputStream in) throws IOException {
+        int length = in.readInt();
+        if (length < 0) {
+            return null;
+        }
+        byte[] bytes = new byte[length];
+        in.readFully(bytes);
+        return new String(bytes, StandardCharsets.UTF_8);
+    }
+}
@@ -28,10 +28,33 @@ public final class NetworkUtil {
     }
 
     static boolean updateSwitchPosition(Network network, String switchId, boolean open) {
+        return updateSwitchPosition(getSwitch(network, switchId), open);
+    }
+
+    /**
+     * Updates the position of several switches. All switches are checked to exist before any update.
+     *
+     * @return for each switch, true if its position has changed
+     */
+    static boolean[] updateSwitchesPositions(Network network, List<String> switchesIds, List<Boolean> open) {
+        checkSameSize(switchesIds, open);
+        List<Switch> switches = switchesIds.stream().map(id -> getSwitch(network, id)).collect(Collectors.toList());
+        boolean[] changed = new boolean[switches.size()];
+        for (int i = 0; i < switches.size(); i++) {
+            changed[i] = updateSwitchPosition(switches.get(i), open.get(i));
+        }
+        return changed;
+    }
+
+    private static Switch getSwitch(Network network, String switchId) {
         Switch sw = network.getSwitch(switchId);
         if (sw == null) {
             throw new PowsyblException("Switch '" + switchId + "' not found");
         }
+        return sw;
+    }
+
+    private static boolean updateSwitchPosition(Switch sw, boolean open) {
         if (open && !sw.isOpen()) {
             sw.setOpen(true);
             return true;
@@ -43,6 +66,32 @@ public final class NetworkUtil {
     }
 
     static boolean updateConnectableStatus(Network network, String id, boolean connected) {
+        return updateConnectableStatus(getConnectable(network, id), connected);
+    }
+
+    /**
+     * Connects or disconnects several equipments. All equipments are checked to exist,
+     * and to be connectables, before any update.
+     *
+     * @return for each equipment, true if its status has changed
+     */
+    static boolean[] updateConnectablesStatus(Network network, List<String> ids, List<Boolean> connected) {
+        checkSameSize(ids, connected);
+        List<Identifiable<?>> equipments = ids.stream().<Identifiable<?>>map(id -> getConnectable(network, id)).collect(Collectors.toList());
+        boolean[] changed = new boolean[equipments.size()];
+        for (int i = 0; i < equipments.size(); i++) {
+            changed[i] = updateConnectableStatus(equipments.get(i), connected.get(i));
+        }
+        return changed;
+    }
+
+    private static void checkSameSize(List<String> ids, List<Boolean> values) {
+        if (ids.size() != values.size()) {
+            throw new PowsyblException("Ids and values must have the same size: " + ids.size() + " != " + values.size());
+        }
+    }
+
+    private static Identifiable<?> getConnectable(Network network, String id) {
         Identifiable<?> equipment = network.getIdentifiable(id);
         if (equipment == null) {
             throw new PowsyblException("Equipment '" + id + "' not found");
@@ -50,6 +99,10 @@ public final class NetworkUtil {
         if (!(equipment instanceof Connectable)) {
             throw new PowsyblException("Equipment '" + id + "' is not a connectable");
         }
+        return equipment;
+    }
+
+    private static boolean updateConnectableStatus(Identifiable<?> equipment, boolean connected) {
         if (equipment instanceof Injection) {
             Injection<?> injection = (Injection<?>) equipment;
             if (connected) {
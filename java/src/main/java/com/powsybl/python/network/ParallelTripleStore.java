@@ -0,0 +1,186 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.network;
+
+import com.powsybl.commons.PowsyblException;
+import com.powsybl.triplestore.api.PropertyBags;
+import com.powsybl.triplestore.api.TripleStoreOptions;
+import com.powsybl.triplestore.impl.rdf4j.TripleStoreRDF4J;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+
+import java.io.ByteArrayInputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.UncheckedIOException;
+import java.nio.charset.StandardCharsets;
+import java.util.*;
+import java.util.concurrent.*;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+/**
+ * A RDF4J triple store which parses files in parallel, and skips files of some CGMES profiles.
+ *
+ * <p>Reading a file only buffers its content and submits its parsing to an executor,
+ * so that the importer can read the next file right away. Parsing of all submitted files
+ * is awaited by the first query, which logs the progress as files are parsed
+ * and notifies it to the progress listener of the store.
+ */
+public class ParallelTripleStore extends TripleStoreRDF4J {
+
+    private static final Logger LOGGER = LoggerFactory.getLogger(ParallelTripleStore.class);
+
+    /**
+     * Profiles are declared in the header of the file, so only its beginning is searched for them.
+     */
+    private static final int HEADER_SIZE = 64 * 1024;
+
+    private static final Pattern PROFILE_PATTERN = Pattern.compile("Model\\.profile>\\s*([^<\\s]+)\\s*<");
+
+    private static final Set<String> PROFILES_IN_FILE_NAMES = Set.of("EQ", "TP", "SSH", "SV", "DL", "GL", "DY");
+
+    private final ExecutorService executor;
+    private final CompletionService<String> completionService;
+    private final Set<String> skippedProfiles;
+    private final ProgressListener progressListener;
+    private int submittedCount = 0;
+    private int parsedCount = 0;
+
+    /**
+     * Notified each time a file has been parsed, in the thread awaiting the parsing.
+     */
+    @FunctionalInterface
+    public interface ProgressListener {
+
+        ProgressListener NO_OP = (fileName, parsedCount, totalCount) -> { };
+
+        void onFileParsed(String fileName, int parsedCount, int totalCount);
+    }
+
+    public ParallelTripleStore(TripleStoreOptions options, ExecutorService executor, Set<String> skippedProfiles) {
+        this(options, executor, skippedProfiles, ProgressListener.NO_OP);
+    }
+
+    public ParallelTripleStore(TripleStoreOptions options, ExecutorService executor, Set<String> skippedProfiles,
+                               ProgressListener progressListener) {
+        super(options);
+        this.executor = Objects.requireNonNull(executor);
+        this.completionService = new ExecutorCompletionService<>(executor);
+        this.skippedProfiles = Objects.requireNonNull(skippedProfiles);
+        this.progressListener = Objects.requireNonNull(progressListener);
+    }
+
+    @Override
+    public synchronized void read(InputStream is, String baseName, String contextName) {
+        byte[] data;
+        try {
+            data = is.readAllBytes();
+        } catch (IOException e) {
+            throw new UncheckedIOException(e);
+        }
+        Set<String> profiles = getProfiles(data, contextName);
+        if (!profiles.isEmpty() && skippedProfiles.containsAll(profiles)) {
+            LOGGER.info("Skipped CGMES file {} of profiles {}", contextName, profiles);
+            return;
+        }
+        if (executor.isShutdown()) {
+            // files read after the import, for example to update the model
+            super.read(new ByteArrayInputStream(data), baseName, contextName);
+            return;
+        }
+        completionService.submit(() -> {
+            super.read(new ByteArrayInputStream(data), baseName, contextName);
+            return contextName;
+        });
+        submittedCount++;
+    }
+
+    private synchronized void awaitPendingReads() {
+        try {
+            while (parsedCount < submittedCount) {
+                String contextName = completionService.take().get();
+                parsedCount++;
+                LOGGER.info("Parsed CGMES file {} ({} of {})", contextName, parsedCount, submittedCount);
+                progressListener.onFileParsed(contextName, parsedCount, submittedCount);
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new PowsyblException("Interrupted while parsing CGMES files", e);
+        } catch (ExecutionException e) {
+            if (e.getCause() instanceof RuntimeException) {
+                throw (RuntimeException) e.getCause();
+            }
+            throw new PowsyblException("Failed to parse CGMES file", e.getCause());
+        }
+    }
+
+    @Override
+    public PropertyBags query(String query) {
+        awaitPendingReads();
+        return super.query(query);
+    }
+
+    @Override
+    public void update(String query) {
+        awaitPendingReads();
+        super.update(query);
+    }
+
+    @Override
+    public Set<String> contextNames() {
+        awaitPendingReads();
+        return super.contextNames();
+    }
+
+    /**
+     * CGMES profiles of a file, from the profiles declared in its header,
+     * or from the usual naming of CGMES files when there are none.
+     */
+    static Set<String> getProfiles(byte[] data, String fileName) {
+        Set<String> profiles = new TreeSet<>();
+        String header = new String(data, 0, Math.min(data.length, HEADER_SIZE), StandardCharsets.ISO_8859_1);
+        Matcher matcher = PROFILE_PATTERN.matcher(header);
+        while (matcher.find()) {
+            String profile = getProfile(matcher.group(1));
+            if (profile != null) {
+                profiles.add(profile);
+            }
+        }
+        if (profiles.isEmpty()) {
+            for (String token : fileName.toUpperCase().split("[_.\\-/]")) {
+                if (PROFILES_IN_FILE_NAMES.contains(token)) {
+                    profiles.add(token);
+                }
+            }
+        }
+        return profiles;
+    }
+
+    private static String getProfile(String uri) {
+        if (uri.contains("EquipmentBoundary")) {
+            return "EQ_BD";
+        } else if (uri.contains("TopologyBoundary")) {
+            return "TP_BD";
+        } else if (uri.contains("Equipment") || uri.contains("Operation") || uri.contains("ShortCircuit")) {
+            return "EQ";
+        } else if (uri.contains("SteadyStateHypothesis")) {
+            return "SSH";
+        } else if (uri.contains("StateVariables")) {
+            return "SV";
+        } else if (uri.contains("Topology")) {
+            return "TP";
+        } else if (uri.contains("DiagramLayout")) {
+            return "DL";
+        } else if (uri.contains("GeographicalLocation")) {
+            return "GL";
+        } else if (uri.contains("Dynamics")) {
+            return "DY";
+        }
+        return null;
+    }
+}
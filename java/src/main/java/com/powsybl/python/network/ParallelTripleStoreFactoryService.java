@@ -0,0 +1,82 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.network;
+
+import com.google.auto.service.AutoService;
+import com.powsybl.triplestore.api.TripleStore;
+import com.powsybl.triplestore.api.TripleStoreFactoryService;
+import com.powsybl.triplestore.api.TripleStoreOptions;
+import com.powsybl.triplestore.impl.rdf4j.TripleStoreFactoryServiceRDF4J;
+
+import java.util.Collections;
+import java.util.Objects;
+import java.util.Set;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.ForkJoinPool;
+import java.util.function.Supplier;
+
+/**
+ * Creates {@link ParallelTripleStore} instances, used by the CGMES importer when selected by
+ * the {@code iidm.import.cgmes.powsybl-triplestore} import parameter.
+ *
+ * <p>The importer creates its triple store itself, so the executor, skipped profiles and progress listener
+ * of an import are given to the triple store through the thread running the import.
+ */
+@AutoService(TripleStoreFactoryService.class)
+public class ParallelTripleStoreFactoryService extends TripleStoreFactoryServiceRDF4J {
+
+    public static final String NAME = "pypowsybl-parallel-rdf4j";
+
+    private static final ThreadLocal<ImportContext> CONTEXT = new ThreadLocal<>();
+
+    private static final class ImportContext {
+
+        private final ExecutorService executor;
+        private final Set<String> skippedProfiles;
+        private final ParallelTripleStore.ProgressListener progressListener;
+
+        private ImportContext(ExecutorService executor, Set<String> skippedProfiles,
+                              ParallelTripleStore.ProgressListener progressListener) {
+            this.executor = Objects.requireNonNull(executor);
+            this.skippedProfiles = Objects.requireNonNull(skippedProfiles);
+            this.progressListener = Objects.requireNonNull(progressListener);
+        }
+    }
+
+    /**
+     * Runs an import, the triple stores created by which parse files with the given executor,
+     * skip files of the given profiles, and notify the parsing progress to the given listener.
+     */
+    public static <T> T runImport(ExecutorService executor, Set<String> skippedProfiles,
+                                  ParallelTripleStore.ProgressListener progressListener, Supplier<T> importer) {
+        CONTEXT.set(new ImportContext(executor, skippedProfiles, progressListener));
+        try {
+            return importer.get();
+        } finally {
+            CONTEXT.remove();
+        }
+    }
+
+    @Override
+    public TripleStore create() {
+        return create(new TripleStoreOptions());
+    }
+
+    @Override
+    public TripleStore create(TripleStoreOptions options) {
+        ImportContext context = CONTEXT.get();
+        if (context == null) {
+            return new ParallelTripleStore(options, ForkJoinPool.commonPool(), Collections.emptySet());
+        }
+        return new ParallelTripleStore(options, context.executor, context.skippedProfiles, context.progressListener);
+    }
+
+    @Override
+    public String getImplementationName() {
+        return NAME;
+    }
+}
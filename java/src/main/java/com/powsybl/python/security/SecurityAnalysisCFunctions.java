@@ -6,19 +6,24 @@
  */
 package com.powsybl.python.security;
 
+import com.fasterxml.jackson.core.JsonProcessingException;
+import com.fasterxml.jackson.databind.ObjectMapper;
 import com.powsybl.commons.PowsyblException;
+import com.powsybl.commons.json.JsonUtil;
 import com.powsybl.commons.reporter.ReporterModel;
 import com.powsybl.commons.util.ServiceLoaderCache;
 import com.powsybl.contingency.ContingencyContext;
 import com.powsybl.iidm.network.Network;
-import com.powsybl.loadflow.LoadFlowResult;
 import com.powsybl.python.commons.*;
 import com.powsybl.python.commons.PyPowsyblApiHeader.SecurityAnalysisParametersPointer;
 import com.powsybl.python.contingency.ContingencyContainer;
+import com.powsybl.python.contingency.RejectedContingencyElement;
 import com.powsybl.python.loadflow.LoadFlowCFunctions;
 import com.powsybl.python.loadflow.LoadFlowCUtils;
 import com.powsybl.python.network.Dataframes;
 import com.powsybl.security.*;
+import com.powsybl.security.json.SecurityAnalysisJsonModule;
+import com.powsybl.security.json.SecurityAnalysisResultDeserializer;
 import com.powsybl.security.monitor.StateMonitor;
 import com.powsybl.security.results.PostContingencyResult;
 import org.graalvm.nativeimage.IsolateThread;
@@ -30,10 +35,16 @@ import org.graalvm.nativeimage.c.function.CEntryPoint;
 import org.graalvm.nativeimage.c.struct.SizeOf;
 import org.graalvm.nativeimage.c.type.CCharPointer;
 import org.graalvm.nativeimage.c.type.CCharPointerPointer;
+import org.graalvm.nativeimage.c.type.CTypeConversion;
+import org.graalvm.word.WordFactory;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 
+import java.io.UncheckedIOException;
+import java.util.ArrayList;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 import java.util.Objects;
 import java.util.ServiceLoader;
 import java.util.Set;
@@ -52,6 +63,9 @@ import static com.powsybl.python.commons.Util.*;
 @CContext(Directives.class)
 public final class SecurityAnalysisCFunctions {
 
+    private static final ObjectMapper RESULT_MAPPER = JsonUtil.createObjectMapper()
+            .registerModule(new SecurityAnalysisJsonModule());
+
     private SecurityAnalysisCFunctions() {
     }
 
@@ -138,13 +152,23 @@ public final class SecurityAnalysisCFunctions {
         });
     }
 
-    private static LoadFlowResult.ComponentResult.Status getStatus(LimitViolationsResult result) {
-        return result.isComputationOk() ? LoadFlowResult.ComponentResult.Status.CONVERGED : LoadFlowResult.ComponentResult.Status.FAILED;
+    @CEntryPoint(name = "addContingencies")
+    public static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.SeriesPointer> addContingencies(IsolateThread thread, ObjectHandle contingencyContainerHandle, ObjectHandle networkHandle,
+                                                                                                     CCharPointerPointer contingencyIdPtrPtr, CCharPointerPointer elementIdPtrPtr, int count,
+                                                                                                     PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            ContingencyContainer contingencyContainer = ObjectHandles.getGlobal().get(contingencyContainerHandle);
+            Network network = ObjectHandles.getGlobal().get(networkHandle);
+            List<String> contingencyIds = toStringList(contingencyIdPtrPtr, count);
+            List<String> elementIds = toStringList(elementIdPtrPtr, count);
+            List<RejectedContingencyElement> rejectedElements = contingencyContainer.addContingencies(contingencyIds, elementIds, network);
+            return Dataframes.createCDataframe(Dataframes.rejectedContingencyElementsMapper(), rejectedElements);
+        });
     }
 
     private static void setSecurityAnalysisResultPointer(PyPowsyblApiHeader.ContingencyResultPointer contingencyPtr, String contingencyId, LimitViolationsResult limitViolationsResult) {
         contingencyPtr.setContingencyId(CTypeUtil.toCharPtr(contingencyId));
-        contingencyPtr.setStatus(getStatus(limitViolationsResult).ordinal());
+        contingencyPtr.setStatus(Dataframes.getStatus(limitViolationsResult).ordinal());
         List<LimitViolation> limitViolations = limitViolationsResult.getLimitViolations();
         PyPowsyblApiHeader.LimitViolationPointer limitViolationPtr = UnmanagedMemory.calloc(limitViolations.size() * SizeOf.get(PyPowsyblApiHeader.LimitViolationPointer.class));
         for (int i = 0; i < limitViolations.size(); i++) {
@@ -176,6 +200,38 @@ public final class SecurityAnalysisCFunctions {
         return allocArrayPointer(contingencyPtr, resultCount);
     }
 
+    /**
+     * Creates the results of the given contingencies only, in the given order,
+     * an empty contingency ID standing for the pre-contingency result.
+     */
+    private static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.ContingencyResultPointer> createContingencyResultArrayPointer(SecurityAnalysisResult result, List<String> contingencyIds) {
+        Set<String> requestedIds = Set.copyOf(contingencyIds);
+        Map<String, PostContingencyResult> postContingencyResults = new HashMap<>();
+        for (PostContingencyResult postContingencyResult : result.getPostContingencyResults()) {
+            String contingencyId = postContingencyResult.getContingency().getId();
+            if (requestedIds.contains(contingencyId)) {
+                postContingencyResults.put(contingencyId, postContingencyResult);
+            }
+        }
+        List<LimitViolationsResult> limitViolationsResults = new ArrayList<>(contingencyIds.size());
+        for (String contingencyId : contingencyIds) {
+            if (contingencyId.isEmpty()) {
+                limitViolationsResults.add(result.getPreContingencyResult().getLimitViolationsResult());
+            } else {
+                PostContingencyResult postContingencyResult = postContingencyResults.get(contingencyId);
+                if (postContingencyResult == null) {
+                    throw new PowsyblException("Contingency '" + contingencyId + "' not found");
+                }
+                limitViolationsResults.add(postContingencyResult.getLimitViolationsResult());
+            }
+        }
+        PyPowsyblApiHeader.ContingencyResultPointer contingencyPtr = UnmanagedMemory.calloc(contingencyIds.size() * SizeOf.get(PyPowsyblApiHeader.ContingencyResultPointer.class));
+        for (int i = 0; i < contingencyIds.size(); i++) {
+            setSecurityAnalysisResultPointer(contingencyPtr.addressOf(i), contingencyIds.get(i), limitViolationsResults.get(i));
+        }
+        return allocArrayPointer(contingencyPtr, contingencyIds.size());
+    }
+
     private static SecurityAnalysisProvider getProvider(String name) {
         String actualName = name.isEmpty() ? PyPowsyblConfiguration.getDefaultSecurityAnalysisProvider() : name;
         return ServiceLoader.load(SecurityAnalysisProvider.class).stream()
@@ -189,6 +245,7 @@ public final class SecurityAnalysisCFunctions {
     public static ObjectHandle runSecurityAnalysis(IsolateThread thread, ObjectHandle securityAnalysisContextHandle,
                                                    ObjectHandle networkHandle, SecurityAnalysisParametersPointer securityAnalysisParametersPointer,
                                                    CCharPointer providerName, boolean dc,  ObjectHandle reporterHandle,
+                                                   ObjectHandle cancelTokenHandle,
                                                    PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> {
             SecurityAnalysisContext analysisContext = ObjectHandles.getGlobal().get(securityAnalysisContextHandle);
@@ -197,11 +254,88 @@ public final class SecurityAnalysisCFunctions {
             logger().info("Security analysis provider used for security analysis is : {}", provider.getName());
             SecurityAnalysisParameters securityAnalysisParameters = SecurityAnalysisCUtils.createSecurityAnalysisParameters(dc, securityAnalysisParametersPointer, provider);
             ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
-            SecurityAnalysisResult result = analysisContext.run(network, securityAnalysisParameters, provider.getName(), reporter);
+            CancelToken cancelToken = ObjectHandles.getGlobal().get(cancelTokenHandle);
+            SecurityAnalysisResult result = analysisContext.run(network, securityAnalysisParameters, provider.getName(), reporter, cancelToken);
             return ObjectHandles.getGlobal().create(result);
         });
     }
 
+    @CEntryPoint(name = "createSecurityAnalysisResultStream")
+    public static ObjectHandle createSecurityAnalysisResultStream(IsolateThread thread, int capacity,
+                                                                  PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> ObjectHandles.getGlobal().create(new SecurityAnalysisResultStream(capacity)));
+    }
+
+    /**
+     * Runs a security analysis by batches of contingencies, the result of each batch being put in the stream,
+     * where it is taken by another thread with {@link #getNextSecurityAnalysisStreamResult}.
+     */
+    @CEntryPoint(name = "runSecurityAnalysisStream")
+    public static void runSecurityAnalysisStream(IsolateThread thread, ObjectHandle securityAnalysisContextHandle, ObjectHandle streamHandle,
+                                                 ObjectHandle networkHandle, SecurityAnalysisParametersPointer securityAnalysisParametersPointer,
+                                                 CCharPointer providerName, boolean dc, ObjectHandle reporterHandle,
+                                                 ObjectHandle cancelTokenHandle, int batchSize,
+                                                 PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResultStream stream = ObjectHandles.getGlobal().get(streamHandle);
+            // failures are also signaled to the consuming thread by the end of the stream
+            stream.produce(consumer -> {
+                SecurityAnalysisContext analysisContext = ObjectHandles.getGlobal().get(securityAnalysisContextHandle);
+                Network network = ObjectHandles.getGlobal().get(networkHandle);
+                SecurityAnalysisProvider provider = getProvider(CTypeUtil.toString(providerName));
+                logger().info("Security analysis provider used for security analysis is : {}", provider.getName());
+                SecurityAnalysisParameters securityAnalysisParameters = SecurityAnalysisCUtils.createSecurityAnalysisParameters(dc, securityAnalysisParametersPointer, provider);
+                ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
+                CancelToken cancelToken = ObjectHandles.getGlobal().get(cancelTokenHandle);
+                analysisContext.runByBatches(network, securityAnalysisParameters, provider.getName(),
+                        reporter, cancelToken, batchSize, consumer);
+            });
+        });
+    }
+
+    @CEntryPoint(name = "getNextSecurityAnalysisStreamResult")
+    public static ObjectHandle getNextSecurityAnalysisStreamResult(IsolateThread thread, ObjectHandle streamHandle, int timeoutMs,
+                                                                   PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResultStream stream = ObjectHandles.getGlobal().get(streamHandle);
+            SecurityAnalysisResult result = stream.next(timeoutMs);
+            if (result == null) {
+                return WordFactory.nullPointer();
+            }
+            return ObjectHandles.getGlobal().create(result);
+        });
+    }
+
+    @CEntryPoint(name = "isSecurityAnalysisResultStreamEnded")
+    public static boolean isSecurityAnalysisResultStreamEnded(IsolateThread thread, ObjectHandle streamHandle,
+                                                              PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResultStream stream = ObjectHandles.getGlobal().get(streamHandle);
+            return stream.isEnded();
+        });
+    }
+
+    /**
+     * Ends a stream the analysis of which failed before being run by {@link #runSecurityAnalysisStream}.
+     */
+    @CEntryPoint(name = "finishSecurityAnalysisResultStream")
+    public static void finishSecurityAnalysisResultStream(IsolateThread thread, ObjectHandle streamHandle,
+                                                          PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResultStream stream = ObjectHandles.getGlobal().get(streamHandle);
+            stream.finish();
+        });
+    }
+
+    @CEntryPoint(name = "closeSecurityAnalysisResultStream")
+    public static void closeSecurityAnalysisResultStream(IsolateThread thread, ObjectHandle streamHandle,
+                                                         PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResultStream stream = ObjectHandles.getGlobal().get(streamHandle);
+            stream.close();
+        });
+    }
+
     @CEntryPoint(name = "getSecurityAnalysisResult")
     public static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.ContingencyResultPointer> getSecurityAnalysisResult(IsolateThread thread, ObjectHandle securityAnalysisResultHandle, PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> {
@@ -210,6 +344,57 @@ public final class SecurityAnalysisCFunctions {
         });
     }
 
+    @CEntryPoint(name = "getSecurityAnalysisContingencyResults")
+    public static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.ContingencyResultPointer> getSecurityAnalysisContingencyResults(IsolateThread thread, ObjectHandle securityAnalysisResultHandle,
+                                                                                                                                     CCharPointerPointer contingencyIdsPtr, int contingencyIdsCount,
+                                                                                                                                     PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResult result = ObjectHandles.getGlobal().get(securityAnalysisResultHandle);
+            return createContingencyResultArrayPointer(result, toStringList(contingencyIdsPtr, contingencyIdsCount));
+        });
+    }
+
+    @CEntryPoint(name = "serializeSecurityAnalysisResult")
+    public static PyPowsyblApiHeader.ArrayPointer<CCharPointer> serializeSecurityAnalysisResult(IsolateThread thread, ObjectHandle securityAnalysisResultHandle,
+                                                                                                PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResult result = ObjectHandles.getGlobal().get(securityAnalysisResultHandle);
+            try {
+                return Util.createByteArray(RESULT_MAPPER.writeValueAsBytes(result));
+            } catch (JsonProcessingException e) {
+                throw new UncheckedIOException(e);
+            }
+        });
+    }
+
+    @CEntryPoint(name = "deserializeSecurityAnalysisResult")
+    public static ObjectHandle deserializeSecurityAnalysisResult(IsolateThread thread, CCharPointer data, int size,
+                                                                 PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResult result = SecurityAnalysisResultDeserializer.read(new ByteBufferInputStream(CTypeConversion.asByteBuffer(data, size)));
+            return ObjectHandles.getGlobal().create(result);
+        });
+    }
+
+    /**
+     * Merges the results of security analyses of the same network, run on distinct contingencies.
+     * The pre-contingency result is the one of the first result, post-contingency results are concatenated.
+     */
+    @CEntryPoint(name = "mergeSecurityAnalysisResults")
+    public static ObjectHandle mergeSecurityAnalysisResults(IsolateThread thread, PyPowsyblApiHeader.VoidPointerPointer resultsHandles, int resultsCount,
+                                                            PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            if (resultsCount == 0) {
+                throw new PowsyblException("At least one security analysis result is expected");
+            }
+            List<SecurityAnalysisResult> results = new ArrayList<>(resultsCount);
+            for (int i = 0; i < resultsCount; i++) {
+                results.add(ObjectHandles.getGlobal().get(resultsHandles.read(i)));
+            }
+            return ObjectHandles.getGlobal().create(SecurityAnalysisContext.merge(results));
+        });
+    }
+
     @CEntryPoint(name = "getLimitViolations")
     public static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.SeriesPointer> getLimitViolations(IsolateThread thread, ObjectHandle securityAnalysisResultHandle, PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> {
@@ -218,6 +403,14 @@ public final class SecurityAnalysisCFunctions {
         });
     }
 
+    @CEntryPoint(name = "getContingencyStatus")
+    public static PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.SeriesPointer> getContingencyStatus(IsolateThread thread, ObjectHandle securityAnalysisResultHandle, PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
+        return doCatch(exceptionHandlerPtr, () -> {
+            SecurityAnalysisResult result = ObjectHandles.getGlobal().get(securityAnalysisResultHandle);
+            return Dataframes.createCDataframe(Dataframes.contingencyStatusMapper(), result);
+        });
+    }
+
     @CEntryPoint(name = "freeContingencyResultArrayPointer")
     public static void freeContingencyResultArrayPointer(IsolateThread thread, PyPowsyblApiHeader.ArrayPointer<PyPowsyblApiHeader.ContingencyResultPointer> contingencyResultArrayPtr,
                                                          PyPowsyblApiHeader.ExceptionHandlerPointer exceptionHandlerPtr) {
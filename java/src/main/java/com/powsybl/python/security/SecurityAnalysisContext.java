@@ -9,25 +9,90 @@ package com.powsybl.python.security;
 import com.powsybl.commons.reporter.Reporter;
 import com.powsybl.computation.local.LocalComputationManager;
 import com.powsybl.contingency.ContingenciesProvider;
+import com.powsybl.contingency.Contingency;
+import com.powsybl.contingency.ContingencyContextType;
 import com.powsybl.iidm.network.Network;
+import com.powsybl.python.commons.CancelToken;
+import com.powsybl.python.commons.CancelTokenReporter;
 import com.powsybl.python.contingency.ContingencyContainerImpl;
 import com.powsybl.security.*;
 import com.powsybl.security.detectors.DefaultLimitViolationDetector;
 import com.powsybl.security.monitor.StateMonitor;
+import com.powsybl.security.results.OperatorStrategyResult;
+import com.powsybl.security.results.PostContingencyResult;
 
-import java.util.ArrayList;
-import java.util.Collections;
-import java.util.List;
+import java.util.*;
+import java.util.function.Consumer;
+import java.util.stream.Collectors;
 
 /**
  * @author Geoffroy Jamgotchian {@literal <geoffroy.jamgotchian at rte-france.com>}
  */
 class SecurityAnalysisContext extends ContingencyContainerImpl {
 
+    /**
+     * When the run may be cancelled, or is streamed, contingencies are simulated by batches, the token being checked between batches.
+     * Batches are large enough for the pre-contingency simulation, done for each batch, to be negligible,
+     * and there are few enough of them for the delay of a cancellation to stay a small fraction of the run.
+     */
+    private static final int MIN_BATCH_SIZE = 10;
+    private static final int MAX_BATCH_COUNT = 100;
+
     private final List<StateMonitor> monitors = new ArrayList<>();
 
     SecurityAnalysisResult run(Network network, SecurityAnalysisParameters securityAnalysisParameters, String provider, Reporter reporter) {
-        ContingenciesProvider contingencies = this::createContingencies;
+        return run(network, securityAnalysisParameters, provider, reporter, this::createContingencies, monitors);
+    }
+
+    /**
+     * Runs the security analysis, stopping before its end if the token is cancelled.
+     * The result then holds the pre-contingency result and the results of the simulated contingencies only.
+     *
+     * <p>A token which may only be cancelled directly aborts the run instead: the analysis is then run in a single pass,
+     * the token being checked each time the provider reports a step, for example the simulation of a contingency.
+     */
+    SecurityAnalysisResult run(Network network, SecurityAnalysisParameters securityAnalysisParameters, String provider, Reporter reporter,
+                               CancelToken cancelToken) {
+        if (cancelToken == null) {
+            return run(network, securityAnalysisParameters, provider, reporter);
+        }
+        if (!cancelToken.isCancellableByCaller()) {
+            Reporter cancellableReporter = new CancelTokenReporter(reporter == null ? Reporter.NO_OP : reporter, cancelToken);
+            return run(network, securityAnalysisParameters, provider, cancellableReporter, this::createContingencies, monitors);
+        }
+        List<SecurityAnalysisResult> results = new ArrayList<>();
+        runByBatches(network, securityAnalysisParameters, provider, reporter, cancelToken, 0, results::add);
+        return results.size() == 1 ? results.get(0) : merge(results);
+    }
+
+    /**
+     * Runs the security analysis by batches of contingencies, giving the result of each batch to the consumer
+     * as soon as it is computed. Each result holds the pre-contingency result and the results of the contingencies
+     * of the batch. The token, if any, is checked between batches.
+     *
+     * @param batchSize the number of contingencies of a batch, or 0 for a default size
+     */
+    void runByBatches(Network network, SecurityAnalysisParameters securityAnalysisParameters, String provider, Reporter reporter,
+                      CancelToken cancelToken, int batchSize, Consumer<SecurityAnalysisResult> consumer) {
+        List<Contingency> contingencies = createContingencies(network);
+        int size = batchSize > 0 ? batchSize
+                : Math.max(MIN_BATCH_SIZE, (contingencies.size() + MAX_BATCH_COUNT - 1) / MAX_BATCH_COUNT);
+        int start = 0;
+        do {
+            // when cancelled before the start, only the pre-contingency state is simulated
+            boolean cancelled = cancelToken != null && cancelToken.isCancelled();
+            int end = cancelled ? start : Math.min(start + size, contingencies.size());
+            List<Contingency> batch = contingencies.subList(start, end);
+            consumer.accept(run(network, securityAnalysisParameters, provider, reporter, n -> batch, getMonitors(batch)));
+            start = end;
+        } while (start < contingencies.size() && (cancelToken == null || !cancelToken.isCancelled()));
+        if (start < contingencies.size()) {
+            cancelToken.setInterrupted();
+        }
+    }
+
+    private SecurityAnalysisResult run(Network network, SecurityAnalysisParameters securityAnalysisParameters, String provider, Reporter reporter,
+                                       ContingenciesProvider contingencies, List<StateMonitor> runMonitors) {
         SecurityAnalysisReport report = SecurityAnalysis.find(provider)
                 .run(
                         network,
@@ -40,13 +105,39 @@ class SecurityAnalysisContext extends ContingencyContainerImpl {
                         Collections.emptyList(),
                         Collections.emptyList(),
                         Collections.emptyList(),
-                        monitors,
+                        runMonitors,
                         (reporter == null) ? Reporter.NO_OP : reporter
                 );
         return report.getResult();
     }
 
+    /**
+     * Monitors of a batch of contingencies: monitors of specific contingencies are kept only for contingencies of the batch.
+     */
+    private List<StateMonitor> getMonitors(List<Contingency> batch) {
+        Set<String> batchIds = batch.stream().map(Contingency::getId).collect(Collectors.toSet());
+        return monitors.stream()
+                .filter(monitor -> monitor.getContingencyContext().getContextType() != ContingencyContextType.SPECIFIC
+                        || batchIds.contains(monitor.getContingencyContext().getContingencyId()))
+                .collect(Collectors.toList());
+    }
+
     void addMonitor(StateMonitor monitor) {
         monitors.add(monitor);
     }
+
+    /**
+     * Merges the results of security analyses of the same network, run on distinct contingencies.
+     * Pre-contingency results are the same, the one of the first result is kept.
+     */
+    static SecurityAnalysisResult merge(List<SecurityAnalysisResult> results) {
+        List<PostContingencyResult> postContingencyResults = results.stream()
+                .flatMap(result -> result.getPostContingencyResults().stream())
+                .collect(Collectors.toList());
+        List<OperatorStrategyResult> operatorStrategyResults = results.stream()
+                .flatMap(result -> result.getOperatorStrategyResults().stream())
+                .collect(Collectors.toList());
+        return new SecurityAnalysisResult(results.get(0).getPreContingencyResult(),
+                postContingencyResults, operatorStrategyResults);
+    }
 }
@@ -0,0 +1,139 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.security;
+
+import com.powsybl.commons.PowsyblException;
+import com.powsybl.security.SecurityAnalysisResult;
+
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.CancellationException;
+import java.util.concurrent.TimeUnit;
+import java.util.function.Consumer;
+
+/**
+ * A bounded buffer of the results of the batches of a security analysis, between the thread running the analysis,
+ * which waits when the buffer is full, and the thread consuming the results.
+ */
+class SecurityAnalysisResultStream {
+
+    private static final Object END = new Object();
+
+    private static final long POLL_TIMEOUT_MS = 100;
+
+    private final BlockingQueue<Object> queue;
+    private volatile boolean closed = false;
+    private volatile boolean finished = false;
+    private volatile boolean ended = false;
+
+    SecurityAnalysisResultStream(int capacity) {
+        if (capacity < 1) {
+            throw new PowsyblException("Stream capacity must be strictly positive");
+        }
+        queue = new ArrayBlockingQueue<>(capacity);
+    }
+
+    /**
+     * Runs the security analysis, which gives the results of its batches to the given consumer.
+     * The end of the stream is signaled once the analysis is over, even if it failed.
+     * If the stream is closed in the meantime, the analysis is interrupted at its next result.
+     */
+    void produce(Consumer<Consumer<SecurityAnalysisResult>> analysis) {
+        try {
+            analysis.accept(this::put);
+        } catch (CancellationException e) {
+            if (!closed) {
+                throw e;
+            }
+        } finally {
+            put(END);
+        }
+    }
+
+    private void put(Object item) {
+        try {
+            while (!queue.offer(item, POLL_TIMEOUT_MS, TimeUnit.MILLISECONDS)) {
+                if (closed) {
+                    if (item == END) {
+                        return;
+                    }
+                    throw new CancellationException("Security analysis result stream closed");
+                }
+            }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new PowsyblException("Interrupted while streaming security analysis results", e);
+        }
+    }
+
+    /**
+     * Signals that no more results will be produced, for example when the analysis could not be started.
+     */
+    void finish() {
+        finished = true;
+    }
+
+    /**
+     * Waits for the result of the next batch, until the stream is closed or finished.
+     *
+     * @return the result of the next batch, or null at the end of the stream
+     */
+    SecurityAnalysisResult next() {
+        SecurityAnalysisResult result = null;
+        while (result == null && !ended) {
+            result = next(POLL_TIMEOUT_MS);
+        }
+        return result;
+    }
+
+    /**
+     * Waits for the result of the next batch, at most the given time, so that the waiting thread
+     * may handle signals in the meantime.
+     *
+     * @return the result of the next batch, or null at the end of the stream or if no result is available in time,
+     * which {@link #isEnded} tells apart
+     */
+    SecurityAnalysisResult next(long timeoutMs) {
+        long deadline = System.nanoTime() + TimeUnit.MILLISECONDS.toNanos(timeoutMs);
+        try {
+            while (!ended) {
+                long remaining = Math.max(deadline - System.nanoTime(), 0);
+                Object item = queue.poll(Math.min(remaining, TimeUnit.MILLISECONDS.toNanos(POLL_TIMEOUT_MS)), TimeUnit.NANOSECONDS);
+                if (item == END) {
+                    ended = true;
+                } else if (item != null) {
+                    return (SecurityAnalysisResult) item;
+                } else if (closed || (finished && queue.isEmpty())) {
+                    ended = true;
+                } else if (remaining == 0) {
+                    return null;
+                }
+            }
+            return null;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            throw new PowsyblException("Interrupted while streaming security analysis results", e);
+        }
+    }
+
+    /**
+     * True once the end of the stream has been reached, or the stream closed.
+     */
+    boolean isEnded() {
+        return ended;
+    }
+
+    /**
+     * Stops the stream: buffered results are dropped, the analysis is interrupted at its next result,
+     * and a thread waiting for the next result gets the end of the stream.
+     */
+    void close() {
+        closed = true;
+        ended = true;
+        queue.clear();
+    }
+}
@@ -164,6 +164,7 @@ public final class SensitivityAnalysisCFunctions {
     public static ObjectHandle runSensitivityAnalysis(IsolateThread thread, ObjectHandle sensitivityAnalysisContextHandle,
                                                       ObjectHandle networkHandle, boolean dc, SensitivityAnalysisParametersPointer sensitivityAnalysisParametersPtr,
                                                       CCharPointer providerName, ObjectHandle reporterHandle,
+                                                      ObjectHandle cancelTokenHandle,
                                                       ExceptionHandlerPointer exceptionHandlerPtr) {
         return doCatch(exceptionHandlerPtr, () -> {
             SensitivityAnalysisContext analysisContext = ObjectHandles.getGlobal().get(sensitivityAnalysisContextHandle);
@@ -172,7 +173,8 @@ public final class SensitivityAnalysisCFunctions {
             logger().info("Sensitivity analysis provider used for sensitivity analysis is : {}", provider.getName());
             SensitivityAnalysisParameters sensitivityAnalysisParameters = SensitivityAnalysisCUtils.createSensitivityAnalysisParameters(dc, sensitivityAnalysisParametersPtr, provider);
             ReporterModel reporter = ObjectHandles.getGlobal().get(reporterHandle);
-            SensitivityAnalysisResultContext resultContext = analysisContext.run(network, sensitivityAnalysisParameters, provider.getName(), reporter);
+            CancelToken cancelToken = ObjectHandles.getGlobal().get(cancelTokenHandle);
+            SensitivityAnalysisResultContext resultContext = analysisContext.run(network, sensitivityAnalysisParameters, provider.getName(), reporter, cancelToken);
             return ObjectHandles.getGlobal().create(resultContext);
         });
     }
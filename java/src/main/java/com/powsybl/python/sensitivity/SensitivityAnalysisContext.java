@@ -16,6 +16,7 @@ import com.powsybl.iidm.network.Injection;
 import com.powsybl.iidm.network.Network;
 import com.powsybl.iidm.network.TwoWindingsTransformer;
 import com.powsybl.contingency.ContingencyContextType;
+import com.powsybl.python.commons.CancelToken;
 import com.powsybl.python.contingency.ContingencyContainerImpl;
 import com.powsybl.sensitivity.*;
 
@@ -182,6 +183,15 @@ class SensitivityAnalysisContext extends ContingencyContainerImpl {
     }
 
     SensitivityAnalysisResultContext run(Network network, SensitivityAnalysisParameters sensitivityAnalysisParameters, String provider, Reporter reporter) {
+        return run(network, sensitivityAnalysisParameters, provider, reporter, null);
+    }
+
+    /**
+     * Runs the sensitivity analysis, stopping before its end if the token is cancelled.
+     * The result then holds the values of the base case and of the completed contingencies only.
+     */
+    SensitivityAnalysisResultContext run(Network network, SensitivityAnalysisParameters sensitivityAnalysisParameters, String provider, Reporter reporter,
+                                         CancelToken cancelToken) {
         List<Contingency> contingencies = createContingencies(network);
 
         List<MatrixInfo> matrices = prepareMatrices();
@@ -271,6 +281,7 @@ class SensitivityAnalysisContext extends ContingencyContainerImpl {
             factorIndexMatrixMap.put(m.getOffsetData(), m);
         }
 
+        BitSet completedContingencies = new BitSet(contingencies.size());
         SensitivityResultWriter valueWriter = new SensitivityResultWriter() {
             @Override
             public void writeSensitivityValue(int factorContext, int contingencyIndex, double value, double functionReference) {
@@ -289,24 +300,42 @@ class SensitivityAnalysisContext extends ContingencyContainerImpl {
 
             @Override
             public void writeContingencyStatus(int i, SensitivityAnalysisResult.Status status) {
-
+                completedContingencies.set(i);
+                // the token is checked once per contingency, not for each value
+                if (cancelToken != null) {
+                    cancelToken.check();
+                }
             }
         };
 
-        SensitivityAnalysis.find(provider)
-                .run(network,
-                        network.getVariantManager().getWorkingVariantId(),
-                        factorReader,
-                        valueWriter,
-                        contingencies,
-                        variableSets,
-                        sensitivityAnalysisParameters,
-                        LocalComputationManager.getDefault(),
-                        (reporter == null) ? Reporter.NO_OP : reporter);
+        try {
+            if (cancelToken != null) {
+                cancelToken.check();
+            }
+            SensitivityAnalysis.find(provider)
+                    .run(network,
+                            network.getVariantManager().getWorkingVariantId(),
+                            factorReader,
+                            valueWriter,
+                            contingencies,
+                            variableSets,
+                            sensitivityAnalysisParameters,
+                            LocalComputationManager.getDefault(),
+                            (reporter == null) ? Reporter.NO_OP : reporter);
+        } catch (RuntimeException e) {
+            if (cancelToken == null || !CancelToken.isCancellation(e)) {
+                throw e;
+            }
+            cancelToken.setInterrupted();
+        }
 
         Map<String, double[]> valuesByContingencyId = new HashMap<>(contingencies.size());
         Map<String, double[]> referencesByContingencyId = new HashMap<>(contingencies.size());
         for (int contingencyIndex = 0; contingencyIndex < contingencies.size(); contingencyIndex++) {
+            if (cancelToken != null && cancelToken.isInterrupted() && !completedContingencies.get(contingencyIndex)) {
+                // values of contingencies which have not been simulated are left out of partial results
+                continue;
+            }
             Contingency contingency = contingencies.get(contingencyIndex);
             valuesByContingencyId.put(contingency.getId(), valuesByContingencyIndex[contingencyIndex]);
             referencesByContingencyId.put(contingency.getId(), referencesByContingencyIndex[contingencyIndex]);
@@ -7,9 +7,11 @@
 package com.powsybl.dataframe.network;
 
 import com.google.common.collect.ImmutableMap;
+import com.powsybl.commons.PowsyblException;
 import com.powsybl.dataframe.DataframeElementType;
 import com.powsybl.dataframe.DataframeFilter;
 import com.powsybl.dataframe.DoubleIndexedSeries;
+import com.powsybl.dataframe.SeriesPredicate;
 import com.powsybl.dataframe.impl.DefaultDataframeHandler;
 import com.powsybl.dataframe.impl.Series;
 import com.powsybl.dataframe.network.extensions.NetworkExtensions;
@@ -33,7 +35,9 @@ import java.util.function.Function;
 
 import static com.powsybl.dataframe.DataframeElementType.*;
 import static com.powsybl.dataframe.DataframeFilter.AttributeFilterType.ALL_ATTRIBUTES;
+import static com.powsybl.dataframe.DataframeFilter.AttributeFilterType.DEFAULT_ATTRIBUTES;
 import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
 import static org.junit.jupiter.api.Assertions.assertEquals;
 import static org.junit.jupiter.api.Assertions.assertNotNull;
 
@@ -105,6 +109,30 @@ class NetworkDataframesTest {
                 .containsExactly("VLGEN", "VLHV1", "VLHV2", "VLLOAD");
     }
 
+    @Test
+    void busesWithPredicates() {
+        Network network = EurostagTutorialExample1Factory.create();
+        DataframeFilter filter = new DataframeFilter(DEFAULT_ATTRIBUTES, Collections.emptyList(), null,
+                List.of(new SeriesPredicate("voltage_level_id", SeriesPredicate.Operator.IN, List.of("VLHV1", "VLHV2", "VLLOAD")),
+                        new SeriesPredicate("voltage_level_id", SeriesPredicate.Operator.NOT_EQUAL, List.of("VLHV2"))));
+        List<Series> series = createDataFrame(BUS, network, filter);
+        assertThat(series.get(0).getStrings())
+                .containsExactly("VLHV1_0", "VLLOAD_0");
+
+        network.getVoltageLevel("VLHV1").getBusView().getBus("VLHV1_0").setV(400);
+        filter = new DataframeFilter(DEFAULT_ATTRIBUTES, Collections.emptyList(), null,
+                List.of(new SeriesPredicate("v_mag", SeriesPredicate.Operator.GREATER_OR_EQUAL, List.of("390"))));
+        series = createDataFrame(BUS, network, filter);
+        assertThat(series.get(0).getStrings())
+                .containsExactly("VLHV1_0");
+
+        DataframeFilter outOfRangeFilter = new DataframeFilter(DEFAULT_ATTRIBUTES, Collections.emptyList(), null,
+                List.of(new SeriesPredicate("connected_component", SeriesPredicate.Operator.EQUAL, List.of("4294967296"))));
+        assertThatThrownBy(() -> createDataFrame(BUS, network, outOfRangeFilter))
+                .isInstanceOf(PowsyblException.class)
+                .hasMessageContaining("integer values must be between");
+    }
+
     @Test
     void generators() {
         Network network = EurostagTutorialExample1Factory.create();
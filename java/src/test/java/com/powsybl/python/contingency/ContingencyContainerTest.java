@@ -71,4 +71,27 @@ class ContingencyContainerTest {
                 .hasMessageContaining("Element 'not_exists_id' not found");
     }
 
+    @Test
+    void testAddContingencies() {
+        var network = EurostagTutorialExample1Factory.create();
+        var container = new ContingencyContainerImpl();
+        List<RejectedContingencyElement> rejectedElements = container.addContingencies(
+                List.of("n-2", "n-2", "n-1", "unknown", "unknown"),
+                List.of("NHV1_NHV2_1", "NHV1_NHV2_2", "GEN", "GEN", "not_exists_id"),
+                network);
+        assertThat(rejectedElements).hasOnlyOneElementSatisfying(e -> {
+            assertThat(e.getContingencyId()).isEqualTo("unknown");
+            assertThat(e.getElementId()).isEqualTo("not_exists_id");
+            assertThat(e.getReason()).isEqualTo("Element 'not_exists_id' not found");
+        });
+        assertThat(container.createContingencies(network))
+                .extracting(Contingency::getId)
+                .containsExactlyInAnyOrder("n-2", "n-1");
+
+        var unchecked = new ContingencyContainerImpl();
+        assertThat(unchecked.addContingencies(List.of("unknown"), List.of("not_exists_id"), null)).isEmpty();
+        assertThatThrownBy(() -> unchecked.addContingencies(List.of("c"), List.of(), null))
+                .hasMessageContaining("must have the same size");
+    }
+
 }
@@ -0,0 +1,35 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.loadflow;
+
+import com.powsybl.iidm.network.Network;
+import com.powsybl.iidm.network.VariantManagerConstants;
+import com.powsybl.iidm.network.test.EurostagTutorialExample1Factory;
+import com.powsybl.loadflow.LoadFlow;
+import com.powsybl.loadflow.LoadFlowParameters;
+import com.powsybl.loadflow.LoadFlowResult;
+import org.junit.jupiter.api.Test;
+
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+class MultiVariantLoadFlowTest {
+
+    @Test
+    void testWorkingVariantRestored() {
+        Network network = EurostagTutorialExample1Factory.create();
+        network.getVariantManager().cloneVariant(VariantManagerConstants.INITIAL_VARIANT_ID, List.of("v1", "v2", "v3"));
+        network.getVariantManager().setWorkingVariant("v2");
+
+        List<LoadFlowResult> results = MultiVariantLoadFlow.run(network, List.of("v1", "v3"), LoadFlow.find("OpenLoadFlow"),
+                new LoadFlowParameters(), 2);
+        assertThat(results).hasSize(2).allMatch(LoadFlowResult::isOk);
+        assertThat(network.getVariantManager().getWorkingVariantId()).isEqualTo("v2");
+        assertThat(network.getVariantManager().isVariantMultiThreadAccessAllowed()).isFalse();
+    }
+}
@@ -0,0 +1,39 @@
+/**
+ * Copyright (c) 2022, RTE (http://www.rte-france.com)
+ * This Source Code Form is subject to the terms of the Mozilla Public
+ * License, v. 2.0. If a copy of the MPL was not distributed with this
+ * file, You can obtain one at http://mozilla.org/MPL/2.0/.
+ */
+package com.powsybl.python.network;
+
+import com.powsybl.dataframe.impl.DefaultDataframeHandler;
+import com.powsybl.dataframe.impl.Series;
+import org.junit.jupiter.api.Test;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+class DataframesTest {
+
+    @Test
+    void stackSeriesWithDistinctColumns() {
+        List<Series> v1 = List.of(Series.index("id", new String[] {"GEN"}),
+                new Series("target_p", new double[] {607}));
+        List<Series> v2 = List.of(Series.index("id", new String[] {"GEN2", "GEN3"}),
+                new Series("target_p", new double[] {700, 800}),
+                new Series("owner", new String[] {"A", null}));
+        List<Series> empty = List.of();
+
+        List<Series> stacked = new ArrayList<>();
+        Dataframes.stackSeries("variant_id", List.of("v1", "v2", "v3"), List.of(v1, v2, empty),
+                new DefaultDataframeHandler(stacked::add));
+
+        assertThat(stacked).extracting(Series::getName).containsExactly("variant_id", "id", "target_p", "owner");
+        assertThat(stacked.get(0).getStrings()).containsExactly("v1", "v2", "v2");
+        assertThat(stacked.get(1).getStrings()).containsExactly("GEN", "GEN2", "GEN3");
+        assertThat(stacked.get(2).getDoubles()).containsExactly(607, 700, 800);
+        assertThat(stacked.get(3).getStrings()).containsExactly(null, "A", null);
+    }
+}
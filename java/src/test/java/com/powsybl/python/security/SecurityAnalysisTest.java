@@ -13,6 +13,7 @@ import com.powsybl.dataframe.impl.Series;
 import com.powsybl.iidm.network.Network;
 import com.powsybl.iidm.network.test.EurostagTutorialExample1Factory;
 import com.powsybl.openloadflow.OpenLoadFlowParameters;
+import com.powsybl.python.commons.CancelToken;
 import com.powsybl.python.network.Dataframes;
 import com.powsybl.python.network.Networks;
 import com.powsybl.security.SecurityAnalysisParameters;
@@ -22,10 +23,12 @@ import com.powsybl.security.results.BranchResult;
 import org.assertj.core.api.Assertions;
 import org.junit.jupiter.api.Test;
 
+import java.util.ArrayList;
 import java.util.Collections;
 import java.util.List;
 
 import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
 
 /**
  * @author Etienne Lesot <etienne.lesot at rte-france.com>
@@ -69,4 +72,77 @@ class SecurityAnalysisTest {
         Assertions.assertThat(series.get(1).getStrings())
             .containsExactly("NHV1_NHV2_2", "VLHV1");
     }
+
+    @Test
+    void testCancelledSecurityAnalysis() {
+        Network network = EurostagTutorialExample1Factory.createWithFixedCurrentLimits();
+        SecurityAnalysisContext analysisContext = new SecurityAnalysisContext();
+        analysisContext.addContingency("First contingency", Collections.singletonList("NHV1_NHV2_1"));
+        analysisContext.addContingency("Second contingency", Collections.singletonList("NHV1_NHV2_2"));
+
+        CancelToken token = new CancelToken(null, CancelToken.NO_DEADLINE);
+        SecurityAnalysisResult result = analysisContext.run(network, new SecurityAnalysisParameters(), "OpenLoadFlow", Reporter.NO_OP, token);
+        assertThat(result.getPostContingencyResults()).hasSize(2);
+        assertThat(token.isInterrupted()).isFalse();
+
+        CancelToken child = new CancelToken(token, CancelToken.NO_DEADLINE);
+        token.cancel();
+        assertThat(child.isCancelled()).isTrue();
+        result = analysisContext.run(network, new SecurityAnalysisParameters(), "OpenLoadFlow", Reporter.NO_OP, child);
+        assertThat(result.getPreContingencyResult()).isNotNull();
+        assertThat(result.getPostContingencyResults()).isEmpty();
+        assertThat(child.isInterrupted()).isTrue();
+
+        // a token only cancelled directly aborts the run, which is not split into batches
+        assertThat(token.isCancellableByCaller()).isFalse();
+        assertThat(child.isCancellableByCaller()).isTrue();
+        assertThatThrownBy(() -> analysisContext.run(network, new SecurityAnalysisParameters(), "OpenLoadFlow", Reporter.NO_OP, token))
+                .satisfies(e -> assertThat(CancelToken.isCancellation(e)).isTrue());
+    }
+
+    @Test
+    void testSecurityAnalysisStream() {
+        Network network = EurostagTutorialExample1Factory.createWithFixedCurrentLimits();
+        SecurityAnalysisContext analysisContext = new SecurityAnalysisContext();
+        analysisContext.addContingency("First contingency", Collections.singletonList("NHV1_NHV2_1"));
+        analysisContext.addContingency("Second contingency", Collections.singletonList("NHV1_NHV2_2"));
+
+        SecurityAnalysisResultStream stream = new SecurityAnalysisResultStream(1);
+        Thread producer = new Thread(() -> stream.produce(consumer -> analysisContext.runByBatches(network,
+                new SecurityAnalysisParameters(), "OpenLoadFlow", Reporter.NO_OP, null, 1, consumer)));
+        producer.start();
+        List<String> contingencyIds = new ArrayList<>();
+        for (SecurityAnalysisResult result = stream.next(); result != null; result = stream.next()) {
+            assertThat(result.getPostContingencyResults()).hasSize(1);
+            contingencyIds.add(result.getPostContingencyResults().get(0).getContingency().getId());
+        }
+        assertThat(contingencyIds).containsExactly("First contingency", "Second contingency");
+        assertThat(stream.next()).isNull();
+    }
+
+    @Test
+    void testSecurityAnalysisStreamEnd() throws InterruptedException {
+        // a stream the analysis of which could not be run is ended
+        SecurityAnalysisResultStream finishedStream = new SecurityAnalysisResultStream(1);
+        finishedStream.finish();
+        assertThat(finishedStream.next()).isNull();
+
+        // closing a stream ends it for a thread waiting for the next result
+        SecurityAnalysisResultStream closedStream = new SecurityAnalysisResultStream(1);
+        Thread closer = new Thread(closedStream::close);
+        closer.start();
+        assertThat(closedStream.next()).isNull();
+        closer.join();
+    }
+
+    @Test
+    void testSecurityAnalysisStreamTimeout() {
+        // no result in time does not end the stream
+        SecurityAnalysisResultStream stream = new SecurityAnalysisResultStream(1);
+        assertThat(stream.next(10)).isNull();
+        assertThat(stream.isEnded()).isFalse();
+        stream.finish();
+        assertThat(stream.next(10)).isNull();
+        assertThat(stream.isEnded()).isTrue();
+    }
 }
@@ -9,6 +9,7 @@ import inspect as _inspect
 import logging
 from pypowsybl import _pypowsybl
 from pypowsybl._pypowsybl import PyPowsyblError
+from pypowsybl.util import CancelToken
 from pypowsybl import (
     network,
     loadflow,
@@ -16,6 +17,9 @@ from pypowsybl import (
     sensitivity,
     glsk,
     flowdecomposition,
+    timeseries,
+    isolate,
+    aio,
 )
 
 __version__ = '0.20.0.dev1'
@@ -33,7 +37,11 @@ __all__ = [
     "security",
     "sensitivity",
     "glsk",
-    "flowdecomposition"
+    "flowdecomposition",
+    "timeseries",
+    "isolate",
+    "aio",
+    "CancelToken"
 ]
 
 
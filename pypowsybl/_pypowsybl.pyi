@@ -1,4 +1,4 @@
-from typing import ClassVar, Dict, Iterator, List, Sequence, Optional, Union
+from typing import Any, Callable, ClassVar, Dict, Iterator, List, Sequence, Optional, Tuple, Union
 from numpy.typing import ArrayLike as _ArrayLike
 from logging import Logger
 
@@ -242,6 +242,9 @@ class SensitivityAnalysisParameters:
 class Matrix:
     ...
 
+class ByteArray:
+    def __len__(self) -> int: ...
+
 class NetworkMetadata:
     @property
     def case_date(self) -> float: ...
@@ -263,6 +266,16 @@ class Series:
     def index(self) -> bool: ...
     @property
     def name(self) -> str: ...
+    @property
+    def type(self) -> int: ...
+    def __arrow_c_array__(self, requested_schema: Optional[object] = None) -> Tuple[object, object]: ...
+    def dictionary_encoded_data(self, dictionary: StringDictionary) -> object: ...
+
+class StringDictionary:
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def values(self) -> List[str]: ...
 
 class SeriesArray:
     def __iter__(self) -> Iterator: ...
@@ -377,6 +390,7 @@ class FlowDecompositionParameters:
     def __init__(self) -> None: ...
 
 def add_contingency(analysis_context: JavaHandle, contingency_id: str, elements_ids: List[str]) -> None: ...
+def add_contingencies(analysis_context: JavaHandle, network: Optional[JavaHandle], contingency_ids: List[str], elements_ids: List[str]) -> SeriesArray: ...
 def add_monitored_elements(security_analysis_context: JavaHandle, contingency_context_type: ContingencyContextType, branch_ids: List[str], voltage_level_ids: List[str], three_windings_transformer_ids: List[str], contingency_ids: List[str]) -> None: ...
 def clone_variant(network: JavaHandle, src: str, variant: str, may_overwrite: bool) -> None: ...
 def create_dataframe(columns_values: list, columns_names: List[str], columns_types: List[int], is_index: List[bool]) -> Dataframe: ...
@@ -384,13 +398,16 @@ def create_element(network: JavaHandle, dataframes: List[Optional[Dataframe]], e
 def create_exporter_parameters_series_array(format: str) -> SeriesArray: ...
 def create_importer_parameters_series_array(format: str) -> SeriesArray: ...
 def create_network(name: str, id: str) -> JavaHandle: ...
-def create_network_elements_series_array(network: JavaHandle, element_type: ElementType, filter_attributes_type: FilterAttributesType, attributes: List[str], array: Optional[Dataframe]) -> SeriesArray: ...
+def create_network_elements_series_arrays(network: JavaHandle, element_types: List[ElementType], filter_attributes_types: List[FilterAttributesType], attributes: List[List[str]]) -> List[SeriesArray]: ...
+def create_network_elements_series_array(network: JavaHandle, element_type: ElementType, filter_attributes_type: FilterAttributesType, attributes: List[str], array: Optional[Dataframe], filter: Optional[Dataframe] = None) -> SeriesArray: ...
+def create_network_elements_variants_series_array(network: JavaHandle, element_type: ElementType, filter_attributes_type: FilterAttributesType, attributes: List[str], array: Optional[Dataframe], filter: Optional[Dataframe], variant_ids: List[str]) -> SeriesArray: ...
 def create_network_elements_extension_series_array(network: JavaHandle, extension_name: str) -> SeriesArray: ...
 def get_extensions_names() -> List[str]: ...
 def create_security_analysis() -> JavaHandle: ...
 def create_sensitivity_analysis() -> JavaHandle: ...
 def dump_network(network: JavaHandle, file: str, format: str, parameters: Dict[str,str], report: Optional[JavaHandle]) -> None: ...
 def dump_network_to_string(network: JavaHandle, format: str, parameters: Dict[str,str], report: Optional[JavaHandle]) -> str: ...
+def dump_network_to_binary_buffer(network: JavaHandle, format: str, parameters: Dict[str,str], reporter: Optional[JavaHandle]) -> ByteArray: ...
 def get_branch_flows_sensitivity_matrix(sensitivity_analysis_result_context: JavaHandle, matrix_id: str, contingency_id: str) -> Matrix: ...
 def get_branch_results(result: JavaHandle) -> SeriesArray: ...
 def get_bus_breaker_view_buses(network: JavaHandle, voltage_level: str) -> SeriesArray: ...
@@ -402,6 +419,15 @@ def get_loadflow_provider_parameters_names(provider: str) -> List[str]: ...
 def get_security_analysis_provider_parameters_names(provider: str) -> List[str]: ...
 def get_sensitivity_analysis_provider_parameters_names(provider: str) -> List[str]: ...
 def get_limit_violations(result: JavaHandle) -> SeriesArray: ...
+def get_contingency_status(result: JavaHandle) -> SeriesArray: ...
+def get_security_analysis_contingency_results(result: JavaHandle, contingency_ids: List[str]) -> ContingencyResultArray: ...
+def create_isolate() -> int: ...
+def set_thread_isolate(isolate: int) -> None: ...
+def get_thread_isolate() -> int: ...
+def get_handle_isolate(handle: JavaHandle) -> int: ...
+def serialize_security_analysis_result(result: JavaHandle) -> ByteArray: ...
+def deserialize_security_analysis_result(buffer: Any) -> JavaHandle: ...
+def merge_security_analysis_results(results: List[JavaHandle]) -> JavaHandle: ...
 def get_network_area_diagram_svg(network: JavaHandle, voltage_level_ids:  Union[str, List[str]], depth: int) -> str: ...
 def get_network_elements_ids(network: JavaHandle, element_type: ElementType, nominal_voltages: List[float], countries: List[str], main_connected_component: bool, main_synchronous_component: bool, not_connected_to_same_bus_at_both_sides: bool) -> List[str]: ...
 def get_network_export_formats() -> List[str]: ...
@@ -424,23 +450,44 @@ def get_validation_level(network: JavaHandle) -> ValidationLevel: ...
 def get_variant_ids(network: JavaHandle) -> List[str]: ...
 def get_version_table() -> str: ...
 def get_working_variant_id(network: JavaHandle) -> str: ...
+def get_network_modification_count(network: JavaHandle) -> int: ...
+def serialize_network(network: JavaHandle, compress: bool) -> ByteArray: ...
+def deserialize_network(buffer: Any) -> JavaHandle: ...
+def copy_network(network: JavaHandle, variant_ids: List[str]) -> JavaHandle: ...
+def get_variant_modification_count(network: JavaHandle, variant: str) -> int: ...
 def add_branch_flow_factor_matrix(sensitivity_analysis_context: JavaHandle, matrix_id: str, branches_ids: List[str], variables_ids: List[str]) -> None: ...
 def add_precontingency_branch_flow_factor_matrix(sensitivity_analysis_context: JavaHandle, matrix_id: str, branches_ids: List[str], variables_ids: List[str]) -> None: ...
 def add_postcontingency_branch_flow_factor_matrix(sensitivity_analysis_context: JavaHandle, matrix_id: str, branches_ids: List[str], variables_ids: List[str], contingencies_ids: List[str]) -> None: ...
 def is_config_read() -> bool: ...
+def create_cancel_token(parent: Optional[JavaHandle], deadline: int) -> JavaHandle: ...
+def cancel(cancel_token: JavaHandle) -> None: ...
+def is_cancelled(cancel_token: JavaHandle) -> bool: ...
+def is_interrupted(cancel_token: JavaHandle) -> bool: ...
 def get_default_loadflow_provider() -> str: ...
 def get_default_security_analysis_provider() -> str: ...
 def get_default_sensitivity_analysis_provider() -> str: ...
-def load_network(file: str, parameters: Dict[str,str], report: Optional[JavaHandle]) -> JavaHandle: ...
+def load_network(file: str, parameters: Dict[str,str], parallelism: int, skipped_profiles: List[str], report: Optional[JavaHandle], progress: Optional[Callable[[str, int, int], None]] = ...) -> JavaHandle: ...
 def load_network_from_string(file_name: str, file_content: str, parameters: Dict[str,str], report: Optional[JavaHandle]) -> JavaHandle: ...
+def load_network_from_binary_buffer(file_name: str, buffer: Any, parameters: Dict[str,str], reporter: Optional[JavaHandle]) -> JavaHandle: ...
 def merge(arg0: JavaHandle, arg1: List[JavaHandle]) -> None: ...
 def reduce_network(network: JavaHandle, v_min: float, v_max: float, ids: List[str], vls: List[str], depths: List[int], with_dangling_lines: bool) -> None: ...
 def remove_elements(network: JavaHandle, element_ids: List[str]) -> None: ...
 def remove_variant(network: JavaHandle, variant: str) -> None: ...
 def run_load_flow(network: JavaHandle, dc: bool, parameters: LoadFlowParameters, provider: str, report: Optional[JavaHandle]) -> LoadFlowComponentResultArray: ...
+def run_load_flow_variants(network: JavaHandle, dc: bool, parameters: LoadFlowParameters, provider: str, variant_ids: List[str], max_workers: int) -> List[LoadFlowComponentResultArray]: ...
+def run_load_flow_time_series(network: JavaHandle, dc: bool, parameters: LoadFlowParameters, provider: str, steps_count: int,
+                              profiles_element_types: List[ElementType], profiles_attributes: List[str], profiles_ids: List[List[str]], profiles_values: _ArrayLike,
+                              results_element_types: List[ElementType], results_attributes: List[str], results_ids: List[List[str]], results_values: _ArrayLike,
+                              statuses: _ArrayLike) -> None: ...
 def run_load_flow_validation(network: JavaHandle, validation_type: ValidationType) -> SeriesArray: ...
-def run_security_analysis(security_analysis_context: JavaHandle, network: JavaHandle, parameters: SecurityAnalysisParameters, provider: str, dc: bool, report: Optional[JavaHandle]) -> JavaHandle: ...
-def run_sensitivity_analysis(sensitivity_analysis_context: JavaHandle, network: JavaHandle, dc: bool, parameters: SensitivityAnalysisParameters, provider: str, report: Optional[JavaHandle]) -> JavaHandle: ...
+def run_security_analysis(security_analysis_context: JavaHandle, network: JavaHandle, parameters: SecurityAnalysisParameters, provider: str, dc: bool, report: Optional[JavaHandle], cancel_token: Optional[JavaHandle]) -> JavaHandle: ...
+def create_security_analysis_result_stream(capacity: int) -> JavaHandle: ...
+def run_security_analysis_stream(security_analysis_context: JavaHandle, stream: JavaHandle, network: JavaHandle, parameters: SecurityAnalysisParameters, provider: str, dc: bool, report: Optional[JavaHandle], cancel_token: Optional[JavaHandle], batch_size: int) -> None: ...
+def get_next_security_analysis_stream_result(stream: JavaHandle, timeout_ms: int) -> Optional[JavaHandle]: ...
+def is_security_analysis_result_stream_ended(stream: JavaHandle) -> bool: ...
+def finish_security_analysis_result_stream(stream: JavaHandle) -> None: ...
+def close_security_analysis_result_stream(stream: JavaHandle) -> None: ...
+def run_sensitivity_analysis(sensitivity_analysis_context: JavaHandle, network: JavaHandle, dc: bool, parameters: SensitivityAnalysisParameters, provider: str, report: Optional[JavaHandle], cancel_token: Optional[JavaHandle]) -> JavaHandle: ...
 def set_branch_flow_factor_matrix(sensitivity_analysis_context: JavaHandle, branches_ids: List[str], variables_ids: List[str]) -> None: ...
 def set_bus_voltage_factor_matrix(sensitivity_analysis_context: JavaHandle, bus_ids: List[str], target_voltage_ids: List[str]) -> None: ...
 def set_config_read(arg0: bool) -> None: ...
@@ -454,8 +501,10 @@ def set_working_variant(network: JavaHandle, variant: str) -> None: ...
 def set_zones(sensitivity_analysis_context: JavaHandle, zones: List[Zone]) -> None: ...
 def get_logger() -> Logger: ...
 def update_connectable_status(arg0: JavaHandle, arg1: str, arg2: bool) -> bool: ...
+def update_connectables_status(network: JavaHandle, ids: List[str], connected: List[int]) -> List[bool]: ...
 def update_network_elements_with_series(network: JavaHandle, array: Dataframe, element_type: ElementType) -> None: ...
 def update_switch_position(arg0: JavaHandle, arg1: str, arg2: bool) -> bool: ...
+def update_switches_positions(network: JavaHandle, ids: List[str], open: List[int]) -> List[bool]: ...
 def validate(network: JavaHandle) -> ValidationLevel: ...
 def write_network_area_diagram_svg(network: JavaHandle, svg_file: str, voltage_level_ids:  Union[str, List[str]], depth: int) -> None: ...
 def write_single_line_diagram_svg(network: JavaHandle, container_id: str, svg_file: str) -> None: ...
@@ -0,0 +1,28 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides asynchronous versions of long-running computations, to be awaited in asyncio coroutines.
+
+Computations are run on a pool of worker threads, which bounds the number of pending computations.
+"""
+from .pool import WorkerPool, get_default_pool, set_default_pool
+from . import (
+    loadflow,
+    security,
+    sensitivity,
+    flowdecomposition,
+)
+
+__all__ = [
+    "WorkerPool",
+    "get_default_pool",
+    "set_default_pool",
+    "loadflow",
+    "security",
+    "sensitivity",
+    "flowdecomposition",
+]
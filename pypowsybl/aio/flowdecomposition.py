@@ -0,0 +1,36 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Asynchronous versions of flow decompositions.
+"""
+from __future__ import annotations
+
+import pandas as _pd
+
+import pypowsybl.flowdecomposition as _fd
+import pypowsybl.loadflow
+from pypowsybl.flowdecomposition import Parameters as _Parameters
+from pypowsybl.network import Network as _Network
+from .pool import WorkerPool, _run
+
+
+async def run_async(network: _Network, flow_decomposition_parameters: _Parameters = None,
+                    load_flow_parameters: pypowsybl.loadflow.Parameters = None,
+                    pool: WorkerPool = None) -> _pd.DataFrame:
+    """
+    Runs a flow decomposition, on a worker of a pool.
+
+    Args:
+        network:                        Network on which the flow decomposition will be computed
+        flow_decomposition_parameters:  Flow decomposition parameters
+        load_flow_parameters:           Load flow parameters
+        pool:                           the pool running the flow decomposition, default is the default pool
+
+    Returns:
+        A dataframe with decomposed flow for each relevant line, see :func:`pypowsybl.flowdecomposition.run`
+    """
+    return await _run(pool, _fd.run, network, flow_decomposition_parameters, load_flow_parameters)
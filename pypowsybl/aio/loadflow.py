@@ -0,0 +1,54 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Asynchronous versions of loadflow computations.
+"""
+from __future__ import annotations
+
+from typing import List as _List
+
+import pypowsybl.loadflow as _lf
+from pypowsybl.loadflow import ComponentResult as _ComponentResult, Parameters as _Parameters
+from pypowsybl.network import Network as _Network
+from pypowsybl.report import Reporter as _Reporter
+from .pool import WorkerPool, _run
+
+
+async def run_ac_async(network: _Network, parameters: _Parameters = None, provider: str = '',
+                       reporter: _Reporter = None, pool: WorkerPool = None) -> _List[_ComponentResult]:
+    """
+    Run an AC loadflow on a network, on a worker of a pool.
+
+    Args:
+        network:    a network
+        parameters: the loadflow parameters
+        provider:   the loadflow implementation provider, default is the default loadflow provider
+        reporter:   the reporter to be used to create an execution report, default is None (no report)
+        pool:       the pool running the loadflow, default is the default pool
+
+    Returns:
+        A list of component results, one for each component of the network.
+    """
+    return await _run(pool, _lf.run_ac, network, parameters, provider, reporter)
+
+
+async def run_dc_async(network: _Network, parameters: _Parameters = None, provider: str = '',
+                       reporter: _Reporter = None, pool: WorkerPool = None) -> _List[_ComponentResult]:
+    """
+    Run a DC loadflow on a network, on a worker of a pool.
+
+    Args:
+        network:    a network
+        parameters: the loadflow parameters
+        provider:   the loadflow implementation provider, default is the default loadflow provider
+        reporter:   the reporter to be used to create an execution report, default is None (no report)
+        pool:       the pool running the loadflow, default is the default pool
+
+    Returns:
+        A list of component results, one for each component of the network.
+    """
+    return await _run(pool, _lf.run_dc, network, parameters, provider, reporter)
@@ -0,0 +1,218 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides the pool of worker threads on which asynchronous computations are run.
+"""
+from __future__ import annotations
+
+import asyncio as _asyncio
+import functools as _functools
+import os as _os
+import threading as _threading
+from collections import deque as _deque
+from concurrent.futures import Executor as _Executor, Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import (
+    Any as _Any,
+    Awaitable as _Awaitable,
+    Callable as _Callable,
+    Deque as _Deque,
+    Optional as _Optional,
+    Tuple as _Tuple,
+    TypeVar as _TypeVar
+)
+
+_T = _TypeVar('_T')
+
+
+class WorkerPool:
+    """
+    A pool of worker threads running computations of the native library for coroutines.
+
+    Native computations release the GIL, so that calls run in parallel on the workers,
+    while the event loop keeps serving other coroutines.
+
+    The number of calls submitted to the pool and not yet finished is bounded: when it is reached,
+    coroutines wait for a call to finish before submitting theirs, in the order in which they started waiting.
+    This provides backpressure to services receiving more requests than they can compute.
+
+    Cancelling a coroutine waiting for a call removes the call from the pool if it has not started yet.
+    A call which has already started runs to completion, but its result is discarded.
+
+    Args:
+        max_workers: the number of worker threads, default is the number of processors
+        max_pending: the maximum number of calls submitted and not yet finished, running or queued,
+                     default is twice the number of workers
+        executor:    the executor running the calls, for example an :class:`~pypowsybl.isolate.IsolateExecutor`,
+                     default is a pool of ``max_workers`` threads owned by this pool
+
+    Examples:
+
+        .. code-block:: python
+
+            pool = WorkerPool(max_workers=4, max_pending=16)
+            results = await pp.aio.loadflow.run_ac_async(network, pool=pool)
+    """
+
+    def __init__(self, max_workers: int = None, max_pending: int = None, executor: _Executor = None):
+        if max_workers is None:
+            max_workers = _os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError('Number of workers must be strictly positive')
+        if max_pending is None:
+            max_pending = 2 * max_workers
+        if max_pending < 1:
+            raise ValueError('Maximum number of pending calls must be strictly positive')
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else \
+            _ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pypowsybl-aio')
+        self._pending = 0
+        self._waiters: _Deque[_Tuple[_asyncio.AbstractEventLoop, _asyncio.Future]] = _deque()
+        self._lock = _threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """
+        The number of worker threads.
+        """
+        return self._max_workers
+
+    @property
+    def max_pending(self) -> int:
+        """
+        The maximum number of calls submitted and not yet finished.
+        """
+        return self._max_pending
+
+    @property
+    def pending(self) -> int:
+        """
+        The number of calls submitted and not yet finished, which a service may use to reject requests early.
+        """
+        with self._lock:
+            return self._pending
+
+    @property
+    def waiting(self) -> int:
+        """
+        The number of coroutines waiting for a call to finish before submitting theirs.
+        """
+        with self._lock:
+            return len(self._waiters)
+
+    async def _acquire(self) -> None:
+        with self._lock:
+            if self._pending < self._max_pending and not self._waiters:
+                self._pending += 1
+                return
+            loop = _asyncio.get_running_loop()
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await waiter
+        except _asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was handed over to this coroutine before its cancellation
+                self._release()
+            else:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, waiter))
+                    except ValueError:
+                        # already handed over, the slot is passed on by _wake
+                        pass
+            raise
+
+    def _release(self) -> None:
+        """
+        Hands the slot of a finished call over to the first waiting coroutine, if any, may be called from any thread.
+        """
+        with self._lock:
+            while self._waiters:
+                loop, waiter = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(self._wake, waiter)
+                    return
+                except RuntimeError:
+                    # the event loop of the waiter is closed
+                    continue
+            self._pending -= 1
+
+    def _wake(self, waiter: _asyncio.Future) -> None:
+        if waiter.done():
+            # cancelled in the meantime
+            self._release()
+        else:
+            waiter.set_result(None)
+
+    async def run(self, fn: _Callable[..., _T], *args: _Any, **kwargs: _Any) -> _T:
+        """
+        Runs a call on a worker, waiting first for a pending call to finish if there are too many of them.
+
+        Args:
+            fn: the function to be called
+            args: positional arguments of the call
+            kwargs: keyword arguments of the call
+
+        Returns:
+            the result of the call
+        """
+        await self._acquire()
+        try:
+            future: _Future[_T] = self._executor.submit(_functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return await _asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops the workers, once the submitted calls are finished if wait is true.
+        The executor given to the pool, if any, is left running.
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    def __repr__(self) -> str:
+        return f'WorkerPool(max_workers={self._max_workers}, max_pending={self._max_pending})'
+
+
+_DEFAULT_POOL: _Optional[WorkerPool] = None
+_DEFAULT_POOL_LOCK = _threading.Lock()
+
+
+def get_default_pool() -> WorkerPool:
+    """
+    Get the pool used by asynchronous functions when no pool is given, created on first use.
+    """
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    with _DEFAULT_POOL_LOCK:
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = WorkerPool()
+        return _DEFAULT_POOL
+
+
+def set_default_pool(pool: WorkerPool) -> None:
+    """
+    Set the pool used by asynchronous functions when no pool is given.
+    The previous default pool is not shut down.
+
+    Args:
+        pool: the new default pool
+    """
+    global _DEFAULT_POOL  # pylint: disable=global-statement
+    with _DEFAULT_POOL_LOCK:
+        _DEFAULT_POOL = pool
+
+
+def _run(pool: _Optional[WorkerPool], fn: _Callable[..., _T], *args: _Any, **kwargs: _Any) -> _Awaitable[_T]:
+    """
+    Runs a call on the given pool, or on the default pool.
+    """
+    return (pool if pool is not None else get_default_pool()).run(fn, *args, **kwargs)
@@ -0,0 +1,88 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Asynchronous versions of security analyses.
+"""
+from __future__ import annotations
+
+import asyncio as _asyncio
+from typing import Union as _Union
+
+import pypowsybl.loadflow
+from pypowsybl.network import Network as _Network
+from pypowsybl.report import Reporter as _Reporter
+from pypowsybl.util import CancelToken as _CancelToken, _create_abort_token
+from pypowsybl.security import (
+    Parameters as _Parameters,
+    SecurityAnalysis as _SecurityAnalysis,
+    SecurityAnalysisResult as _SecurityAnalysisResult
+)
+from .pool import WorkerPool, _run
+
+
+async def run_ac_async(analysis: _SecurityAnalysis, network: _Network,
+                       parameters: _Union[_Parameters, pypowsybl.loadflow.Parameters] = None,
+                       provider: str = '', reporter: _Reporter = None,
+                       deadline: float = None, cancel_token: _CancelToken = None,
+                       pool: WorkerPool = None) -> _SecurityAnalysisResult:
+    """
+    Runs an AC security analysis, on a worker of a pool.
+
+    Args:
+        analysis:   the security analysis, with its contingencies and monitored elements
+        network:    network on which the security analysis will be computed
+        parameters: security analysis parameters
+        provider:   name of the security analysis implementation provider to be used,
+                    will use default provider if not specified.
+        reporter:   the reporter to be used to create an execution report, default is None (no report)
+        deadline:   time, in seconds since the epoch, after which the analysis stops with partial results
+        cancel_token: token to cancel the analysis, which then stops with partial results
+        pool:       the pool running the security analysis, default is the default pool
+
+    Returns:
+        A security analysis result, containing information about violations and monitored elements
+    """
+    # cancelling the coroutine also stops the analysis if it has already started
+    token = _create_abort_token(cancel_token)
+    try:
+        return await _run(pool, analysis.run_ac, network, parameters, provider, reporter,
+                          deadline=deadline, cancel_token=token)
+    except _asyncio.CancelledError:
+        token.cancel()
+        raise
+
+
+async def run_dc_async(analysis: _SecurityAnalysis, network: _Network,
+                       parameters: _Union[_Parameters, pypowsybl.loadflow.Parameters] = None,
+                       provider: str = '', reporter: _Reporter = None,
+                       deadline: float = None, cancel_token: _CancelToken = None,
+                       pool: WorkerPool = None) -> _SecurityAnalysisResult:
+    """
+    Runs a DC security analysis, on a worker of a pool.
+
+    Args:
+        analysis:   the security analysis, with its contingencies and monitored elements
+        network:    network on which the security analysis will be computed
+        parameters: security analysis parameters
+        provider:   name of the security analysis implementation provider to be used,
+                    will use default provider if not specified.
+        reporter:   the reporter to be used to create an execution report, default is None (no report)
+        deadline:   time, in seconds since the epoch, after which the analysis stops with partial results
+        cancel_token: token to cancel the analysis, which then stops with partial results
+        pool:       the pool running the security analysis, default is the default pool
+
+    Returns:
+        A security analysis result, containing information about violations and monitored elements
+    """
+    # cancelling the coroutine also stops the analysis if it has already started
+    token = _create_abort_token(cancel_token)
+    try:
+        return await _run(pool, analysis.run_dc, network, parameters, provider, reporter,
+                          deadline=deadline, cancel_token=token)
+    except _asyncio.CancelledError:
+        token.cancel()
+        raise
@@ -0,0 +1,58 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Asynchronous versions of sensitivity analyses.
+"""
+from __future__ import annotations
+
+import asyncio as _asyncio
+from typing import Union as _Union
+
+import pypowsybl.loadflow
+from pypowsybl.network import Network as _Network
+from pypowsybl.report import Reporter as _Reporter
+from pypowsybl.util import CancelToken as _CancelToken, _create_abort_token
+from pypowsybl.sensitivity import (
+    AcSensitivityAnalysis as _AcSensitivityAnalysis,
+    AcSensitivityAnalysisResult as _AcSensitivityAnalysisResult,
+    DcSensitivityAnalysis as _DcSensitivityAnalysis,
+    DcSensitivityAnalysisResult as _DcSensitivityAnalysisResult,
+    Parameters as _Parameters
+)
+from .pool import WorkerPool, _run
+
+
+async def run_async(analysis: _Union[_DcSensitivityAnalysis, _AcSensitivityAnalysis], network: _Network,
+                    parameters: _Union[_Parameters, pypowsybl.loadflow.Parameters] = None,
+                    provider: str = '', reporter: _Reporter = None,
+                    deadline: float = None, cancel_token: _CancelToken = None,
+                    pool: WorkerPool = None) -> _Union[_DcSensitivityAnalysisResult, _AcSensitivityAnalysisResult]:
+    """
+    Runs a DC or AC sensitivity analysis, on a worker of a pool.
+
+    Args:
+        analysis:   the sensitivity analysis, created by :func:`pypowsybl.sensitivity.create_dc_analysis`
+                    or :func:`pypowsybl.sensitivity.create_ac_analysis`
+        network:    The network
+        parameters: The sensitivity parameters
+        provider:   Name of the sensitivity analysis provider
+        reporter:   the reporter to be used to create an execution report, default is None (no report)
+        deadline:   time, in seconds since the epoch, after which the analysis stops with partial results
+        cancel_token: token to cancel the analysis, which then stops with partial results
+        pool:       the pool running the sensitivity analysis, default is the default pool
+
+    Returns:
+        a sensitivity analysis result, DC or AC depending on the analysis
+    """
+    # cancelling the coroutine also stops the analysis if it has already started
+    token = _create_abort_token(cancel_token)
+    try:
+        return await _run(pool, analysis.run, network, parameters, provider, reporter,
+                          deadline=deadline, cancel_token=token)
+    except _asyncio.CancelledError:
+        token.cancel()
+        raise
@@ -0,0 +1,199 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides an executor running computations in several isolates of the native library, in the same process.
+"""
+from __future__ import annotations
+
+import inspect as _inspect
+import os as _os
+import threading as _threading
+from concurrent.futures import Executor as _Executor, Future as _Future, ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import (
+    Any as _Any,
+    Callable as _Callable,
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Set as _Set,
+    TypeVar as _TypeVar
+)
+
+from pypowsybl import _pypowsybl
+from pypowsybl.network import Network as _Network
+
+_T = _TypeVar('_T')
+
+#: Isolates created by executors, reused by later executors, since isolates cannot be destroyed
+#: as long as java objects they own may still be referenced
+_ISOLATES: _List[int] = []
+_INITIALIZED_ISOLATES: _Set[int] = set()
+_ISOLATES_LOCK = _threading.Lock()
+
+MAIN_ISOLATE = 0
+
+
+def _get_isolates(count: int) -> _List[int]:
+    with _ISOLATES_LOCK:
+        while len(_ISOLATES) < count:
+            _ISOLATES.append(_pypowsybl.create_isolate())
+        return _ISOLATES[:count]
+
+
+def _init_worker(isolate: int, config_read: bool, providers: _Dict[str, str]) -> None:
+    """
+    Binds a worker thread to its isolate, and initializes the isolate on its first use,
+    with the configuration of the main isolate.
+    """
+    _pypowsybl.set_thread_isolate(isolate)
+    with _ISOLATES_LOCK:
+        if isolate in _INITIALIZED_ISOLATES:
+            return
+        _pypowsybl.set_java_library_path(_os.path.dirname(_inspect.getfile(_pypowsybl)))
+        # the logger is shared, its callback has to be registered in each isolate
+        _pypowsybl.set_logger(_pypowsybl.get_logger())
+        _pypowsybl.set_config_read(config_read)
+        _pypowsybl.set_default_loadflow_provider(providers['loadflow'])
+        _pypowsybl.set_default_security_analysis_provider(providers['security'])
+        _pypowsybl.set_default_sensitivity_analysis_provider(providers['sensitivity'])
+        _INITIALIZED_ISOLATES.add(isolate)
+
+
+def get_isolate(network: _Network) -> int:
+    """
+    Get the isolate which owns a network, :data:`MAIN_ISOLATE` for networks created outside of any executor.
+
+    Args:
+        network: a network
+
+    Returns:
+        the ID of the isolate
+    """
+    return _pypowsybl.get_handle_isolate(network._handle)  # pylint: disable=protected-access
+
+
+class IsolateExecutor(_Executor):
+    """
+    An executor running calls in several isolates of the native library, each one with its own heap,
+    so that computations in distinct isolates run in parallel without sharing any state.
+
+    Each isolate is used by a single worker thread. Networks are pinned to the isolate in which they have been
+    created: a call is dispatched to the isolate of the networks given as arguments, if any,
+    otherwise to the isolate with the fewest pending calls. Networks loaded or created by a call belong
+    to the isolate of this call, and other networks can be copied to an isolate with :meth:`pin`.
+
+    Methods of a pinned network may still be called from any thread, they are run in its isolate.
+    However, objects of different isolates, like a network and a security analysis, cannot be used together.
+
+    Isolates are created on first use, and are then reused by other executors for the lifetime of the process.
+    They are initialized with the configuration and default providers of the main isolate.
+
+    Args:
+        max_workers: the number of isolates, default is the number of processors
+
+    Examples:
+
+        .. code-block:: python
+
+            with IsolateExecutor(4) as executor:
+                networks = [executor.submit(pp.network.load, path).result() for path in paths]
+                results = list(executor.map(pp.loadflow.run_ac, networks))
+    """
+
+    def __init__(self, max_workers: int = None):
+        if max_workers is None:
+            max_workers = _os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError('Number of workers must be strictly positive')
+        providers = {
+            'loadflow': _pypowsybl.get_default_loadflow_provider(),
+            'security': _pypowsybl.get_default_security_analysis_provider(),
+            'sensitivity': _pypowsybl.get_default_sensitivity_analysis_provider()
+        }
+        config_read = _pypowsybl.is_config_read()
+        self._isolates = _get_isolates(max_workers)
+        self._workers = [_ThreadPoolExecutor(max_workers=1, initializer=_init_worker,
+                                             initargs=(isolate, config_read, providers))
+                         for isolate in self._isolates]
+        self._pending = [0] * max_workers
+        self._lock = _threading.Lock()
+
+    @property
+    def isolates(self) -> _List[int]:
+        """
+        The IDs of the isolates of this executor.
+        """
+        return list(self._isolates)
+
+    def _select_worker(self, args: _Any, kwargs: _Dict[str, _Any]) -> int:
+        networks_isolates = set(get_isolate(arg) for arg in list(args) + list(kwargs.values()) if isinstance(arg, _Network))
+        if len(networks_isolates) > 1:
+            raise ValueError('Networks of different isolates cannot be used in the same call')
+        if networks_isolates:
+            isolate = networks_isolates.pop()
+            if isolate not in self._isolates:
+                raise ValueError(f'Network belongs to isolate {isolate}, which is not an isolate of this executor, '
+                                 f'it has to be pinned to one of them first')
+            return self._isolates.index(isolate)
+        with self._lock:
+            return self._pending.index(min(self._pending))
+
+    def _submit_to(self, worker: int, fn: _Callable[..., _T], *args: _Any, **kwargs: _Any) -> _Future[_T]:
+        with self._lock:
+            self._pending[worker] += 1
+        future = self._workers[worker].submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._call_done(worker))
+        return future
+
+    def _call_done(self, worker: int) -> None:
+        with self._lock:
+            self._pending[worker] -= 1
+
+    def submit(self, fn: _Callable[..., _T], *args: _Any, **kwargs: _Any) -> _Future[_T]:
+        """
+        Schedules a call in the isolate of the networks given as arguments, if any,
+        otherwise in the isolate with the fewest pending calls.
+
+        Returns:
+            the future result of the call
+        """
+        return self._submit_to(self._select_worker(args, kwargs), fn, *args, **kwargs)
+
+    def pin(self, network: _Network, isolate: _Optional[int] = None) -> _Network:
+        """
+        Copies a network, with all its variants, to an isolate of this executor.
+
+        Args:
+            network: the network to be copied
+            isolate: the isolate of the copy, default is the isolate with the fewest pending calls
+
+        Returns:
+            the copy of the network, pinned to the isolate
+        """
+        if isolate is None:
+            with self._lock:
+                worker = self._pending.index(min(self._pending))
+        elif isolate in self._isolates:
+            worker = self._isolates.index(isolate)
+        else:
+            raise ValueError(f'Isolate {isolate} is not an isolate of this executor')
+        data = _pypowsybl.serialize_network(network._handle, False)  # pylint: disable=protected-access
+        return self._submit_to(worker, _deserialize_network, data).result()
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        for worker in self._workers:
+            if cancel_futures:
+                worker.shutdown(wait=wait, cancel_futures=True)  # type: ignore[call-arg]
+            else:
+                worker.shutdown(wait=wait)
+
+    def __repr__(self) -> str:
+        return f'IsolateExecutor(isolates={self._isolates})'
+
+
+def _deserialize_network(data: _Any) -> _Network:
+    return _Network(_pypowsybl.deserialize_network(data))
@@ -8,8 +8,10 @@ from typing import (
     List as _List,
     Sequence as _Sequence,
     Optional as _Optional,
-    Dict as _Dict
+    Dict as _Dict,
+    Tuple as _Tuple
 )
+import numpy as _np
 from pandas import DataFrame as _DataFrame
 
 from pypowsybl import _pypowsybl
@@ -282,6 +284,266 @@ def run_dc(network: _Network, parameters: Parameters = None, provider: str = '',
     return [ComponentResult(res) for res in _pypowsybl.run_load_flow(network._handle, True, p, provider, None if reporter is None else reporter._reporter_model)] # pylint: disable=protected-access
 
 
+def run_ac_variants(network: _Network, variant_ids: _Sequence[str], parameters: Parameters = None, provider: str = '',
+                    max_workers: int = None) -> _Dict[str, _List[ComponentResult]]:
+    """
+    Run AC loadflows on several variants of a network, concurrently.
+
+    Loadflows are run by a pool of threads in the native library, each thread working on its own variant,
+    which is much faster than running them one after another on a multi-core machine.
+    The working variant of the network is left unchanged.
+
+    Args:
+        network:     a network
+        variant_ids: the ids of the variants to run the loadflow on
+        parameters:  the loadflow parameters, used for all variants
+        provider:    the loadflow implementation provider, default is the default loadflow provider
+        max_workers: maximum number of loadflows running at the same time, default is the number of available processors
+
+    Returns:
+        A dictionary of component results lists, one list for each variant.
+
+    Examples:
+
+        .. code-block:: python
+
+            results = pp.loadflow.run_ac_variants(network, ['t00', 't15', 't30', 't45'], max_workers=4)
+            results['t15'][0].status
+    """
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError('max_workers must be strictly positive')
+    p = parameters._to_c_parameters() if parameters is not None else _pypowsybl.LoadFlowParameters()  # pylint: disable=protected-access
+    variant_ids = list(variant_ids)
+    if len(set(variant_ids)) != len(variant_ids):
+        raise ValueError('Variant ids must be unique')
+    results = _pypowsybl.run_load_flow_variants(network._handle, False, p, provider, variant_ids,  # pylint: disable=protected-access
+                                                0 if max_workers is None else max_workers)
+    return {variant_id: [ComponentResult(res) for res in result] for variant_id, result in zip(variant_ids, results)}
+
+
+class WarmStartResult:
+    """
+    The result of warm started AC loadflows on several variants.
+
+    .. currentmodule:: pypowsybl.loadflow
+    """
+
+    def __init__(self, order: _List[str], seeds: _Dict[str, _Optional[str]],
+                 results: _Dict[str, _List[ComponentResult]],
+                 baseline_iteration_counts: _Optional[_Dict[str, int]]):
+        self._order = order
+        self._seeds = seeds
+        self._results = results
+        self._baseline_iteration_counts = baseline_iteration_counts
+
+    @property
+    def order(self) -> _List[str]:
+        """The ids of the variants, in the order loadflows have been run."""
+        return self._order
+
+    @property
+    def seeds(self) -> _Dict[str, _Optional[str]]:
+        """For each variant, the id of the variant its voltages have been initialized from, or None for a cold start."""
+        return self._seeds
+
+    @property
+    def results(self) -> _Dict[str, _List[ComponentResult]]:
+        """The component results of each variant."""
+        return self._results
+
+    @property
+    def iteration_counts(self) -> _Dict[str, int]:
+        """The number of iterations of each variant, summed over its components."""
+        return {variant_id: sum(r.iteration_count for r in results) for variant_id, results in self._results.items()}
+
+    @property
+    def baseline_iteration_counts(self) -> _Optional[_Dict[str, int]]:
+        """
+        The number of iterations of each variant when started with the baseline voltage initialization mode,
+        or None if no baseline has been requested.
+        """
+        return self._baseline_iteration_counts
+
+    @property
+    def saved_iterations(self) -> _Optional[int]:
+        """
+        The total number of iterations saved compared to the baseline,
+        or None if no baseline has been requested.
+        """
+        if self._baseline_iteration_counts is None:
+            return None
+        return sum(self._baseline_iteration_counts.values()) - sum(self.iteration_counts.values())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(" \
+               f"order={self.order!r}" \
+               f", iteration_counts={self.iteration_counts!r}" \
+               f", saved_iterations={self.saved_iterations!r}" \
+               f")"
+
+
+def _injections_matrix(network: _Network, variant_ids: _List[str]) -> _np.ndarray:
+    """
+    One row for each variant, with loads and generators setpoints as columns.
+
+    Columns are standardised, so that setpoints of different units, such as powers in MW
+    and voltages in kV, weigh the same in distances between variants.
+    """
+    loads = network.get_loads(attributes=['p0', 'q0'], variants=variant_ids)
+    generators = network.get_generators(attributes=['target_p', 'target_v'], variants=variant_ids)
+    blocks = [df.unstack('id').reindex(variant_ids).to_numpy(dtype=_np.float64)
+              for df in (loads, generators) if not df.empty]
+    if not blocks:
+        return _np.zeros((len(variant_ids), 0))
+    injections = _np.nan_to_num(_np.hstack(blocks))
+    injections -= injections.mean(axis=0)
+    std = injections.std(axis=0)
+    # columns identical in all variants are left null
+    std[std == 0] = 1
+    injections /= std
+    return injections
+
+
+def _pairwise_distances(x: _np.ndarray) -> _np.ndarray:
+    """
+    Euclidean distances between all rows of the given matrix.
+
+    Computed from the Gram matrix, so that memory stays proportional to the square of the number of rows,
+    whatever the number of columns.
+    """
+    sq = (x ** 2).sum(axis=1)
+    d2 = sq[:, _np.newaxis] + sq[_np.newaxis, :] - 2 * (x @ x.T)
+    # rounding errors may give slightly negative squares
+    return _np.sqrt(_np.clip(d2, 0, None))
+
+
+def _seed_voltages(network: _Network, seed_variant_id: str, variant_id: str) -> bool:
+    """
+    Copies bus voltages of the seed variant to the given variant, which must be the working variant.
+    Returns False, leaving the variant unchanged, if some buses would not have a valid starting point.
+    """
+    buses = network.get_buses(attributes=[])
+    network.set_working_variant(seed_variant_id)
+    seed_voltages = network.get_buses(attributes=['v_mag', 'v_angle'])
+    network.set_working_variant(variant_id)
+    voltages = seed_voltages.reindex(buses.index)
+    if voltages.isna().to_numpy().any():
+        return False
+    network.update_buses(voltages)
+    return True
+
+
+def _next_warm_start_variant(distances: _np.ndarray, remaining: _List[int], converged: _List[int],
+                             last: _Optional[int]) -> _Tuple[int, _Optional[int]]:
+    """
+    Chooses the next variant to compute, and the converged variant to initialize it from, if any.
+    """
+    if converged:
+        to_converged = distances[_np.ix_(remaining, converged)]
+        row, col = _np.unravel_index(_np.argmin(to_converged), to_converged.shape)
+        return remaining[int(row)], converged[int(col)]
+    # start from the most central variant, or continue from the last computed one
+    reference = int(_np.argmin(distances.sum(axis=1))) if last is None else last
+    return remaining[int(_np.argmin(distances[remaining, reference]))], None
+
+
+def _run_baseline(network: _Network, variant_id: str, parameters: Parameters, provider: str,
+                  voltage_init_mode: VoltageInitMode) -> int:
+    """
+    Runs a loadflow on a temporary copy of the variant, with the given voltage initialization mode,
+    and returns its number of iterations.
+    """
+    existing_variant_ids = set(network.get_variant_ids())
+    baseline_variant_id = variant_id + '_baseline'
+    while baseline_variant_id in existing_variant_ids:
+        baseline_variant_id += '_'
+    network.clone_variant(variant_id, baseline_variant_id)
+    try:
+        network.set_working_variant(baseline_variant_id)
+        baseline_parameters = _parameters_from_c(parameters._to_c_parameters())  # pylint: disable=protected-access
+        baseline_parameters.voltage_init_mode = voltage_init_mode
+        return sum(r.iteration_count for r in run_ac(network, baseline_parameters, provider))
+    finally:
+        network.set_working_variant(variant_id)
+        network.remove_variant(baseline_variant_id)
+
+
+def run_ac_warm_start(network: _Network, variant_ids: _Sequence[str], parameters: Parameters = None,
+                      provider: str = '', baseline: VoltageInitMode = None) -> WarmStartResult:
+    """
+    Run AC loadflows on several variants of a network, starting each one from the voltages of a similar solved variant.
+
+    Variants are ordered by similarity of their injections (loads and generators setpoints, each one
+    standardised over the variants):
+    the first one is started with the voltage initialization mode of the parameters,
+    then the next variant is always the one closest to an already converged variant, and its voltages are
+    initialized from the voltages of this nearest converged neighbour, using ``PREVIOUS_VALUES`` mode.
+    When no variant has converged yet, or when buses of the two variants do not match, the variant is
+    started with the voltage initialization mode of the parameters.
+
+    When a baseline voltage initialization mode is given, typically ``UNIFORM_VALUES`` or ``DC_VALUES``,
+    each variant is also computed from this starting point on a temporary copy,
+    in order to report the number of iterations saved by warm starts.
+
+    The working variant of the network is left unchanged.
+
+    Args:
+        network:     a network
+        variant_ids: the ids of the variants to run the loadflow on
+        parameters:  the loadflow parameters, used for all variants
+        provider:    the loadflow implementation provider, default is the default loadflow provider
+        baseline:    the voltage initialization mode to compare iterations counts with, default is no comparison
+
+    Returns:
+        The component results of each variant, with the order of the computations and the seed of each variant.
+
+    Examples:
+
+        .. code-block:: python
+
+            res = pp.loadflow.run_ac_warm_start(network, scenarios, baseline=pp.loadflow.VoltageInitMode.DC_VALUES)
+            res.saved_iterations
+    """
+    variant_ids = list(variant_ids)
+    if len(set(variant_ids)) != len(variant_ids):
+        raise ValueError('Variant ids must be unique')
+    if parameters is None:
+        parameters = Parameters()
+    warm_parameters = _parameters_from_c(parameters._to_c_parameters())  # pylint: disable=protected-access
+    warm_parameters.voltage_init_mode = VoltageInitMode.PREVIOUS_VALUES
+
+    injections = _injections_matrix(network, variant_ids)
+    distances = _pairwise_distances(injections)
+
+    working_variant_id = network.get_working_variant_id()
+    seeds: _Dict[str, _Optional[str]] = {}
+    results: _Dict[str, _List[ComponentResult]] = {}
+    baseline_iteration_counts: _Optional[_Dict[str, int]] = None if baseline is None else {}
+    remaining = list(range(len(variant_ids)))
+    converged: _List[int] = []
+    last: _Optional[int] = None
+    try:
+        while remaining:
+            current, seed = _next_warm_start_variant(distances, remaining, converged, last)
+            remaining.remove(current)
+            variant_id = variant_ids[current]
+            if baseline_iteration_counts is not None:
+                baseline_iteration_counts[variant_id] = _run_baseline(network, variant_id, parameters, provider, baseline)
+
+            network.set_working_variant(variant_id)
+            seed_id = variant_ids[seed] if seed is not None else None
+            if seed_id is not None and not _seed_voltages(network, seed_id, variant_id):
+                seed_id = None
+            seeds[variant_id] = seed_id
+            results[variant_id] = run_ac(network, warm_parameters if seed_id is not None else parameters, provider)
+            if results[variant_id] and results[variant_id][0].status == ComponentStatus.CONVERGED:
+                converged.append(current)
+            last = current
+    finally:
+        network.set_working_variant(working_variant_id)
+    return WarmStartResult(list(results.keys()), seeds, results, baseline_iteration_counts)
+
+
 ValidationType.ALL = [ValidationType.BUSES, ValidationType.FLOWS, ValidationType.GENERATORS, ValidationType.SHUNTS,
                       ValidationType.SVCS, ValidationType.TWTS, ValidationType.TWTS3W]
 
@@ -7,10 +7,15 @@
 from __future__ import annotations  # Necessary for type alias like _DataFrame to work with sphinx
 
 from os import PathLike as _PathLike
+import os as _os
+import io as _io
 import sys as _sys
 import datetime as _datetime
 from datetime import timezone as _timezone
 import warnings
+import pickle as _pickle
+import itertools as _itertools
+from contextlib import contextmanager as _contextmanager
 from typing import (
     Sequence as _Sequence,
     List as _List,
@@ -18,9 +23,15 @@ from typing import (
     Dict as _Dict,
     Optional as _Optional,
     Union as _Union,
+    Any as _Any,
+    Tuple as _Tuple,
+    Iterator as _Iterator,
+    BinaryIO as _BinaryIO,
+    Callable as _Callable,
     TYPE_CHECKING as _TYPE_CHECKING
 )
 
+import numpy as _np
 from numpy import Inf
 from numpy.typing import ArrayLike as _ArrayLike
 from pandas import DataFrame as _DataFrame
@@ -36,12 +47,25 @@ from pypowsybl.utils.dataframes import (
     _create_c_dataframe,
     _create_properties_c_dataframe,
     _adapt_properties_kwargs,
-    _get_c_dataframes, _adapt_kwargs
+    _get_c_dataframes, _adapt_kwargs,
+    _create_filter_c_dataframe
+)
+from pypowsybl.utils.arrow import _create_arrow_table
+from pypowsybl.utils.cache import NetworkCache
+from pypowsybl.utils.lazy import LazyDataFrame
+from pypowsybl.utils.metadata import (
+    get_elements_metadata as _get_elements_metadata,
+    get_elements_creation_metadata as _get_elements_creation_metadata,
+    get_extensions_metadata as _get_extensions_metadata,
+    get_extensions_creation_metadata as _get_extensions_creation_metadata,
+    get_line_feeder_bays_metadata as _get_line_feeder_bays_metadata,
+    get_twt_feeder_bays_metadata as _get_twt_feeder_bays_metadata
 )
 from pypowsybl.report import Reporter as _Reporter
 
 # Type definitions
 if _TYPE_CHECKING:
+    from typing import SupportsIndex as _SupportsIndex
     ParamsDict = _Optional[_Dict[str, str]]
     PathOrStr = _Union[str, _PathLike]
 
@@ -54,6 +78,19 @@ def _series_metadata_repr(self: _pp.SeriesMetadata) -> str:
 _pp.SeriesMetadata.__repr__ = _series_metadata_repr  # type: ignore
 
 
+def _to_flags(values: _ArrayLike, count: int) -> _List[int]:
+    """
+    Converts a boolean, or an array of booleans, to a list of count integer flags.
+    """
+    flags = _np.broadcast_to(_np.asarray(values, dtype=bool), (count,))
+    return flags.astype(int).tolist()
+
+
+_VARIANT_POOLS_COUNTER = _itertools.count()
+
+_PICKLE_OPTIONS = {'compress': False}
+
+
 def _path_to_str(path: PathOrStr) -> str:
     if isinstance(path, str):
         return path
@@ -178,6 +215,148 @@ class BusBreakerTopology:
         return graph
 
 
+class VariantPool:
+    """
+    A fixed set of variants of a network, which are reused instead of being created and removed.
+
+    All variants of the pool are created on pool creation, as copies of a base variant.
+    A variant is reserved with :meth:`checkout`, and given back to the pool at the end of the ``with`` block.
+    When it is checked out again, it is reset to the state of the base variant,
+    but only if it has been modified, or if the base variant has been modified in the meantime:
+    unmodified variants are handed over as they are, without any copy.
+
+    Only variant dependent attributes (injections, switches positions, voltages...) are reset,
+    like for :meth:`Network.clone_variant`.
+
+    Modifications are detected through the notifications of the network. Some updates do not send any
+    notification, for example some updates of extensions attributes, or updates made by code working
+    directly on the network in the native library: a variant modified only by such updates is then handed over
+    again without being reset. Use ``always_reset`` when variants may be modified this way.
+
+    Instances are created by :meth:`Network.variant_pool`.
+    """
+
+    def __init__(self, network: Network, size: int, base_variant_id: str, prefix: str, always_reset: bool = False):
+        if size <= 0:
+            raise ValueError('Pool size must be strictly positive')
+        existing_variant_ids = set(network.get_variant_ids())
+        if base_variant_id not in existing_variant_ids:
+            raise ValueError(f'Variant {base_variant_id} does not exist')
+        self._network = network
+        self._base_variant_id = base_variant_id
+        self._variant_ids = [f'{prefix}_{i}' for i in range(size)]
+        for variant_id in self._variant_ids:
+            if variant_id in existing_variant_ids:
+                raise ValueError(f'Variant {variant_id} already exists')
+        # modifications counts of the base variant and of each variant, when it was last copied from the base variant
+        self._synchronized_counts: _Dict[str, _Tuple[int, int]] = {}
+        for variant_id in self._variant_ids:
+            network.clone_variant(base_variant_id, variant_id, False)
+            self._synchronized_counts[variant_id] = self._get_modification_counts(variant_id)
+        self._available = list(reversed(self._variant_ids))
+        self._always_reset = always_reset
+        # variants handed over at least once, which may have been modified without notification
+        self._used: _Set[str] = set()
+        self._reset_count = 0
+        self._closed = False
+
+    def _get_modification_counts(self, variant_id: str) -> _Tuple[int, int]:
+        return (_pp.get_variant_modification_count(self._network._handle, self._base_variant_id),  # pylint: disable=protected-access
+                _pp.get_variant_modification_count(self._network._handle, variant_id))  # pylint: disable=protected-access
+
+    @property
+    def base_variant_id(self) -> str:
+        """
+        The id of the variant the variants of the pool are copies of.
+        """
+        return self._base_variant_id
+
+    @property
+    def variant_ids(self) -> _List[str]:
+        """
+        The ids of the variants of the pool.
+        """
+        return list(self._variant_ids)
+
+    @property
+    def available(self) -> int:
+        """
+        The number of variants which are not checked out.
+        """
+        return len(self._available)
+
+    @property
+    def reset_count(self) -> int:
+        """
+        The number of times a variant of the pool had to be reset to the state of the base variant.
+        """
+        return self._reset_count
+
+    def _acquire(self) -> str:
+        if self._closed:
+            raise RuntimeError('Variant pool is closed')
+        if not self._available:
+            raise RuntimeError(f'All the {len(self._variant_ids)} variants of the pool are checked out')
+        variant_id = self._available.pop()
+        modified = self._get_modification_counts(variant_id) != self._synchronized_counts[variant_id]
+        if modified or (self._always_reset and variant_id in self._used):
+            self._network.clone_variant(self._base_variant_id, variant_id, True)
+            self._synchronized_counts[variant_id] = self._get_modification_counts(variant_id)
+            self._reset_count += 1
+        self._used.add(variant_id)
+        return variant_id
+
+    @_contextmanager
+    def checkout(self) -> _Iterator[str]:
+        """
+        Reserves a variant of the pool, in the state of the base variant, and makes it the working variant.
+
+        At the end of the ``with`` block, the variant is given back to the pool,
+        and the previous working variant is restored.
+
+        Examples:
+
+            .. code-block:: python
+
+                with network.variant_pool(4) as pool:
+                    for scenario in scenarios:
+                        with pool.checkout() as variant_id:
+                            network.update_loads(scenario)
+                            pp.loadflow.run_ac(network)
+        """
+        variant_id = self._acquire()
+        working_variant_id = self._network.get_working_variant_id()
+        try:
+            self._network.set_working_variant(variant_id)
+            yield variant_id
+        finally:
+            self._network.set_working_variant(working_variant_id)
+            self._available.append(variant_id)
+
+    def close(self) -> None:
+        """
+        Removes the variants of the pool from the network.
+        """
+        if self._closed:
+            return
+        if len(self._available) != len(self._variant_ids):
+            raise RuntimeError('Cannot close a variant pool while some of its variants are checked out')
+        for variant_id in self._variant_ids:
+            self._network.remove_variant(variant_id)
+        self._available.clear()
+        self._closed = True
+
+    def __enter__(self) -> VariantPool:
+        return self
+
+    def __exit__(self, *args: _Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'VariantPool(base_variant_id={self._base_variant_id!r}, size={len(self._variant_ids)}, ' \
+               f'available={self.available})'
+
+
 class Network:  # pylint: disable=too-many-public-methods
 
     def __init__(self, handle: _pp.JavaHandle):
@@ -188,6 +367,7 @@ class Network:  # pylint: disable=too-many-public-methods
         self._source_format = att.source_format
         self._forecast_distance = _datetime.timedelta(minutes=att.forecast_distance)
         self._case_date = _datetime.datetime.fromtimestamp(att.case_date, _timezone.utc)
+        self._string_dictionaries: _Dict[str, _pp.StringDictionary] = {}
 
     @property
     def id(self) -> str:
@@ -231,12 +411,53 @@ class Network:  # pylint: disable=too-many-public-methods
     def __repr__(self) -> str:
         return str(self)
 
-    def __getstate__(self) -> _Dict[str, str]:
-        return {'xml': self.dump_to_string()}
+    def __reduce_ex__(self, protocol: _SupportsIndex) -> _Tuple[_Any, ...]:
+        """
+        Networks are pickled in a compact binary form, which preserves all variants.
+        With pickle protocol 5, the binary content is provided as an out-of-band buffer,
+        so that it can be transferred without any copy, for example to shared memory.
+        See :func:`set_pickle_compression` to compress it.
+        """
+        data = _np.array(_pp.serialize_network(self._handle, _PICKLE_OPTIONS['compress']), copy=False).data
+        if protocol.__index__() >= 5 and hasattr(_pickle, 'PickleBuffer'):
+            return _restore_network, (_pickle.PickleBuffer(data),)
+        return _restore_network, (data.tobytes(),)
 
     def __setstate__(self, state: _Dict[str, str]) -> None:
+        # networks pickled by previous versions, as XIIDM strings
         xml = state['xml']
-        self._handle = _pp.load_network_from_string('tmp.xiidm', xml, {}, None)
+        self.__init__(_pp.load_network_from_string('tmp.xiidm', xml, {}, None))  # type: ignore
+
+    def __deepcopy__(self, memo: _Dict[int, _Any]) -> Network:
+        copy = self.copy()
+        memo[id(self)] = copy
+        return copy
+
+    def copy(self, variants: _Sequence[str] = None) -> Network:
+        """
+        Creates a copy of this network.
+
+        The copy is performed in the native library, by an in-memory serialization of the network
+        followed by its deserialization, without any file or python object in between.
+        ``copy.deepcopy`` also relies on this method.
+
+        Args:
+            variants: the ids of the variants to be copied, default is all variants.
+                      The initial variant is always copied.
+
+        Returns:
+            a copy of this network. Its working variant is the working variant of this network
+            if it has been copied, the initial variant otherwise.
+
+        Examples:
+
+            .. code-block:: python
+
+                copy = network.copy()
+                copy.update_loads(id='LOAD', p0=100)  # the original network is not modified
+        """
+        variant_ids = self.get_variant_ids() if variants is None else list(variants)
+        return Network(_pp.copy_network(self._handle, variant_ids))
 
     def open_switch(self, id: str) -> bool:
         return _pp.update_switch_position(self._handle, id, True)
@@ -250,6 +471,90 @@ class Network:  # pylint: disable=too-many-public-methods
     def disconnect(self, id: str) -> bool:
         return _pp.update_connectable_status(self._handle, id, False)
 
+    def set_switch_positions(self, ids: _Sequence[str], open: _ArrayLike) -> _np.ndarray:  # pylint: disable=redefined-builtin
+        """
+        Opens or closes several switches, in a single call to the native library.
+
+        All switches are checked to exist before any of them is modified.
+
+        Args:
+            ids: the switches ids
+            open: for each switch, ``True`` to open it, ``False`` to close it.
+                  A single boolean applies to all switches.
+
+        Returns:
+            a boolean array telling, for each switch, if its position has changed
+
+        Examples:
+
+            .. code-block:: python
+
+                changed = net.set_switch_positions(['S1', 'S2'], [True, False])
+        """
+        ids = list(ids)
+        flags = _to_flags(open, len(ids))
+        return _np.array(_pp.update_switches_positions(self._handle, ids, flags), dtype=bool)
+
+    def open_switches(self, ids: _Sequence[str]) -> _np.ndarray:
+        """
+        Opens several switches, in a single call to the native library.
+
+        Args:
+            ids: the switches ids
+
+        Returns:
+            a boolean array telling, for each switch, if it has been opened (``False`` if it was already open)
+        """
+        return self.set_switch_positions(ids, True)
+
+    def close_switches(self, ids: _Sequence[str]) -> _np.ndarray:
+        """
+        Closes several switches, in a single call to the native library.
+
+        Args:
+            ids: the switches ids
+
+        Returns:
+            a boolean array telling, for each switch, if it has been closed (``False`` if it was already closed)
+        """
+        return self.set_switch_positions(ids, False)
+
+    def connect_elements(self, ids: _Sequence[str], connected: _ArrayLike = True) -> _np.ndarray:
+        """
+        Connects or disconnects several connectables (branches or injections), in a single call to the native library.
+
+        All equipments are checked to exist, and to be connectables, before any of them is modified.
+
+        Args:
+            ids: the equipments ids
+            connected: for each equipment, ``True`` to connect it, ``False`` to disconnect it.
+                       A single boolean applies to all equipments. Default is to connect all of them.
+
+        Returns:
+            a boolean array telling, for each equipment, if its status has changed
+
+        Examples:
+
+            .. code-block:: python
+
+                changed = net.connect_elements(['L1', 'GEN'], [False, True])
+        """
+        ids = list(ids)
+        flags = _to_flags(connected, len(ids))
+        return _np.array(_pp.update_connectables_status(self._handle, ids, flags), dtype=bool)
+
+    def disconnect_elements(self, ids: _Sequence[str]) -> _np.ndarray:
+        """
+        Disconnects several connectables (branches or injections), in a single call to the native library.
+
+        Args:
+            ids: the equipments ids
+
+        Returns:
+            a boolean array telling, for each equipment, if its status has changed
+        """
+        return self.connect_elements(ids, False)
+
     def dump(self, file: PathOrStr, format: str = 'XIIDM', parameters: ParamsDict = None,
              reporter: _Reporter = None) -> None:
         """
@@ -296,6 +601,61 @@ class Network:  # pylint: disable=too-many-public-methods
         return _pp.dump_network_to_string(self._handle, format, parameters,
                                           None if reporter is None else reporter._reporter_model)  # pylint: disable=protected-access
 
+    def _dump_to_buffer(self, format: str, parameters: ParamsDict, reporter: _Optional[_Reporter]) -> memoryview:
+        if parameters is None:
+            parameters = {}
+        byte_array = _pp.dump_network_to_binary_buffer(self._handle, format, parameters,
+                                                       None if reporter is None else reporter._reporter_model)  # pylint: disable=protected-access
+        return _np.array(byte_array, copy=False).data
+
+    def dump_to_bytes(self, format: str = 'XIIDM', parameters: ParamsDict = None, reporter: _Reporter = None) -> bytes:
+        """
+        Save a network to bytes using a specified format.
+
+        Unlike :meth:`dump_to_string`, formats made of several files, like CGMES, are supported:
+        files are then zipped together, and the result may be loaded back with
+        :func:`load_from_bytes`, with a file name ending with ``.zip``.
+
+        Args:
+            format:     format to export, defaults to 'XIIDM'
+            parameters: a dictionary of export parameters
+            reporter:   the reporter to be used to create an execution report, default is None (no report)
+
+        Returns:
+            The content of the exported file, or the content of the zip of exported files
+
+        Examples:
+
+            .. code-block:: python
+
+                data = network.dump_to_bytes('CGMES')
+                network = pp.network.load_from_bytes('network.zip', data)
+        """
+        return self._dump_to_buffer(format, parameters, reporter).tobytes()
+
+    def dump_to_stream(self, stream: _BinaryIO, format: str = 'XIIDM', parameters: ParamsDict = None,
+                       reporter: _Reporter = None) -> None:
+        """
+        Save a network to a binary stream using a specified format.
+
+        Exported content is written directly from the memory of the native library, without any intermediate copy.
+        Formats made of several files are zipped, as for :meth:`dump_to_bytes`.
+
+        Args:
+            stream:     a binary file-like object, for example an opened file or a ``io.BytesIO``
+            format:     format to export, defaults to 'XIIDM'
+            parameters: a dictionary of export parameters
+            reporter:   the reporter to be used to create an execution report, default is None (no report)
+
+        Examples:
+
+            .. code-block:: python
+
+                with gzip.open('network.xiidm.gz', 'wb') as f:
+                    network.dump_to_stream(f)
+        """
+        stream.write(self._dump_to_buffer(format, parameters, reporter))
+
     def reduce(self, v_min: float = 0, v_max: float = _sys.float_info.max, ids: _List[str] = None,
                vl_depths: tuple = (), with_dangling_lines: bool = False) -> None:
         if ids is None:
@@ -375,6 +735,9 @@ class Network:  # pylint: disable=too-many-public-methods
                                             not_connected_to_same_bus_at_both_sides)
 
     def get_elements(self, element_type: ElementType, all_attributes: bool = False, attributes: _List[str] = None,
+                     categorical: _Union[bool, _List[str]] = False,
+                     filter: _Dict[str, _Any] = None,  # pylint: disable=redefined-builtin
+                     variants: _Sequence[str] = None,
                      **kwargs: _ArrayLike) -> _DataFrame:
         """
         Get network elements as a :class:`~pandas.DataFrame` for a specified element type.
@@ -383,6 +746,16 @@ class Network:  # pylint: disable=too-many-public-methods
             element_type: the element type
             all_attributes: flag for including all attributes in the dataframe, default is false
             attributes: attributes to include in the dataframe. The 2 optional parameters are mutually exclusive. If no optional parameter is specified, the dataframe will include the default attributes.
+            categorical: string columns to be returned as :class:`pandas.Categorical`, or ``True`` for all string
+                         columns except the index. Values are dictionary encoded in the native library,
+                         so that only distinct values are converted to python strings.
+            filter: conditions on attribute values that elements must all satisfy to be part of the dataframe,
+                    evaluated in the native library. Keys are attribute names, values may be a single value
+                    (equality), a tuple ``(operator, value)`` where operator is one of
+                    ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, or a list of accepted values.
+            variants: ids of variants to get the elements of. When specified, dataframes of all variants
+                      are computed in a single native call and stacked, with an additional first index level
+                      ``variant_id``. Default is to get the elements of the working variant only.
             kwargs: the data to be selected, as named arguments.
 
         Keyword Args:
@@ -390,7 +763,165 @@ class Network:  # pylint: disable=too-many-public-methods
 
         Returns:
             a network elements dataframe for the specified element type
+
+        Notes:
+            Each categorical column has its own dictionary, kept by the network and shared by the columns
+            with the same name of all dataframes: a given string always has the same code in a column,
+            and the categories of a column of a previously obtained dataframe are always a prefix
+            of the categories of the same column of a new one. This makes joins and comparisons
+            between categorical columns cheap. Null strings are missing values.
+
+        Examples:
+
+            .. code-block:: python
+
+                net.get_elements(pp.network.ElementType.SWITCH, filter={'open': True})
+                net.get_elements(pp.network.ElementType.VOLTAGE_LEVEL,
+                                 filter={'nominal_v': ('>=', 225), 'substation_id': ['S1', 'S2']})
+
+            Values of several variants, as a dataframe with one column per variant:
+
+            .. code-block:: python
+
+                buses = net.get_elements(pp.network.ElementType.BUS, attributes=['v_mag'], variants=['v1', 'v2'])
+                v_mag = buses['v_mag'].unstack('variant_id')
+        """
+        series_array = self._create_elements_series_array(element_type, all_attributes, attributes, filter,
+                                                          variants, **kwargs)
+        if categorical:
+            result = _create_data_frame_from_series_array(series_array, self._string_dictionaries, categorical)
+        else:
+            result = _create_data_frame_from_series_array(series_array)
+        if attributes:
+            result = result[attributes]
+        return result
+
+    def get_elements_many(self, element_types: _Union[_Sequence[ElementType], _Dict[ElementType, _Optional[_List[str]]]],
+                          all_attributes: bool = False) -> _Dict[ElementType, _DataFrame]:
+        """
+        Get network elements of several element types, as a dictionary of :class:`~pandas.DataFrame`.
+
+        All dataframes are created in a single call to the native library, which is much faster than
+        calling :meth:`get_elements` once per element type when many types are requested.
+
+        Args:
+            element_types: the element types, or a dictionary associating to each element type the attributes
+                           to include in its dataframe. When attributes are ``None`` for an element type,
+                           all or default attributes are included, depending on ``all_attributes``.
+            all_attributes: flag for including all attributes in the dataframes for which no attributes
+                            have been selected, default is false
+
+        Returns:
+            a dictionary of network elements dataframes, indexed by element type
+
+        Examples:
+
+            .. code-block:: python
+
+                dfs = net.get_elements_many({pp.network.ElementType.BUS: ['v_mag', 'v_angle'],
+                                             pp.network.ElementType.LINE: None})
+                buses = dfs[pp.network.ElementType.BUS]
+        """
+        if not isinstance(element_types, dict):
+            element_types = {element_type: None for element_type in element_types}
+        default_filter = _pp.FilterAttributesType.ALL_ATTRIBUTES if all_attributes \
+            else _pp.FilterAttributesType.DEFAULT_ATTRIBUTES
+        types = list(element_types.keys())
+        filters = [default_filter if element_types[t] is None else _pp.FilterAttributesType.SELECTION_ATTRIBUTES
+                   for t in types]
+        attributes = [element_types[t] or [] for t in types]
+        series_arrays = _pp.create_network_elements_series_arrays(self._handle, types, filters, attributes)
+        result = {}
+        for element_type, type_attributes, series_array in zip(types, attributes, series_arrays):
+            df = _create_data_frame_from_series_array(series_array)
+            result[element_type] = df[type_attributes] if type_attributes else df
+        return result
+
+    def get_elements_arrow(self, element_type: ElementType, all_attributes: bool = False,
+                           attributes: _List[str] = None,
+                           filter: _Dict[str, _Any] = None,  # pylint: disable=redefined-builtin
+                           **kwargs: _ArrayLike) -> _Any:
+        """
+        Get network elements as a :class:`pyarrow.Table` for a specified element type.
+
+        Series are exported from the native library through the Apache Arrow C data interface:
+        numerical columns are transferred as contiguous buffers, and string columns
+        are not converted to python objects.
+        Index columns come first in the table, and are restored as the dataframe index
+        by :func:`pypowsybl.utils.arrow.to_pandas`.
+
+        This method requires the optional dependency pyarrow (>= 14.0).
+
+        Args:
+            element_type: the element type
+            all_attributes: flag for including all attributes in the table, default is false
+            attributes: attributes to include in the table. The 2 optional parameters are mutually exclusive. If no optional parameter is specified, the table will include the default attributes.
+            filter: conditions on attribute values that elements must satisfy, see :meth:`get_elements`.
+            kwargs: the data to be selected, as named arguments.
+
+        Returns:
+            a network elements arrow table for the specified element type
+
+        Examples:
+
+            .. code-block:: python
+
+                from pypowsybl.utils.arrow import to_pandas, to_polars
+
+                table = net.get_elements_arrow(pp.network.ElementType.GENERATOR, attributes=['target_p'])
+                df = to_pandas(table)
+                pl_df = to_polars(table)
+        """
+        series_array = self._create_elements_series_array(element_type, all_attributes, attributes, filter, **kwargs)
+        return _create_arrow_table(series_array, attributes)
+
+    def get_elements_lazy(self, element_type: ElementType,
+                          filter: _Dict[str, _Any] = None,  # pylint: disable=redefined-builtin
+                          **kwargs: _ArrayLike) -> LazyDataFrame:
         """
+        Get network elements as a :class:`~pypowsybl.utils.lazy.LazyDataFrame` for a specified element type.
+
+        Contrary to :meth:`get_elements`, no column is computed by this method: the index is fetched on first access,
+        then each column is fetched from the native library the first time it is accessed.
+        Fetched columns are cached until the network is modified, or its working variant is changed.
+        This is much faster than getting all attributes when only a few columns are actually used,
+        in particular for attributes which are costly to compute, like currents.
+
+        Args:
+            element_type: the element type
+            filter: conditions on attribute values that elements must satisfy, see :meth:`get_elements`.
+            kwargs: the data to be selected, as named arguments.
+
+        Returns:
+            a lazy network elements dataframe for the specified element type
+
+        Examples:
+
+            .. code-block:: python
+
+                lines = net.get_elements_lazy(pp.network.ElementType.LINE)
+                lines['i1']  # only computes the i1 column
+                lines[['p1', 'q1']].sum()
+        """
+        metadata = _get_elements_metadata(element_type)
+        columns = [m.name for m in metadata if not m.is_index]
+
+        def fetch(attributes: _List[str]) -> _DataFrame:
+            return self.get_elements(element_type, attributes=attributes, filter=filter, **kwargs)
+
+        return LazyDataFrame(fetch, columns, self._get_modification_state)
+
+    def _get_modification_state(self) -> _Tuple[str, int]:
+        """
+        Changes each time the network elements are modified, or the working variant is changed.
+        """
+        return _pp.get_working_variant_id(self._handle), _pp.get_network_modification_count(self._handle)
+
+    def _create_elements_series_array(self, element_type: ElementType, all_attributes: bool = False,
+                                      attributes: _List[str] = None,
+                                      filter: _Dict[str, _Any] = None,  # pylint: disable=redefined-builtin
+                                      variants: _Sequence[str] = None,
+                                      **kwargs: _ArrayLike) -> _pp.SeriesArray:
         filter_attributes = _pp.FilterAttributesType.DEFAULT_ATTRIBUTES
         if all_attributes:
             filter_attributes = _pp.FilterAttributesType.ALL_ATTRIBUTES
@@ -402,19 +933,22 @@ class Network:  # pylint: disable=too-many-public-methods
             raise RuntimeError('parameters "all_attributes" and "attributes" are mutually exclusive')
 
         if kwargs:
-            metadata = _pp.get_network_elements_dataframe_metadata(element_type)
+            metadata = _get_elements_metadata(element_type)
             df = _adapt_df_or_kwargs(metadata, None, **kwargs)
             elements_array = _create_c_dataframe(df, metadata)
 
         else:
             elements_array = None
 
-        series_array = _pp.create_network_elements_series_array(self._handle, element_type, filter_attributes,
-                                                                attributes, elements_array)
-        result = _create_data_frame_from_series_array(series_array)
-        if attributes:
-            result = result[attributes]
-        return result
+        filter_array = _create_filter_c_dataframe(filter) if filter else None
+        if variants is not None:
+            if not variants:
+                raise ValueError('At least one variant is expected')
+            return _pp.create_network_elements_variants_series_array(self._handle, element_type, filter_attributes,
+                                                                     attributes, elements_array, filter_array,
+                                                                     list(variants))
+        return _pp.create_network_elements_series_array(self._handle, element_type, filter_attributes,
+                                                        attributes, elements_array, filter_array)
 
     def get_buses(self, all_attributes: bool = False, attributes: _List[str] = None,
                   **kwargs: _ArrayLike) -> _DataFrame:
@@ -2159,7 +2693,7 @@ class Network:  # pylint: disable=too-many-public-methods
                     Arguments can be single values or any type of sequence.
                     In the case of sequences, all arguments must have the same length.
         """
-        metadata = _pp.get_network_elements_dataframe_metadata(element_type)
+        metadata = _get_elements_metadata(element_type)
         df = _adapt_df_or_kwargs(metadata, df, **kwargs)
         c_df = _create_c_dataframe(df, metadata)
         _pp.update_network_elements_with_series(self._handle, c_df, element_type)
@@ -2892,7 +3426,7 @@ class Network:  # pylint: disable=too-many-public-methods
         Notes:
             The id column in the dataframe provides the link to the extensions parent elements
         """
-        metadata = _pp.get_network_extensions_dataframe_metadata(extension_name)
+        metadata = _get_extensions_metadata(extension_name)
         df = _adapt_df_or_kwargs(metadata, df, **kwargs)
         c_df = _create_c_dataframe(df, metadata)
         _pp.update_extensions(self._handle, extension_name, c_df)
@@ -2961,6 +3495,40 @@ class Network:  # pylint: disable=too-many-public-methods
         """
         return _pp.get_variant_ids(self._handle)
 
+    def variant_pool(self, size: int, base_variant_id: str = None, prefix: str = None,
+                     always_reset: bool = False) -> VariantPool:
+        """
+        Creates a pool of variants, which are reused instead of being created and removed.
+
+        This is much cheaper than cloning and removing variants, when a large number of
+        short-lived variants are needed, for example for Monte Carlo simulations.
+        See :class:`VariantPool`.
+
+        Args:
+            size: the number of variants of the pool
+            base_variant_id: the variant the variants of the pool are copies of, default is the working variant
+            prefix: the prefix of the ids of the variants of the pool, default is a unique prefix
+            always_reset: reset variants on each checkout after their first one, even if no modification
+                          has been notified, see :class:`VariantPool`
+
+        Returns:
+            a pool of variants, which removes its variants from the network when closed
+
+        Examples:
+
+            .. code-block:: python
+
+                with network.variant_pool(4) as pool:
+                    with pool.checkout() as variant_id:
+                        network.update_loads(id='LOAD', p0=100)
+                        pp.loadflow.run_ac(network)
+        """
+        if base_variant_id is None:
+            base_variant_id = self.get_working_variant_id()
+        if prefix is None:
+            prefix = f'pool{next(_VARIANT_POOLS_COUNTER)}'
+        return VariantPool(self, size, base_variant_id, prefix, always_reset)
+
     def get_current_limits(self, all_attributes: bool = False, attributes: _List[str] = None) -> _DataFrame:
         """
         Get the list of all current limits on the network paired with their branch id.
@@ -3058,12 +3626,12 @@ class Network:  # pylint: disable=too-many-public-methods
 
     def _create_elements(self, element_type: ElementType, dfs: _List[_Optional[_DataFrame]],
                          **kwargs: _ArrayLike) -> None:
-        metadata = _pp.get_network_elements_creation_dataframes_metadata(element_type)
+        metadata = _get_elements_creation_metadata(element_type)
         c_dfs = _get_c_dataframes(dfs, metadata, **kwargs)
         _pp.create_element(self._handle, c_dfs, element_type)
 
     def _create_extensions(self, extension_name: str, dfs: _List[_Optional[_DataFrame]], **kwargs: _ArrayLike) -> None:
-        metadata = _pp.get_network_extensions_creation_dataframes_metadata(extension_name)
+        metadata = _get_extensions_creation_metadata(extension_name)
         c_dfs = _get_c_dataframes(dfs, metadata, **kwargs)
         _pp.create_extensions(self._handle, c_dfs, extension_name)
 
@@ -4091,7 +4659,7 @@ class Network:  # pylint: disable=too-many-public-methods
 
                 network.remove_aliases(id='element_id', alias='alias_id')
         """
-        metadata = _pp.get_network_elements_creation_dataframes_metadata(ElementType.ALIAS)[0]
+        metadata = _get_elements_creation_metadata(ElementType.ALIAS)[0]
         df = _adapt_df_or_kwargs(metadata, df, **kwargs)
         c_df = _create_c_dataframe(df, metadata)
         _pp.remove_aliases(self._handle, c_df)
@@ -4233,6 +4801,28 @@ def _create_network(name: str, network_id: str = '') -> Network:
     return Network(_pp.create_network(name, network_id))
 
 
+def _restore_network(buffer: _Any) -> Network:
+    """
+    Creates a network from its pickled binary content.
+    """
+    return Network(_pp.deserialize_network(buffer))
+
+
+def set_pickle_compression(compress: bool) -> None:
+    """
+    Enables or disables the compression of networks when they are pickled.
+
+    Compression reduces the size of pickled networks, at the cost of some computation time:
+    it is worth when networks are sent over a network or stored on disk,
+    but not when they are shared with other processes of the same machine.
+    Networks are not compressed by default.
+
+    Args:
+        compress: True to compress pickled networks
+    """
+    _PICKLE_OPTIONS['compress'] = compress
+
+
 def create_empty(id: str = "Default") -> Network:
     """
     Create an empty network.
@@ -4421,16 +5011,72 @@ def get_export_parameters(fmt: str) -> _DataFrame:
     return _create_data_frame_from_series_array(series_array)
 
 
-def load(file: _Union[str, _PathLike], parameters: _Dict[str, str] = None, reporter: _Reporter = None) -> Network:
+#: CGMES profiles which may be skipped when loading a network
+SKIPPABLE_CGMES_PROFILES = ['TP', 'SSH', 'SV', 'DL', 'GL', 'DY']
+
+#: A callback notified of the progress of an import, with the name of the last parsed file,
+#: the count of parsed files, and the total count of files to be parsed
+ImportProgressCallback = _Callable[[str, int, int], None]
+
+
+class _ImportProgress:
+    """
+    Progress callback given to the native library for a single import.
+    Errors of the callback cannot be raised through the native library, they are raised after the import instead.
+    """
+
+    def __init__(self, callback: ImportProgressCallback):
+        self._callback = callback
+        self.error: _Optional[BaseException] = None
+
+    def __call__(self, file_name: str, parsed_count: int, total_count: int) -> None:
+        if self.error is not None:
+            return
+        try:
+            self._callback(file_name, parsed_count, total_count)
+        except Exception as err:  # pylint: disable=broad-except
+            self.error = err
+
+    def check(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+
+def _check_skipped_profiles(profiles: _Optional[_List[str]]) -> _List[str]:
+    if profiles is None:
+        return []
+    profiles = sorted(set(p.upper() for p in profiles))
+    for profile in profiles:
+        if profile not in SKIPPABLE_CGMES_PROFILES:
+            raise ValueError(f'CGMES profile {profile} cannot be skipped, skippable profiles are {SKIPPABLE_CGMES_PROFILES}')
+    return profiles
+
+
+def load(file: _Union[str, _PathLike], parameters: _Dict[str, str] = None, reporter: _Reporter = None,
+         cache: NetworkCache = None, progress: ImportProgressCallback = None, skip_profiles: _List[str] = None,
+         parallelism: int = None) -> Network:
     """
     Load a network from a file. File should be in a supported format.
 
     Basic compression formats are also supported (gzip, bzip2).
 
+    The files of CGMES profiles are parsed in parallel. Each parsed file is logged by the ``powsybl`` logger,
+    and notified to the ``progress`` callback if any.
+
     Args:
-       file:       path to the network file
-       parameters: a dictionary of import parameters
-       reporter:   the reporter to be used to create an execution report, default is None (no report)
+       file:          path to the network file
+       parameters:    a dictionary of import parameters
+       reporter:      the reporter to be used to create an execution report, default is None (no report)
+       cache:         a cache of parsed networks: the network is read from the cache if the same file
+                      has already been loaded with the same parameters, otherwise it is parsed and added to the cache.
+                      The cache is not used when a reporter is given, since reports are only produced by parsing.
+       progress:      a callback notified each time a CGMES file has been parsed, with the name of the file,
+                      the count of parsed files, and the total count of files to be parsed.
+                      It is called from the thread calling this function.
+       skip_profiles: CGMES profiles, among :data:`SKIPPABLE_CGMES_PROFILES`, the files of which are not parsed,
+                      for example ``['DL', 'GL']`` when diagram layouts and geographical locations are not needed
+       parallelism:   the maximum number of CGMES files parsed in parallel, default is the number of processors.
+                      Use 1 to parse files sequentially.
 
     Returns:
         The loaded network
@@ -4446,12 +5092,51 @@ def load(file: _Union[str, _PathLike], parameters: _Dict[str, str] = None, repor
             network = pp.network.load('network.xiidm.gz')
             network = pp.network.load('network.uct')
             ...
+
+        Loading of large files may be made much faster by a cache, after the first time:
+
+        .. code-block:: python
+
+            cache = pp.network.NetworkCache('/path/to/cache')
+            network = pp.network.load('network.zip', cache=cache)
+
+        Progress of the parsing of large CGMES files may be displayed, and unneeded profiles skipped:
+
+        .. code-block:: python
+
+            network = pp.network.load('CGMES.zip', skip_profiles=['DL', 'GL'],
+                                      progress=lambda file, count, total: print(f'{count}/{total} {file}'))
     """
     file = _path_to_str(file)
     if parameters is None:
         parameters = {}
-    return Network(_pp.load_network(file, parameters,
-                                    None if reporter is None else reporter._reporter_model))  # pylint: disable=protected-access
+    skipped_profiles = _check_skipped_profiles(skip_profiles)
+    if parallelism is None:
+        parallelism = 0
+    elif parallelism < 1:
+        raise ValueError('Parallelism must be strictly positive')
+    import_progress = None if progress is None else _ImportProgress(progress)
+    if cache is None or reporter is not None:
+        network = Network(_pp.load_network(file, parameters, parallelism, skipped_profiles,
+                                           None if reporter is None else reporter._reporter_model,  # pylint: disable=protected-access
+                                           import_progress))
+        if import_progress is not None:
+            import_progress.check()
+        return network
+    # skipped profiles change the content of the network
+    key = cache.key(file, {**parameters, 'skipped-profiles': ','.join(skipped_profiles)} if skipped_profiles else parameters)
+    data = cache.get(key)
+    if data is not None:
+        try:
+            return Network(_pp.deserialize_network(data))
+        except _pp.PyPowsyblError:
+            # unreadable entry, parsed again below
+            cache.remove(key)
+    network = Network(_pp.load_network(file, parameters, parallelism, skipped_profiles, None, import_progress))
+    if import_progress is not None:
+        import_progress.check()
+    cache.put(key, _np.array(_pp.serialize_network(network._handle, cache.compress), copy=False).data)  # pylint: disable=protected-access
+    return network
 
 
 def load_from_string(file_name: str, file_content: str, parameters: _Dict[str, str] = None,
@@ -4473,6 +5158,75 @@ def load_from_string(file_name: str, file_content: str, parameters: _Dict[str, s
                                                 None if reporter is None else reporter._reporter_model))  # pylint: disable=protected-access
 
 
+def load_from_bytes(file_name: str, data: _Union[bytes, bytearray, memoryview], parameters: _Dict[str, str] = None,
+                    reporter: _Reporter = None) -> Network:
+    """
+    Load a network from bytes, for example received from a message bus.
+
+    Data is passed to the native library without any decoding or copy.
+    Contrary to :func:`load_from_string`, compressed data (gzip, bzip2), and zip archives
+    holding several files, like CGMES files, are supported.
+
+    Args:
+       file_name:  file name, used to detect the format and compression of the data
+       data:       the content of the file, as bytes or any object supporting the buffer protocol
+       parameters: a dictionary of import parameters
+       reporter:   the reporter to be used to create an execution report, default is None (no report)
+
+    Returns:
+        The loaded network
+
+    Examples:
+
+        .. code-block:: python
+
+            network = pp.network.load_from_bytes('network.xiidm.gz', message.payload)
+            network = pp.network.load_from_bytes('CGMES_model.zip', message.payload)
+    """
+    if parameters is None:
+        parameters = {}
+    return Network(_pp.load_network_from_binary_buffer(file_name, data, parameters,
+                                                       None if reporter is None else reporter._reporter_model))  # pylint: disable=protected-access
+
+
+def load_from_stream(stream: _BinaryIO, file_name: str = None, parameters: _Dict[str, str] = None,
+                     reporter: _Reporter = None) -> Network:
+    """
+    Load a network from a binary stream, without any temporary file.
+
+    The content of a ``io.BytesIO`` is passed to the native library without any copy.
+
+    Args:
+       stream:     a binary file-like object, read to its end
+       file_name:  file name, used to detect the format and compression of the data.
+                   Default is the name of the stream, when it has one, like opened files.
+       parameters: a dictionary of import parameters
+       reporter:   the reporter to be used to create an execution report, default is None (no report)
+
+    Returns:
+        The loaded network
+
+    Examples:
+
+        .. code-block:: python
+
+            with open('network.xiidm', 'rb') as f:
+                network = pp.network.load_from_stream(f)
+            network = pp.network.load_from_stream(io.BytesIO(payload), 'network.uct')
+    """
+    if file_name is None:
+        name = getattr(stream, 'name', None)
+        if not isinstance(name, str):
+            raise ValueError('A file name is needed to detect the format of the stream')
+        file_name = _os.path.basename(name)
+    if isinstance(stream, _io.BytesIO):
+        with stream.getbuffer() as buffer:
+            network = load_from_bytes(file_name, buffer[stream.tell():], parameters, reporter)
+        stream.seek(0, _io.SEEK_END)
+        return network
+    return load_from_bytes(file_name, stream.read(), parameters, reporter)
+
+
 def get_extensions_names() -> _List[str]:
     """
     Get the list of available extensions.
@@ -4878,7 +5632,7 @@ def _create_feeder_bay(network: Network, dfs: _List[_Optional[_DataFrame]], elem
         section with an open disconnector.
 
     """
-    metadata = _pp.get_network_elements_creation_dataframes_metadata(element_type)
+    metadata = _get_elements_creation_metadata(element_type)
     c_dfs = _get_c_dataframes_and_add_voltage_level_id(network, dfs, metadata, **kwargs)
     _pp.create_feeder_bay(network._handle, raise_exception, None if reporter is None else reporter._reporter_model,
                           c_dfs, element_type)
@@ -4942,7 +5696,7 @@ def create_line_bays(network: Network, df: _DataFrame = None, **kwargs: _ArrayLi
     See Also:
         :meth:`Network.create_lines`
     """
-    metadata = _pp.get_line_feeder_bays_metadata()
+    metadata = _get_line_feeder_bays_metadata()
     df = _adapt_df_or_kwargs(metadata, df, **kwargs)
     c_df = _create_c_dataframe(df, metadata)
     _pp.create_branch_feeder_bays_line(network._handle, c_df)
@@ -4990,7 +5744,7 @@ def create_2_windings_transformer_bays(network: Network, df: _DataFrame = None,
     See Also:
         :meth:`Network.create_2_windings_transformers`
     """
-    metadata = _pp.get_twt_feeder_bays_metadata()
+    metadata = _get_twt_feeder_bays_metadata()
     df = _adapt_df_or_kwargs(metadata, df, **kwargs)
     c_df = _create_c_dataframe(df, metadata)
     _pp.create_branch_feeder_bays_twt(network._handle, c_df)
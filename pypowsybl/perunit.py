@@ -12,10 +12,11 @@ from pypowsybl import _pypowsybl
 import pypowsybl.network as _net
 from pypowsybl.network import ElementType
 from pypowsybl.utils.dataframes import _adapt_df_or_kwargs
+from pypowsybl.utils.metadata import get_elements_metadata
 
 
 def _adapt_to_dataframe(element_type: ElementType, df: _pd.DataFrame = None, **kwargs: _ArrayLike) -> _pd.DataFrame:
-    metadata = _pypowsybl.get_network_elements_dataframe_metadata(element_type)
+    metadata = get_elements_metadata(element_type)
     return _adapt_df_or_kwargs(metadata, df, **kwargs)
 
 
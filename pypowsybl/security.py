@@ -4,7 +4,23 @@
 # iicense, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 #
-from typing import Union as _Union, Dict as _Dict, List as _List
+from __future__ import annotations
+
+import math as _math
+import multiprocessing as _multiprocessing
+import threading as _threading
+from concurrent.futures import ProcessPoolExecutor as _ProcessPoolExecutor
+from typing import (
+    Union as _Union,
+    Dict as _Dict,
+    List as _List,
+    Tuple as _Tuple,
+    Optional as _Optional,
+    Callable as _Callable,
+    Iterator as _Iterator,
+    Any as _Any
+)
+import numpy as _np
 import pandas as _pd
 import pypowsybl.loadflow
 from prettytable import PrettyTable as _PrettyTable
@@ -12,8 +28,10 @@ from pypowsybl import _pypowsybl
 from pypowsybl._pypowsybl import ContingencyResult, LimitViolation, ContingencyContextType
 from pypowsybl.network import Network as _Network
 from pypowsybl.util import (
+    CancelToken as _CancelToken,
     ContingencyContainer as _ContingencyContainer,
-    create_data_frame_from_series_array as _create_data_frame_from_series_array
+    create_data_frame_from_series_array as _create_data_frame_from_series_array,
+    _run_cancellable
 )
 from pypowsybl.report import Reporter as _Reporter
 
@@ -155,69 +173,111 @@ class Parameters:  # pylint: disable=too-few-public-methods
 class SecurityAnalysisResult:
     """
     The result of a security analysis.
+
+    The result is kept on the native side: its dataframes and results objects are only built
+    on their first access, and then cached.
     """
 
-    def __init__(self, handle: _pypowsybl.JavaHandle):
+    def __init__(self, handle: _pypowsybl.JavaHandle, interrupted: bool = False):
         self._handle = handle
-        results = _pypowsybl.get_security_analysis_result(self._handle)
-        self._post_contingency_results = {}
-        for result in results:
-            if result.contingency_id:
-                self._post_contingency_results[result.contingency_id] = result
-            else:
-                self._pre_contingency_result = result
-        self._limit_violations = _create_data_frame_from_series_array(_pypowsybl.get_limit_violations(self._handle))
+        self._interrupted = interrupted
+        self._pre_contingency_result: _Optional[ContingencyResult] = None
+        self._post_contingency_results: _Optional[_Dict[str, ContingencyResult]] = None
+        self._contingency_status: _Optional[_pd.DataFrame] = None
+        self._limit_violations: _Optional[_pd.DataFrame] = None
+
+    @property
+    def interrupted(self) -> bool:
+        """
+        True if the security analysis was cancelled before its end: the result then holds the results
+        of the simulated contingencies only.
+        """
+        return self._interrupted
 
     @property
     def pre_contingency_result(self) -> ContingencyResult:
         """
         Result for the pre-contingency state.
         """
+        if self._pre_contingency_result is None:
+            self._pre_contingency_result = list(_pypowsybl.get_security_analysis_contingency_results(self._handle, ['']))[0]
         return self._pre_contingency_result
 
     @property
     def post_contingency_results(self) -> _Dict[str, ContingencyResult]:
         """
         Results for the contingencies, as a dictionary contingency ID -> result.
+
+        All results objects are created on the first access: :attr:`contingency_status` and
+        :attr:`limit_violations` are much cheaper for a large number of contingencies.
         """
+        if self._post_contingency_results is None:
+            results = {}
+            for result in _pypowsybl.get_security_analysis_result(self._handle):
+                if result.contingency_id:
+                    results[result.contingency_id] = result
+                elif self._pre_contingency_result is None:
+                    self._pre_contingency_result = result
+            self._post_contingency_results = results
         return self._post_contingency_results
 
     def find_post_contingency_result(self, contingency_id: str) -> ContingencyResult:
         """
-        Result for the specified contingency.
+        Result for the specified contingency, created on demand.
 
         Returns:
             Result for the specified contingency.
         """
-        result = self._post_contingency_results[contingency_id]
-        if not result:
+        if self._post_contingency_results is not None:
+            return self._post_contingency_results[contingency_id]
+        if contingency_id not in self.contingency_status.index:
             raise KeyError(f'Contingency {contingency_id} not found')
-        return result
+        return list(_pypowsybl.get_security_analysis_contingency_results(self._handle, [contingency_id]))[0]
 
     def get_table(self) -> _PrettyTable:
         table = _PrettyTable()
         table.field_names = ["Contingency ID", "Status", "Equipment ID", "Equipment name", "Limit type", "Limit",
                              "Limit name", "Acceptable duration", "Limit reduction", "Value", "Side"]
-        for contingency_id, post_contingency_result in self._post_contingency_results.items():
-            table.add_row([contingency_id, post_contingency_result.status.name, '', '', '', '', '', '', '', '', ''])
-            for limit_violation in post_contingency_result.limit_violations:
+        violations = self.limit_violations
+        violations_by_contingency = {contingency_id: group for contingency_id, group
+                                     in violations.groupby(level='contingency_id', sort=False)}
+        for contingency_id, status in self.contingency_status['status'].items():
+            table.add_row([contingency_id, status, '', '', '', '', '', '', '', '', ''])
+            if contingency_id not in violations_by_contingency:
+                continue
+            for (_, subject_id), violation in violations_by_contingency[contingency_id].iterrows():
                 table.add_row(['', '',
-                               limit_violation.subject_id,
-                               limit_violation.subject_name,
-                               limit_violation.limit_type.name,
-                               f'{limit_violation.limit:.1f}',
-                               limit_violation.limit_name,
-                               limit_violation.acceptable_duration,
-                               limit_violation.limit_reduction,
-                               f'{limit_violation.value:.1f}',
-                               limit_violation.side.name])
+                               subject_id,
+                               violation['subject_name'],
+                               violation['limit_type'],
+                               f'{violation["limit"]:.1f}',
+                               violation['limit_name'],
+                               violation['acceptable_duration'],
+                               violation['limit_reduction'],
+                               f'{violation["value"]:.1f}',
+                               violation['side'] or 'NONE'])
         return table
 
+    @property
+    def contingency_status(self) -> _pd.DataFrame:
+        """
+        Status of the computation of each contingency, and number of its limit violations,
+        in a dataframe indexed by contingency ID.
+        """
+        if self._contingency_status is None:
+            self._contingency_status = _create_data_frame_from_series_array(
+                _pypowsybl.get_contingency_status(self._handle))
+        return self._contingency_status
+
     @property
     def limit_violations(self) -> _pd.DataFrame:
         """
-        All limit violations in a dataframe representation.
+        All limit violations in a dataframe representation, indexed by contingency ID and subject ID,
+        the contingency ID of pre-contingency violations being empty.
         """
+        if self._limit_violations is None:
+            self._limit_violations = _create_data_frame_from_series_array(
+                _pypowsybl.get_limit_violations(self._handle))
         return self._limit_violations
 
     @property
@@ -242,6 +302,103 @@ class SecurityAnalysisResult:
         return _create_data_frame_from_series_array(_pypowsybl.get_three_windings_transformer_results(self._handle))
 
 
+#: Maximum duration of a wait for the next result of a stream in the native library, in milliseconds
+_STREAM_WAIT_TIMEOUT_MS = 100
+
+
+class SecurityAnalysisResultStream:
+    """
+    An iterator over the results of a security analysis run by batches of contingencies,
+    each result being available as soon as its batch is simulated.
+
+    Each result holds the pre-contingency result, and the results of the contingencies of its batch,
+    including limit violations and results of monitored elements.
+
+    The analysis runs in a background thread, which waits when the given number of results
+    are waiting to be consumed, so that memory usage is bounded.
+    Closing the stream, or leaving a ``with`` block, stops the analysis.
+
+    Examples:
+
+        .. code-block:: python
+
+            with analysis.run_ac_stream(network, batch_size=1000) as stream:
+                for result in stream:
+                    result.limit_violations.to_csv(file, header=False)
+    """
+
+    def __init__(self, run: _Callable[[_pypowsybl.JavaHandle, _pypowsybl.JavaHandle], None],
+                 buffer_size: int, cancel_token: _Optional[_CancelToken], deadline: _Optional[float]):
+        self._handle = _pypowsybl.create_security_analysis_result_stream(buffer_size)
+        self._run_token = _pypowsybl.create_cancel_token(None if cancel_token is None else cancel_token._handle,  # pylint: disable=protected-access
+                                                         0 if deadline is None else int(deadline * 1000))
+        self._errors: _List[BaseException] = []
+        # the thread does not reference the stream, so that an abandoned stream is closed when garbage collected
+        self._thread = _threading.Thread(target=_produce_stream,
+                                         args=(run, self._handle, self._run_token, self._errors,
+                                               _pypowsybl.get_thread_isolate()),
+                                         name='pypowsybl-security-analysis-stream', daemon=True)
+        self._thread.start()
+
+    def __iter__(self) -> _Iterator[SecurityAnalysisResult]:
+        return self
+
+    def __next__(self) -> SecurityAnalysisResult:
+        try:
+            # waits by short slices, since signals such as keyboard interrupts are only handled between native calls
+            handle = _pypowsybl.get_next_security_analysis_stream_result(self._handle, _STREAM_WAIT_TIMEOUT_MS)
+            while handle is None and not _pypowsybl.is_security_analysis_result_stream_ended(self._handle):
+                handle = _pypowsybl.get_next_security_analysis_stream_result(self._handle, _STREAM_WAIT_TIMEOUT_MS)
+        except KeyboardInterrupt:
+            self.close()
+            raise
+        if handle is None:
+            self._thread.join()
+            if self._errors:
+                raise self._errors.pop()
+            raise StopIteration
+        return SecurityAnalysisResult(handle)
+
+    @property
+    def interrupted(self) -> bool:
+        """
+        True if the security analysis was cancelled before its end.
+        """
+        return _pypowsybl.is_interrupted(self._run_token)
+
+    def close(self) -> None:
+        """
+        Stops the security analysis, at the end of the batch being simulated, and drops the results not yet consumed.
+        """
+        _pypowsybl.close_security_analysis_result_stream(self._handle)
+
+    def __enter__(self) -> SecurityAnalysisResultStream:
+        return self
+
+    def __exit__(self, *args: _Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        if hasattr(self, '_thread'):
+            self.close()
+
+
+def _produce_stream(run: _Callable[[_pypowsybl.JavaHandle, _pypowsybl.JavaHandle], None], handle: _pypowsybl.JavaHandle,
+                    run_token: _pypowsybl.JavaHandle, errors: _List[BaseException], isolate: int) -> None:
+    try:
+        _pypowsybl.set_thread_isolate(isolate)
+        run(handle, run_token)
+    except BaseException as exc:  # pylint: disable=broad-except
+        # raised by the consuming thread, at the end of the stream
+        errors.append(exc)
+        # the stream has not been ended if the analysis failed before being run
+        _pypowsybl.finish_security_analysis_result_stream(handle)
+
+
+#: Arguments of a call to :meth:`SecurityAnalysis.add_monitored_elements`
+_MonitoredElements = _Tuple[ContingencyContextType, _List[str], _List[str], _List[str], _List[str]]
+
+
 class SecurityAnalysis(_ContingencyContainer):
     """
     Allows to run a security analysis on a network.
@@ -249,9 +406,11 @@ class SecurityAnalysis(_ContingencyContainer):
 
     def __init__(self, handle: _pypowsybl.JavaHandle):
         _ContingencyContainer.__init__(self, handle)
+        self._monitored_elements: _List[_MonitoredElements] = []
 
     def run_ac(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters] = None,
-               provider: str = '', reporter: _Reporter = None) -> SecurityAnalysisResult:
+               provider: str = '', reporter: _Reporter = None, workers: int = None,
+               deadline: float = None, cancel_token: _CancelToken = None) -> SecurityAnalysisResult:
         """ Runs an AC security analysis.
 
         Args:
@@ -259,17 +418,23 @@ class SecurityAnalysis(_ContingencyContainer):
             parameters: Security analysis parameters
             provider:   Name of the security analysis implementation provider to be used,
                         will use default provider if empty.
+            reporter:   the reporter to be used to create an execution report, default is None (no report)
+            workers:    if greater than 1, contingencies are split into as many shards, each one simulated
+                        by a distinct worker process. Results of the workers are then merged,
+                        so that the result is the same as the one of a single process run.
+            deadline:   time, in seconds since the epoch as returned by ``time.time()``, after which the security
+                        analysis stops, with the results of the contingencies simulated so far
+            cancel_token: token to cancel the security analysis, which then stops
+                        with the results of the contingencies simulated so far
 
         Returns:
             A security analysis result, containing information about violations and monitored elements
         """
-        security_parameters = Parameters(load_flow_parameters=parameters) if isinstance(parameters, pypowsybl.loadflow.Parameters) else parameters
-        p = security_parameters._to_c_parameters() if security_parameters is not None else Parameters()._to_c_parameters()
-        return SecurityAnalysisResult(
-            _pypowsybl.run_security_analysis(self._handle, network._handle, p, provider, False, None if reporter is None else reporter._reporter_model)) # pylint: disable=protected-access
+        return self._run(network, parameters, provider, False, reporter, workers, deadline, cancel_token)
 
     def run_dc(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters] = None,
-               provider: str = '', reporter: _Reporter = None) -> SecurityAnalysisResult:
+               provider: str = '', reporter: _Reporter = None, workers: int = None,
+               deadline: float = None, cancel_token: _CancelToken = None) -> SecurityAnalysisResult:
         """ Runs an DC security analysis.
 
         Args:
@@ -277,14 +442,116 @@ class SecurityAnalysis(_ContingencyContainer):
             parameters: Security analysis parameters
             provider:   Name of the security analysis implementation provider to be used,
                         will use default provider if empty.
+            reporter:   the reporter to be used to create an execution report, default is None (no report)
+            workers:    if greater than 1, contingencies are split into as many shards, each one simulated
+                        by a distinct worker process. Results of the workers are then merged,
+                        so that the result is the same as the one of a single process run.
+            deadline:   time, in seconds since the epoch as returned by ``time.time()``, after which the security
+                        analysis stops, with the results of the contingencies simulated so far
+            cancel_token: token to cancel the security analysis, which then stops
+                        with the results of the contingencies simulated so far
 
         Returns:
             A security analysis result, containing information about violations and monitored elements
         """
+        return self._run(network, parameters, provider, True, reporter, workers, deadline, cancel_token)
+
+    def run_ac_stream(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters] = None,
+                      provider: str = '', reporter: _Reporter = None, batch_size: int = None, buffer_size: int = 2,
+                      deadline: float = None, cancel_token: _CancelToken = None) -> SecurityAnalysisResultStream:
+        """ Runs an AC security analysis by batches of contingencies, the results of which are streamed
+        as soon as they are computed, instead of being held in memory until the end of the analysis.
+
+        Args:
+            network:     Network on which the security analysis will be computed
+            parameters:  Security analysis parameters
+            provider:    Name of the security analysis implementation provider to be used,
+                         will use default provider if empty.
+            reporter:    the reporter to be used to create an execution report, default is None (no report)
+            batch_size:  the number of contingencies of a batch, by default contingencies are split in about 100 batches
+            buffer_size: the maximum number of batch results waiting to be consumed, before the analysis waits
+            deadline:    time, in seconds since the epoch, after which the security analysis stops
+            cancel_token: token to cancel the security analysis
+
+        Returns:
+            An iterator over the results of the batches of contingencies
+        """
+        return self._run_stream(network, parameters, provider, False, reporter, batch_size, buffer_size, deadline, cancel_token)
+
+    def run_dc_stream(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters] = None,
+                      provider: str = '', reporter: _Reporter = None, batch_size: int = None, buffer_size: int = 2,
+                      deadline: float = None, cancel_token: _CancelToken = None) -> SecurityAnalysisResultStream:
+        """ Runs a DC security analysis by batches of contingencies, the results of which are streamed
+        as soon as they are computed, instead of being held in memory until the end of the analysis.
+
+        Args:
+            network:     Network on which the security analysis will be computed
+            parameters:  Security analysis parameters
+            provider:    Name of the security analysis implementation provider to be used,
+                         will use default provider if empty.
+            reporter:    the reporter to be used to create an execution report, default is None (no report)
+            batch_size:  the number of contingencies of a batch, by default contingencies are split in about 100 batches
+            buffer_size: the maximum number of batch results waiting to be consumed, before the analysis waits
+            deadline:    time, in seconds since the epoch, after which the security analysis stops
+            cancel_token: token to cancel the security analysis
+
+        Returns:
+            An iterator over the results of the batches of contingencies
+        """
+        return self._run_stream(network, parameters, provider, True, reporter, batch_size, buffer_size, deadline, cancel_token)
+
+    def _run_stream(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters, None],
+                    provider: str, dc: bool, reporter: _Optional[_Reporter], batch_size: _Optional[int], buffer_size: int,
+                    deadline: _Optional[float], cancel_token: _Optional[_CancelToken]) -> SecurityAnalysisResultStream:
+        if batch_size is not None and batch_size < 1:
+            raise ValueError('Batch size must be strictly positive')
+        if buffer_size < 1:
+            raise ValueError('Buffer size must be strictly positive')
+        security_parameters = Parameters(load_flow_parameters=parameters) if isinstance(parameters, pypowsybl.loadflow.Parameters) else parameters
+        p = security_parameters._to_c_parameters() if security_parameters is not None else Parameters()._to_c_parameters()
+        return SecurityAnalysisResultStream(
+            lambda stream, run_token: _pypowsybl.run_security_analysis_stream(
+                self._handle, stream, network._handle, p, provider, dc,  # pylint: disable=protected-access
+                None if reporter is None else reporter._reporter_model,  # pylint: disable=protected-access
+                run_token, 0 if batch_size is None else batch_size),
+            buffer_size, cancel_token, deadline)
+
+    def _run(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters, None],
+             provider: str, dc: bool, reporter: _Optional[_Reporter], workers: _Optional[int],
+             deadline: _Optional[float] = None, cancel_token: _Optional[_CancelToken] = None) -> SecurityAnalysisResult:
         security_parameters = Parameters(load_flow_parameters=parameters) if isinstance(parameters, pypowsybl.loadflow.Parameters) else parameters
+        if workers is not None and workers < 1:
+            raise ValueError('Number of workers must be strictly positive')
+        if workers is not None and workers > 1 and len(self._contingencies) > 1:
+            if reporter is not None:
+                raise ValueError('Reporter is not supported by security analysis run by several workers')
+            if cancel_token is not None:
+                raise ValueError('Cancel token is not supported by security analysis run by several workers')
+            return self._run_sharded(network, security_parameters, provider, dc, workers, deadline)
         p = security_parameters._to_c_parameters() if security_parameters is not None else Parameters()._to_c_parameters()
-        return SecurityAnalysisResult(
-            _pypowsybl.run_security_analysis(self._handle, network._handle, p, provider, True, None if reporter is None else reporter._reporter_model)) # pylint: disable=protected-access
+        handle, interrupted = _run_cancellable(
+            lambda run_token: _pypowsybl.run_security_analysis(self._handle, network._handle, p, provider, dc,  # pylint: disable=protected-access
+                                                               None if reporter is None else reporter._reporter_model,  # pylint: disable=protected-access
+                                                               run_token),
+            cancel_token, deadline)
+        return SecurityAnalysisResult(handle, interrupted)
+
+    def _run_sharded(self, network: _Network, parameters: _Optional[Parameters], provider: str, dc: bool,
+                     workers: int, deadline: _Optional[float]) -> SecurityAnalysisResult:
+        # shards are contiguous, so that merged post-contingency results are in the order of contingencies
+        contingencies = list(self._contingencies.items())
+        shard_size = _math.ceil(len(contingencies) / workers)
+        shards = [contingencies[i:i + shard_size] for i in range(0, len(contingencies), shard_size)]
+        network_data = _np.array(_pypowsybl.serialize_network(network._handle, False), copy=False).tobytes()  # pylint: disable=protected-access
+        # worker processes are spawned rather than forked, since the native library of this process cannot be forked
+        with _ProcessPoolExecutor(max_workers=len(shards), mp_context=_multiprocessing.get_context('spawn')) as executor:
+            futures = [executor.submit(_run_shard, network_data, shard, self._monitored_elements, parameters, provider, dc,
+                                       deadline)
+                       for shard in shards]
+            shard_results = [future.result() for future in futures]
+        results = [_pypowsybl.deserialize_security_analysis_result(data) for data, _ in shard_results]
+        return SecurityAnalysisResult(_pypowsybl.merge_security_analysis_results(results),
+                                      any(interrupted for _, interrupted in shard_results))
 
     def add_monitored_elements(self, contingency_context_type: ContingencyContextType = ContingencyContextType.ALL,
                                contingency_ids: _Union[_List[str], str] = None,
@@ -320,6 +587,8 @@ class SecurityAnalysis(_ContingencyContainer):
 
         _pypowsybl.add_monitored_elements(self._handle, contingency_context_type, branch_ids, voltage_level_ids,
                                           three_windings_transformer_ids, contingency_ids)
+        self._monitored_elements.append((contingency_context_type, list(contingency_ids), branch_ids,
+                                         voltage_level_ids, three_windings_transformer_ids))
 
     def add_precontingency_monitored_elements(self,
                                               branch_ids: _List[str] = None,
@@ -355,6 +624,31 @@ class SecurityAnalysis(_ContingencyContainer):
                                            branch_ids, voltage_level_ids, three_windings_transformer_ids)
 
 
+def _run_shard(network_data: bytes, contingencies: _List[_Tuple[str, _List[str]]], monitored_elements: _List[_MonitoredElements],
+               parameters: _Optional[Parameters], provider: str, dc: bool, deadline: _Optional[float]) -> _Tuple[bytes, bool]:
+    """
+    Runs a security analysis on a shard of the contingencies, in a worker process.
+
+    Returns:
+        the serialized result, and true if the security analysis was interrupted by the deadline
+    """
+    network = _Network(_pypowsybl.deserialize_network(network_data))
+    analysis = create_analysis()
+    for contingency_id, elements_ids in contingencies:
+        analysis.add_multiple_elements_contingency(elements_ids, contingency_id)
+    shard_ids = set(contingency_id for contingency_id, _ in contingencies)
+    for context_type, contingency_ids, branch_ids, voltage_level_ids, three_windings_transformer_ids in monitored_elements:
+        if context_type == ContingencyContextType.SPECIFIC:
+            contingency_ids = [contingency_id for contingency_id in contingency_ids if contingency_id in shard_ids]
+            if not contingency_ids:
+                continue
+        _pypowsybl.add_monitored_elements(analysis._handle, context_type, branch_ids, voltage_level_ids,  # pylint: disable=protected-access
+                                          three_windings_transformer_ids, contingency_ids)
+    result = analysis._run(network, parameters, provider, dc, None, None, deadline)  # pylint: disable=protected-access
+    data = _np.array(_pypowsybl.serialize_security_analysis_result(result._handle), copy=False).tobytes()  # pylint: disable=protected-access
+    return data, result.interrupted
+
+
 def create_analysis() -> SecurityAnalysis:
     """ Creates a security analysis objet, which can be used to run a security analysis on a network
 
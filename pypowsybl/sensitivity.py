@@ -6,7 +6,7 @@
 #
 from __future__ import annotations
 from datetime import datetime
-from typing import List as _List, Optional as _Optional, Dict as _Dict, Union as _Union
+from typing import List as _List, Optional as _Optional, Dict as _Dict, Union as _Union, Tuple as _Tuple
 from enum import Enum as _Enum
 import numpy as _np
 import pandas as _pd
@@ -16,7 +16,11 @@ import pypowsybl.loadflow
 from pypowsybl import _pypowsybl
 from pypowsybl import glsk
 from pypowsybl.network import Network as _Network
-from pypowsybl.util import ContingencyContainer as _ContingencyContainer
+from pypowsybl.util import (
+    CancelToken as _CancelToken,
+    ContingencyContainer as _ContingencyContainer,
+    _run_cancellable
+)
 from pypowsybl._pypowsybl import PyPowsyblError as _PyPowsyblError
 from pypowsybl.report import Reporter as _Reporter
 
@@ -189,11 +193,21 @@ class DcSensitivityAnalysisResult:
     def __init__(self,
                  result_context_ptr: _pypowsybl.JavaHandle,
                  branches_ids: _Dict[str, _List[str]],
-                 branch_data_frame_index: _Dict[str, _List[str]]):
+                 branch_data_frame_index: _Dict[str, _List[str]],
+                 interrupted: bool = False):
         self._handle = result_context_ptr
         self.result_context_ptr = result_context_ptr
         self.branches_ids = branches_ids
         self.branch_data_frame_index = branch_data_frame_index
+        self._interrupted = interrupted
+
+    @property
+    def interrupted(self) -> bool:
+        """
+        True if the sensitivity analysis was cancelled before its end: matrices of contingencies
+        which have not been simulated are then None.
+        """
+        return self._interrupted
 
     def get_branch_flows_sensitivity_matrix(self, matrix_id: str = 'default', contingency_id: str = None) -> _Optional[
         _pd.DataFrame]:
@@ -255,8 +269,8 @@ class AcSensitivityAnalysisResult(DcSensitivityAnalysisResult):
 
     def __init__(self, result_context_ptr: _pypowsybl.JavaHandle, branches_ids: _Dict[str, _List[str]],
                  branch_data_frame_index: _Dict[str, _List[str]],
-                 bus_ids: _List[str], target_voltage_ids: _List[str]):
-        DcSensitivityAnalysisResult.__init__(self, result_context_ptr, branches_ids, branch_data_frame_index)
+                 bus_ids: _List[str], target_voltage_ids: _List[str], interrupted: bool = False):
+        DcSensitivityAnalysisResult.__init__(self, result_context_ptr, branches_ids, branch_data_frame_index, interrupted)
         self.bus_ids = bus_ids
         self.target_voltage_ids = target_voltage_ids
 
@@ -316,6 +330,17 @@ class SensitivityAnalysis(_ContingencyContainer):
                                           list(zone.shift_keys_by_injections_ids.values())))
         _pypowsybl.set_zones(self._handle, _zones)
 
+    def _run(self, network: _Network, dc: bool, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters, None],
+             provider: str, reporter: _Optional[_Reporter], deadline: _Optional[float],
+             cancel_token: _Optional[_CancelToken]) -> _Tuple[_pypowsybl.JavaHandle, bool]:
+        sensitivity_parameters = Parameters(load_flow_parameters=parameters) if isinstance(parameters, pypowsybl.loadflow.Parameters) else parameters
+        p: _pypowsybl.SensitivityAnalysisParameters = sensitivity_parameters._to_c_parameters() if sensitivity_parameters is not None else Parameters()._to_c_parameters()
+        return _run_cancellable(
+            lambda run_token: _pypowsybl.run_sensitivity_analysis(self._handle, network._handle, dc, p, provider,  # pylint: disable=protected-access
+                                                                  None if reporter is None else reporter._reporter_model,  # pylint: disable=protected-access
+                                                                  run_token),
+            cancel_token, deadline)
+
     def _process_variable_ids(self, variables_ids: _List) -> tuple:
         flatten_variables_ids = []
         branch_data_frame_index = []
@@ -426,24 +451,26 @@ class DcSensitivityAnalysis(SensitivityAnalysis):
         SensitivityAnalysis.__init__(self, handle)
 
     def run(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters] = None,
-            provider: str = '', reporter: _Reporter = None) -> DcSensitivityAnalysisResult:
+            provider: str = '', reporter: _Reporter = None,
+            deadline: float = None, cancel_token: _CancelToken = None) -> DcSensitivityAnalysisResult:
         """ Runs the sensitivity analysis
 
         Args:
             network:    The network
             parameters: The sensitivity parameters
             provider:   Name of the sensitivity analysis provider
+            deadline:   time, in seconds since the epoch as returned by ``time.time()``, after which the analysis
+                        stops, with the results of the contingencies simulated so far
+            cancel_token: token to cancel the analysis, which then stops with the results
+                        of the contingencies simulated so far
 
         Returns:
             a sensitivity analysis result
         """
-        sensitivity_parameters = Parameters(load_flow_parameters=parameters) if isinstance(parameters, pypowsybl.loadflow.Parameters) else parameters
-        p: _pypowsybl.SensitivityAnalysisParameters = sensitivity_parameters._to_c_parameters() if sensitivity_parameters is not None else Parameters()._to_c_parameters()
-        return DcSensitivityAnalysisResult(
-            _pypowsybl.run_sensitivity_analysis(self._handle, network._handle, True, p, provider,
-                                                None if reporter is None else reporter._reporter_model),
-            # pylint: disable=protected-access
-            branches_ids=self.branches_ids, branch_data_frame_index=self.branch_data_frame_index)
+        handle, interrupted = self._run(network, True, parameters, provider, reporter, deadline, cancel_token)
+        return DcSensitivityAnalysisResult(handle, branches_ids=self.branches_ids,
+                                           branch_data_frame_index=self.branch_data_frame_index,
+                                           interrupted=interrupted)
 
 
 class AcSensitivityAnalysis(SensitivityAnalysis):
@@ -467,7 +494,8 @@ class AcSensitivityAnalysis(SensitivityAnalysis):
         self.target_voltage_ids = target_voltage_ids
 
     def run(self, network: _Network, parameters: _Union[Parameters, pypowsybl.loadflow.Parameters] = None,
-            provider: str = '', reporter: _Reporter = None) -> AcSensitivityAnalysisResult:
+            provider: str = '', reporter: _Reporter = None,
+            deadline: float = None, cancel_token: _CancelToken = None) -> AcSensitivityAnalysisResult:
         """
         Runs the sensitivity analysis.
 
@@ -475,19 +503,19 @@ class AcSensitivityAnalysis(SensitivityAnalysis):
             network:    The network
             parameters: The sensitivity parameters
             provider:   Name of the sensitivity analysis provider
+            deadline:   time, in seconds since the epoch as returned by ``time.time()``, after which the analysis
+                        stops, with the results of the contingencies simulated so far
+            cancel_token: token to cancel the analysis, which then stops with the results
+                        of the contingencies simulated so far
 
         Returns:
             a sensitivity analysis result
         """
-        sensitivity_parameters = Parameters(load_flow_parameters=parameters) if isinstance(parameters,
-                                                                                                       pypowsybl.loadflow.Parameters) else parameters
-        p: _pypowsybl.SensitivityAnalysisParameters = sensitivity_parameters._to_c_parameters() if sensitivity_parameters is not None else Parameters()._to_c_parameters()
-        return AcSensitivityAnalysisResult(
-            _pypowsybl.run_sensitivity_analysis(self._handle, network._handle, False, p, provider,
-                                                None if reporter is None else reporter._reporter_model),
-            # pylint: disable=protected-access
-            branches_ids=self.branches_ids, branch_data_frame_index=self.branch_data_frame_index,
-            bus_ids=self.bus_voltage_ids, target_voltage_ids=self.target_voltage_ids)
+        handle, interrupted = self._run(network, False, parameters, provider, reporter, deadline, cancel_token)
+        return AcSensitivityAnalysisResult(handle, branches_ids=self.branches_ids,
+                                           branch_data_frame_index=self.branch_data_frame_index,
+                                           bus_ids=self.bus_voltage_ids, target_voltage_ids=self.target_voltage_ids,
+                                           interrupted=interrupted)
 
 
 def create_dc_analysis() -> DcSensitivityAnalysis:
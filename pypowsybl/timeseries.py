@@ -0,0 +1,149 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides a time series engine, running a loadflow for each step of a time series of network modifications.
+"""
+from typing import (
+    Dict as _Dict,
+    List as _List,
+    Optional as _Optional,
+    Sequence as _Sequence,
+    Tuple as _Tuple,
+    Union as _Union
+)
+
+import numpy as _np
+import pandas as _pd
+from pandas import DataFrame as _DataFrame
+
+from pypowsybl import _pypowsybl
+from pypowsybl._pypowsybl import ElementType
+from pypowsybl.loadflow import Parameters, ComponentStatus
+from pypowsybl.network import Network as _Network
+
+#: An attribute of an element type, for example ``(ElementType.LOAD, 'p0')``
+ElementsAttribute = _Tuple[ElementType, str]
+
+
+class TimeSeriesResult:
+    """
+    The results of a time series computation.
+
+    For each requested attribute, values are available as a dataframe indexed by the time series index,
+    with one column for each element.
+    """
+
+    def __init__(self, index: _pd.Index, statuses: _np.ndarray, values: _Dict[ElementsAttribute, _DataFrame]):
+        self._index = index
+        self._statuses = _pd.Series(data=[ComponentStatus(s) for s in statuses], index=index, name='status')
+        self._values = values
+
+    @property
+    def index(self) -> _pd.Index:
+        """
+        The index of the time series.
+        """
+        return self._index
+
+    @property
+    def statuses(self) -> _pd.Series:
+        """
+        The status of the loadflow on the main component, for each step.
+        """
+        return self._statuses
+
+    def keys(self) -> _List[ElementsAttribute]:
+        """
+        The attributes for which values have been collected.
+        """
+        return list(self._values.keys())
+
+    def __getitem__(self, key: ElementsAttribute) -> _DataFrame:
+        return self._values[key]
+
+    def __repr__(self) -> str:
+        return f'TimeSeriesResult(steps={len(self._index)}, attributes={self.keys()})'
+
+
+def run(network: _Network, profiles: _Dict[ElementsAttribute, _DataFrame],
+        results: _Union[_Sequence[ElementsAttribute], _Dict[ElementsAttribute, _Optional[_List[str]]]],
+        parameters: Parameters = None, provider: str = '', dc: bool = False) -> TimeSeriesResult:
+    """
+    Runs a loadflow for each step of a time series.
+
+    Before each step, the values of the profiles for this step are applied to the network.
+    After each step, the values of the requested result attributes are collected.
+    The whole time series is run in a single call to the native library: values are exchanged
+    through preallocated arrays, without any dataframe conversion during the computation.
+
+    The network is modified by the computation: at the end, it is in the state of the last step.
+    Use a dedicated variant to keep the working variant unchanged.
+
+    Args:
+        network:    a network
+        profiles:   for each attribute to be modified, a dataframe of values indexed by the time series index,
+                    with one column for each element to be modified. All profiles must have the same index.
+                    Only float attributes can be modified.
+        results:    attributes to be collected after each step, or a dictionary associating to each attribute
+                    the ids of the elements to be collected. When ids are ``None``, all elements are collected.
+                    Only float attributes can be collected.
+        parameters: the loadflow parameters
+        provider:   the loadflow implementation provider, default is the default loadflow provider
+        dc:         run DC loadflows instead of AC loadflows, default is false
+
+    Returns:
+        the collected values, and the loadflow status of each step
+
+    Examples:
+
+        .. code-block:: python
+
+            loads_p0 = pd.DataFrame(index=pd.date_range('2022-01-01', periods=8760, freq='H'),
+                                    data={'LOAD1': ..., 'LOAD2': ...})
+            result = pp.timeseries.run(network, {(ElementType.LOAD, 'p0'): loads_p0},
+                                       [(ElementType.LINE, 'p1'), (ElementType.BUS, 'v_mag')])
+            lines_p1 = result[ElementType.LINE, 'p1']
+    """
+    if not profiles:
+        raise ValueError('At least one profile is expected')
+    index = next(iter(profiles.values())).index
+    for key, profile in profiles.items():
+        if not profile.index.equals(index):
+            raise ValueError(f'All profiles must have the same index, which is not the case of profile {key}')
+    if not isinstance(results, dict):
+        results = {key: None for key in results}
+    steps_count = len(index)
+
+    profiles_keys = list(profiles.keys())
+    profiles_ids = [[str(c) for c in profiles[key].columns] for key in profiles_keys]
+    profiles_values = _np.concatenate([profiles[key].to_numpy(dtype=_np.float64).ravel() for key in profiles_keys])
+
+    results_keys = list(results.keys())
+    results_ids = []
+    for key in results_keys:
+        ids = results[key]
+        if ids is None:
+            ids = network.get_elements(key[0], attributes=[]).index.tolist()
+        results_ids.append(list(ids))
+    results_values = _np.empty(sum(steps_count * len(ids) for ids in results_ids), dtype=_np.float64)
+    statuses = _np.empty(steps_count, dtype=_np.int32)
+
+    p = parameters._to_c_parameters() if parameters is not None else _pypowsybl.LoadFlowParameters()  # pylint: disable=protected-access
+    _pypowsybl.run_load_flow_time_series(network._handle, dc, p, provider, steps_count,  # pylint: disable=protected-access
+                                         [key[0] for key in profiles_keys], [key[1] for key in profiles_keys],
+                                         profiles_ids, profiles_values,
+                                         [key[0] for key in results_keys], [key[1] for key in results_keys],
+                                         results_ids, results_values, statuses)
+
+    values = {}
+    offset = 0
+    for key, ids in zip(results_keys, results_ids):
+        size = steps_count * len(ids)
+        values[key] = _DataFrame(data=results_values[offset:offset + size].reshape(steps_count, len(ids)),
+                                 index=index, columns=_pd.Index(ids, name='id'))
+        offset += size
+    return TimeSeriesResult(index, statuses, values)
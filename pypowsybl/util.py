@@ -4,14 +4,137 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 #
-from typing import List as _List, Callable as _Callable
+from __future__ import annotations
+
+import threading as _threading
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor, TimeoutError as _TimeoutError
+from typing import (
+    Dict as _Dict,
+    List as _List,
+    Callable as _Callable,
+    Optional as _Optional,
+    Union as _Union,
+    Tuple as _Tuple,
+    TypeVar as _TypeVar,
+    TYPE_CHECKING as _TYPE_CHECKING
+)
 import pandas as _pd
 from pypowsybl import _pypowsybl
 
+if _TYPE_CHECKING:
+    from pypowsybl.network import Network
+
+_T = _TypeVar('_T')
+
+
+class CancelToken:
+    """
+    A token to cancel computations, which check it between steps, for example between contingencies,
+    and then stop before their end with partial results.
+
+    A token may be cancelled from any thread, and given to several computations to cancel all of them.
+    Once cancelled, a token stays cancelled.
+
+    Args:
+        parent: a token, the cancellation of which also cancels this token
+
+    Examples:
+
+        .. code-block:: python
+
+            token = pp.CancelToken()
+            threading.Timer(60, token.cancel).start()
+            result = analysis.run_ac(network, cancel_token=token)
+    """
+
+    def __init__(self, parent: CancelToken = None) -> None:
+        self._handle = _pypowsybl.create_cancel_token(None if parent is None else parent._handle, 0)
+        # true if the token only aborts computations, which then do not have to return partial results
+        self._abort_only = False
+
+    def cancel(self) -> None:
+        """
+        Cancels the computations of this token.
+        """
+        _pypowsybl.cancel(self._handle)
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        True if this token has been cancelled.
+        """
+        return _pypowsybl.is_cancelled(self._handle)
+
+    def __repr__(self) -> str:
+        return f'CancelToken(cancelled={self.cancelled})'
+
+
+def _create_abort_token(cancel_token: _Optional[CancelToken]) -> CancelToken:
+    """
+    Creates a token to abort a computation, for example when its coroutine is cancelled,
+    which is also cancelled by the given token, if any.
+
+    Without a given token, cancelling the created token only aborts the computation, as a keyboard interrupt does:
+    no partial results are expected, so that computations run as if they had no token.
+    """
+    token = CancelToken(cancel_token)
+    token._abort_only = cancel_token is None  # pylint: disable=protected-access
+    return token
+
+
+def _run_cancellable(fn: _Callable[[_Optional[_pypowsybl.JavaHandle]], _T], cancel_token: _Optional[CancelToken],
+                     deadline: _Optional[float]) -> _Tuple[_T, bool]:
+    """
+    Runs a computation which may be cancelled, given the token of the run, until the given token is cancelled
+    or the deadline, in seconds since the epoch, is reached.
+
+    When called from the main thread, the computation is run in another thread, so that a keyboard interrupt
+    aborts it instead of waiting for its end. The token of the run then has no parent and no deadline,
+    so that computations know that no partial results are expected, and run as if they had no token,
+    only checking it between their steps. Otherwise, the computation is given no token, unless a token
+    or a deadline is given. An abort token, without deadline, is given as it is to the computation,
+    which then also runs as if it had no token.
+
+    Returns:
+        the result of the computation, and true if it stopped before its end
+    """
+    main_thread = _threading.current_thread() is _threading.main_thread()
+    if cancel_token is None and deadline is None and not main_thread:
+        return fn(None), False
+    if cancel_token is not None and cancel_token._abort_only and deadline is None:  # pylint: disable=protected-access
+        # not a child of the abort token, which would mean that partial results are expected
+        run_token = cancel_token._handle  # pylint: disable=protected-access
+    else:
+        run_token = _pypowsybl.create_cancel_token(None if cancel_token is None else cancel_token._handle,  # pylint: disable=protected-access
+                                                   0 if deadline is None else int(deadline * 1000))
+    if not main_thread:
+        return fn(run_token), _pypowsybl.is_interrupted(run_token)
+    with _ThreadPoolExecutor(max_workers=1, initializer=_pypowsybl.set_thread_isolate,
+                             initargs=(_pypowsybl.get_thread_isolate(),)) as executor:
+        future = executor.submit(fn, run_token)
+        try:
+            while True:
+                # waits with a timeout, since a wait without timeout cannot be interrupted on all platforms
+                try:
+                    return future.result(timeout=0.1), _pypowsybl.is_interrupted(run_token)
+                except _TimeoutError:
+                    continue
+        except KeyboardInterrupt:
+            # the executor then waits for the computation to stop
+            _pypowsybl.cancel(run_token)
+            raise
+
 
 class ContingencyContainer:
     def __init__(self, handle: _pypowsybl.JavaHandle):
         self._handle = handle
+        # contingencies are also kept on python side, to be distributed to other processes,
+        # a contingency replacing a previously added one with the same ID, as on java side
+        self._contingencies: _Dict[str, _List[str]] = {}
+
+    def _add_contingency(self, contingency_id: str, elements_ids: _List[str]) -> None:
+        _pypowsybl.add_contingency(self._handle, contingency_id, elements_ids)
+        self._contingencies[contingency_id] = list(elements_ids)
 
     def add_single_element_contingency(self, element_id: str, contingency_id: str = None) -> None:
         """
@@ -22,7 +145,7 @@ class ContingencyContainer:
             contingency_id: The ID of the contingency.
                 If ``None``, element_id will be used.
         """
-        _pypowsybl.add_contingency(self._handle, contingency_id if contingency_id else element_id, [element_id])
+        self._add_contingency(contingency_id if contingency_id else element_id, [element_id])
 
     def add_multiple_elements_contingency(self, elements_ids: _List[str], contingency_id: str) -> None:
         """
@@ -32,7 +155,7 @@ class ContingencyContainer:
             elements_ids: The ID of the lost network elements.
             contingency_id: The ID of the contingency.
         """
-        _pypowsybl.add_contingency(self._handle, contingency_id, elements_ids)
+        self._add_contingency(contingency_id, elements_ids)
 
     def add_single_element_contingencies(self, elements_ids: _List[str], contingency_id_provider: _Callable[[str], str] = None) -> None:
         """
@@ -46,19 +169,93 @@ class ContingencyContainer:
         """
         for element_id in elements_ids:
             contingency_id = contingency_id_provider(element_id) if contingency_id_provider else element_id
-            _pypowsybl.add_contingency(self._handle, contingency_id, [element_id])
+            self._add_contingency(contingency_id, [element_id])
+
+    def add_contingencies(self, df: _pd.DataFrame, network: _Optional[Network] = None) -> _pd.DataFrame:
+        """
+        Add multiple contingencies at once, from a dataframe with one row for each element of each contingency.
+
+        All contingencies are registered by a single native call, which makes it much faster than adding
+        contingencies one by one when there are many of them.
+
+        If a network is given, elements are checked against it: contingencies with elements which
+        do not exist in the network, or whose type is not supported, are not added.
+
+        Args:
+            df: A dataframe with columns, or index levels, ``contingency_id`` and ``element_id``.
+                A N-K contingency is defined by K rows with the same contingency ID.
+            network: The network to check elements against, if any.
+
+        Returns:
+            A dataframe of the rejected elements, indexed by contingency ID and element ID, with the reason
+            of the rejection. It is empty if all contingencies have been added.
+
+        Examples:
+
+            .. code-block:: python
+
+                df = pd.DataFrame.from_records(columns=['contingency_id', 'element_id'],
+                                               data=[('N-2', 'LINE_1'), ('N-2', 'LINE_2'), ('N-1', 'LINE_3')])
+                rejected = analysis.add_contingencies(df, network)
+        """
+        columns = ['contingency_id', 'element_id']
+        if not set(columns).issubset(df.columns):
+            df = df.reset_index()
+        missing_columns = [c for c in columns if c not in df.columns]
+        if missing_columns:
+            raise ValueError(f'Missing columns {missing_columns} to define contingencies')
+        contingency_ids = df['contingency_id'].astype(str).tolist()
+        elements_ids = df['element_id'].astype(str).tolist()
+        rejected = create_data_frame_from_series_array(_pypowsybl.add_contingencies(
+            self._handle, None if network is None else network._handle,  # pylint: disable=protected-access
+            contingency_ids, elements_ids))
+        rejected_contingency_ids = set(rejected.index.get_level_values('contingency_id'))
+        elements_ids_by_contingency: _Dict[str, _List[str]] = {}
+        for contingency_id, element_id in zip(contingency_ids, elements_ids):
+            if contingency_id not in rejected_contingency_ids:
+                elements_ids_by_contingency.setdefault(contingency_id, []).append(element_id)
+        self._contingencies.update(elements_ids_by_contingency)
+        return rejected
+
+
+def _is_categorical(series: _pypowsybl.Series, categorical: _Union[bool, _List[str]]) -> bool:
+    if series.index or series.type != 0:
+        return False
+    if isinstance(categorical, bool):
+        return categorical
+    return series.name in categorical
+
 
+def create_data_frame_from_series_array(series_array: _pypowsybl.SeriesArray,
+                                        string_dictionaries: _Optional[_Dict[str, _pypowsybl.StringDictionary]] = None,
+                                        categorical: _Union[bool, _List[str]] = False) -> _pd.DataFrame:
+    """
+    Creates a dataframe from a series array.
 
-def create_data_frame_from_series_array(series_array: _pypowsybl.SeriesArray) -> _pd.DataFrame:
+    Non index string series selected by ``categorical`` are dictionary encoded, and returned
+    as :class:`pandas.Categorical` columns whose categories are the values of the dictionary of the column,
+    null strings being missing values. Dictionaries are taken from ``string_dictionaries``, by column name,
+    and added to it for new columns.
+    """
+    dictionaries = string_dictionaries if string_dictionaries is not None else {}
     series_dict = {}
     index_data = []
     index_names = []
+    codes_dict = {}
     for series in series_array:
         if series.index:
             index_data.append(series.data)
             index_names.append(series.name)
+        elif _is_categorical(series, categorical):
+            dictionary = dictionaries.setdefault(series.name, _pypowsybl.StringDictionary())
+            codes_dict[series.name] = series.dictionary_encoded_data(dictionary)
+            series_dict[series.name] = None
         else:
             series_dict[series.name] = series.data
+    for name, codes in codes_dict.items():
+        # code -1 of null strings is a missing value for pandas
+        categories = _pd.Index(dictionaries[name].values)
+        series_dict[name] = _pd.Categorical.from_codes(codes, categories=categories)
     index = None
     if not index_names:
         raise ValueError('No index in returned dataframe')
@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides utility methods for exchanging network data as Apache Arrow tables:
+ - creation of arrow tables from C API series arrays, through the arrow C data interface
+ - conversion of those tables to pandas and polars dataframes
+
+pyarrow (and polars for the polars conversion) are optional dependencies,
+they are only imported when needed.
+"""
+import json
+from typing import Any, List, Optional
+
+from pandas import DataFrame
+import pypowsybl._pypowsybl as _pp
+
+INDEX_METADATA_KEY = b'pypowsybl.index'
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError('pyarrow >= 14.0 is required to export network elements as arrow tables, '
+                          'you can install it with "pip install pyarrow"') from exc
+    return pyarrow
+
+
+def _import_polars() -> Any:
+    try:
+        import polars  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError('polars is required to convert arrow tables to polars dataframes, '
+                          'you can install it with "pip install polars"') from exc
+    return polars
+
+
+def _create_arrow_table(series_array: _pp.SeriesArray, attributes: Optional[List[str]] = None) -> Any:
+    """
+    Creates an arrow table from a series array.
+    Each series is transferred through the arrow C data interface, without creating python objects
+    for its values. Index series come first, their names are stored in the schema metadata.
+    """
+    pa = _import_pyarrow()
+    index_names = []
+    index_arrays = []
+    arrays_by_name = {}
+    for series in series_array:
+        if series.index:
+            index_names.append(series.name)
+            index_arrays.append(pa.array(series))
+        else:
+            arrays_by_name[series.name] = pa.array(series)
+    if not index_names:
+        raise ValueError('No index in returned dataframe')
+    names = attributes if attributes else list(arrays_by_name.keys())
+    metadata = {INDEX_METADATA_KEY: json.dumps(index_names).encode()}
+    return pa.Table.from_arrays(index_arrays + [arrays_by_name[name] for name in names],
+                                names=index_names + names, metadata=metadata)
+
+
+def _get_index_names(table: Any) -> List[str]:
+    metadata = table.schema.metadata
+    if not metadata or INDEX_METADATA_KEY not in metadata:
+        return []
+    return json.loads(metadata[INDEX_METADATA_KEY].decode())
+
+
+def to_pandas(table: Any) -> DataFrame:
+    """
+    Converts an arrow table created by pypowsybl to a pandas dataframe.
+
+    Index columns of the table become the index of the dataframe,
+    so that the result is equivalent to the one of :meth:`Network.get_elements`.
+
+    Args:
+        table: an arrow table, as returned by :meth:`Network.get_elements_arrow`
+
+    Returns:
+        a pandas dataframe
+    """
+    df = table.to_pandas()
+    index_names = _get_index_names(table)
+    if index_names:
+        df = df.set_index(index_names)
+    return df
+
+
+def to_polars(table: Any) -> Any:
+    """
+    Converts an arrow table created by pypowsybl to a polars dataframe.
+
+    Polars dataframes have no index, index columns are kept as the first columns of the dataframe.
+
+    Args:
+        table: an arrow table, as returned by :meth:`Network.get_elements_arrow`
+
+    Returns:
+        a polars dataframe
+    """
+    return _import_polars().from_arrow(table)
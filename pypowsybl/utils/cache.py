@@ -0,0 +1,212 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides an on-disk cache of parsed networks, shared between processes.
+"""
+import functools
+import hashlib
+import os
+import pathlib
+import tempfile
+from typing import Any, Dict, List, Optional, Union
+
+import pypowsybl._pypowsybl as _pp
+
+_ENTRY_SUFFIX = '.network'
+_CHUNK_SIZE = 1024 * 1024
+
+
+@functools.lru_cache(maxsize=None)
+def _get_version_table() -> str:
+    return _pp.get_version_table()
+
+
+class NetworkCache:
+    """
+    An on-disk cache of parsed networks, to be used with :func:`pypowsybl.network.load`.
+
+    Entries are identified by a hash of the content of the input file, or of all the files of an input directory,
+    of the import parameters, and of the versions of the libraries used for the import.
+    Each entry holds a binary snapshot of the network, which is much faster to read than the original input.
+
+    When the total size of the entries exceeds the maximum size, least recently used entries are removed.
+    Entries larger than the maximum size are not stored.
+
+    The cache may be shared by several processes: entries are written to temporary files,
+    then atomically renamed, so that a process never reads a partially written entry.
+
+    Args:
+        directory: the directory where entries are stored, created if it does not exist
+        max_size:  the maximum total size of the entries, in bytes, default is 10 GB
+        compress:  compress entries, which reduces their size but makes them slower to read, default is false
+
+    Examples:
+
+        .. code-block:: python
+
+            cache = NetworkCache('/tmp/networks')
+            network = pp.network.load('europe.zip', cache=cache)  # parsed, and stored in the cache
+            network = pp.network.load('europe.zip', cache=cache)  # read from the cache
+    """
+
+    def __init__(self, directory: Union[str, os.PathLike], max_size: int = 10 * 1024 ** 3, compress: bool = False):
+        if max_size <= 0:
+            raise ValueError('Maximum cache size must be strictly positive')
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._compress = compress
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """
+        The directory where entries are stored.
+        """
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        """
+        The maximum total size of the entries, in bytes.
+        """
+        return self._max_size
+
+    @property
+    def compress(self) -> bool:
+        """
+        True if entries are compressed.
+        """
+        return self._compress
+
+    def key(self, file: Union[str, os.PathLike], parameters: Optional[Dict[str, str]] = None) -> str:
+        """
+        Computes the key of the entry of the given input file, or directory, and import parameters.
+        """
+        path = pathlib.Path(file)
+        digest = hashlib.sha256()
+        digest.update(_get_version_table().encode())
+        digest.update(repr(sorted((parameters or {}).items())).encode())
+        # file names are part of the key, as they are used to detect the input format
+        files = sorted(p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]
+        for f in files:
+            digest.update((f.name if f == path else str(f.relative_to(path))).encode())
+            with open(f, 'rb') as stream:
+                chunk = stream.read(_CHUNK_SIZE)
+                while chunk:
+                    digest.update(chunk)
+                    chunk = stream.read(_CHUNK_SIZE)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> pathlib.Path:
+        return self._directory / (key + _ENTRY_SUFFIX)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Reads the content of an entry, and marks it as recently used.
+
+        Returns:
+            the content of the entry, or None if there is no such entry
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as stream:
+                data = stream.read()
+            os.utime(path)
+        except FileNotFoundError:
+            # may also be removed by another process in the meantime
+            return None
+        return data
+
+    def put(self, key: str, data: Any) -> None:
+        """
+        Writes the content of an entry, then removes least recently used entries if the cache is too large.
+        The entry is not written if it is larger than the maximum size of the cache.
+
+        Args:
+            key:  the key of the entry
+            data: the content of the entry, any object supporting the buffer protocol
+        """
+        with memoryview(data) as view:
+            if view.nbytes > self._max_size:
+                return
+        path = self._entry_path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as stream:
+                stream.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._evict(path)
+
+    def remove(self, key: str) -> None:
+        """
+        Removes an entry, if it exists.
+        """
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _entries(self) -> 'List[os.DirEntry[str]]':
+        with os.scandir(self._directory) as entries:
+            return [e for e in entries if e.name.endswith(_ENTRY_SUFFIX)]
+
+    def _evict(self, written_path: pathlib.Path) -> None:
+        """
+        Removes least recently used entries, but the one just written, until the cache is small enough.
+        """
+        entries = []
+        for entry in self._entries():
+            if entry.path == str(written_path):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        try:
+            written_size = written_path.stat().st_size
+        except FileNotFoundError:
+            written_size = 0
+        total_size = written_size + sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # already removed, or still opened, by another process
+                continue
+            total_size -= size
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the entries, in bytes.
+        """
+        size = 0
+        for entry in self._entries():
+            try:
+                size += entry.stat().st_size
+            except FileNotFoundError:
+                continue
+        return size
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        for entry in self._entries():
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+
+    def __repr__(self) -> str:
+        return f'NetworkCache(directory={str(self._directory)!r}, max_size={self._max_size}, compress={self._compress})'
@@ -11,12 +11,13 @@ Provides utility methods for dataframes handling:
  - ...
 """
 from typing import List
-from typing import Optional as _Optional
+from typing import Optional as _Optional, Dict as _Dict, Any as _Any
 
 from pandas import DataFrame, Index, MultiIndex
 import numpy as np
 from numpy.typing import ArrayLike as _ArrayLike
 import pypowsybl._pypowsybl as _pp
+from pypowsybl.utils.metadata import DataframeMetadata
 
 
 def _to_array(value: _ArrayLike) -> np.ndarray:
@@ -34,7 +35,8 @@ def _adapt_kwargs(metadata: List[_pp.SeriesMetadata], **kwargs: _ArrayLike) -> D
     """
     Converts named arguments to a dataframe.
     """
-    index_columns = [col.name for col in metadata if col.is_index]
+    index_columns = metadata.index_names if isinstance(metadata, DataframeMetadata) \
+        else [col.name for col in metadata if col.is_index]
 
     columns = {}
     expected_size = None
@@ -71,11 +73,32 @@ def _adapt_df_or_kwargs(metadata: List[_pp.SeriesMetadata], df: DataFrame = None
     return df
 
 
+def _to_c_compatible_array(values: np.ndarray, series_type: int) -> np.ndarray:
+    """
+    Adapts numerical data to the memory layout expected by the C API (contiguous float64 or int32),
+    so that it can be passed to the native library without any intermediate copy.
+    Other data is kept as is and will be converted when creating the C dataframe.
+    """
+    if not isinstance(values, np.ndarray):
+        return values
+    if series_type == 1 and values.dtype.kind in 'iuf':
+        return np.ascontiguousarray(values, dtype=np.float64)
+    if series_type == 2 and values.dtype.kind in 'iu':
+        if values.dtype.itemsize >= 4 and values.size > 0 and values.dtype != np.int32:
+            info = np.iinfo(np.int32)
+            if values.min() < info.min or values.max() > info.max:
+                raise ValueError(f'Integer values must be between {info.min} and {info.max}, '
+                                 f'got values between {values.min()} and {values.max()}')
+        return np.ascontiguousarray(values, dtype=np.int32)
+    return values
+
+
 def _create_c_dataframe(df: DataFrame, series_metadata: List[_pp.SeriesMetadata]) -> _pp.Dataframe:
     """
     Creates the C representation of a dataframe.
     """
-    metadata_by_name = {s.name: s for s in series_metadata}
+    types_by_name = series_metadata.types_by_name if isinstance(series_metadata, DataframeMetadata) \
+        else {s.name: s.type for s in series_metadata}
     is_index = []
     columns_names = []
     columns_values = []
@@ -85,25 +108,67 @@ def _create_c_dataframe(df: DataFrame, series_metadata: List[_pp.SeriesMetadata]
     for idx, index_name in enumerate(df.index.names):
         if index_name is None:
             index_name = series_metadata[idx].name
+        index_type = types_by_name[index_name]
         if is_multi_index:
-            columns_values.append(df.index.get_level_values(index_name))
+            columns_values.append(_to_c_compatible_array(df.index.get_level_values(index_name).values, index_type))
         else:
-            columns_values.append(df.index.values)
+            columns_values.append(_to_c_compatible_array(df.index.values, index_type))
         columns_names.append(index_name)
-        columns_types.append(metadata_by_name[index_name].type)
+        columns_types.append(index_type)
         is_index.append(True)
     columns_names.extend(df.columns.values)
     for series_name in df.columns.values:
-        if series_name not in metadata_by_name:
+        if series_name not in types_by_name:
             raise ValueError(f'No column named {series_name}')
         series = df[series_name]
-        series_type = metadata_by_name[series_name].type
+        series_type = types_by_name[series_name]
         columns_types.append(series_type)
-        columns_values.append(series.values)
+        columns_values.append(_to_c_compatible_array(series.values, series_type))
         is_index.append(False)
     return _pp.create_dataframe(columns_values, columns_names, columns_types, is_index)
 
 
+_FILTER_OPERATORS = ('==', '!=', '<', '<=', '>', '>=')
+
+
+def _filter_value_to_str(value: _Any) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def _create_filter_c_dataframe(filter: _Dict[str, _Any]) -> _pp.Dataframe:  # pylint: disable=redefined-builtin
+    """
+    Creates the C representation of a filter on attribute values, as a dataframe of conditions.
+
+    A condition may be expressed as:
+     - a single value, for equality
+     - a tuple (operator, value), where operator is one of ==, !=, <, <=, >, >=
+     - a list of values, to select rows whose value is one of them
+    """
+    attributes = []
+    operators = []
+    values = []
+    for attribute, condition in filter.items():
+        if isinstance(condition, tuple):
+            if len(condition) != 2 or condition[0] not in _FILTER_OPERATORS:
+                raise ValueError(f'Invalid filter on {attribute}: expecting a tuple (operator, value) '
+                                 f'with operator in {_FILTER_OPERATORS}, got {condition}')
+            conditions = [condition]
+        elif isinstance(condition, (list, set, np.ndarray, Index)):
+            conditions = [('in', value) for value in condition]
+            if not conditions:
+                raise ValueError(f'Invalid filter on {attribute}: empty list of values')
+        else:
+            conditions = [('==', condition)]
+        for operator, value in conditions:
+            attributes.append(attribute)
+            operators.append(operator)
+            values.append(_filter_value_to_str(value))
+    return _pp.create_dataframe([attributes, operators, values], ['attribute', 'operator', 'value'], [0, 0, 0],
+                                [False, False, False])
+
+
 def _create_properties_c_dataframe(df: DataFrame) -> _pp.Dataframe:
     """
        Creates the C representation of a dataframe of properties.
@@ -0,0 +1,117 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides a dataframe proxy which fetches its columns from the native library on demand.
+"""
+from typing import Any, Callable, Dict, Hashable, List, Optional, Union
+
+import pandas as pd
+from pandas import DataFrame
+
+
+class LazyDataFrame:
+    """
+    A read-only view on network elements, which only fetches the columns which are actually accessed.
+
+    The index is fetched on first access, then each column is fetched on its first access
+    and kept in a cache. The cache is cleared as soon as the network is modified,
+    or its working variant is changed, so that values are always up to date.
+
+    Instances are created by :meth:`Network.get_elements_lazy`.
+    """
+
+    def __init__(self, fetch: Callable[[List[str]], DataFrame], columns: List[str], state: Callable[[], Hashable]):
+        """
+        Args:
+            fetch: function creating a dataframe with the given columns, or with only the index for an empty list
+            columns: names of the columns which may be fetched
+            state: function returning the current state of the source of the data,
+                   cached columns are discarded when it changes
+        """
+        self._fetch = fetch
+        self._columns = columns
+        self._state = state
+        self._current_state: Optional[Hashable] = None
+        self._index: Optional[pd.Index] = None
+        self._cache: Dict[str, pd.Series] = {}
+
+    def _check_state(self) -> None:
+        state = self._state()
+        if state != self._current_state:
+            self._index = None
+            self._cache.clear()
+            self._current_state = state
+
+    @property
+    def columns(self) -> List[str]:
+        """
+        Names of the columns which may be accessed.
+        """
+        return list(self._columns)
+
+    @property
+    def cached_columns(self) -> List[str]:
+        """
+        Names of the columns which have already been fetched, and are still valid.
+        """
+        self._check_state()
+        return list(self._cache.keys())
+
+    @property
+    def index(self) -> pd.Index:
+        """
+        The index of the dataframe.
+        """
+        self._check_state()
+        if self._index is None:
+            self._index = self._fetch([]).index
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, column: str) -> bool:
+        return column in self._columns
+
+    def __getitem__(self, key: Union[str, List[str]]) -> Union[pd.Series, DataFrame]:
+        if isinstance(key, str):
+            return self._get_columns([key])[key]
+        return self._get_columns(list(key))
+
+    def _get_columns(self, columns: List[str]) -> DataFrame:
+        unknown = [c for c in columns if c not in self._columns]
+        if unknown:
+            raise KeyError(f'No column named {", ".join(unknown)}')
+        self._check_state()
+        missing = [c for c in columns if c not in self._cache]
+        if missing:
+            df = self._fetch(missing)
+            for column in missing:
+                self._cache[column] = df[column]
+            if self._index is None:
+                self._index = df.index
+        return DataFrame({c: self._cache[c] for c in columns}, index=self._index)
+
+    def to_pandas(self, columns: List[str] = None) -> DataFrame:
+        """
+        Creates a pandas dataframe.
+
+        Args:
+            columns: the columns of the dataframe, all columns by default
+
+        Returns:
+            a dataframe with the requested columns
+        """
+        return self._get_columns(self._columns if columns is None else columns)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_') or name not in self._columns:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self[name]
+
+    def __repr__(self) -> str:
+        return f'LazyDataFrame(rows={len(self)}, columns={len(self._columns)}, cached_columns={len(self._cache)})'
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+"""
+Provides a process-wide registry of dataframes metadata.
+
+Metadata only depends on the element type or extension name, so it is fetched
+from the native library once, on first use, and then kept for the lifetime of the process.
+"""
+import functools
+from typing import Dict, Iterable, List
+
+import pypowsybl._pypowsybl as _pp
+
+
+class DataframeMetadata(List[_pp.SeriesMetadata]):
+    """
+    The list of series metadata of a dataframe, with precomputed lookups by series name,
+    used when converting dataframes to their C representation.
+    """
+
+    def __init__(self, series: Iterable[_pp.SeriesMetadata]):
+        super().__init__(series)
+        self.types_by_name: Dict[str, int] = {s.name: s.type for s in self}
+        self.index_names: List[str] = [s.name for s in self if s.is_index]
+
+
+@functools.lru_cache(maxsize=None)
+def get_elements_metadata(element_type: _pp.ElementType) -> DataframeMetadata:
+    """
+    Metadata of the dataframes of network elements of the given type.
+    """
+    return DataframeMetadata(_pp.get_network_elements_dataframe_metadata(element_type))
+
+
+@functools.lru_cache(maxsize=None)
+def get_elements_creation_metadata(element_type: _pp.ElementType) -> List[DataframeMetadata]:
+    """
+    Metadata of the dataframes used to create network elements of the given type.
+    """
+    return [DataframeMetadata(m) for m in _pp.get_network_elements_creation_dataframes_metadata(element_type)]
+
+
+@functools.lru_cache(maxsize=None)
+def get_extensions_metadata(extension_name: str) -> DataframeMetadata:
+    """
+    Metadata of the dataframes of the given network extension.
+    """
+    return DataframeMetadata(_pp.get_network_extensions_dataframe_metadata(extension_name))
+
+
+@functools.lru_cache(maxsize=None)
+def get_extensions_creation_metadata(extension_name: str) -> List[DataframeMetadata]:
+    """
+    Metadata of the dataframes used to create the given network extension.
+    """
+    return [DataframeMetadata(m) for m in _pp.get_network_extensions_creation_dataframes_metadata(extension_name)]
+
+
+@functools.lru_cache(maxsize=None)
+def get_line_feeder_bays_metadata() -> DataframeMetadata:
+    """
+    Metadata of the dataframe used to create lines with their feeder bays.
+    """
+    return DataframeMetadata(_pp.get_line_feeder_bays_metadata())
+
+
+@functools.lru_cache(maxsize=None)
+def get_twt_feeder_bays_metadata() -> DataframeMetadata:
+    """
+    Metadata of the dataframe used to create two windings transformers with their feeder bays.
+    """
+    return DataframeMetadata(_pp.get_twt_feeder_bays_metadata())
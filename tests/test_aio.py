@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+import asyncio
+import threading
+
+import pytest
+
+import pypowsybl as pp
+from pypowsybl.aio import WorkerPool
+
+
+def test_async_computations():
+    n = pp.network.create_ieee14()
+    expected = pp.loadflow.run_ac(n)[0].iteration_count
+
+    analysis = pp.security.create_analysis()
+    analysis.add_single_element_contingency('L1-2-1', 'c1')
+    sensitivity = pp.sensitivity.create_dc_analysis()
+    sensitivity.add_branch_flow_factor_matrix(['L1-2-1'], ['B1-G'])
+
+    async def compute():
+        return await asyncio.gather(pp.aio.loadflow.run_ac_async(n),
+                                    pp.aio.security.run_dc_async(analysis, pp.network.create_ieee14()),
+                                    pp.aio.sensitivity.run_async(sensitivity, pp.network.create_ieee14()))
+
+    lf_results, sa_result, sensi_result = asyncio.run(compute())
+    assert expected == lf_results[0].iteration_count
+    assert {'c1'} == set(sa_result.post_contingency_results.keys())
+    assert sensi_result.get_branch_flows_sensitivity_matrix() is not None
+
+
+def test_pool_backpressure():
+    pool = WorkerPool(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def compute():
+        blocking = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.1)
+        waiting = asyncio.ensure_future(pool.run(lambda: 42))
+        await asyncio.sleep(0.1)
+        assert 1 == pool.pending
+        assert 1 == pool.waiting
+        # a waiting call is never run once cancelled
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert 0 == pool.waiting
+        release.set()
+        await blocking
+        return await pool.run(lambda: 42)
+
+    try:
+        assert 42 == asyncio.run(compute())
+        assert 0 == pool.pending
+    finally:
+        pool.shutdown()
+
+    with pytest.raises(ValueError):
+        WorkerPool(max_workers=0)
+
+
+def test_abort_token():
+    from pypowsybl.util import _create_abort_token, _run_cancellable
+
+    # without token nor deadline, the abort token itself is given to the computation, so that it has no parent
+    # and runs in a single pass, as when no partial results are expected
+    token = _create_abort_token(None)
+    run_token, interrupted = _run_cancellable(lambda t: t, token, None)
+    assert run_token is token._handle
+    assert not interrupted
+
+    # otherwise, the computation is given a child token, which stops it with partial results
+    token = _create_abort_token(pp.CancelToken())
+    run_token, _ = _run_cancellable(lambda t: t, token, None)
+    assert run_token is not token._handle
+    token = _create_abort_token(None)
+    run_token, _ = _run_cancellable(lambda t: t, token, 1e12)
+    assert run_token is not token._handle
@@ -0,0 +1,45 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+import pickle
+
+import pandas as pd
+import pytest
+
+import pypowsybl as pp
+from pypowsybl.isolate import IsolateExecutor, get_isolate, MAIN_ISOLATE
+
+
+def test_isolate_executor():
+    n = pp.network.create_ieee14()
+    assert MAIN_ISOLATE == get_isolate(n)
+    expected = pp.loadflow.run_ac(n)[0].iteration_count
+
+    with IsolateExecutor(2) as executor:
+        assert 2 == len(executor.isolates)
+        assert MAIN_ISOLATE not in executor.isolates
+        pinned = [executor.pin(n, isolate) for isolate in executor.isolates]
+        assert executor.isolates == [get_isolate(p) for p in pinned]
+
+        results = list(executor.map(pp.loadflow.run_ac, pinned))
+        assert [expected, expected] == [r[0].iteration_count for r in results]
+        # methods of pinned networks may be called from any thread
+        pd.testing.assert_frame_equal(n.get_buses(), pinned[0].get_buses())
+        # buffers returned by an isolate are freed by this isolate, from any thread
+        data = pickle.dumps(pinned[1])
+        assert MAIN_ISOLATE == get_isolate(pickle.loads(data))
+        del data
+
+        created = executor.submit(pp.network.create_ieee9).result()
+        assert get_isolate(created) in executor.isolates
+
+        with pytest.raises(ValueError, match='pinned'):
+            executor.submit(pp.loadflow.run_ac, n)
+
+        analysis = pp.security.create_analysis()
+        analysis.add_single_element_contingency('L1-2-1')
+        with pytest.raises(pp.PyPowsyblError, match='different isolates'):
+            analysis.run_ac(pinned[0])
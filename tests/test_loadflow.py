@@ -6,6 +6,7 @@
 #
 import unittest
 import json
+import numpy as np
 
 import pypowsybl as pp
 import pypowsybl.loadflow as lf
@@ -50,6 +51,93 @@ def test_run_lf():
     assert 1 == len(results)
 
 
+def test_run_ac_variants():
+    n = pp.network.create_ieee14()
+    variant_ids = [f'v{i}' for i in range(4)]
+    for i, variant_id in enumerate(variant_ids):
+        n.clone_variant('InitialState', variant_id)
+        n.set_working_variant(variant_id)
+        n.update_loads(id='B3-L', p0=94.2 + 10 * i)
+    n.set_working_variant('InitialState')
+
+    results = lf.run_ac_variants(n, variant_ids, max_workers=2)
+    assert variant_ids == list(results.keys())
+    assert all(lf.ComponentStatus.CONVERGED == r[0].status for r in results.values())
+    assert 'InitialState' == n.get_working_variant_id()
+
+    # results are the same as sequential computations
+    p1 = n.get_lines(attributes=['p1'], variants=variant_ids)['p1'].unstack('variant_id')
+    for variant_id in variant_ids:
+        n.set_working_variant(variant_id)
+        lf.run_ac(n)
+        assert n.get_lines()['p1'].values == pytest.approx(p1[variant_id].values)
+    assert p1['v0']['L2-3-1'] < p1['v3']['L2-3-1']
+
+    # the working variant is restored, also when it is not the initial one
+    n.set_working_variant('v1')
+    lf.run_ac_variants(n, ['v0', 'v2', 'v3'], max_workers=3)
+    assert 'v1' == n.get_working_variant_id()
+    assert 104.2 == pytest.approx(n.get_loads().loc['B3-L', 'p0'])
+    n.set_working_variant('InitialState')
+
+    with pytest.raises(pp.PyPowsyblError, match="Variant 'unknown' not found"):
+        lf.run_ac_variants(n, ['v0', 'unknown'])
+    with pytest.raises(ValueError):
+        lf.run_ac_variants(n, ['v0', 'v0'])
+
+
+def test_run_ac_warm_start():
+    n = pp.network.create_ieee14()
+    variant_ids = ['v0', 'v3', 'v1', 'v2']
+    for variant_id in variant_ids:
+        n.clone_variant('InitialState', variant_id)
+        n.set_working_variant(variant_id)
+        n.update_loads(id='B3-L', p0=94.2 + 10 * int(variant_id[1]))
+    n.set_working_variant('InitialState')
+
+    result = lf.run_ac_warm_start(n, variant_ids, baseline=lf.VoltageInitMode.UNIFORM_VALUES)
+    assert sorted(variant_ids) == sorted(result.order)
+    assert result.seeds[result.order[0]] is None
+    assert all(result.seeds[variant_id] is not None for variant_id in result.order[1:])
+    assert all(lf.ComponentStatus.CONVERGED == r[0].status for r in result.results.values())
+    assert result.saved_iterations == sum(result.baseline_iteration_counts.values()) - sum(result.iteration_counts.values())
+    assert result.saved_iterations > 0
+    assert 'InitialState' == n.get_working_variant_id()
+    assert ['InitialState'] + variant_ids == n.get_variant_ids()
+
+    # each variant is started from its nearest neighbour
+    assert all(abs(int(v[1]) - int(result.seeds[v][1])) == 1 for v in result.order[1:])
+
+    # same solution as a cold start
+    n.set_working_variant('v2')
+    p1 = n.get_lines()['p1']
+    lf.run_ac(n)
+    assert n.get_lines()['p1'].values == pytest.approx(p1.values, abs=1e-3)
+
+    assert lf.run_ac_warm_start(n, ['v0']).baseline_iteration_counts is None
+
+
+def test_warm_start_distances():
+    n = pp.network.create_ieee14()
+    variant_ids = ['v0', 'v1', 'v2']
+    for i, variant_id in enumerate(variant_ids):
+        n.clone_variant('InitialState', variant_id)
+        n.set_working_variant(variant_id)
+        n.update_loads(id='B3-L', p0=94.2 + 100 * i)
+        n.update_generators(id='B1-G', target_v=143.1 + 2 * (i % 2))
+    n.set_working_variant('InitialState')
+
+    injections = lf._injections_matrix(n, variant_ids)
+    # columns are standardised: a voltage change weighs as much as a much larger power change
+    assert injections.mean(axis=0) == pytest.approx(0)
+    assert injections.std(axis=0)[injections.std(axis=0) > 0] == pytest.approx(1)
+
+    distances = lf._pairwise_distances(injections)
+    expected = np.linalg.norm(injections[:, np.newaxis, :] - injections[np.newaxis, :, :], axis=2)
+    assert distances == pytest.approx(expected, abs=1e-6)
+    assert np.diag(distances) == pytest.approx(0, abs=1e-6)
+
+
 def test_lf_parameters():
     parameters = lf.Parameters()
     assert parameters.dc_use_transformer_ratio
@@ -5,6 +5,11 @@
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 #
 import copy
+import gzip
+import io
+import logging
+import os
+import pickle
 import re
 import unittest
 import datetime
@@ -54,6 +59,80 @@ def test_dump_to_string():
     assert xml == n.dump_to_string()
 
 
+def test_load_from_bytes():
+    bat_path = TEST_DIR.joinpath('battery.xiidm')
+    n = pp.network.load_from_bytes('battery.xiidm', bat_path.read_bytes())
+    assert bat_path.read_text() == n.dump_to_string()
+    assert bat_path.read_bytes() == n.dump_to_bytes()
+
+    compressed = pp.network.load_from_bytes('battery.xiidm.gz', gzip.compress(bat_path.read_bytes()))
+    assert n.id == compressed.id
+
+    be = pp.network.create_micro_grid_be_network()
+    data = be.dump_to_bytes('CGMES')
+    assert data.startswith(b'PK')
+    loaded = pp.network.load_from_bytes('micro_grid_be.zip', data)
+    assert set(be.get_generators().index) == set(loaded.get_generators().index)
+
+
+def test_load_from_stream():
+    bat_path = TEST_DIR.joinpath('battery.xiidm')
+    n = pp.network.load(str(bat_path))
+    stream = io.BytesIO()
+    n.dump_to_stream(stream)
+    stream.seek(0)
+    assert n.id == pp.network.load_from_stream(stream, 'battery.xiidm').id
+    assert stream.tell() == len(stream.getvalue())
+
+    with open(bat_path, 'rb') as f:
+        assert n.id == pp.network.load_from_stream(f).id
+    with pytest.raises(ValueError, match='file name is needed'):
+        pp.network.load_from_stream(io.BytesIO(bat_path.read_bytes()))
+
+
+def test_load_cgmes_with_progress(tmpdir):
+    be = pp.network.create_micro_grid_be_network()
+    path = str(tmpdir.join('micro_grid_be.zip'))
+    with open(path, 'wb') as f:
+        be.dump_to_stream(f, 'CGMES')
+
+    progress = []
+    n = pp.network.load(path, progress=lambda file, count, total: progress.append((file, count, total)))
+    assert set(be.get_generators().index) == set(n.get_generators().index)
+    assert len(progress) > 1
+    assert [count for _, count, _ in progress] == list(range(1, len(progress) + 1))
+    assert all(total == len(progress) for _, _, total in progress)
+
+    without_sv = []
+    n = pp.network.load(path, skip_profiles=['SV'], parallelism=1,
+                        progress=lambda file, count, total: without_sv.append(file))
+    assert len(progress) - 1 == len(without_sv)
+    assert set(be.get_generators().index) == set(n.get_generators().index)
+
+    # progress does not depend on the level of the logger, which is left unchanged
+    logger = logging.getLogger('powsybl')
+    previous_level = logger.level
+    logger.setLevel(logging.WARNING)
+    try:
+        with_warning_level = []
+        pp.network.load(path, progress=lambda file, count, total: with_warning_level.append(file))
+        assert len(progress) == len(with_warning_level)
+        assert logging.WARNING == logger.level
+    finally:
+        logger.setLevel(previous_level)
+
+    def failing_progress(file, count, total):
+        raise RuntimeError('progress failure')
+
+    with pytest.raises(RuntimeError, match='progress failure'):
+        pp.network.load(path, progress=failing_progress)
+
+    with pytest.raises(ValueError, match='cannot be skipped'):
+        pp.network.load(path, skip_profiles=['EQ'])
+    with pytest.raises(ValueError, match='strictly positive'):
+        pp.network.load(path, parallelism=0)
+
+
 def test_get_import_format():
     formats = pp.network.get_import_formats()
     assert ['CGMES', 'MATPOWER', 'IEEE-CDF', 'PSS/E', 'UCTE', 'XIIDM', 'POWER-FACTORY'] == formats
@@ -102,6 +181,34 @@ def test_connect_disconnect():
     assert n.connect('L1-2-1')
 
 
+def test_connect_disconnect_elements():
+    n = pp.network.create_ieee14()
+    assert [True, True] == n.disconnect_elements(['L1-2-1', 'B1-G']).tolist()
+    assert [False, True] == n.connect_elements(['L1-5-1', 'L1-2-1']).tolist()
+    assert [False, True] == n.connect_elements(['L1-5-1', 'B1-G'], [True, True]).tolist()
+    assert [True, False] == n.connect_elements(['L1-5-1', 'B1-G'], [False, True]).tolist()
+    assert not n.get_lines().loc['L1-5-1', 'connected1']
+    with pytest.raises(pp.PyPowsyblError, match="Equipment 'unknown' not found"):
+        n.connect_elements(['L1-5-1', 'unknown'])
+    # nothing is modified when an id is invalid
+    assert not n.get_lines().loc['L1-5-1', 'connected1']
+
+
+def test_switch_positions():
+    n = pp.network.create_four_substations_node_breaker_network()
+    ids = ['S1VL1_LD1_BREAKER', 'S1VL1_TWT_BREAKER']
+    changed = n.open_switches(ids)
+    assert changed.dtype == bool
+    assert [True, True] == changed.tolist()
+    assert n.get_switches().loc[ids, 'open'].all()
+    assert [False, True] == n.set_switch_positions(ids, [True, False]).tolist()
+    assert [True, False] == n.close_switches(ids).tolist()
+    assert [False, False] == n.close_switches(ids).tolist()
+    with pytest.raises(pp.PyPowsyblError, match="Switch 'aa' not found"):
+        n.open_switches(['S1VL1_LD1_BREAKER', 'aa'])
+    assert not n.get_switches().loc['S1VL1_LD1_BREAKER', 'open']
+
+
 def test_network_attributes():
     n = pp.network.create_eurostag_tutorial_example1_network()
     assert 'sim1' == n.id
@@ -161,6 +268,121 @@ def test_buses():
     pd.testing.assert_frame_equal(expected, buses, check_dtype=False)
 
 
+def test_get_elements_arrow():
+    pytest.importorskip('pyarrow')
+    from pypowsybl.utils.arrow import to_pandas
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    table = n.get_elements_arrow(pp.network.ElementType.BUS)
+    assert ['id', 'name', 'v_mag', 'v_angle', 'connected_component', 'synchronous_component',
+            'voltage_level_id'] == table.column_names
+    pd.testing.assert_frame_equal(n.get_buses(), to_pandas(table))
+
+    table = n.get_elements_arrow(pp.network.ElementType.GENERATOR, attributes=['voltage_regulator_on', 'target_p'])
+    assert ['id', 'voltage_regulator_on', 'target_p'] == table.column_names
+    assert [True] == table.column('voltage_regulator_on').to_pylist()
+    pd.testing.assert_frame_equal(n.get_generators(attributes=['voltage_regulator_on', 'target_p']),
+                                  to_pandas(table), check_dtype=False)
+
+    table = n.get_elements_arrow(pp.network.ElementType.LOAD, id=['LOAD'])
+    assert ['LOAD'] == table.column('id').to_pylist()
+
+
+def test_get_elements_with_filter():
+    n = pp.network.create_four_substations_node_breaker_network()
+    switches = n.get_switches()
+    open_switches = n.get_switches(filter={'open': True})
+    pd.testing.assert_frame_equal(switches[switches['open']], open_switches)
+
+    vls = n.get_voltage_levels()
+    filtered = n.get_elements(pp.network.ElementType.VOLTAGE_LEVEL,
+                              filter={'nominal_v': ('>=', 225), 'substation_id': ['S1', 'S2']})
+    pd.testing.assert_frame_equal(vls[(vls['nominal_v'] >= 225) & vls['substation_id'].isin(['S1', 'S2'])], filtered)
+
+    generators = n.get_generators(attributes=['target_p'], filter={'voltage_level_id': 'S1VL2'})
+    assert ['GH1', 'GH2', 'GH3'] == generators.index.to_list()
+    assert ['target_p'] == generators.columns.to_list()
+
+    with pytest.raises(ValueError):
+        n.get_switches(filter={'open': ('~', True)})
+    with pytest.raises(pp.PyPowsyblError, match='No series named unknown'):
+        n.get_switches(filter={'unknown': True})
+    with pytest.raises(pp.PyPowsyblError, match='integer values must be between'):
+        n.get_ratio_tap_changers(filter={'tap': ('>', 2 ** 32)})
+    with pytest.raises(pp.PyPowsyblError, match='Invalid integer value: 1.5'):
+        n.get_ratio_tap_changers(filter={'tap': 1.5})
+
+
+def test_get_elements_many():
+    n = pp.network.create_four_substations_node_breaker_network()
+    dfs = n.get_elements_many([pp.network.ElementType.BUS, pp.network.ElementType.LINE])
+    assert [pp.network.ElementType.BUS, pp.network.ElementType.LINE] == list(dfs.keys())
+    pd.testing.assert_frame_equal(n.get_buses(), dfs[pp.network.ElementType.BUS])
+    pd.testing.assert_frame_equal(n.get_lines(), dfs[pp.network.ElementType.LINE])
+
+    dfs = n.get_elements_many({pp.network.ElementType.GENERATOR: ['target_p', 'voltage_level_id'],
+                               pp.network.ElementType.LOAD: None}, all_attributes=True)
+    pd.testing.assert_frame_equal(n.get_generators(attributes=['target_p', 'voltage_level_id']),
+                                  dfs[pp.network.ElementType.GENERATOR])
+    pd.testing.assert_frame_equal(n.get_loads(all_attributes=True), dfs[pp.network.ElementType.LOAD])
+
+    with pytest.raises(KeyError):
+        n.get_elements_many({pp.network.ElementType.BUS: None, pp.network.ElementType.LINE: ['unknown']})
+
+
+def test_get_elements_categorical():
+    n = pp.network.create_four_substations_node_breaker_network()
+    generators = n.get_elements(pp.network.ElementType.GENERATOR, categorical=True)
+    assert isinstance(generators['voltage_level_id'].dtype, pd.CategoricalDtype)
+    assert not isinstance(generators['target_p'].dtype, pd.CategoricalDtype)
+    decoded = generators.apply(lambda c: c.astype(object) if isinstance(c.dtype, pd.CategoricalDtype) else c)
+    pd.testing.assert_frame_equal(n.get_generators(), decoded, check_dtype=False)
+
+    loads = n.get_elements(pp.network.ElementType.LOAD, categorical=['voltage_level_id'])
+    assert isinstance(loads['voltage_level_id'].dtype, pd.CategoricalDtype)
+    assert not isinstance(loads['bus_id'].dtype, pd.CategoricalDtype)
+    # each column has its own categories
+    assert 'GH1' not in generators['voltage_level_id'].cat.categories
+    assert set(generators['energy_source']) == set(generators['energy_source'].cat.categories)
+    # the dictionary of a column is shared by all dataframes of the network: codes are stable
+    generators_categories = generators['voltage_level_id'].cat.categories
+    assert generators_categories.to_list() == loads['voltage_level_id'].cat.categories[:len(generators_categories)].to_list()
+    assert generators.loc['GH1', 'voltage_level_id'] == loads.loc['LD2', 'voltage_level_id']
+    assert generators['voltage_level_id'].cat.codes['GH1'] == loads['voltage_level_id'].cat.codes['LD2']
+
+
+def test_get_elements_lazy():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    generators = n.get_elements_lazy(pp.network.ElementType.GENERATOR)
+    assert ['GEN', 'GEN2'] == generators.index.to_list()
+    assert [] == generators.cached_columns
+    assert 'target_p' in generators.columns
+    pd.testing.assert_series_equal(n.get_generators()['target_p'], generators['target_p'])
+    assert ['target_p'] == generators.cached_columns
+    pd.testing.assert_frame_equal(n.get_generators(attributes=['target_p', 'target_q']),
+                                  generators[['target_p', 'target_q']])
+    assert 2 == len(generators)
+
+    # cache is invalidated by modifications
+    n.update_generators(id='GEN', target_p=700)
+    assert [] == generators.cached_columns
+    assert 700 == generators['target_p']['GEN']
+
+    # and by variant changes
+    n.clone_variant(n.get_working_variant_id(), 'variant')
+    n.set_working_variant('variant')
+    n.update_generators(id='GEN', target_p=800)
+    n.set_working_variant('InitialState')
+    assert 700 == generators['target_p']['GEN']
+    n.set_working_variant('variant')
+    assert 800 == generators['target_p']['GEN']
+
+    pd.testing.assert_frame_equal(n.get_generators(all_attributes=True), generators.to_pandas(), check_like=True)
+    lines = n.get_elements_lazy(pp.network.ElementType.LINE, filter={'voltage_level1_id': 'VLHV1'})
+    assert ['NHV1_NHV2_1', 'NHV1_NHV2_2'] == lines.index.to_list()
+    with pytest.raises(KeyError):
+        generators['unknown']
+
+
 def test_loads_data_frame():
     n = pp.network.create_eurostag_tutorial_example1_network()
     loads = n.get_loads(all_attributes=True)
@@ -510,6 +732,19 @@ def test_update_unknown_data():
     assert 'No column named unknown' in str(context)
 
 
+def test_dataframe_metadata_registry():
+    from pypowsybl.utils.metadata import get_elements_metadata, get_elements_creation_metadata
+    metadata = get_elements_metadata(pp.network.ElementType.GENERATOR)
+    assert metadata is get_elements_metadata(pp.network.ElementType.GENERATOR)
+    assert ['id'] == metadata.index_names
+    assert 1 == metadata.types_by_name['target_p']
+    assert [m.name for m in metadata] == \
+           [m.name for m in pp._pypowsybl.get_network_elements_dataframe_metadata(pp.network.ElementType.GENERATOR)]
+    creation_metadata = get_elements_creation_metadata(pp.network.ElementType.GENERATOR)
+    assert creation_metadata is get_elements_creation_metadata(pp.network.ElementType.GENERATOR)
+    assert 'target_p' in creation_metadata[0].types_by_name
+
+
 def test_update_non_modifiable_data():
     n = pp.network.create_eurostag_tutorial_example1_network()
     update = pd.DataFrame(data=[['blob']], columns=['voltage_level_id'], index=['GEN'])
@@ -631,6 +866,9 @@ def test_ratio_tap_changers():
                                      'alpha'],
                             data=[[0, 0, 2, 3, True, False, 180.0, 0.0, 'VLLOAD_0', 0.34, NaN]])
     pd.testing.assert_frame_equal(expected, n.get_ratio_tap_changers(), check_dtype=False, atol=1e-2)
+    # integers which do not fit in 32 bits are rejected, instead of wrapping around
+    with pytest.raises(ValueError, match='Integer values must be between'):
+        n.update_ratio_tap_changers(id=['NHV2_NLOAD'], tap=np.array([2 ** 32 + 1], dtype=np.int64))
 
 
 def test_phase_tap_changers():
@@ -680,6 +918,106 @@ def test_variant():
     assert 1 == len(n.get_variant_ids())
 
 
+def test_variant_pool():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    with n.variant_pool(2, prefix='pool') as pool:
+        assert ['InitialState', 'pool_0', 'pool_1'] == n.get_variant_ids()
+        with pool.checkout() as variant_id:
+            assert variant_id == n.get_working_variant_id()
+            assert 1 == pool.available
+            n.update_generators(id='GEN', target_p=700)
+            with pool.checkout():
+                assert 0 == pool.available
+                with pytest.raises(RuntimeError, match='checked out'):
+                    with pool.checkout():
+                        pass
+        assert 'InitialState' == n.get_working_variant_id()
+        assert 607 == n.get_generators().loc['GEN', 'target_p']
+
+        # modified variants are reset on next checkout, unmodified ones are reused as they are
+        for _ in range(3):
+            with pool.checkout():
+                assert 607 == n.get_generators().loc['GEN', 'target_p']
+        assert 1 == pool.reset_count
+
+        # modifications of the base variant are propagated
+        n.update_generators(id='GEN', target_p=650)
+        with pool.checkout():
+            assert 650 == n.get_generators().loc['GEN', 'target_p']
+    assert ['InitialState'] == n.get_variant_ids()
+    with pytest.raises(RuntimeError, match='closed'):
+        with pool.checkout():
+            pass
+
+
+def test_variant_pool_always_reset():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    # unmodified variants are handed over again without being reset
+    with n.variant_pool(1) as pool:
+        for _ in range(3):
+            with pool.checkout():
+                pass
+        assert 0 == pool.reset_count
+
+    # unless variants are always reset, which protects against modifications sending no notification,
+    # for example some updates of extensions attributes, which cannot be detected
+    with n.variant_pool(1, always_reset=True) as pool:
+        for i in range(3):
+            with pool.checkout():
+                assert 607 == n.get_generators().loc['GEN', 'target_p']
+                if i == 0:
+                    n.update_generators(id='GEN', target_p=700)
+        assert 2 == pool.reset_count
+
+
+def test_get_elements_variants():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    n.clone_variant('InitialState', 'variant')
+    n.set_working_variant('variant')
+    n.update_generators(id='GEN', target_p=700)
+    n.set_working_variant('InitialState')
+
+    generators = n.get_generators(attributes=['target_p', 'voltage_level_id'], variants=['InitialState', 'variant'])
+    assert ['variant_id', 'id'] == generators.index.names
+    assert [('InitialState', 'GEN'), ('InitialState', 'GEN2'), ('variant', 'GEN'), ('variant', 'GEN2')] == \
+           generators.index.to_list()
+    pd.testing.assert_frame_equal(n.get_generators(attributes=['target_p', 'voltage_level_id']),
+                                  generators.loc['InitialState'])
+    assert 607 == generators.loc[('InitialState', 'GEN'), 'target_p']
+    assert 700 == generators.loc[('variant', 'GEN'), 'target_p']
+    target_p = generators['target_p'].unstack('variant_id')
+    assert ['InitialState', 'variant'] == target_p.columns.to_list()
+    # working variant is left unchanged
+    assert 'InitialState' == n.get_working_variant_id()
+
+    with pytest.raises(pp.PyPowsyblError):
+        n.get_generators(variants=['InitialState', 'unknown'])
+    assert 'InitialState' == n.get_working_variant_id()
+    with pytest.raises(ValueError):
+        n.get_generators(variants=[])
+
+
+def test_get_elements_variants_with_filter():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    n.add_elements_properties(id='GEN2', owner='A')
+    n.update_generators(id='GEN2', target_p=100)
+    n.clone_variant('InitialState', 'variant')
+    n.set_working_variant('variant')
+    n.update_generators(id=['GEN', 'GEN2'], target_p=[100, 700])
+    n.set_working_variant('InitialState')
+
+    # the filter selects distinct generators in each variant, so that only one of them has the property column
+    generators = n.get_generators(filter={'target_p': ('>', 500)}, variants=['InitialState', 'variant'])
+    assert [('InitialState', 'GEN'), ('variant', 'GEN2')] == generators.index.to_list()
+    assert 'owner' in generators.columns
+    assert pd.isna(generators.loc[('InitialState', 'GEN'), 'owner'])
+    assert 'A' == generators.loc[('variant', 'GEN2'), 'owner']
+    assert 607 == generators.loc[('InitialState', 'GEN'), 'target_p']
+    assert 700 == generators.loc[('variant', 'GEN2'), 'target_p']
+    pd.testing.assert_frame_equal(n.get_generators(filter={'target_p': ('>', 500)}),
+                                  generators.loc['InitialState'].drop(columns='owner'))
+
+
 def test_sld_svg():
     n = pp.network.create_four_substations_node_breaker_network()
     sld = n.get_single_line_diagram('S1VL1')
@@ -719,6 +1057,71 @@ def test_deep_copy():
     n = pp.network.create_eurostag_tutorial_example1_network()
     copy_n = copy.deepcopy(n)
     assert ['NGEN_NHV1', 'NHV2_NLOAD'] == copy_n.get_elements_ids(pp.network.ElementType.TWO_WINDINGS_TRANSFORMER)
+    # a network referenced several times is copied once
+    copies = copy.deepcopy([n, n])
+    assert copies[0] is copies[1]
+    assert copies[0] is not n
+
+
+def test_copy():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    n.clone_variant('InitialState', 'v1')
+    n.clone_variant('InitialState', 'v2')
+    n.set_working_variant('v1')
+    n.update_loads(id='LOAD', p0=700)
+
+    copy_n = n.copy()
+    assert n.id == copy_n.id
+    assert sorted(n.get_variant_ids()) == sorted(copy_n.get_variant_ids())
+    assert 'v1' == copy_n.get_working_variant_id()
+    assert 700 == copy_n.get_loads().loc['LOAD', 'p0']
+    copy_n.update_loads(id='LOAD', p0=800)
+    assert 700 == n.get_loads().loc['LOAD', 'p0']
+
+    copy_n = n.copy(variants=['v2'])
+    assert ['InitialState', 'v2'] == sorted(copy_n.get_variant_ids())
+    assert 'InitialState' == copy_n.get_working_variant_id()
+    assert 600 == copy_n.get_loads().loc['LOAD', 'p0']
+
+    with pytest.raises(pp.PyPowsyblError, match="Variant 'unknown' not found"):
+        n.copy(variants=['unknown'])
+
+
+def test_pickle():
+    n = pp.network.create_four_substations_node_breaker_network()
+    n.clone_variant('InitialState', 'variant')
+    n.set_working_variant('variant')
+    n.update_generators(id='GH1', target_p=120)
+    n.update_switches(id='S1VL1_LD1_BREAKER', open=True)
+
+    # with out-of-band buffers
+    buffers = []
+    data = pickle.dumps(n, protocol=5, buffer_callback=buffers.append)
+    assert 1 == len(buffers)
+    n2 = pickle.loads(data, buffers=buffers)
+    assert n.id == n2.id
+    assert ['InitialState', 'variant'] == sorted(n2.get_variant_ids())
+    assert 'variant' == n2.get_working_variant_id()
+    assert 120 == n2.get_generators().loc['GH1', 'target_p']
+    assert n2.get_switches().loc['S1VL1_LD1_BREAKER', 'open']
+    n2.set_working_variant('InitialState')
+    pd.testing.assert_frame_equal(n.get_generators(attributes=['target_p', 'target_v'], variants=['InitialState']),
+                                  n2.get_generators(attributes=['target_p', 'target_v'], variants=['InitialState']))
+    assert not n2.get_switches().loc['S1VL1_LD1_BREAKER', 'open']
+
+    # compressed, in band
+    pp.network.set_pickle_compression(True)
+    try:
+        compressed = pickle.dumps(n, protocol=4)
+    finally:
+        pp.network.set_pickle_compression(False)
+    assert len(compressed) < len(pickle.dumps(n, protocol=4))
+    n3 = pickle.loads(compressed)
+    assert 120 == n3.get_generators().loc['GH1', 'target_p']
+
+    # buffers are given as a single array to the native library
+    with pytest.raises(ValueError, match='C-contiguous'):
+        pickle.loads(data, buffers=[memoryview(bytes(buffers[0]) * 2)[::2]])
 
 
 def test_lines():
@@ -967,6 +1370,19 @@ def test_update_generators_with_keywords():
     assert [200, 300] == n.get_generators().loc[['GTH1', 'GTH2'], 'target_p'].to_list()
 
 
+def test_update_with_numpy_buffers():
+    n = pp.network.create_four_substations_node_breaker_network()
+    # non contiguous and float32 data must be handled as well as contiguous float64 data
+    values = np.array([[200, 0], [300, 0]], dtype=np.float32)
+    n.update_generators(id=np.array(['GTH1', 'GTH2']), target_p=values[:, 0])
+    assert [200, 300] == n.get_generators().loc[['GTH1', 'GTH2'], 'target_p'].to_list()
+    n.update_generators(pd.DataFrame(index=pd.Series(name='id', data=['GTH1', 'GTH2']),
+                                     data={'target_p': np.array([210.5, 310.5])}))
+    assert [210.5, 310.5] == n.get_generators().loc[['GTH1', 'GTH2'], 'target_p'].to_list()
+    n.update_shunt_compensators(id='SHUNT', section_count=np.array([0], dtype=np.int64))
+    assert 0 == n.get_shunt_compensators().loc['SHUNT', 'section_count']
+
+
 def test_update_generators_minax_reactive_limits():
     n = pp.network.create_micro_grid_be_network()
     generators = n.get_generators()
@@ -1488,6 +1904,48 @@ def test_pathlib_load_dump(tmpdir):
     assert n_path.dump_to_string() == n_str.dump_to_string()
 
 
+def test_load_with_cache(tmpdir):
+    cache = pp.network.NetworkCache(tmpdir.join('cache'))
+    path = TEST_DIR.joinpath('node-breaker.xiidm')
+    n = pp.network.load(path, cache=cache)
+    key = cache.key(path, {})
+    assert cache.get(key) is not None
+    size = cache.size
+    assert size > 0
+
+    cached = pp.network.load(path, cache=cache)
+    assert n.id == cached.id
+    pd.testing.assert_frame_equal(n.get_switches(attributes=['open']), cached.get_switches(attributes=['open']))
+    assert size == cache.size
+
+    # other parameters and other files are other entries
+    assert key != cache.key(path, {'iidm.import.xml.throw-exception-if-extension-not-found': 'true'})
+    assert key != cache.key(TEST_DIR.joinpath('battery.xiidm'))
+
+    # unreadable entries are parsed again
+    cache.put(key, b'invalid')
+    assert n.id == pp.network.load(path, cache=cache).id
+    assert size == cache.size
+
+    # least recently used entries are removed, the times of use are set explicitly
+    # since the resolution of modification times depends on the file system
+    small_cache = pp.network.NetworkCache(tmpdir.join('small_cache'), max_size=size + 1)
+    pp.network.load(path, cache=small_cache)
+    entry_path = next(small_cache.directory.iterdir())
+    os.utime(entry_path, (entry_path.stat().st_atime, entry_path.stat().st_mtime - 100))
+    pp.network.load(TEST_DIR.joinpath('battery.xiidm'), cache=small_cache)
+    assert small_cache.get(small_cache.key(path)) is None
+    assert small_cache.get(small_cache.key(TEST_DIR.joinpath('battery.xiidm'))) is not None
+
+    # entries larger than the cache are not stored
+    tiny_cache = pp.network.NetworkCache(tmpdir.join('tiny_cache'), max_size=1)
+    assert n.id == pp.network.load(path, cache=tiny_cache).id
+    assert 0 == tiny_cache.size
+    assert tiny_cache.get(tiny_cache.key(path)) is None
+    cache.clear()
+    assert 0 == cache.size
+
+
 def test_write_svg_file(tmpdir):
     data = tmpdir.mkdir('data')
     net = pp.network.create_four_substations_node_breaker_network()
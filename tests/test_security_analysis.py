@@ -4,6 +4,9 @@
 # License, v. 2.0. If a copy of the MPL was not distributed with this
 # file, You can obtain one at http://mozilla.org/MPL/2.0/.
 #
+import threading
+import time
+
 import numpy as np
 import pytest
 import pypowsybl as pp
@@ -53,6 +56,31 @@ def test_ac_security_analysis():
     pd.testing.assert_frame_equal(expected, sa_result.limit_violations, check_dtype=False)
 
 
+def test_contingency_status():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    sa = pp.security.create_analysis()
+    sa.add_single_element_contingency('NHV1_NHV2_1', 'First contingency')
+    sa_result = sa.run_ac(n)
+    expected = pd.DataFrame.from_records(
+        index='contingency_id',
+        columns=['contingency_id', 'status', 'limit_violation_count'],
+        data=[
+            ['First contingency', 'CONVERGED', 2],
+        ])
+    pd.testing.assert_frame_equal(expected, sa_result.contingency_status, check_dtype=False)
+
+    # per-contingency results are created on demand, without building all of them
+    result = sa_result.find_post_contingency_result('First contingency')
+    assert 'First contingency' == result.contingency_id
+    assert 2 == len(result.limit_violations)
+    assert sa_result._post_contingency_results is None
+    with pytest.raises(KeyError):
+        sa_result.find_post_contingency_result('Unknown')
+    assert 'CONVERGED' == sa_result.pre_contingency_result.status.name
+    assert ['First contingency'] == list(sa_result.post_contingency_results.keys())
+    assert 'First contingency' in str(sa_result.get_table())
+
+
 def test_variant():
     n = pp.network.create_eurostag_tutorial_example1_network()
     sa = pp.security.create_analysis()
@@ -103,6 +131,91 @@ def test_monitored_elements():
     assert branch_results.loc['NHV1_NHV2_1', 'NHV1_NHV2_2']['p1'] == pytest.approx(610.56, abs=1e-2)
 
 
+def test_sharded_security_analysis():
+    n = pp.network.create_ieee14()
+    sa = pp.security.create_analysis()
+    sa.add_single_element_contingencies(n.get_lines().index.tolist())
+    sa.add_monitored_elements(voltage_level_ids=['VL1'])
+    sa.add_postcontingency_monitored_elements(branch_ids=['L1-2-1'], contingency_ids=['L1-5-1', 'L13-14-1'])
+
+    serial_result = sa.run_ac(n)
+    sharded_result = sa.run_ac(n, workers=3)
+    assert list(serial_result.post_contingency_results.keys()) == list(sharded_result.post_contingency_results.keys())
+    for contingency_id, result in serial_result.post_contingency_results.items():
+        assert result.status == sharded_result.post_contingency_results[contingency_id].status
+    pd.testing.assert_frame_equal(serial_result.limit_violations, sharded_result.limit_violations)
+    pd.testing.assert_frame_equal(serial_result.bus_results, sharded_result.bus_results)
+    pd.testing.assert_frame_equal(serial_result.branch_results, sharded_result.branch_results)
+
+    with pytest.raises(ValueError, match='strictly positive'):
+        sa.run_ac(n, workers=0)
+
+
+def test_security_analysis_stream():
+    n = pp.network.create_ieee14()
+    sa = pp.security.create_analysis()
+    sa.add_single_element_contingencies(n.get_lines().index.tolist())
+    sa.add_monitored_elements(voltage_level_ids=['VL1'])
+    expected = sa.run_ac(n)
+
+    with sa.run_ac_stream(n, batch_size=5, buffer_size=1) as stream:
+        results = list(stream)
+        assert not stream.interrupted
+    assert 4 == len(results)
+    assert [5, 5, 5, 2] == [len(r.post_contingency_results) for r in results]
+    contingency_ids = [c for r in results for c in r.post_contingency_results.keys()]
+    assert list(expected.post_contingency_results.keys()) == contingency_ids
+    violated_contingencies = set(c for r in results for c in r.limit_violations.index.get_level_values('contingency_id'))
+    assert set(expected.limit_violations.index.get_level_values('contingency_id')) == violated_contingencies
+    # closing the stream stops the analysis
+    with sa.run_dc_stream(n, batch_size=1) as stream:
+        first = next(stream)
+        assert 1 == len(first.post_contingency_results)
+
+    with pytest.raises(ValueError, match='Batch size'):
+        sa.run_ac_stream(n, batch_size=0)
+
+
+def test_security_analysis_stream_failing_before_run():
+    def run(handle, run_token):
+        raise ValueError('Invalid parameters')
+
+    # the failure ends the stream, instead of leaving the consumer waiting forever
+    stream = pp.security.SecurityAnalysisResultStream(run, 1, None, None)
+    with pytest.raises(ValueError, match='Invalid parameters'):
+        next(stream)
+
+    # closing the stream ends it for a consumer waiting for the next result
+    stream = pp.security.SecurityAnalysisResultStream(lambda handle, run_token: time.sleep(1), 1, None, None)
+    threading.Timer(0.5, stream.close).start()
+    assert [] == list(stream)
+
+
+def test_cancelled_security_analysis():
+    n = pp.network.create_ieee14()
+    sa = pp.security.create_analysis()
+    sa.add_single_element_contingencies(n.get_lines().index.tolist())
+
+    token = pp.CancelToken()
+    result = sa.run_ac(n, cancel_token=token)
+    assert not result.interrupted
+    assert len(n.get_lines()) == len(result.post_contingency_results)
+
+    token.cancel()
+    assert token.cancelled
+    result = sa.run_ac(n, cancel_token=token)
+    assert result.interrupted
+    assert 0 == len(result.post_contingency_results)
+    assert 'CONVERGED' == result.pre_contingency_result.status.name
+
+    result = sa.run_dc(n, deadline=time.time() - 1)
+    assert result.interrupted
+    assert 0 == len(result.post_contingency_results)
+
+    with pytest.raises(ValueError, match='several workers'):
+        sa.run_ac(n, workers=2, cancel_token=token)
+
+
 def test_flow_transfer():
     n = pp.network.create_eurostag_tutorial_example1_network()
     sa = pp.security.create_analysis()
@@ -233,3 +346,38 @@ def test_provider_parameters_names():
     assert pp.security.get_provider_parameters_names('OpenLoadFlow') == ['createResultExtension', 'contingencyPropagation']
     with pytest.raises(pp.PyPowsyblError, match='No security analysis provider for name \'unknown\''):
         pp.security.get_provider_parameters_names('unknown')
+
+
+def test_add_contingencies():
+    n = pp.network.create_eurostag_tutorial_example1_network()
+    sa = pp.security.create_analysis()
+    df = pd.DataFrame.from_records(
+        columns=['contingency_id', 'element_id'],
+        data=[
+            ('N-2', 'NHV1_NHV2_1'),
+            ('N-2', 'NHV1_NHV2_2'),
+            ('N-1', 'NHV1_NHV2_1'),
+            ('Unknown', 'NHV1_NHV2_1'),
+            ('Unknown', 'NOT_EXISTS'),
+            ('Unsupported', 'LOAD'),
+        ])
+    rejected = sa.add_contingencies(df, n)
+    assert [('Unknown', 'NOT_EXISTS'), ('Unsupported', 'LOAD')] == rejected.index.tolist()
+    assert "Element 'NOT_EXISTS' not found" == rejected.loc[('Unknown', 'NOT_EXISTS'), 'reason']
+    assert rejected.loc[('Unsupported', 'LOAD'), 'reason'].startswith('Element type not supported')
+    assert {'N-2': ['NHV1_NHV2_1', 'NHV1_NHV2_2'], 'N-1': ['NHV1_NHV2_1']} == sa._contingencies
+    result = sa.run_dc(n)
+    assert {'N-1', 'N-2'} == set(result.post_contingency_results.keys())
+
+    # without network, elements are not checked, and contingencies may be given as index
+    sa = pp.security.create_analysis()
+    assert sa.add_contingencies(df.set_index('contingency_id')).empty
+    assert 4 == len(sa._contingencies)
+    # contingencies added again replace the previous ones
+    sa.add_contingencies(pd.DataFrame({'contingency_id': ['N-1'], 'element_id': ['NHV1_NHV2_2']}))
+    sa.add_single_element_contingency('NHV1_NHV2_1', 'N-2')
+    assert 4 == len(sa._contingencies)
+    assert ['NHV1_NHV2_2'] == sa._contingencies['N-1']
+    assert ['NHV1_NHV2_1'] == sa._contingencies['N-2']
+    with pytest.raises(ValueError, match='Missing columns'):
+        sa.add_contingencies(pd.DataFrame({'element_id': ['NHV1_NHV2_1']}))
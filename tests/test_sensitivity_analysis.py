@@ -94,6 +94,23 @@ def test_sensitivity_analysis():
     assert df['L2-3-1']['B1-G'] == pytest.approx(-0.084428, abs=1e-6)
 
 
+def test_cancelled_sensitivity_analysis():
+    n = pp.network.create_ieee14()
+    sa = pp.sensitivity.create_dc_analysis()
+    sa.add_single_element_contingency('L1-2-1')
+    sa.add_branch_flow_factor_matrix(['L1-5-1', 'L2-3-1'], ['B1-G', 'B2-G', 'B3-G'], 'm')
+
+    token = pp.CancelToken()
+    r = sa.run(n, cancel_token=token)
+    assert not r.interrupted
+    assert r.get_branch_flows_sensitivity_matrix('m', 'L1-2-1') is not None
+
+    token.cancel()
+    r = sa.run(n, cancel_token=token)
+    assert r.interrupted
+    assert r.get_branch_flows_sensitivity_matrix('m', 'L1-2-1') is None
+
+
 def test_voltage_sensitivities():
     n = pp.network.create_eurostag_tutorial_example1_network()
     sa = pp.sensitivity.create_ac_analysis()
@@ -0,0 +1,50 @@
+#
+# Copyright (c) 2022, RTE (http://www.rte-france.com)
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+#
+import pandas as pd
+import pytest
+
+import pypowsybl as pp
+import pypowsybl.loadflow as lf
+from pypowsybl.network import ElementType
+
+
+@pytest.fixture(autouse=True)
+def set_up():
+    pp.set_config_read(False)
+
+
+def test_run_time_series():
+    n = pp.network.create_ieee14()
+    index = pd.date_range('2022-01-01', periods=4, freq='H')
+    loads_p0 = pd.DataFrame(index=index, data={'B3-L': [90, 100, 110, 120], 'B4-L': [40, 45, 50, 55]})
+
+    result = pp.timeseries.run(n, {(ElementType.LOAD, 'p0'): loads_p0},
+                               {(ElementType.LINE, 'p1'): ['L2-3-1', 'L3-4-1'], (ElementType.BUS, 'v_mag'): None})
+    assert index.equals(result.index)
+    assert [(ElementType.LINE, 'p1'), (ElementType.BUS, 'v_mag')] == result.keys()
+    assert all(lf.ComponentStatus.CONVERGED == s for s in result.statuses)
+
+    lines_p1 = result[ElementType.LINE, 'p1']
+    assert (4, 2) == lines_p1.shape
+    assert ['L2-3-1', 'L3-4-1'] == list(lines_p1.columns)
+    assert lines_p1['L2-3-1'].is_monotonic_increasing
+    assert (4, len(n.get_buses())) == result[ElementType.BUS, 'v_mag'].shape
+
+    # the network is left in the state of the last step
+    assert 120 == n.get_loads().loc['B3-L', 'p0']
+    assert n.get_lines().loc['L2-3-1', 'p1'] == pytest.approx(lines_p1['L2-3-1'].iloc[-1])
+
+
+def test_run_time_series_errors():
+    n = pp.network.create_ieee14()
+    loads_p0 = pd.DataFrame(index=[0, 1], data={'B3-L': [90, 100]})
+    with pytest.raises(pp.PyPowsyblError, match='is not a double series'):
+        pp.timeseries.run(n, {(ElementType.LOAD, 'p0'): loads_p0}, [(ElementType.LINE, 'connected1')])
+    with pytest.raises(ValueError, match='same index'):
+        pp.timeseries.run(n, {(ElementType.LOAD, 'p0'): loads_p0,
+                              (ElementType.LOAD, 'q0'): pd.DataFrame(index=[0, 2], data={'B3-L': [1, 2]})},
+                          [(ElementType.LINE, 'p1')])